@@ -1,8 +1,7 @@
 """
 Chuck Data package initialization.
-"""
-
-# Import and register all commands from the modular command system
-from chuck_data.commands import register_all_commands
 
-register_all_commands()
+Commands are registered with the unified command registry on its first read
+(see chuck_data.command_registry.load_commands), not on import, to keep
+startup and `chuck --version` fast.
+"""
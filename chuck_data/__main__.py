@@ -5,7 +5,6 @@ import argparse
 import os
 
 from chuck_data.logger import setup_logging
-from chuck_data.ui.tui import ChuckTUI
 from chuck_data.version import __version__
 
 
@@ -33,6 +32,9 @@ def main(argv: list[str] | None = None) -> None:
     no_color_env = os.environ.get("NO_COLOR", "").lower() in ("1", "true", "yes")
     no_color = args.no_color or no_color_env
 
+    # Imported only now so --version and --help exit without loading the TUI
+    from chuck_data.ui.tui import ChuckTUI
+
     # Initialize and run the TUI
     tui = ChuckTUI(no_color=no_color)
     try:
@@ -0,0 +1,157 @@
+"""
+Helpers for keeping the agent's conversation history cheap to resend.
+
+Messages are sanitized once, when they enter the history, rather than on a
+deep copy of the whole history before every LLM call. Large tool results
+are compacted to a token budget before they are stored; the full result
+stays available outside the history. Token counts use the same rough
+four-characters-per-token estimate as PII prompt budgeting.
+"""
+
+import json
+import logging
+from typing import Any, Dict, List, Optional, Tuple
+
+# Tokens a single tool result may take in the history unless configured
+DEFAULT_TOOL_OUTPUT_TOKEN_BUDGET = 4000
+
+# Characters per token for estimates
+_CHARS_PER_TOKEN = 4
+
+
+def estimate_tokens(text: str) -> int:
+    """Rough token count for a piece of text."""
+    return max(1, len(text) // _CHARS_PER_TOKEN) if text else 0
+
+
+def estimate_message_tokens(message: Dict[str, Any]) -> int:
+    """Rough token count for one chat message, including tool call arguments."""
+    tokens = estimate_tokens(message.get("content") or "")
+    for tool_call in message.get("tool_calls") or []:
+        function = tool_call.get("function", {})
+        tokens += estimate_tokens(function.get("name", ""))
+        tokens += estimate_tokens(function.get("arguments", ""))
+    return tokens
+
+
+def sanitize_message(message: Dict[str, Any]) -> Dict[str, Any]:
+    """Ensure a message's content is acceptable to every LLM API, in place.
+
+    user and system messages must have non-empty content; assistant messages
+    may only have empty content when they carry tool calls.
+
+    Returns:
+        The same message
+    """
+    role = message.get("role")
+    if role in ("user", "system"):
+        if not message.get("content"):
+            message["content"] = " "  # Use single space as minimum content
+            logging.warning(f"Empty content in {role} message, replacing with space")
+    elif role == "assistant":
+        if not message.get("tool_calls") and not message.get("content"):
+            message["content"] = " "
+            logging.warning(
+                "Empty content in assistant message without tool_calls, replacing with space"
+            )
+    return message
+
+
+def with_system_context(
+    history: List[Dict[str, Any]], system_index: int, system_content: str
+) -> List[Dict[str, Any]]:
+    """Messages for one LLM call: the history with the system message swapped.
+
+    Only the list is new; every message other than the system message is the
+    history's own (already sanitized) dict.
+    """
+    messages = list(history)
+    if 0 <= system_index < len(messages):
+        messages[system_index] = {"role": "system", "content": system_content}
+    return messages
+
+
+def compact_tool_result(result: Any, max_tokens: int) -> Tuple[str, bool]:
+    """Serialize a tool result for the history, keeping it within max_tokens.
+
+    A dict result is shortened by dropping items from the end of its largest
+    list (e.g. "tables" or "rows") and recording what was dropped under
+    "_truncated". Anything still over budget is cut off as text.
+
+    Returns:
+        Tuple of (content string, whether it was truncated)
+    """
+    content = json.dumps(result)
+    if estimate_tokens(content) <= max_tokens:
+        return content, False
+
+    if isinstance(result, dict):
+        list_fields = [k for k, v in result.items() if isinstance(v, list) and v]
+        if list_fields:
+            field = max(list_fields, key=lambda k: len(json.dumps(result[k])))
+            items = result[field]
+
+            def shortened(keep: int) -> str:
+                compacted = dict(result)
+                compacted[field] = items[:keep]
+                compacted["_truncated"] = {
+                    "field": field,
+                    "shown": keep,
+                    "total": len(items),
+                    "note": "Full result was shown to the user; ask for a narrower query if more rows are needed.",
+                }
+                return json.dumps(compacted)
+
+            # Largest prefix of the list that fits
+            low, high = 0, len(items)
+            while low < high:
+                mid = (low + high + 1) // 2
+                if estimate_tokens(shortened(mid)) <= max_tokens:
+                    low = mid
+                else:
+                    high = mid - 1
+            content = shortened(low)
+            if estimate_tokens(content) <= max_tokens:
+                return content, True
+
+    max_chars = max_tokens * _CHARS_PER_TOKEN
+    return (
+        content[:max_chars]
+        + f"... [truncated {len(content) - max_chars} characters of tool output]",
+        True,
+    )
+
+
+def context_breakdown(
+    messages: List[Dict[str, Any]], top: Optional[int] = None
+) -> Dict[str, Any]:
+    """Per-message token estimates for a list of messages.
+
+    Args:
+        messages: Chat messages
+        top: If given, also report the indexes of the largest messages
+
+    Returns:
+        Dict with "total_tokens", "by_role" and "messages" (one entry per
+        message with index, role, tool name if any and tokens), plus
+        "largest" when top is given
+    """
+    entries = []
+    by_role: Dict[str, int] = {}
+    for index, message in enumerate(messages):
+        tokens = estimate_message_tokens(message)
+        role = message.get("role", "")
+        by_role[role] = by_role.get(role, 0) + tokens
+        entry = {"index": index, "role": role, "tokens": tokens}
+        if message.get("name"):
+            entry["name"] = message["name"]
+        entries.append(entry)
+
+    breakdown: Dict[str, Any] = {
+        "total_tokens": sum(e["tokens"] for e in entries),
+        "by_role": by_role,
+        "messages": entries,
+    }
+    if top:
+        breakdown["largest"] = sorted(entries, key=lambda e: -e["tokens"])[:top]
+    return breakdown
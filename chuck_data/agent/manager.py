@@ -1,12 +1,20 @@
 import json
 import logging
-from copy import deepcopy
+import time
 from chuck_data.llm.factory import LLMProviderFactory
-from .tool_executor import get_tool_schemas, execute_tool
+from .conversation import (
+    DEFAULT_TOOL_OUTPUT_TOKEN_BUDGET,
+    compact_tool_result,
+    context_breakdown,
+    sanitize_message,
+    with_system_context,
+)
+from .tool_executor import get_tool_schemas, execute_tool_calls
 from chuck_data.config import (
     get_active_catalog,
     get_active_schema,
     get_active_database,
+    get_agent_tool_output_token_budget,
     get_warehouse_id,
     get_workspace_url,
     get_data_provider,
@@ -21,12 +29,29 @@ from .prompts import (
 
 
 class AgentManager:
-    def __init__(self, client, model=None, tool_output_callback=None, llm_client=None):
+    def __init__(
+        self,
+        client,
+        model=None,
+        tool_output_callback=None,
+        llm_client=None,
+        stream_callback=None,
+    ):
         self.api_client = client
         # Use factory to create provider (supports llm_client override for testing)
         self.llm_client = llm_client or LLMProviderFactory.create()
         self.model = model
         self.tool_output_callback = tool_output_callback
+        # Receives assistant text deltas as they stream in, then None once
+        # each LLM response is complete
+        self.stream_callback = stream_callback
+        # Per-LLM-call timings of the last process_with_tools run
+        self.turn_timings = []
+        # Whether the last final response was already shown via stream_callback
+        self.last_response_streamed = False
+        # Untruncated results of tool calls whose history entry was compacted,
+        # keyed by tool_call_id
+        self.full_tool_outputs = {}
 
         # Get provider-aware system message
         provider = get_data_provider()
@@ -34,19 +59,45 @@ class AgentManager:
 
         self.conversation_history = [{"role": "system", "content": system_message}]
 
+    @property
+    def conversation_history(self):
+        return self._conversation_history
+
+    @conversation_history.setter
+    def conversation_history(self, history):
+        # Messages are sanitized once on the way in, not before every LLM call
+        for msg in history:
+            sanitize_message(msg)
+        self._conversation_history = history
+
+    def _append_message(self, message):
+        self._conversation_history.append(sanitize_message(message))
+
     def add_user_message(self, content):
-        self.conversation_history.append({"role": "user", "content": content})
+        self._append_message({"role": "user", "content": content})
 
     def add_assistant_message(self, content):
-        self.conversation_history.append({"role": "assistant", "content": content})
+        self._append_message({"role": "assistant", "content": content})
 
     def add_system_message(self, content):
+        message = sanitize_message({"role": "system", "content": content})
         # If there's already a system message, replace it; otherwise prepend
         for i, msg in enumerate(self.conversation_history):
             if msg["role"] == "system":
-                self.conversation_history[i] = {"role": "system", "content": content}
+                self.conversation_history[i] = message
                 return
-        self.conversation_history.insert(0, {"role": "system", "content": content})
+        self.conversation_history.insert(0, message)
+
+    def context_breakdown(self, top=None):
+        """Estimated tokens per message of the conversation history.
+
+        Args:
+            top: If given, also list the largest messages
+
+        Returns:
+            See chuck_data.agent.conversation.context_breakdown
+        """
+        return context_breakdown(self.conversation_history, top=top)
 
     def process_pii_detection(self, table_name):
         """Process a PII detection request for a specific table
@@ -158,35 +209,15 @@ class AgentManager:
                 original_system_message_content = msg["content"]
                 break
 
+        self.turn_timings = []
+        self.last_response_streamed = False
+
         if system_message_index == -1:
             # This should ideally not happen if the history is initialized correctly
             logging.error("System message not found in conversation history.")
             # Handle error appropriately, maybe raise exception or return error message
 
         while iteration_count < max_iterations:
-            # Prepare a temporary history copy for this specific LLM call
-            current_history = deepcopy(self.conversation_history)
-
-            # Sanitize messages to ensure content is never empty string for non-tool roles
-            # Some LLM APIs reject messages with empty content, but allow None for tool_calls
-            for msg in current_history:
-                if msg["role"] in ["user", "system"]:
-                    # user and system messages MUST have non-empty content
-                    if not msg.get("content"):
-                        msg["content"] = " "  # Use single space as minimum content
-                        logging.warning(
-                            f"Empty content in {msg['role']} message, replacing with space"
-                        )
-                elif msg["role"] == "assistant":
-                    # assistant messages can have None content if they have tool_calls
-                    if "tool_calls" not in msg or not msg["tool_calls"]:
-                        # No tool calls, so content must be non-empty
-                        if not msg.get("content"):
-                            msg["content"] = " "
-                            logging.warning(
-                                "Empty content in assistant message without tool_calls, replacing with space"
-                            )
-
             # Get current configuration state
             active_catalog = get_active_catalog() or "Not set"
             active_schema = get_active_schema() or "Not set"
@@ -206,27 +237,26 @@ class AgentManager:
                 f"-----------------------"
             )
 
-            # Update the system message *in the temporary copy*
-            # Append the current config state to the *original* system message content
-            if (
-                system_message_index != -1
-                and original_system_message_content is not None
-            ):
-                current_history[system_message_index]["content"] = (
-                    original_system_message_content + config_state_info
-                )
-            # else: log warning or handle case where system message wasn't found initially
-
-            logging.debug(
-                f"Iteration {iteration_count}: Sending {len(current_history)} messages to LLM"
+            # Messages for this call: the history's own (already sanitized)
+            # messages, with the current config state appended to the
+            # *original* system message content
+            current_history = with_system_context(
+                self.conversation_history,
+                system_message_index,
+                (original_system_message_content or "") + config_state_info,
             )
 
+            if logging.getLogger().isEnabledFor(logging.DEBUG):
+                breakdown = context_breakdown(current_history, top=3)
+                logging.debug(
+                    f"Iteration {iteration_count}: Sending {len(current_history)} messages "
+                    f"(~{breakdown['total_tokens']} tokens, by role {breakdown['by_role']}, "
+                    f"largest {breakdown['largest']}) to LLM"
+                )
+
             # Get the LLM response using the temporary, updated history
-            response = self.llm_client.chat(
-                messages=current_history,  # Use the modified temporary history for the call
-                model=self.model,
-                tools=tools,
-                stream=False,  # Important: No streaming within the loop
+            response, streamed = self._request_completion(
+                current_history, tools, iteration_count
             )
 
             response_message = response.choices[0].message
@@ -234,7 +264,7 @@ class AgentManager:
 
             # --- IMPORTANT ---
             # All modifications to the conversation history (appending assistant messages, tool calls, tool results)
-            # MUST be done on the original self.conversation_history, NOT the temporary current_history.
+            # MUST be done on self.conversation_history, NOT current_history.
             # current_history is only used for the LLM call itself.
 
             # Check if the response contains tool calls
@@ -274,41 +304,32 @@ class AgentManager:
                     "content": content,
                     "tool_calls": tool_calls_list,
                 }
-                self.conversation_history.append(assistant_msg)
-
-                # Execute each tool call
-                for tool_call in response_message.tool_calls:
-                    func = getattr(tool_call, "function", None)
-                    if func is None:
-                        continue
-                    tool_name = getattr(func, "name", "")
-                    tool_id = tool_call.id
-                    try:
-                        tool_args = json.loads(getattr(func, "arguments", "{}"))
-                        tool_result = execute_tool(
-                            self.api_client,
-                            tool_name,
-                            tool_args,
-                            output_callback=self.tool_output_callback,
-                        )
-                    except json.JSONDecodeError as e:
-                        tool_result = {"error": f"Invalid JSON arguments: {e}"}
-                    except Exception as e:
-                        # Handle pagination cancellation specially - let it bubble up
-                        from chuck_data.exceptions import PaginationCancelled
+                self._append_message(assistant_msg)
 
-                        if isinstance(e, PaginationCancelled):
-                            raise  # Re-raise to bubble up to main TUI loop
-
-                        tool_result = {"error": f"Tool execution failed: {e}"}
-
-                    # Add the tool execution result to the *original* history
-                    self.conversation_history.append(
+                # Execute the tool calls; side-effect-free ones run concurrently
+                tool_results = self._execute_tool_calls(response_message.tool_calls)
+                token_budget = (
+                    get_agent_tool_output_token_budget()
+                    or DEFAULT_TOOL_OUTPUT_TOKEN_BUDGET
+                )
+                for tool_id, tool_name, tool_result in tool_results:
+                    # Large results are compacted to the token budget; the
+                    # TUI already received the full result, and it is kept
+                    # in full_tool_outputs
+                    content, truncated = compact_tool_result(tool_result, token_budget)
+                    if truncated:
+                        self.full_tool_outputs[tool_id] = tool_result
+                        logging.debug(
+                            f"Compacted '{tool_name}' result to ~{token_budget} tokens in history"
+                        )
+                    # Add the tool execution result to the history,
+                    # in the order the LLM requested the calls
+                    self._append_message(
                         {
                             "role": "tool",
                             "tool_call_id": tool_id,
                             "name": tool_name,
-                            "content": json.dumps(tool_result),
+                            "content": content,
                         }
                     )
 
@@ -336,6 +357,7 @@ class AgentManager:
                     if "<function" not in line
                 )
                 self.add_assistant_message(final_content)
+                self.last_response_streamed = streamed
                 return final_content
 
         logging.error(
@@ -345,6 +367,102 @@ class AgentManager:
         self.add_assistant_message(error_msg)
         return error_msg
 
+    def _execute_tool_calls(self, tool_calls):
+        """Execute one response's tool calls through the parallel dispatcher.
+
+        Calls with unparseable arguments get an error result without being
+        run. The others go to execute_tool_calls, which overlaps calls to
+        side-effect-free tools and serializes the rest.
+
+        Returns:
+            List of (tool_call_id, tool_name, result) in the original order
+        """
+        parsed = []
+        for tool_call in tool_calls:
+            func = getattr(tool_call, "function", None)
+            if func is None:
+                continue
+            tool_name = getattr(func, "name", "")
+            try:
+                tool_args = json.loads(getattr(func, "arguments", "{}"))
+                error = None
+            except json.JSONDecodeError as e:
+                tool_args = None
+                error = {"error": f"Invalid JSON arguments: {e}"}
+            parsed.append((tool_call.id, tool_name, tool_args, error))
+
+        runnable = [(name, args) for _, name, args, error in parsed if error is None]
+        # Failures are reported per call; PaginationCancelled bubbles up to the
+        # main TUI loop
+        results = iter(
+            execute_tool_calls(
+                self.api_client,
+                runnable,
+                output_callback=self.tool_output_callback,
+            )
+        )
+
+        return [
+            (tool_id, name, error if error is not None else next(results))
+            for tool_id, name, _, error in parsed
+        ]
+
+    def _request_completion(self, messages, tools, iteration):
+        """Get one LLM response, streaming it to stream_callback when set.
+
+        The response is streamed if a stream_callback was given and the
+        provider implements stream_chat(); the chunks are assembled into the
+        same ChatCompletion chat() returns. Time to first token and total
+        latency are logged and recorded in turn_timings.
+
+        Returns:
+            Tuple of (ChatCompletion, whether the response was streamed)
+        """
+        stream_callback = (
+            self.stream_callback if hasattr(self.llm_client, "stream_chat") else None
+        )
+        streamed = stream_callback is not None
+        started_at = time.monotonic()
+        if stream_callback is not None:
+            from chuck_data.llm.streaming import StreamAssembler
+
+            assembler = StreamAssembler(on_text=stream_callback, started_at=started_at)
+            try:
+                for chunk in self.llm_client.stream_chat(
+                    messages=messages, model=self.model, tools=tools
+                ):
+                    assembler.add(chunk)
+            finally:
+                stream_callback(None)
+            response = assembler.to_completion()
+            time_to_first_token = assembler.time_to_first_token
+        else:
+            response = self.llm_client.chat(
+                messages=messages,
+                model=self.model,
+                tools=tools,
+                stream=False,
+            )
+            time_to_first_token = None
+        total_seconds = time.monotonic() - started_at
+        if time_to_first_token is None:
+            # Without streaming the first token arrives with the whole response
+            time_to_first_token = total_seconds
+
+        self.turn_timings.append(
+            {
+                "iteration": iteration,
+                "streamed": streamed,
+                "time_to_first_token": time_to_first_token,
+                "total_seconds": total_seconds,
+            }
+        )
+        logging.info(
+            f"Agent LLM call {iteration}: time to first token {time_to_first_token:.2f}s, "
+            f"total {total_seconds:.2f}s (streamed={streamed})"
+        )
+        return response, streamed
+
     def process_query(self, query):
         """Process a general query using available tools
 
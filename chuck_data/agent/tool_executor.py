@@ -10,6 +10,7 @@ This module is responsible for:
    - Returning the result (or error) in a JSON-serializable dictionary format.
 """
 
+import concurrent.futures
 import logging
 import jsonschema  # Requires jsonschema to be installed
 
@@ -23,9 +24,12 @@ from chuck_data.commands.base import (
     CommandResult,
 )  # For type hinting and checking handler result
 from chuck_data.config import get_data_provider
-from typing import Dict, Any, Optional, List, Callable, Union
+from typing import Dict, Any, Optional, List, Callable, Tuple, Union
 from jsonschema.exceptions import ValidationError
 
+# Worker threads for side-effect-free tool calls made in one agent turn
+MAX_PARALLEL_TOOL_CALLS = 8
+
 # The display_to_user utility and individual tool implementation functions
 # (like list_models, set_warehouse, tag_pii_columns, scan_schema_for_pii, etc.)
 # that were previously in this file have been removed.
@@ -214,3 +218,150 @@ def execute_tool(
         return {
             "error": f"Unexpected error during execution of tool '{tool_name}': {str(e_exec)}"
         }
+
+
+def is_side_effect_free(
+    api_client: Optional[DatabricksAPIClient | RedshiftAPIClient], tool_name: str
+) -> bool:
+    """Return True if a tool is declared safe to run concurrently with others."""
+    from chuck_data.data_providers import get_provider_name_from_client
+
+    command_def = get_command(
+        tool_name, provider=get_provider_name_from_client(api_client)
+    )
+    return bool(
+        command_def
+        and command_def.side_effect_free
+        and not command_def.supports_interactive_input
+    )
+
+
+def execute_tool_calls(
+    api_client: Optional[DatabricksAPIClient | RedshiftAPIClient],
+    tool_calls: List[Tuple[str, Dict[str, Any]]],
+    output_callback: Optional[Callable[..., Any]] = None,
+    max_workers: int = MAX_PARALLEL_TOOL_CALLS,
+) -> List[Dict[str, Any]]:
+    """Execute the tool calls of one agent turn, overlapping read-only ones.
+
+    Consecutive calls to side-effect-free tools run concurrently; any other
+    tool runs on its own, after everything before it and before everything
+    after it, so a selection or mutation is always seen by later calls.
+    Output from concurrent calls is buffered and passed to output_callback
+    in call order once the group finishes, keeping the TUI (and pagination
+    prompts) on the calling thread. A call that fails gets its own error
+    result; only PaginationCancelled is raised.
+
+    Args:
+        api_client: API client passed to each tool's handler
+        tool_calls: (tool_name, tool_args) pairs in the order the LLM gave them
+        output_callback: Optional callback for displaying tool output
+        max_workers: Most tools run at once
+
+    Returns:
+        One execute_tool result per call, in the same order
+    """
+    results: List[Dict[str, Any]] = []
+    start = 0
+    while start < len(tool_calls):
+        end = start
+        while end < len(tool_calls) and is_side_effect_free(
+            api_client, tool_calls[end][0]
+        ):
+            end += 1
+
+        if end - start < 2:
+            # Not side-effect-free, or nothing to overlap with
+            tool_name, tool_args = tool_calls[start]
+            results.append(
+                _execute_tool_safely(api_client, tool_name, tool_args, output_callback)
+            )
+            start += 1
+            continue
+
+        results.extend(
+            _execute_concurrently(
+                api_client, tool_calls[start:end], output_callback, max_workers
+            )
+        )
+        start = end
+    return results
+
+
+def _execute_tool_safely(
+    api_client: Optional[DatabricksAPIClient | RedshiftAPIClient],
+    tool_name: str,
+    tool_args: Dict[str, Any],
+    output_callback: Optional[Callable[..., Any]],
+) -> Dict[str, Any]:
+    """execute_tool, turning anything it raises except PaginationCancelled into an error result."""
+    from chuck_data.exceptions import PaginationCancelled
+
+    try:
+        return execute_tool(api_client, tool_name, tool_args, output_callback)
+    except PaginationCancelled:
+        raise
+    except Exception as e:
+        logging.warning(
+            f"Critical error executing tool '{tool_name}': {e}", exc_info=True
+        )
+        return {
+            "error": f"Unexpected error during execution of tool '{tool_name}': {str(e)}"
+        }
+
+
+def _execute_concurrently(
+    api_client: Optional[DatabricksAPIClient | RedshiftAPIClient],
+    tool_calls: List[Tuple[str, Dict[str, Any]]],
+    output_callback: Optional[Callable[..., Any]],
+    max_workers: int,
+) -> List[Dict[str, Any]]:
+    """Run side-effect-free tool calls on a thread pool, replaying their output in order."""
+    buffered_output: List[List[Tuple[Any, ...]]] = [[] for _ in tool_calls]
+
+    def run(index: int) -> Dict[str, Any]:
+        tool_name, tool_args = tool_calls[index]
+        callback = None
+        if output_callback:
+            callback = lambda *args: buffered_output[index].append(args)  # noqa: E731
+        return execute_tool(api_client, tool_name, tool_args, callback)
+
+    logging.debug(
+        f"Running {len(tool_calls)} side-effect-free tool calls concurrently: "
+        f"{[name for name, _ in tool_calls]}"
+    )
+    results: List[Dict[str, Any]] = []
+    with concurrent.futures.ThreadPoolExecutor(
+        max_workers=min(max_workers, len(tool_calls))
+    ) as executor:
+        futures = [executor.submit(run, i) for i in range(len(tool_calls))]
+        for (tool_name, _), future in zip(tool_calls, futures):
+            try:
+                results.append(future.result())
+            except Exception as e:
+                logging.warning(
+                    f"Critical error executing tool '{tool_name}' concurrently: {e}",
+                    exc_info=True,
+                )
+                results.append(
+                    {
+                        "error": f"Unexpected error during execution of tool '{tool_name}': {str(e)}"
+                    }
+                )
+
+    if output_callback:
+        for (tool_name, _), calls in zip(tool_calls, buffered_output):
+            for args in calls:
+                try:
+                    output_callback(*args)
+                except Exception as e:
+                    # Handle pagination cancellation specially - let it bubble up
+                    from chuck_data.exceptions import PaginationCancelled
+
+                    if isinstance(e, PaginationCancelled):
+                        raise  # Re-raise to bubble up to agent manager
+
+                    logging.warning(
+                        f"Tool output callback failed for '{tool_name}': {e}"
+                    )
+    return results
@@ -5,17 +5,20 @@ Reusable Databricks API client for authentication and requests.
 import logging
 import requests
 
+from chuck_data.clients.http_session import get_http_session
+
 
 class APIClient:
     """Reusable Databricks API client for authentication and requests."""
 
-    def __init__(self, workspace_url, token):
+    def __init__(self, workspace_url, token, session=None):
         """
         Initialize the API client.
 
         Args:
             workspace_url: Databricks workspace URL
             token: Databricks API token
+            session: Optional requests.Session (defaults to the shared pool)
         """
         # Initialize with workspace URL and token
         self.workspace_url = workspace_url
@@ -24,6 +27,7 @@ class APIClient:
             "Authorization": f"Bearer {self.token}",
             "User-Agent": "amperity",
         }
+        self.session = session or get_http_session()
 
     def get(self, endpoint):
         """
@@ -43,7 +47,7 @@ class APIClient:
         # Construct the full URL for the API request
 
         try:
-            response = requests.get(url, headers=self.headers)
+            response = self.session.get(url, headers=self.headers)
             response.raise_for_status()
             return response.json()
         except requests.exceptions.HTTPError as e:
@@ -72,7 +76,7 @@ class APIClient:
         logging.debug(f"POST request to: {url}")
 
         try:
-            response = requests.post(url, headers=self.headers, json=data)
+            response = self.session.post(url, headers=self.headers, json=data)
             response.raise_for_status()
             return response.json()
         except requests.exceptions.HTTPError as e:
@@ -141,7 +145,7 @@ class APIClient:
 
         try:
             # Use PUT request with raw binary data in the body
-            response = requests.put(url, headers=headers, data=binary_data)
+            response = self.session.put(url, headers=headers, data=binary_data)
             response.raise_for_status()
             # API returns 204 No Content on success
             return True
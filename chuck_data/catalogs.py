@@ -2,6 +2,11 @@
 Module for interacting with Databricks Unity Catalog catalogs, schemas, and tables.
 """
 
+import logging
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
 
 def list_catalogs(client, include_browse=False, max_results=None, page_token=None):
     """
@@ -168,3 +173,234 @@ def get_table(
     return client.get_table(
         full_name, include_delta_metadata, include_browse, include_manifest_capabilities
     )
+
+
+#
+# Auto-paginating iterators
+#
+
+# Schemas listed at once by iter_tables_in_schemas
+DEFAULT_LISTING_CONCURRENCY = 8
+
+
+def _iter_pages(fetch_page, items_key, prefetch=True):
+    """
+    Yield the items of every page of a Unity Catalog listing.
+
+    Args:
+        fetch_page: Callable taking a page token (None for the first page) and
+            returning the API response
+        items_key: Response key holding the page's items (e.g. "tables")
+        prefetch: Fetch the next page in the background while the caller
+            works through the current one
+
+    Yields:
+        Items in listing order
+    """
+    executor = ThreadPoolExecutor(max_workers=1) if prefetch else None
+    seen_tokens = set()
+    try:
+        response = fetch_page(None)
+        while True:
+            token = response.get("next_page_token")
+            if token in seen_tokens:
+                logging.warning(f"Listing repeated page token {token}; stopping")
+                token = None
+            pending = None
+            if token:
+                seen_tokens.add(token)
+                if executor is not None:
+                    pending = executor.submit(fetch_page, token)
+            for item in response.get(items_key) or []:
+                yield item
+            if not token:
+                return
+            response = pending.result() if pending is not None else fetch_page(token)
+    finally:
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+
+def iter_catalogs(client, include_browse=False, page_size=None, prefetch=True):
+    """
+    Iterate over every catalog in the metastore, following next_page_token.
+
+    Args:
+        client: DatabricksAPIClient instance
+        include_browse: Whether to include catalogs with selective metadata access
+        page_size: max_results for each page request (optional)
+        prefetch: Load the next page while the current one is consumed
+
+    Yields:
+        Catalog dictionaries
+    """
+    return _iter_pages(
+        lambda token: client.list_catalogs(
+            include_browse=include_browse, max_results=page_size, page_token=token
+        ),
+        "catalogs",
+        prefetch,
+    )
+
+
+def iter_schemas(
+    client, catalog_name, include_browse=False, page_size=None, prefetch=True
+):
+    """
+    Iterate over every schema in a catalog, following next_page_token.
+
+    Args:
+        client: DatabricksAPIClient instance
+        catalog_name: Parent catalog
+        include_browse: Whether to include schemas with selective metadata access
+        page_size: max_results for each page request (optional)
+        prefetch: Load the next page while the current one is consumed
+
+    Yields:
+        Schema dictionaries
+    """
+    return _iter_pages(
+        lambda token: client.list_schemas(
+            catalog_name,
+            include_browse=include_browse,
+            max_results=page_size,
+            page_token=token,
+        ),
+        "schemas",
+        prefetch,
+    )
+
+
+def iter_tables(
+    client, catalog_name, schema_name, page_size=None, prefetch=True, **list_kwargs
+):
+    """
+    Iterate over every table in a schema, following next_page_token.
+
+    Consumers can start describing or classifying tables from the first page
+    while later pages are still loading.
+
+    Args:
+        client: DatabricksAPIClient instance
+        catalog_name: Parent catalog
+        schema_name: Parent schema
+        page_size: max_results for each page request (optional)
+        prefetch: Load the next page while the current one is consumed
+        **list_kwargs: Other list_tables options (omit_columns, include_browse, ...)
+
+    Yields:
+        Table dictionaries
+    """
+    return _iter_pages(
+        lambda token: client.list_tables(
+            catalog_name=catalog_name,
+            schema_name=schema_name,
+            max_results=page_size,
+            page_token=token,
+            **list_kwargs,
+        ),
+        "tables",
+        prefetch,
+    )
+
+
+def iter_volumes(
+    client,
+    catalog_name,
+    schema_name,
+    include_browse=False,
+    page_size=None,
+    prefetch=True,
+):
+    """
+    Iterate over every volume in a schema, following next_page_token.
+
+    Args:
+        client: DatabricksAPIClient instance
+        catalog_name: Parent catalog
+        schema_name: Parent schema
+        include_browse: Whether to include volumes with selective metadata access
+        page_size: max_results for each page request (optional)
+        prefetch: Load the next page while the current one is consumed
+
+    Yields:
+        Volume dictionaries
+    """
+    return _iter_pages(
+        lambda token: client.list_volumes(
+            catalog_name=catalog_name,
+            schema_name=schema_name,
+            max_results=page_size,
+            page_token=token,
+            include_browse=include_browse,
+        ),
+        "volumes",
+        prefetch,
+    )
+
+
+def iter_tables_in_schemas(
+    client, schemas, max_workers=None, on_error=None, **list_kwargs
+):
+    """
+    List the tables of many schemas at once.
+
+    Each schema is paged through on its own worker; tables are yielded as soon
+    as any schema's page arrives, so the order across schemas is not defined.
+
+    Args:
+        client: DatabricksAPIClient instance
+        schemas: Iterable of (catalog_name, schema_name) pairs
+        max_workers: Schemas listed concurrently
+            (default DEFAULT_LISTING_CONCURRENCY)
+        on_error: Optional callable(catalog_name, schema_name, exception). If
+            given, a schema that fails to list is reported to it and the others
+            continue; otherwise the first failure is raised
+        **list_kwargs: list_tables options (omit_columns, include_browse, ...)
+
+    Yields:
+        (catalog_name, schema_name, table) tuples
+    """
+    schemas = list(dict.fromkeys(schemas))
+    if not schemas:
+        return
+
+    results = queue.Queue()
+    stop = threading.Event()
+    finished = object()
+
+    def list_schema(catalog_name, schema_name):
+        try:
+            for table in iter_tables(
+                client, catalog_name, schema_name, prefetch=False, **list_kwargs
+            ):
+                if stop.is_set():
+                    return
+                results.put((catalog_name, schema_name, table))
+        except Exception as e:
+            results.put((catalog_name, schema_name, e))
+        finally:
+            results.put(finished)
+
+    workers = max(1, min(max_workers or DEFAULT_LISTING_CONCURRENCY, len(schemas)))
+    executor = ThreadPoolExecutor(max_workers=workers)
+    try:
+        for catalog_name, schema_name in schemas:
+            executor.submit(list_schema, catalog_name, schema_name)
+
+        remaining = len(schemas)
+        while remaining:
+            item = results.get()
+            if item is finished:
+                remaining -= 1
+                continue
+            catalog_name, schema_name, value = item
+            if isinstance(value, Exception):
+                if on_error is None:
+                    raise value
+                on_error(catalog_name, schema_name, value)
+                continue
+            yield item
+    finally:
+        stop.set()
+        executor.shutdown(wait=False, cancel_futures=True)
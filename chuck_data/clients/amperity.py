@@ -230,12 +230,13 @@ class AmperityAPIClient:
             logging.error(f"Error submitting bug report: {e}", exc_info=True)
             return False, str(e)
 
-    def get_job_status(self, job_id: str, token: str) -> dict:
+    def get_job_status(self, job_id: str, token: str, timeout: float = 10) -> dict:
         """Get job status from Chuck backend API.
 
         Args:
             job_id: Chuck job identifier
             token: The authentication token
+            timeout: Seconds to wait for the backend to respond
 
         Returns:
             Dict with job data (state, error, credits, etc.)
@@ -249,7 +250,7 @@ class AmperityAPIClient:
                 "Authorization": f"Bearer {token}",
             }
 
-            response = requests.get(url, headers=headers, timeout=10)
+            response = requests.get(url, headers=headers, timeout=timeout)
 
             if response.status_code == 200:
                 data = response.json()
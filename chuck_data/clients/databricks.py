@@ -7,27 +7,45 @@ import json
 import logging
 import os
 import requests
-import time
 import urllib.parse
+from typing import Any, Dict, Optional
 from datetime import datetime, timezone
-from chuck_data.config import get_warehouse_id
+from chuck_data.config import get_uc_metadata_cache_enabled, get_warehouse_id
 from chuck_data.clients.amperity import get_amperity_url
+from chuck_data.clients.http_session import get_http_session
+from chuck_data.clients.statement_waiter import (
+    DATABRICKS_PENDING_STATES,
+    DATABRICKS_QUEUED_STATES,
+    StatementWaiter,
+    databricks_statement_state,
+)
 from chuck_data.databricks.url_utils import (
     detect_cloud_provider,
     normalize_workspace_url,
 )
+from chuck_data.metadata_cache import (
+    MetadataCache,
+    client_identity,
+    get_metadata_cache,
+    make_cache_key,
+)
 
 
 class DatabricksAPIClient:
     """Reusable Databricks API client for authentication and requests."""
 
-    def __init__(self, workspace_url, token):
+    def __init__(self, workspace_url, token, session=None, metadata_cache=None):
         """
         Initialize the API client.
 
         Args:
             workspace_url: Databricks workspace URL (with or without protocol/domain)
             token: Databricks API token
+            session: Optional requests.Session to use. Defaults to the shared
+                pooled session so connections are reused across clients.
+            metadata_cache: Optional MetadataCache for Unity Catalog responses.
+                Defaults to the process-wide cache unless disabled in config;
+                pass False to disable caching for this client.
         """
         self.original_url = workspace_url
         self.workspace_url = self._normalize_workspace_url(workspace_url)
@@ -38,6 +56,12 @@ class DatabricksAPIClient:
             "Authorization": f"Bearer {self.token}",
             "User-Agent": "amperity",
         }
+        self.session = session or get_http_session()
+        self._metadata_cache: Optional[MetadataCache] = (
+            None if metadata_cache is False else metadata_cache
+        )
+        self._metadata_cache_disabled = metadata_cache is False
+        self._cache_identity = client_identity(self.workspace_url, token)
 
     def _normalize_workspace_url(self, url):
         """
@@ -150,7 +174,7 @@ class DatabricksAPIClient:
         logging.debug(f"GET request to: {url}")
 
         try:
-            response = requests.get(url, headers=self.headers)
+            response = self.session.get(url, headers=self.headers)
             response.raise_for_status()
             return response.json()
         except requests.exceptions.HTTPError as e:
@@ -179,7 +203,7 @@ class DatabricksAPIClient:
         logging.debug(f"GET request with params to: {url}")
 
         try:
-            response = requests.get(url, headers=self.headers, params=params)
+            response = self.session.get(url, headers=self.headers, params=params)
             response.raise_for_status()
             return response.json()
         except requests.exceptions.HTTPError as e:
@@ -208,7 +232,7 @@ class DatabricksAPIClient:
         logging.debug(f"POST request to: {url}")
 
         try:
-            response = requests.post(url, headers=self.headers, json=data)
+            response = self.session.post(url, headers=self.headers, json=data)
             response.raise_for_status()
             return response.json()
         except requests.exceptions.HTTPError as e:
@@ -218,6 +242,51 @@ class DatabricksAPIClient:
             logging.debug(f"Connection error: {e}")
             raise ConnectionError(f"Connection error occurred: {e}")
 
+    @property
+    def metadata_cache(self) -> Optional[MetadataCache]:
+        """The MetadataCache used for Unity Catalog reads, or None if disabled."""
+        if self._metadata_cache is None and not self._metadata_cache_disabled:
+            if get_uc_metadata_cache_enabled():
+                self._metadata_cache = get_metadata_cache()
+            else:
+                self._metadata_cache_disabled = True
+        return self._metadata_cache
+
+    def _cached_get(
+        self, resource, endpoint, params=None, catalog=None, schema=None, table=None
+    ):
+        """
+        GET a Unity Catalog endpoint through the metadata cache.
+
+        Args:
+            resource: Resource kind, selecting the cache TTL
+            endpoint: API endpoint (starting with /)
+            params: Dictionary of query parameters (optional)
+            catalog, schema, table: What the response describes, so that
+                mutations can invalidate it
+
+        Returns:
+            JSON response from the API or the cache
+        """
+        cache = self.metadata_cache
+        key = None
+        if cache is not None:
+            key = make_cache_key(self._cache_identity, endpoint, params)
+            cached = cache.get(key, resource)
+            if cached is not None:
+                return cached
+
+        if params:
+            response = self.get_with_params(endpoint, params)
+        else:
+            response = self.get(endpoint)
+
+        if cache is not None and key is not None:
+            cache.put(
+                key, resource, response, catalog=catalog, schema=schema, table=table
+            )
+        return response
+
     #
     # Authentication methods
     #
@@ -262,9 +331,7 @@ class DatabricksAPIClient:
         if page_token:
             params["page_token"] = page_token
 
-        if params:
-            return self.get_with_params("/api/2.1/unity-catalog/catalogs", params)
-        return self.get("/api/2.1/unity-catalog/catalogs")
+        return self._cached_get("catalogs", "/api/2.1/unity-catalog/catalogs", params)
 
     def get_catalog(self, catalog_name):
         """
@@ -276,7 +343,11 @@ class DatabricksAPIClient:
         Returns:
             Catalog information
         """
-        return self.get(f"/api/2.1/unity-catalog/catalogs/{catalog_name}")
+        return self._cached_get(
+            "catalog",
+            f"/api/2.1/unity-catalog/catalogs/{catalog_name}",
+            catalog=catalog_name,
+        )
 
     def list_schemas(
         self, catalog_name, include_browse=False, max_results=None, page_token=None
@@ -303,7 +374,9 @@ class DatabricksAPIClient:
         if page_token:
             params["page_token"] = page_token
 
-        return self.get_with_params("/api/2.1/unity-catalog/schemas", params)
+        return self._cached_get(
+            "schemas", "/api/2.1/unity-catalog/schemas", params, catalog=catalog_name
+        )
 
     def get_schema(self, full_name):
         """
@@ -315,7 +388,13 @@ class DatabricksAPIClient:
         Returns:
             Schema information
         """
-        return self.get(f"/api/2.1/unity-catalog/schemas/{full_name}")
+        catalog_name, _, schema_name = full_name.partition(".")
+        return self._cached_get(
+            "schema",
+            f"/api/2.1/unity-catalog/schemas/{full_name}",
+            catalog=catalog_name,
+            schema=schema_name,
+        )
 
     def list_tables(
         self,
@@ -368,7 +447,13 @@ class DatabricksAPIClient:
             params["include_browse"] = "true"
         if include_manifest_capabilities:
             params["include_manifest_capabilities"] = "true"
-        return self.get_with_params("/api/2.1/unity-catalog/tables", params)
+        return self._cached_get(
+            "tables",
+            "/api/2.1/unity-catalog/tables",
+            params,
+            catalog=catalog_name,
+            schema=schema_name,
+        )
 
     def get_table(
         self,
@@ -397,11 +482,15 @@ class DatabricksAPIClient:
         if include_manifest_capabilities:
             params["include_manifest_capabilities"] = "true"
 
-        if params:
-            return self.get_with_params(
-                f"/api/2.1/unity-catalog/tables/{full_name}", params
-            )
-        return self.get(f"/api/2.1/unity-catalog/tables/{full_name}")
+        parts = full_name.split(".")
+        return self._cached_get(
+            "table",
+            f"/api/2.1/unity-catalog/tables/{full_name}",
+            params,
+            catalog=parts[0] if len(parts) == 3 else None,
+            schema=parts[1] if len(parts) == 3 else None,
+            table=full_name,
+        )
 
     def list_volumes(
         self,
@@ -434,7 +523,13 @@ class DatabricksAPIClient:
         if include_browse:
             params["include_browse"] = "true"
 
-        return self.get_with_params("/api/2.1/unity-catalog/volumes", params)
+        return self._cached_get(
+            "volumes",
+            "/api/2.1/unity-catalog/volumes",
+            params,
+            catalog=catalog_name,
+            schema=schema_name,
+        )
 
     def create_volume(self, catalog_name, schema_name, name, volume_type="MANAGED"):
         """
@@ -455,7 +550,11 @@ class DatabricksAPIClient:
             "name": name,
             "volume_type": volume_type,
         }
-        return self.post("/api/2.1/unity-catalog/volumes", data)
+        response = self.post("/api/2.1/unity-catalog/volumes", data)
+        cache = self.metadata_cache
+        if cache is not None:
+            cache.invalidate(catalog_name, schema_name, resources=("volumes",))
+        return response
 
     #
     # Models and Serving methods
@@ -534,21 +633,33 @@ class DatabricksAPIClient:
         catalog=None,
         wait_timeout="30s",
         on_wait_timeout="CONTINUE",
+        timeout=None,
+        cancel_event=None,
+        parameters=None,
     ):
         """
         Submit a SQL statement to Databricks SQL warehouse and wait for completion.
 
+        The warehouse waits up to wait_timeout server-side before answering;
+        statements still running after that are polled with backoff.
+
         Args:
             sql_text: SQL statement to execute
             warehouse_id: ID of the SQL warehouse
             catalog: Optional catalog name
             wait_timeout: How long to wait for query completion (default "30s")
             on_wait_timeout: What to do on timeout ("CONTINUE" or "CANCEL")
+            timeout: Optional overall deadline in seconds; the statement is
+                cancelled and StatementTimeoutError raised when it passes
+            cancel_event: Optional threading.Event that cancels the statement
+                and raises StatementCancelledError when set
+            parameters: Optional mapping of named parameter markers (":name"
+                in sql_text) to their string values
 
         Returns:
             Dictionary containing the SQL statement execution result
         """
-        data = {
+        data: Dict[str, Any] = {
             "statement": sql_text,
             "warehouse_id": warehouse_id,
             "wait_timeout": wait_timeout,
@@ -558,19 +669,131 @@ class DatabricksAPIClient:
         if catalog:
             data["catalog"] = catalog
 
+        if parameters:
+            data["parameters"] = [
+                {"name": name, "value": value, "type": "STRING"}
+                for name, value in parameters.items()
+            ]
+
         # Submit the SQL statement
         response = self.post("/api/2.0/sql/statements", data)
-        statement_id = response.get("statement_id")
+        try:
+            return self.wait_for_sql_statement(
+                response.get("statement_id"),
+                initial_response=response,
+                timeout=timeout,
+                cancel_event=cancel_event,
+            )
+        finally:
+            # DDL (e.g. ALTER COLUMN ... SET TAGS) may have changed cached
+            # metadata, whether or not it completed
+            cache = self.metadata_cache
+            if cache is not None:
+                cache.invalidate_for_sql(sql_text)
+
+    def wait_for_sql_statement(
+        self, statement_id, initial_response=None, timeout=None, cancel_event=None
+    ):
+        """
+        Wait for a submitted SQL statement to finish.
+
+        Args:
+            statement_id: ID of the statement to wait for
+            initial_response: Submit response, used to skip polling when the
+                statement already finished within the server-side wait
+            timeout: Optional overall deadline in seconds
+            cancel_event: Optional threading.Event that cancels the wait
 
-        # Poll until complete
+        Returns:
+            Dictionary containing the final statement status and result
+        """
+        waiter = StatementWaiter(
+            pending_states=DATABRICKS_PENDING_STATES,
+            queued_states=DATABRICKS_QUEUED_STATES,
+            timeout=timeout,
+            cancel_event=cancel_event,
+        )
+        return waiter.wait(
+            poll=lambda: self.get(f"/api/2.0/sql/statements/{statement_id}"),
+            get_state=databricks_statement_state,
+            initial_response=initial_response,
+            statement_id=statement_id,
+            cancel=lambda: self.cancel_sql_statement(statement_id),
+        )
+
+    def get_schema_columns(self, catalog_name, schema_name, warehouse_id):
+        """
+        Get the columns of every table in a schema with one SQL query.
+
+        Reads system.information_schema.columns on the warehouse instead of
+        calling get_table once per table. Result chunks beyond the first are
+        fetched from the statement's result endpoint.
+
+        Args:
+            catalog_name: Catalog name
+            schema_name: Schema name
+            warehouse_id: ID of the SQL warehouse to run the query on
+
+        Returns:
+            Mapping of table name to its columns in ordinal order, each a dict
+            with name, type_name, type_text, nullable and position like the
+            columns in a get_table response
+
+        Raises:
+            ValueError: If the query does not succeed
+        """
+        query = (
+            "SELECT table_name, column_name, data_type, full_data_type, "
+            "is_nullable, ordinal_position "
+            "FROM system.information_schema.columns "
+            "WHERE table_catalog = :catalog AND table_schema = :schema "
+            "ORDER BY table_name, ordinal_position"
+        )
+        result = self.submit_sql_statement(
+            sql_text=query,
+            warehouse_id=warehouse_id,
+            wait_timeout="50s",
+            parameters={"catalog": catalog_name, "schema": schema_name},
+        )
+        status = result.get("status", {})
+        if status.get("state") != "SUCCEEDED":
+            error = status.get("error", {})
+            message = error.get("message") if isinstance(error, dict) else error
+            raise ValueError(
+                f"Column metadata query failed for {catalog_name}.{schema_name}: "
+                f"{message or status.get('state', 'unknown state')}"
+            )
+
+        columns_by_table = {}
+        chunk = result.get("result") or {}
         while True:
-            status = self.get(f"/api/2.0/sql/statements/{statement_id}")
-            state = status.get("status", {}).get("state", status.get("state"))
-            if state not in ["PENDING", "RUNNING"]:
-                break
-            time.sleep(1)
+            for row in chunk.get("data_array") or []:
+                table_name, column_name, data_type, full_type, nullable, position = row
+                columns_by_table.setdefault(table_name, []).append(
+                    {
+                        "name": column_name,
+                        "type_name": data_type,
+                        "type_text": full_type,
+                        "nullable": nullable != "NO",
+                        "position": int(position) if position is not None else None,
+                    }
+                )
+            next_link = chunk.get("next_chunk_internal_link")
+            if not next_link:
+                return columns_by_table
+            chunk = self.get(next_link)
 
-        return status
+    def cancel_sql_statement(self, statement_id):
+        """
+        Request cancellation of a running SQL statement.
+
+        Args:
+            statement_id: ID of the statement to cancel
+
+        Returns:
+            JSON response from the API
+        """
+        return self.post(f"/api/2.0/sql/statements/{statement_id}/cancel", {})
 
     #
     # Jobs methods
@@ -765,6 +988,30 @@ class DatabricksAPIClient:
         params = {"run_id": run_id}
         return self.get_with_params("/api/2.2/jobs/runs/get", params)
 
+    def list_job_runs(
+        self, active_only=False, run_type=None, limit=25, page_token=None
+    ):
+        """
+        List job runs, most recent first.
+
+        Args:
+            active_only: Only include runs that have not finished
+            run_type: Optional run type filter (e.g. "SUBMIT_RUN")
+            limit: Runs per page (the API allows at most 25)
+            page_token: Token from a previous page's "next_page_token"
+
+        Returns:
+            Dict with "runs", "has_more" and, if there are more, "next_page_token"
+        """
+        params: Dict[str, Any] = {"limit": limit}
+        if active_only:
+            params["active_only"] = "true"
+        if run_type:
+            params["run_type"] = run_type
+        if page_token:
+            params["page_token"] = page_token
+        return self.get_with_params("/api/2.2/jobs/runs/list", params)
+
     #
     # File system methods
     #
@@ -826,7 +1073,7 @@ class DatabricksAPIClient:
 
         try:
             # Use PUT request with raw binary data in the body
-            response = requests.put(url, headers=headers, data=binary_data)
+            response = self.session.put(url, headers=headers, data=binary_data)
             response.raise_for_status()
             # API returns 204 No Content on success
             return True
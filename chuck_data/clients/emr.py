@@ -9,15 +9,22 @@ Storage operations (S3) are handled by RedshiftAPIClient or S3Storage provider.
 
 import logging
 import os
+import queue
 import shlex
 import time
 from typing import Dict, List, Optional, Any
 
-import boto3
 from botocore.exceptions import ClientError, BotoCoreError
 
+from chuck_data.lazy_imports import LazyModule
 from chuck_data.clients.amperity import get_amperity_url
 
+# Imported on first use; see chuck_data.lazy_imports
+boto3 = LazyModule("boto3")
+
+# ListSteps accepts at most this many step IDs per call
+STEP_IDS_PER_LIST_CALL = 10
+
 
 class EMRAPIClient:
     """Reusable AWS EMR API client for cluster management and job execution."""
@@ -267,7 +274,7 @@ class EMRAPIClient:
 
         try:
             # Build Spark step configuration
-            hadoop_jar_step = {
+            hadoop_jar_step: Dict[str, Any] = {
                 "Jar": jar,
             }
 
@@ -773,7 +780,11 @@ class EMRAPIClient:
             >>> print(status['start_time'])  # '2024-01-15T10:30:00Z'
         """
         step = self.describe_step(step_id, cluster_id)
-        status_info = step.get("Status", {})
+        return self._step_status(step.get("Status", {}))
+
+    @staticmethod
+    def _step_status(status_info: Dict[str, Any]) -> Dict[str, Any]:
+        """Flatten the Status block shared by DescribeStep and ListSteps."""
         timeline = status_info.get("Timeline", {})
 
         result = {
@@ -802,6 +813,7 @@ class EMRAPIClient:
         self,
         cluster_id: Optional[str] = None,
         step_states: Optional[List[str]] = None,
+        step_ids: Optional[List[str]] = None,
     ) -> List[Dict[str, Any]]:
         """
         List steps for a cluster.
@@ -809,6 +821,7 @@ class EMRAPIClient:
         Args:
             cluster_id: Cluster ID. If None, uses self.cluster_id
             step_states: Filter by step states (e.g., ['RUNNING', 'PENDING'])
+            step_ids: Filter by step IDs (at most STEP_IDS_PER_LIST_CALL)
 
         Returns:
             List of step summaries
@@ -824,6 +837,8 @@ class EMRAPIClient:
             params = {"ClusterId": cid}
             if step_states:
                 params["StepStates"] = step_states
+            if step_ids:
+                params["StepIds"] = step_ids
 
             response = self.emr.list_steps(**params)
             return response.get("Steps", [])
@@ -835,6 +850,28 @@ class EMRAPIClient:
             logging.debug(f"Connection error: {e}")
             raise ConnectionError(f"Connection error occurred: {e}")
 
+    def get_steps_status(
+        self, step_ids: List[str], cluster_id: Optional[str] = None
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Get the status of several steps with as few ListSteps calls as possible.
+
+        Args:
+            step_ids: Step IDs to check
+            cluster_id: Cluster ID. If None, uses self.cluster_id
+
+        Returns:
+            Dictionary mapping step ID to the same status dictionary as
+            get_step_status. Steps the API did not return are left out.
+        """
+        statuses: Dict[str, Dict[str, Any]] = {}
+        for start in range(0, len(step_ids), STEP_IDS_PER_LIST_CALL):
+            chunk = step_ids[start : start + STEP_IDS_PER_LIST_CALL]
+            for step in self.list_steps(cluster_id, step_ids=chunk):
+                if step.get("Id") in chunk:
+                    statuses[step["Id"]] = self._step_status(step.get("Status", {}))
+        return statuses
+
     def cancel_step(self, step_id: str, cluster_id: Optional[str] = None) -> bool:
         """
         Cancel a running or pending step.
@@ -878,6 +915,9 @@ class EMRAPIClient:
         """
         Wait for a step to complete.
 
+        The step is polled by the shared job watcher, so concurrent waits on
+        the same cluster share batched ListSteps calls.
+
         Args:
             step_id: Step ID to wait for
             cluster_id: Cluster ID. If None, uses self.cluster_id
@@ -890,25 +930,48 @@ class EMRAPIClient:
         Raises:
             ValueError: If step fails or timeout is reached
         """
-        start_time = time.time()
+        from chuck_data.job_watcher import KIND_EMR, get_job_watcher
 
-        while True:
-            status = self.get_step_status(step_id, cluster_id)
-            state = status["status"]
+        cid = cluster_id or self.cluster_id
+        if not cid:
+            raise ValueError("cluster_id must be provided or set in constructor")
 
-            if state == "COMPLETED":
-                return status
-            elif state in ["FAILED", "CANCELLED", "INTERRUPTED"]:
+        watcher = get_job_watcher()
+        events: "queue.Queue" = queue.Queue()
+        unsubscribe = watcher.subscribe(events.put, key=(KIND_EMR, step_id))
+        deadline = time.monotonic() + timeout
+        try:
+            watcher.watch_emr_step(
+                step_id,
+                self,
+                cluster_id=cid,
+                poll_interval=poll_interval,
+                timeout=timeout,
+            )
+            while True:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise ValueError(
+                        f"Step {step_id} timed out after {timeout} seconds"
+                    )
+                try:
+                    event = events.get(timeout=remaining)
+                except queue.Empty:
+                    continue
+
+                if event.error is not None:
+                    raise event.error
+                if not event.terminal:
+                    continue
+
+                status = event.data
+                if event.state == "COMPLETED":
+                    return status
                 raise ValueError(
-                    f"Step {step_id} {state.lower()}: {status.get('state_message', 'Unknown error')}"
+                    f"Step {step_id} {event.state.lower()}: {status.get('state_message', 'Unknown error')}"
                 )
-
-            # Check timeout
-            if time.time() - start_time > timeout:
-                raise ValueError(f"Step {step_id} timed out after {timeout} seconds")
-
-            # Wait before next poll
-            time.sleep(poll_interval)
+        finally:
+            unsubscribe()
 
     #
     # Utility methods
@@ -0,0 +1,105 @@
+"""
+Shared, pooled HTTP session for Databricks REST and external-link traffic.
+
+Every Databricks API call used to go through module-level ``requests.get`` /
+``requests.post``, which opens a fresh TLS connection per request. This module
+owns one process-wide ``requests.Session`` whose adapter keeps connections
+alive and caps the number of idle connections kept per host, so concurrent PII
+scans and bulk tagging runs reuse sockets instead of re-handshaking.
+
+Auth headers are never stored on the session itself: callers pass them per
+request so the same pool can safely be used for pre-signed external links.
+"""
+
+import logging
+import threading
+from typing import Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+
+# Connections kept open per host. Sized to cover the PII scan worker pool plus
+# headroom for the SQL polling and tagging calls that run alongside it.
+DEFAULT_POOL_SIZE = 16
+
+# Number of distinct host pools to cache (workspace, external-link storage,
+# Amperity, ...).
+DEFAULT_POOL_CONNECTIONS = 8
+
+_session: Optional[requests.Session] = None
+_session_lock = threading.Lock()
+
+
+def create_session(
+    pool_size: int = DEFAULT_POOL_SIZE,
+    pool_connections: int = DEFAULT_POOL_CONNECTIONS,
+) -> requests.Session:
+    """
+    Build a keep-alive session with a bounded connection pool per host.
+
+    Args:
+        pool_size: Maximum number of connections kept open per host
+        pool_connections: Number of per-host pools to keep cached
+
+    Returns:
+        Configured requests.Session
+    """
+    if pool_size < 1:
+        raise ValueError("pool_size must be at least 1")
+
+    session = requests.Session()
+    # Do not block when every pooled connection is checked out: requests has no
+    # pool wait timeout, so a blocked thread could wait forever behind a caller
+    # holding a streamed response. Extra threads open a short-lived connection
+    # instead, and at most pool_size connections are kept for reuse.
+    adapter = HTTPAdapter(
+        pool_connections=pool_connections,
+        pool_maxsize=pool_size,
+        pool_block=False,
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.headers.update(
+        {
+            "Accept-Encoding": "gzip, deflate",
+            "Connection": "keep-alive",
+        }
+    )
+    return session
+
+
+def _configured_pool_size() -> int:
+    """Read the pool size from config, falling back to the default."""
+    try:
+        from chuck_data.config import get_http_pool_size
+
+        return get_http_pool_size() or DEFAULT_POOL_SIZE
+    except Exception as e:
+        logging.debug(f"Could not read HTTP pool size from config: {e}")
+        return DEFAULT_POOL_SIZE
+
+
+def get_http_session() -> requests.Session:
+    """
+    Return the process-wide pooled session, creating it on first use.
+
+    Returns:
+        Shared requests.Session
+    """
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                pool_size = _configured_pool_size()
+                logging.debug(f"Creating shared HTTP session (pool_size={pool_size})")
+                _session = create_session(pool_size=pool_size)
+    return _session
+
+
+def reset_http_session() -> None:
+    """Close the shared session so the next caller gets a fresh pool."""
+    global _session
+    with _session_lock:
+        if _session is not None:
+            _session.close()
+        _session = None
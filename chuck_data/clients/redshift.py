@@ -5,13 +5,43 @@ This client uses boto3 and the Redshift Data API to provide interactive
 browsing capabilities similar to DatabricksAPIClient for Unity Catalog.
 """
 
+import concurrent.futures
+import hashlib
 import logging
-import time
-from typing import Dict, List, Optional, Any
+import threading
+from typing import Any, Callable, Dict, Iterator, List, Optional
 
-import boto3
 from botocore.exceptions import ClientError, BotoCoreError
 
+from chuck_data.lazy_imports import LazyModule
+from chuck_data.clients.statement_waiter import (
+    REDSHIFT_PENDING_STATES,
+    REDSHIFT_QUEUED_STATES,
+    StatementWaiter,
+)
+
+# Imported on first use; see chuck_data.lazy_imports
+boto3 = LazyModule("boto3")
+
+# Tables per information_schema query in read_table_schemas. Keeps the IN
+# list well inside the Data API's 100 KB statement limit.
+READ_SCHEMAS_BATCH_SIZE = 500
+
+
+def _merge_result_pages(pages: Iterator[Dict]) -> Dict:
+    """Combine get_statement_result pages into one response with all Records."""
+    merged: Optional[Dict] = None
+    for page in pages:
+        if merged is None:
+            merged = dict(page)
+            merged["Records"] = list(page.get("Records", []))
+        else:
+            merged["Records"].extend(page.get("Records", []))
+    if merged is None:
+        return {"Records": []}
+    merged.pop("NextToken", None)
+    return merged
+
 
 class RedshiftAPIClient:
     """Reusable AWS Redshift API client for authentication and metadata operations."""
@@ -163,13 +193,26 @@ class RedshiftAPIClient:
             logging.debug(f"Connection error: {e}")
             raise ConnectionError(f"Connection error occurred: {e}")
 
-    def _wait_for_statement(self, statement_id: str, timeout: int = 300) -> Dict:
+    def _wait_for_statement(
+        self,
+        statement_id: str,
+        timeout: int = 300,
+        cancel_event: Optional[threading.Event] = None,
+        fetch_results: bool = True,
+    ) -> Dict:
         """
         Wait for SQL statement to complete.
 
+        Polls describe_statement with exponential backoff through the shared
+        StatementWaiter.
+
         Args:
             statement_id: Statement ID to wait for
             timeout: Maximum time to wait in seconds
+            cancel_event: Optional event that cancels the statement when set
+            fetch_results: Read every result page into "result". When False,
+                "result" is None and "has_result_set" tells the caller whether
+                iter_statement_records has rows to stream.
 
         Returns:
             Dictionary containing statement result
@@ -177,64 +220,82 @@ class RedshiftAPIClient:
         Raises:
             ValueError: If statement fails or times out
         """
-        start_time = time.time()
+        waiter = StatementWaiter(
+            pending_states=REDSHIFT_PENDING_STATES,
+            queued_states=REDSHIFT_QUEUED_STATES,
+            timeout=timeout,
+            cancel_event=cancel_event,
+        )
 
-        while True:
-            try:
-                response = self.redshift_data.describe_statement(Id=statement_id)
-                status = response["Status"]
-
-                if status == "FINISHED":
-                    # Check if statement has results (SELECT queries return results, DDL statements don't)
-                    has_result_set = response.get("HasResultSet", False)
-
-                    if has_result_set:
-                        # Get results for SELECT queries
-                        result = self.redshift_data.get_statement_result(
-                            Id=statement_id
+        try:
+            response = waiter.wait(
+                poll=lambda: self.redshift_data.describe_statement(Id=statement_id),
+                get_state=lambda r: r.get("Status"),
+                statement_id=statement_id,
+                cancel=lambda: self.redshift_data.cancel_statement(Id=statement_id),
+            )
+            status = response["Status"]
+
+            if status == "FINISHED":
+                # Check if statement has results (SELECT queries return results, DDL statements don't)
+                has_result_set = response.get("HasResultSet", False)
+
+                if not fetch_results:
+                    return {
+                        "statement_id": statement_id,
+                        "status": status,
+                        "result": None,
+                        "has_result_set": has_result_set,
+                    }
+
+                if has_result_set:
+                    # Get results for SELECT queries, following every page
+                    result = _merge_result_pages(
+                        self._iter_pages(
+                            self.redshift_data.get_statement_result, Id=statement_id
                         )
-                        return {
-                            "statement_id": statement_id,
-                            "status": status,
-                            "result": result,
-                        }
-                    else:
-                        # DDL statements (CREATE, DROP, INSERT, etc.) don't have results
-                        return {
-                            "statement_id": statement_id,
-                            "status": status,
-                            "result": None,
-                        }
-                elif status == "FAILED":
-                    error = response.get("Error", "Unknown error")
-                    raise ValueError(f"Statement failed: {error}")
-                elif status == "ABORTED":
-                    raise ValueError("Statement was aborted")
-
-                # Check timeout
-                if time.time() - start_time > timeout:
-                    raise ValueError(f"Statement timed out after {timeout} seconds")
-
-                # Wait before polling again
-                time.sleep(1)
-
-            except ClientError as e:
-                error_code = e.response.get("Error", {}).get("Code", "")
-                # ResourceNotFoundException means the query doesn't have results (DDL statement)
-                if error_code == "ResourceNotFoundException":
-                    # This is actually success for DDL statements
+                    )
                     return {
                         "statement_id": statement_id,
-                        "status": "FINISHED",
+                        "status": status,
+                        "result": result,
+                    }
+                else:
+                    # DDL statements (CREATE, DROP, INSERT, etc.) don't have results
+                    return {
+                        "statement_id": statement_id,
+                        "status": status,
                         "result": None,
                     }
-                logging.debug(f"Error waiting for statement: {e}")
-                raise ValueError(f"Error waiting for statement: {e}")
+            elif status == "FAILED":
+                error = response.get("Error", "Unknown error")
+                raise ValueError(f"Statement failed: {error}")
+            elif status == "ABORTED":
+                raise ValueError("Statement was aborted")
+
+            raise ValueError(f"Unexpected statement status: {status}")
+
+        except ClientError as e:
+            error_code = e.response.get("Error", {}).get("Code", "")
+            # ResourceNotFoundException means the query doesn't have results (DDL statement)
+            if error_code == "ResourceNotFoundException":
+                # This is actually success for DDL statements
+                return {
+                    "statement_id": statement_id,
+                    "status": "FINISHED",
+                    "result": None,
+                }
+            logging.debug(f"Error waiting for statement: {e}")
+            raise ValueError(f"Error waiting for statement: {e}")
 
     def get_statement_result(self, statement_id: str) -> Dict:
         """
         Retrieve query results for a statement.
 
+        Every page is read, following NextToken, and the Records of all pages
+        are combined into one response. Use iter_statement_records to process
+        large results in bounded memory instead.
+
         Args:
             statement_id: Statement ID to retrieve results for
 
@@ -242,11 +303,92 @@ class RedshiftAPIClient:
             Dictionary containing query results
         """
         try:
-            return self.redshift_data.get_statement_result(Id=statement_id)
+            return _merge_result_pages(
+                self._iter_pages(
+                    self.redshift_data.get_statement_result, Id=statement_id
+                )
+            )
+        except ClientError as e:
+            logging.debug(f"Error getting statement result: {e}")
+            raise ValueError(f"Error getting statement result: {e}")
+
+    def iter_statement_records(self, statement_id: str) -> Iterator[List[Dict]]:
+        """
+        Stream the rows of a finished statement page by page.
+
+        Result pages can only be requested in order (each NextToken comes from
+        the previous page), so the next page is fetched on a background thread
+        while the caller consumes the current one. At most two pages are held
+        in memory.
+
+        Args:
+            statement_id: Statement ID to read results for
+
+        Yields:
+            Each record as a list of Data API field dicts
+        """
+        executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="redshift-result-page"
+        )
+        try:
+            future = executor.submit(self._get_result_page, statement_id, None)
+            while future is not None:
+                page = future.result()
+                next_token = page.get("NextToken")
+                future = (
+                    executor.submit(self._get_result_page, statement_id, next_token)
+                    if next_token
+                    else None
+                )
+                yield from page.get("Records", [])
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def iter_sql_records(
+        self, sql: str, database: Optional[str] = None
+    ) -> Iterator[List[Dict]]:
+        """
+        Execute SQL and stream its result rows.
+
+        Args:
+            sql: SQL statement to execute
+            database: Database name (uses default if not specified)
+
+        Yields:
+            Each record as a list of Data API field dicts
+
+        Raises:
+            ValueError: If the statement fails
+        """
+        statement_id = self.execute_sql(sql, database=database, wait=False)[
+            "statement_id"
+        ]
+        status = self._wait_for_statement(statement_id, fetch_results=False)
+        if status.get("has_result_set"):
+            yield from self.iter_statement_records(statement_id)
+
+    def _get_result_page(self, statement_id: str, next_token: Optional[str]) -> Dict:
+        """Fetch one page of statement results."""
+        params = {"Id": statement_id}
+        if next_token:
+            params["NextToken"] = next_token
+        try:
+            return self.redshift_data.get_statement_result(**params)
         except ClientError as e:
             logging.debug(f"Error getting statement result: {e}")
             raise ValueError(f"Error getting statement result: {e}")
 
+    @staticmethod
+    def _iter_pages(operation: Callable[..., Dict], **params) -> Iterator[Dict]:
+        """Yield every page of a Data API call, following NextToken."""
+        while True:
+            page = operation(**params)
+            yield page
+            next_token = page.get("NextToken")
+            if not next_token:
+                return
+            params["NextToken"] = next_token
+
     #
     # Database/Schema/Table metadata methods (parallel to DatabricksAPIClient)
     #
@@ -278,9 +420,16 @@ class RedshiftAPIClient:
             elif self.workgroup_name:
                 params["WorkgroupName"] = self.workgroup_name
 
-            response = self.redshift_data.list_databases(**params)
             # Return in same format as Databricks for consistency
-            return {"databases": [{"name": db} for db in response.get("Databases", [])]}
+            return {
+                "databases": [
+                    {"name": name}
+                    for page in self._iter_pages(
+                        self.redshift_data.list_databases, **params
+                    )
+                    for name in page.get("Databases", [])
+                ]
+            }
 
         except ClientError as e:
             logging.debug(f"Error listing databases: {e}")
@@ -316,10 +465,15 @@ class RedshiftAPIClient:
             elif self.workgroup_name:
                 params["WorkgroupName"] = self.workgroup_name
 
-            response = self.redshift_data.list_schemas(**params)
             # Return in same format as Databricks for consistency
             return {
-                "schemas": [{"name": schema} for schema in response.get("Schemas", [])]
+                "schemas": [
+                    {"name": schema}
+                    for page in self._iter_pages(
+                        self.redshift_data.list_schemas, **params
+                    )
+                    for schema in page.get("Schemas", [])
+                ]
             }
 
         except ClientError as e:
@@ -350,6 +504,40 @@ class RedshiftAPIClient:
         Returns:
             Dictionary with "tables" key containing list of table metadata dictionaries
 
+        Raises:
+            ValueError: If an error occurs
+        """
+        # Note: omit_columns parameter is accepted for API compatibility with Databricks
+        # but has no effect since Redshift's list_tables API doesn't return column information
+
+        # Return in same format as Databricks for consistency
+        return {
+            "tables": list(
+                self.iter_tables(
+                    database=database,
+                    schema_pattern=schema_pattern,
+                    table_pattern=table_pattern,
+                )
+            )
+        }
+
+    def iter_tables(
+        self,
+        database: Optional[str] = None,
+        schema_pattern: Optional[str] = None,
+        table_pattern: Optional[str] = None,
+    ) -> Iterator[Dict]:
+        """
+        Stream table metadata one page at a time, following NextToken.
+
+        Args:
+            database: Database name (uses default if not specified)
+            schema_pattern: Schema pattern to filter (optional)
+            table_pattern: Table pattern to filter (optional)
+
+        Yields:
+            Table metadata dictionaries
+
         Raises:
             ValueError: If an error occurs
         """
@@ -371,12 +559,8 @@ class RedshiftAPIClient:
             if table_pattern:
                 params["TablePattern"] = table_pattern
 
-            # Note: omit_columns parameter is accepted for API compatibility with Databricks
-            # but has no effect since Redshift's list_tables API doesn't return column information
-
-            response = self.redshift_data.list_tables(**params)
-            # Return in same format as Databricks for consistency
-            return {"tables": response.get("Tables", [])}
+            for page in self._iter_pages(self.redshift_data.list_tables, **params):
+                yield from page.get("Tables", [])
 
         except ClientError as e:
             logging.debug(f"Error listing tables: {e}")
@@ -426,7 +610,15 @@ class RedshiftAPIClient:
             elif self.workgroup_name:
                 params["WorkgroupName"] = self.workgroup_name
 
-            response = self.redshift_data.describe_table(**params)
+            pages = self._iter_pages(self.redshift_data.describe_table, **params)
+            response = next(pages)
+            if response.get("NextToken"):
+                # Wide tables return their ColumnList across several pages
+                columns = list(response.get("ColumnList", []))
+                for page in pages:
+                    columns.extend(page.get("ColumnList", []))
+                response = {**response, "ColumnList": columns}
+                response.pop("NextToken", None)
             return response
 
         except ClientError as e:
@@ -436,6 +628,41 @@ class RedshiftAPIClient:
             logging.debug(f"Connection error: {e}")
             raise ConnectionError(f"Connection error occurred: {e}")
 
+    def get_table_column_signatures(
+        self, database: Optional[str], schema: str
+    ) -> Dict[str, str]:
+        """
+        Get a column signature for every table in a schema with one query.
+
+        Reads pg_table_def, which only covers schemas on the search_path;
+        tables it cannot see are simply absent from the result.
+
+        Args:
+            database: Database name (uses default if not specified)
+            schema: Schema name
+
+        Returns:
+            Mapping of table name to a hash of its ordered column names and types
+        """
+        query = f"""
+        SELECT tablename, "column", type
+        FROM pg_table_def
+        WHERE schemaname = '{schema}'
+        """
+        result = self.execute_sql(query, database=database)
+        rows = (result.get("result") or {}).get("Records", [])
+
+        columns_by_table: Dict[str, List[str]] = {}
+        for row in rows:
+            table_name = row[0]["stringValue"]
+            columns_by_table.setdefault(table_name, []).append(
+                f"{row[1]['stringValue']}:{row[2]['stringValue']}"
+            )
+        return {
+            table_name: hashlib.sha256("\n".join(columns).encode("utf-8")).hexdigest()
+            for table_name, columns in columns_by_table.items()
+        }
+
     #
     # S3 operations (for Spark-Redshift connector)
     #
@@ -507,30 +734,26 @@ class RedshiftAPIClient:
             """
 
             logging.info(f"Reading semantic tags with query: {query}")
-            result = self.execute_sql(query, database=database)
-            logging.info(
-                f"Query result structure: {result.keys() if result else 'None'}"
-            )
-            logging.info(f"Full result: {result}")
-
-            if not result.get("result"):
-                logging.warning(f"No 'result' key in response: {result}")
+            statement_id = self.execute_sql(query, database=database, wait=False)[
+                "statement_id"
+            ]
+            status = self._wait_for_statement(statement_id, fetch_results=False)
+            if not status.get("has_result_set"):
+                logging.warning(f"No result set for semantic_tags query: {status}")
                 return {
                     "success": False,
                     "error": "No results returned from semantic_tags query",
                 }
 
-            rows = result["result"].get("Records", [])
-            logging.info(f"Found {len(rows)} rows in semantic_tags table")
-            tags = []
-            for row in rows:
-                tags.append(
-                    {
-                        "table": row[0]["stringValue"],
-                        "column": row[1]["stringValue"],
-                        "semantic": row[2]["stringValue"],
-                    }
-                )
+            # Stream the rows so large tag tables are never held as raw pages
+            tags = [
+                {
+                    "table": row[0]["stringValue"],
+                    "column": row[1]["stringValue"],
+                    "semantic": row[2]["stringValue"],
+                }
+                for row in self.iter_statement_records(statement_id)
+            ]
 
             logging.info(f"Successfully parsed {len(tags)} semantic tags")
             return {"success": True, "tags": tags}
@@ -547,6 +770,10 @@ class RedshiftAPIClient:
     ) -> Dict[str, Any]:
         """Read table schemas from Redshift to get all column definitions.
 
+        Columns for all tagged tables are read with one information_schema
+        query per READ_SCHEMAS_BATCH_SIZE tables, and tags are joined through
+        a (table, column) index.
+
         Args:
             database: Database name
             schema_name: Schema name
@@ -556,46 +783,44 @@ class RedshiftAPIClient:
             Dict with 'success': bool, 'tables': list of table dicts or 'error': str
         """
         try:
-            table_names = list(set(tag["table"] for tag in semantic_tags))
+            # Keep tables in first-tagged order
+            table_names = list(dict.fromkeys(tag["table"] for tag in semantic_tags))
+            tag_index = {
+                (tag["table"], tag["column"]): tag["semantic"]
+                for tag in reversed(semantic_tags)
+            }
 
-            tables = []
-            for table_name in table_names:
-                logging.debug(f"Reading schema for {table_name}...")
+            columns_by_table: Dict[str, List[Dict[str, Any]]] = {}
+            for i in range(0, len(table_names), READ_SCHEMAS_BATCH_SIZE):
+                batch = table_names[i : i + READ_SCHEMAS_BATCH_SIZE]
+                table_list = ", ".join(f"'{name}'" for name in batch)
+                logging.debug(f"Reading schemas for {len(batch)} tables...")
 
                 query = f"""
-                SELECT column_name, data_type
+                SELECT table_name, column_name, data_type
                 FROM information_schema.columns
                 WHERE table_schema = '{schema_name}'
-                AND table_name = '{table_name}'
-                ORDER BY ordinal_position
+                AND table_name IN ({table_list})
+                ORDER BY table_name, ordinal_position
                 """
 
-                result = self.execute_sql(query, database=database)
-
-                if not result.get("result"):
-                    logging.warning(f"No columns found for {table_name}")
-                    continue
-
-                rows = result["result"].get("Records", [])
-                columns = []
-                for row in rows:
-                    col_name = row[0]["stringValue"]
-                    col_type = row[1]["stringValue"]
-
-                    semantic = None
-                    for tag in semantic_tags:
-                        if tag["table"] == table_name and tag["column"] == col_name:
-                            semantic = tag["semantic"]
-                            break
-
-                    columns.append(
+                for row in self.iter_sql_records(query, database=database):
+                    table_name = row[0]["stringValue"]
+                    col_name = row[1]["stringValue"]
+                    columns_by_table.setdefault(table_name, []).append(
                         {
                             "name": col_name,
-                            "type": col_type,
-                            "semantic": semantic,
+                            "type": row[2]["stringValue"],
+                            "semantic": tag_index.get((table_name, col_name)),
                         }
                     )
 
+            tables = []
+            for table_name in table_names:
+                columns = columns_by_table.get(table_name)
+                if not columns:
+                    logging.warning(f"No columns found for {table_name}")
+                    continue
                 tables.append({"table_name": table_name, "columns": columns})
 
             return {"success": True, "tables": tables}
@@ -8,13 +8,39 @@ RedshiftAPIClient.
 Supports both password and key-pair (RSA) authentication.
 """
 
+import concurrent.futures
 import logging
+import threading
 import time
 from typing import Dict, List, Optional, Any
 
+from chuck_data.clients.snowflake_pool import DEFAULT_POOL_SIZE, SnowflakeConnectionPool
+
 logger = logging.getLogger(__name__)
 
 
+def _configured_tag_discovery_account_usage() -> bool:
+    """Read whether tag discovery should try ACCOUNT_USAGE first."""
+    try:
+        from chuck_data.config import get_snowflake_tag_discovery_account_usage
+
+        return get_snowflake_tag_discovery_account_usage()
+    except Exception as e:
+        logger.debug(f"Could not read Snowflake tag discovery setting: {e}")
+        return False
+
+
+def _configured_pool_size() -> int:
+    """Read the Snowflake pool size from config, falling back to the default."""
+    try:
+        from chuck_data.config import get_snowflake_pool_size
+
+        return get_snowflake_pool_size() or DEFAULT_POOL_SIZE
+    except Exception as e:
+        logger.debug(f"Could not read Snowflake pool size from config: {e}")
+        return DEFAULT_POOL_SIZE
+
+
 class SnowflakeAPIClient:
     """Reusable Snowflake API client for authentication and metadata operations."""
 
@@ -28,6 +54,7 @@ class SnowflakeAPIClient:
         role: Optional[str] = None,
         password: Optional[str] = None,
         private_key_path: Optional[str] = None,
+        pool_size: Optional[int] = None,
     ):
         """
         Initialize the Snowflake API client.
@@ -42,6 +69,8 @@ class SnowflakeAPIClient:
             password: Plain-text password (mutually exclusive with private_key_path)
             private_key_path: Path to an unencrypted RSA private key PEM file
                               (mutually exclusive with password)
+            pool_size: Maximum number of pooled connections (defaults to the
+                       snowflake_pool_size config value, then 8)
 
         Note:
             Either password or private_key_path must be provided.
@@ -60,25 +89,25 @@ class SnowflakeAPIClient:
         self._password = password
         self._private_key_path = private_key_path
 
-        # Lazy connection — created on first use
-        self._conn = None
+        # Lazy connection pool — connections are opened on first use
+        self._pool_size = pool_size
+        self._pool: Optional[SnowflakeConnectionPool] = None
+        self._pool_lock = threading.Lock()
 
     def close(self):
-        """Explicitly close the Snowflake connection.
+        """Explicitly close the pooled Snowflake connections.
 
         Call this before process exit so the Snowflake connector's atexit
-        handler sees an already-closed connection and skips the network
+        handler sees already-closed connections and skips the network
         teardown call — preventing a noisy KeyboardInterrupt traceback
         on Ctrl+C.
         """
-        if self._conn is not None:
+        pool = getattr(self, "_pool", None)
+        if pool is not None:
             try:
-                if not self._conn.is_closed():
-                    self._conn.close()
+                pool.close()
             except Exception:
                 pass
-            finally:
-                self._conn = None
 
     def __del__(self):
         self.close()
@@ -144,24 +173,40 @@ class SnowflakeAPIClient:
 
         return conn
 
-    def _get_connection(self):
-        """Return the current connection, creating one if it doesn't exist or is closed."""
-        if self._conn is None or self._conn.is_closed():
-            self._conn = self._connect()
-        return self._conn
+    def _get_pool(self) -> SnowflakeConnectionPool:
+        """Return the connection pool, creating it on first use."""
+        if self._pool is None:
+            with self._pool_lock:
+                if self._pool is None:
+                    self._pool = SnowflakeConnectionPool(
+                        self._connect,
+                        max_size=self._pool_size or _configured_pool_size(),
+                        database=self.database,
+                    )
+        return self._pool
+
+    def _connection(self):
+        """Check out a pooled connection for the current thread.
+
+        Use as ``with self._connection() as conn:``. Nested calls on the same
+        thread share one connection.
+        """
+        return self._get_pool().connection()
+
+    def pool_stats(self) -> Dict[str, int]:
+        """Connection pool counters (opened, reused, discarded, reaped, ...)."""
+        return self._get_pool().stats()
 
     def _execute(self, sql: str, database: Optional[str] = None) -> List[Dict]:
         """Execute SQL and return results as a list of dicts."""
         import snowflake.connector
 
-        conn = self._get_connection()
-        effective_sql = sql
-        if database:
-            effective_sql = f"USE DATABASE {database}; {sql}"
         try:
-            cursor = conn.cursor(snowflake.connector.DictCursor)
-            cursor.execute(sql)
-            return cursor.fetchall()
+            with self._connection() as conn:
+                with conn.cursor(snowflake.connector.DictCursor) as cursor:
+                    conn.use_database(cursor, database)
+                    conn.execute(cursor, sql)
+                    return cursor.fetchall()
         except Exception as e:
             logger.debug(f"Snowflake SQL error: {e}")
             raise
@@ -177,8 +222,8 @@ class SnowflakeAPIClient:
             True if connection is valid, False otherwise
         """
         try:
-            self._get_connection()
-            return True
+            with self._connection():
+                return True
         except Exception as e:
             logger.debug(f"Snowflake connection validation failed: {e}")
             return False
@@ -195,7 +240,8 @@ class SnowflakeAPIClient:
 
         Args:
             sql: SQL statement to execute
-            database: Database context to USE before executing (optional)
+            database: Database context to USE before executing (optional;
+                      skipped when the pooled session already uses it)
             wait: Accepted for API parity with RedshiftAPIClient; Snowflake connector
                   is synchronous so this parameter has no effect.
 
@@ -208,18 +254,19 @@ class SnowflakeAPIClient:
         """
         import snowflake.connector
 
-        conn = self._get_connection()
         try:
-            with conn.cursor(snowflake.connector.DictCursor) as cursor:
-                if database:
-                    cursor.execute(f"USE DATABASE {database}")
-                cursor.execute(sql)
-                rows = cursor.fetchall()
-                return {
-                    "statement_id": str(cursor.sfqid),
-                    "status": "FINISHED",
-                    "result": {"Records": rows} if rows else None,
-                }
+            with self._connection() as conn:
+                with conn.cursor(snowflake.connector.DictCursor) as cursor:
+                    # The session keeps its database between statements, so
+                    # USE DATABASE is only sent when the context changes
+                    conn.use_database(cursor, database)
+                    conn.execute(cursor, sql)
+                    rows = cursor.fetchall()
+                    return {
+                        "statement_id": str(cursor.sfqid),
+                        "status": "FINISHED",
+                        "result": {"Records": rows} if rows else None,
+                    }
         except Exception as e:
             logger.debug(f"Snowflake SQL execution error: {e}")
             raise ValueError(f"Snowflake SQL execution failed: {e}")
@@ -238,10 +285,10 @@ class SnowflakeAPIClient:
         try:
             import snowflake.connector
 
-            conn = self._get_connection()
-            with conn.cursor(snowflake.connector.DictCursor) as cursor:
-                cursor.execute("SHOW DATABASES")
-                rows = cursor.fetchall()
+            with self._connection() as conn:
+                with conn.cursor(snowflake.connector.DictCursor) as cursor:
+                    cursor.execute("SHOW DATABASES")
+                    rows = cursor.fetchall()
             return {"databases": [{"name": row["name"]} for row in rows]}
         except Exception as e:
             logger.debug(f"Error listing Snowflake databases: {e}")
@@ -261,10 +308,10 @@ class SnowflakeAPIClient:
 
         db = database or self.database
         try:
-            conn = self._get_connection()
-            with conn.cursor(snowflake.connector.DictCursor) as cursor:
-                cursor.execute(f"SHOW SCHEMAS IN DATABASE {db}")
-                rows = cursor.fetchall()
+            with self._connection() as conn:
+                with conn.cursor(snowflake.connector.DictCursor) as cursor:
+                    cursor.execute(f"SHOW SCHEMAS IN DATABASE {db}")
+                    rows = cursor.fetchall()
             return {"schemas": [{"name": row["name"]} for row in rows]}
         except Exception as e:
             logger.debug(f"Error listing Snowflake schemas: {e}")
@@ -293,13 +340,13 @@ class SnowflakeAPIClient:
 
         db = database or self.database
         try:
-            conn = self._get_connection()
-            with conn.cursor(snowflake.connector.DictCursor) as cursor:
-                if schema_pattern:
-                    cursor.execute(f"SHOW TABLES IN SCHEMA {db}.{schema_pattern}")
-                else:
-                    cursor.execute(f"SHOW TABLES IN DATABASE {db}")
-                rows = cursor.fetchall()
+            with self._connection() as conn:
+                with conn.cursor(snowflake.connector.DictCursor) as cursor:
+                    if schema_pattern:
+                        cursor.execute(f"SHOW TABLES IN SCHEMA {db}.{schema_pattern}")
+                    else:
+                        cursor.execute(f"SHOW TABLES IN DATABASE {db}")
+                    rows = cursor.fetchall()
             return {"tables": rows}
         except Exception as e:
             logger.debug(f"Error listing Snowflake tables: {e}")
@@ -329,10 +376,10 @@ class SnowflakeAPIClient:
 
         db = database or self.database
         try:
-            conn = self._get_connection()
-            with conn.cursor(snowflake.connector.DictCursor) as cursor:
-                cursor.execute(f"DESCRIBE TABLE {db}.{schema}.{table}")
-                columns = cursor.fetchall()
+            with self._connection() as conn:
+                with conn.cursor(snowflake.connector.DictCursor) as cursor:
+                    cursor.execute(f"DESCRIBE TABLE {db}.{schema}.{table}")
+                    columns = cursor.fetchall()
             return {
                 "database": db,
                 "schema": schema,
@@ -343,6 +390,35 @@ class SnowflakeAPIClient:
             logger.debug(f"Error describing Snowflake table: {e}")
             raise ValueError(f"Error describing {db}.{schema}.{table}: {e}")
 
+    def get_table_last_altered(
+        self, database: Optional[str], schema: str
+    ) -> Dict[str, str]:
+        """
+        Get LAST_ALTERED for every table in a schema with one query.
+
+        Args:
+            database: Database name (uses default if not specified)
+            schema: Schema name
+
+        Returns:
+            Mapping of table name to its LAST_ALTERED timestamp as a string
+        """
+        import snowflake.connector
+
+        db = database or self.database
+        try:
+            with self._connection() as conn:
+                with conn.cursor(snowflake.connector.DictCursor) as cursor:
+                    cursor.execute(
+                        f"SELECT TABLE_NAME, LAST_ALTERED FROM {db}.INFORMATION_SCHEMA.TABLES "
+                        f"WHERE TABLE_SCHEMA = '{schema}'"
+                    )
+                    rows = cursor.fetchall()
+            return {row["TABLE_NAME"]: str(row["LAST_ALTERED"]) for row in rows}
+        except Exception as e:
+            logger.debug(f"Error reading Snowflake LAST_ALTERED: {e}")
+            raise ValueError(f"Error reading table change times in {db}: {e}")
+
     #
     # Semantic tag metadata (metadata table workaround — Snowflake lacks Spark-visible column tags)
     #
@@ -430,31 +506,111 @@ class SnowflakeAPIClient:
             }
 
     def read_snowflake_semantic_tags(
-        self, database: str, schema: str
+        self, database: str, schema: str, use_account_usage: Optional[bool] = None
     ) -> Dict[str, Any]:
         """Read semantic tags from native Snowflake column tags for Stitch manifest generation.
 
-        Queries INFORMATION_SCHEMA.TAG_REFERENCES to find all columns in the schema
-        that have the `semantic_type` tag applied (via chuck's bulk tagging).
+        Finds all columns in the schema that have the `semantic_type` tag
+        applied (via chuck's bulk tagging) using one of two strategies:
+
+        - ``account_usage``: a single query against
+          SNOWFLAKE.ACCOUNT_USAGE.TAG_REFERENCES. Needs a role that can read
+          the SNOWFLAKE database, and the view lags tag changes by up to two
+          hours, so it is opt-in (use_account_usage or the
+          snowflake_tag_discovery_account_usage config flag).
+        - ``per_table``: SHOW TABLES, then one TAG_REFERENCES_ALL_COLUMNS call
+          per table, run concurrently over the connection pool. Always current
+          and works across all editions and privilege levels.
+
+        The account_usage strategy falls back to per_table when the view is
+        not accessible or returns no rows.
 
         Args:
             database: Snowflake database name
             schema: Snowflake schema name
+            use_account_usage: Try the ACCOUNT_USAGE view first (defaults to
+                the config flag)
 
         Returns:
             Dict with 'success': bool, 'tags': list of
-            {'table': str, 'column': str, 'semantic': str} or 'error': str
+            {'table': str, 'column': str, 'semantic': str}, 'strategy' and
+            'elapsed_seconds', or 'error': str
         """
-        # Use TAG_REFERENCES_ALL_COLUMNS per table — works across all Snowflake editions
-        # and privilege levels. We first list tables in the schema, then for each table
-        # query which columns have the SEMANTIC_TYPE tag applied.
+        if use_account_usage is None:
+            use_account_usage = _configured_tag_discovery_account_usage()
+
+        started = time.monotonic()
+        try:
+            tags = None
+            strategy = "account_usage"
+            if use_account_usage:
+                tags = self._read_semantic_tags_from_account_usage(database, schema)
+            if not tags:
+                strategy = "per_table"
+                tags = self._read_semantic_tags_per_table(database, schema)
+
+            elapsed = time.monotonic() - started
+            logger.debug(
+                f"Read {len(tags)} semantic tags from {database}.{schema} "
+                f"via {strategy} in {elapsed:.2f}s"
+            )
+            return {
+                "success": True,
+                "tags": tags,
+                "strategy": strategy,
+                "elapsed_seconds": elapsed,
+            }
+        except Exception as e:
+            logger.error(f"Error reading Snowflake semantic tags: {e}", exc_info=True)
+            return {
+                "success": False,
+                "error": f"Failed to read semantic tags: {str(e)}",
+            }
+
+    def _read_semantic_tags_from_account_usage(
+        self, database: str, schema: str
+    ) -> Optional[List[Dict[str, str]]]:
+        """One-query tag discovery; returns None when the view is not readable."""
         import snowflake.connector
 
-        tags: list = []
+        sql = f"""
+        SELECT OBJECT_NAME, COLUMN_NAME, TAG_VALUE
+        FROM SNOWFLAKE.ACCOUNT_USAGE.TAG_REFERENCES
+        WHERE TAG_DATABASE = '{database.upper()}'
+          AND TAG_SCHEMA = '{schema.upper()}'
+          AND TAG_NAME = 'SEMANTIC_TYPE'
+          AND OBJECT_DATABASE = '{database.upper()}'
+          AND OBJECT_SCHEMA = '{schema.upper()}'
+          AND DOMAIN = 'COLUMN'
+          AND OBJECT_DELETED IS NULL
+        """
         try:
-            conn = self._get_connection()
+            with self._connection() as conn:
+                with conn.cursor(snowflake.connector.DictCursor) as cur:
+                    cur.execute(sql)
+                    rows = cur.fetchall()
+        except Exception as e:
+            logger.debug(f"ACCOUNT_USAGE.TAG_REFERENCES not available: {e}")
+            return None
+
+        return [
+            {
+                "table": row.get("OBJECT_NAME") or "",
+                "column": row.get("COLUMN_NAME") or "",
+                "semantic": row.get("TAG_VALUE") or "",
+            }
+            for row in rows
+            if row.get("COLUMN_NAME")
+        ]
 
-            # Step 1: list tables in the schema
+    def _read_semantic_tags_per_table(
+        self, database: str, schema: str
+    ) -> List[Dict[str, str]]:
+        """Tag discovery with one TAG_REFERENCES_ALL_COLUMNS call per table."""
+        import snowflake.connector
+
+        # Step 1: list tables in the schema
+        with self._connection() as conn:
             with conn.cursor(snowflake.connector.DictCursor) as cur:
                 cur.execute(f"SHOW TABLES IN SCHEMA {database}.{schema}")
                 tables = [
@@ -463,33 +619,37 @@ class SnowflakeAPIClient:
                     if row.get("name") or row.get("NAME")
                 ]
 
-            # Step 2: for each table query TAG_REFERENCES_ALL_COLUMNS
-            for tbl in tables:
-                try:
+        # Step 2: query TAG_REFERENCES_ALL_COLUMNS for every table, each
+        # worker on its own pooled connection
+        def table_tags(tbl: str) -> List[Dict[str, str]]:
+            try:
+                with self._connection() as conn:
                     with conn.cursor(snowflake.connector.DictCursor) as cur:
                         cur.execute(
                             f"SELECT OBJECT_NAME, COLUMN_NAME, TAG_VALUE "
-                            f"FROM TABLE(INFORMATION_SCHEMA.TAG_REFERENCES_ALL_COLUMNS("
+                            f"FROM TABLE({database}.INFORMATION_SCHEMA.TAG_REFERENCES_ALL_COLUMNS("
                             f"'{database}.{schema}.{tbl}', 'TABLE')) "
                             f"WHERE TAG_NAME = 'SEMANTIC_TYPE'"
                         )
-                        for row in cur.fetchall():
-                            col = row.get("COLUMN_NAME") or row.get("column_name") or ""
-                            sem = row.get("TAG_VALUE") or row.get("tag_value") or ""
-                            if col:
-                                tags.append(
-                                    {"table": tbl, "column": col, "semantic": sem}
-                                )
-                except Exception as tbl_err:
-                    logger.debug(f"No tags on {tbl} (or inaccessible): {tbl_err}")
-
-            return {"success": True, "tags": tags}
-        except Exception as e:
-            logger.error(f"Error reading Snowflake semantic tags: {e}", exc_info=True)
-            return {
-                "success": False,
-                "error": f"Failed to read semantic tags: {str(e)}",
-            }
+                        rows = cur.fetchall()
+            except Exception as tbl_err:
+                logger.debug(f"No tags on {tbl} (or inaccessible): {tbl_err}")
+                return []
+            found = []
+            for row in rows:
+                col = row.get("COLUMN_NAME") or row.get("column_name") or ""
+                sem = row.get("TAG_VALUE") or row.get("tag_value") or ""
+                if col:
+                    found.append({"table": tbl, "column": col, "semantic": sem})
+            return found
+
+        if not tables:
+            return []
+        max_workers = min(len(tables), self._get_pool().max_size)
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+            # map keeps SHOW TABLES order in the result
+            per_table = list(executor.map(table_tags, tables))
+        return [tag for found in per_table for tag in found]
 
     def read_table_schemas_for_stitch(
         self, database: str, schema: str, tagged_tables: list
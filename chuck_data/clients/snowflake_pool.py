@@ -0,0 +1,259 @@
+"""
+Bounded, thread-safe connection pool for the Snowflake connector.
+
+SnowflakeAPIClient used to share one connector connection between every
+caller, so the PII scan's worker threads queued behind a single session. This
+pool hands each thread its own connection for the duration of a call, reuses
+idle connections instead of re-authenticating, drops connections that fail a
+health check and closes ones that have sat idle for too long.
+
+Connections are opened with the client's database, schema, warehouse and role
+as connect parameters, so the session context is set once per connection. The
+pool also remembers which database each session currently uses so callers only
+issue ``USE DATABASE`` when it actually changes; a caller's own ``USE``
+statement makes the pool forget it, so the next call resets the context.
+"""
+
+import logging
+import re
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+# Connections the pool keeps open at most. Sized to match the default PII scan
+# metadata concurrency so parallel describe_table calls do not queue.
+DEFAULT_POOL_SIZE = 8
+
+# Seconds a connection may sit idle before the pool closes it
+DEFAULT_IDLE_TIMEOUT = 300.0
+
+# Idle connections older than this are probed with SELECT 1 before reuse
+DEFAULT_HEALTH_CHECK_AFTER = 60.0
+
+# Seconds a caller waits for a free connection before giving up
+DEFAULT_CHECKOUT_TIMEOUT = 120.0
+
+# Statements that change the session context (USE DATABASE, USE SCHEMA, ...),
+# allowing for leading whitespace and SQL comments
+_USE_STATEMENT = re.compile(r"^(\s|--[^\n]*(\n|$)|/\*.*?\*/)*USE\b", re.I | re.S)
+
+
+class PooledConnection:
+    """A pooled connector connection plus the session state the pool tracks."""
+
+    def __init__(self, raw: Any, database: Optional[str] = None):
+        self.raw = raw
+        self.database = database
+        self.last_used = time.monotonic()
+
+    def cursor(self, *args, **kwargs):
+        """Open a cursor on the underlying connection."""
+        return self.raw.cursor(*args, **kwargs)
+
+    def is_closed(self) -> bool:
+        return self.raw.is_closed()
+
+    def use_database(self, cursor, database: Optional[str]):
+        """Switch the session's database only when it differs from the current one."""
+        if database and database != self.database:
+            cursor.execute(f"USE DATABASE {database}")
+            self.database = database
+
+    def execute(self, cursor, sql: str):
+        """Run a caller's statement, forgetting the tracked database if it may change it."""
+        if _USE_STATEMENT.match(sql):
+            # The session context is no longer known, so the next call that
+            # names a database issues USE again
+            self.database = None
+        return cursor.execute(sql)
+
+    def close(self):
+        try:
+            if not self.raw.is_closed():
+                self.raw.close()
+        except Exception:
+            pass
+
+
+class SnowflakeConnectionPool:
+    """Per-thread checkout of a bounded set of Snowflake connections."""
+
+    def __init__(
+        self,
+        connect: Callable[[], Any],
+        max_size: int = DEFAULT_POOL_SIZE,
+        database: Optional[str] = None,
+        idle_timeout: float = DEFAULT_IDLE_TIMEOUT,
+        health_check_after: float = DEFAULT_HEALTH_CHECK_AFTER,
+        checkout_timeout: float = DEFAULT_CHECKOUT_TIMEOUT,
+    ):
+        """
+        Args:
+            connect: Opens a new connector connection with the session context
+            max_size: Maximum number of open connections
+            database: Database the connections are opened with
+            idle_timeout: Seconds after which an idle connection is closed
+            health_check_after: Idle seconds after which a connection is
+                probed before being handed out again
+            checkout_timeout: Seconds to wait for a free connection
+        """
+        if max_size < 1:
+            raise ValueError("max_size must be at least 1")
+
+        self._connect = connect
+        self.max_size = max_size
+        self.database = database
+        self.idle_timeout = idle_timeout
+        self.health_check_after = health_check_after
+        self.checkout_timeout = checkout_timeout
+
+        self._idle: List[PooledConnection] = []
+        self._open = 0
+        self._closed = False
+        self._cond = threading.Condition()
+        self._local = threading.local()
+        self._stats = {"opened": 0, "reused": 0, "discarded": 0, "reaped": 0}
+
+    @contextmanager
+    def connection(self) -> Iterator[PooledConnection]:
+        """
+        Check out a connection for the current thread.
+
+        Nested use on the same thread returns the connection the thread
+        already holds, so helpers that call other client methods never wait
+        on the pool for a second connection.
+        """
+        held = getattr(self._local, "conn", None)
+        if held is not None:
+            self._local.depth += 1
+            try:
+                yield held
+            finally:
+                self._local.depth -= 1
+            return
+
+        conn = self._acquire()
+        self._local.conn = conn
+        self._local.depth = 1
+        broken = False
+        try:
+            yield conn
+        except Exception:
+            broken = conn.is_closed()
+            raise
+        finally:
+            self._local.conn = None
+            self._local.depth = 0
+            self._release(conn, broken=broken)
+
+    def stats(self) -> Dict[str, int]:
+        """Counters for connections opened, reused, discarded and reaped."""
+        with self._cond:
+            return {
+                **self._stats,
+                "open": self._open,
+                "idle": len(self._idle),
+                "in_use": self._open - len(self._idle),
+            }
+
+    def close(self):
+        """Close every idle connection; checked-out ones close on release."""
+        with self._cond:
+            self._closed = True
+            idle, self._idle = self._idle, []
+            self._open -= len(idle)
+            self._cond.notify_all()
+        for conn in idle:
+            conn.close()
+
+    def _acquire(self) -> PooledConnection:
+        deadline = time.monotonic() + self.checkout_timeout
+        while True:
+            with self._cond:
+                if self._closed:
+                    # A closed client reopens lazily, as the single connection did
+                    self._closed = False
+                stale = self._reap_idle_locked()
+                candidate = self._idle.pop() if self._idle else None
+                open_new = candidate is None and self._open < self.max_size
+                if open_new:
+                    self._open += 1
+                    self._stats["opened"] += 1
+                elif candidate is None:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        raise TimeoutError(
+                            f"No Snowflake connection available after {self.checkout_timeout}s"
+                        )
+                    self._cond.wait(remaining)
+                    continue
+
+            for conn in stale:
+                conn.close()
+            if open_new:
+                break
+
+            assert candidate is not None
+            if self._healthy(candidate):
+                with self._cond:
+                    self._stats["reused"] += 1
+                return candidate
+            candidate.close()
+            with self._cond:
+                self._open -= 1
+                self._stats["discarded"] += 1
+                self._cond.notify()
+
+        # Open the new connection outside the lock; authentication is slow
+        try:
+            return PooledConnection(self._connect(), database=self.database)
+        except Exception:
+            with self._cond:
+                self._open -= 1
+                self._stats["opened"] -= 1
+                self._cond.notify()
+            raise
+
+    def _release(self, conn: PooledConnection, broken: bool = False):
+        with self._cond:
+            if broken or self._closed or conn.is_closed():
+                self._open -= 1
+                self._stats["discarded"] += 1
+                discard = True
+            else:
+                conn.last_used = time.monotonic()
+                self._idle.append(conn)
+                discard = False
+            self._cond.notify()
+        if discard:
+            conn.close()
+
+    def _healthy(self, conn: PooledConnection) -> bool:
+        """Cheap closed check, plus a SELECT 1 probe for long-idle sessions."""
+        try:
+            if conn.is_closed():
+                return False
+            if time.monotonic() - conn.last_used < self.health_check_after:
+                return True
+            with conn.cursor() as cursor:
+                cursor.execute("SELECT 1")
+                cursor.fetchall()
+            return True
+        except Exception as e:
+            logging.debug(f"Discarding unhealthy Snowflake connection: {e}")
+            return False
+
+    def _reap_idle_locked(self) -> List[PooledConnection]:
+        """Remove connections idle longer than idle_timeout and return them.
+
+        The caller holds the lock and closes the returned connections after
+        releasing it.
+        """
+        now = time.monotonic()
+        stale = [c for c in self._idle if now - c.last_used > self.idle_timeout]
+        if stale:
+            self._idle = [c for c in self._idle if c not in stale]
+            self._open -= len(stale)
+            self._stats["reaped"] += len(stale)
+        return stale
@@ -0,0 +1,256 @@
+"""
+Shared waiter for asynchronous SQL statements.
+
+Databricks SQL Statement Execution and the Redshift Data API both hand back a
+statement ID that has to be polled until it reaches a terminal state. Instead
+of every caller sleeping a fixed second between polls, they all go through
+StatementWaiter, which:
+
+- takes whatever state the submit call already returned (Databricks waits
+  server-side for ``wait_timeout`` before answering),
+- polls with exponential backoff plus jitter so fast statements finish fast
+  and long statements don't hammer the API,
+- enforces an optional deadline and supports cancellation via a
+  threading.Event, calling a provider-specific cancel hook in both cases,
+- records how long each statement was queued, running, and how much time
+  was spent on the polling round trips themselves.
+"""
+
+import logging
+import random
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Callable, Deque, Iterable, List, Optional
+
+# Databricks SQL Statement Execution API states
+DATABRICKS_PENDING_STATES = ("PENDING", "RUNNING")
+DATABRICKS_QUEUED_STATES = ("PENDING",)
+
+# Redshift Data API states
+REDSHIFT_PENDING_STATES = ("SUBMITTED", "PICKED", "STARTED")
+REDSHIFT_QUEUED_STATES = ("SUBMITTED", "PICKED")
+
+# Number of completed statements kept for inspection
+_TIMINGS_HISTORY = 200
+
+
+def databricks_statement_state(response: Any) -> Optional[str]:
+    """Extract the state from a Databricks statement response."""
+    return response.get("status", {}).get("state", response.get("state"))
+
+
+class StatementTimeoutError(ValueError):
+    """Raised when a statement does not finish before its deadline."""
+
+
+class StatementCancelledError(Exception):
+    """Raised when waiting is cancelled through the waiter's cancel event."""
+
+
+@dataclass
+class StatementTimings:
+    """Where the wall-clock time of one statement went."""
+
+    statement_id: Optional[str]
+    final_state: Optional[str] = None
+    queued_seconds: float = 0.0
+    running_seconds: float = 0.0
+    polling_seconds: float = 0.0
+    sleep_seconds: float = 0.0
+    polls: int = 0
+    total_seconds: float = 0.0
+
+
+_recent_timings: Deque[StatementTimings] = deque(maxlen=_TIMINGS_HISTORY)
+_timings_lock = threading.Lock()
+
+
+def get_recent_statement_timings() -> List[StatementTimings]:
+    """Return timings for recently completed statements, oldest first."""
+    with _timings_lock:
+        return list(_recent_timings)
+
+
+def clear_statement_timings() -> None:
+    """Forget all recorded statement timings."""
+    with _timings_lock:
+        _recent_timings.clear()
+
+
+def _record_timings(timings: StatementTimings) -> None:
+    with _timings_lock:
+        _recent_timings.append(timings)
+    logging.debug(
+        f"Statement {timings.statement_id} {timings.final_state}: "
+        f"queued={timings.queued_seconds:.2f}s running={timings.running_seconds:.2f}s "
+        f"polling={timings.polling_seconds:.2f}s over {timings.polls} polls "
+        f"total={timings.total_seconds:.2f}s"
+    )
+
+
+class BackoffSchedule:
+    """Exponential backoff with proportional jitter."""
+
+    def __init__(
+        self,
+        initial_delay: float = 0.1,
+        max_delay: float = 5.0,
+        multiplier: float = 2.0,
+        jitter: float = 0.2,
+    ):
+        """
+        Args:
+            initial_delay: Delay before the second poll, in seconds
+            max_delay: Upper bound for any single delay, in seconds
+            multiplier: Growth factor between consecutive delays
+            jitter: Fraction of each delay randomised in both directions
+        """
+        self.initial_delay = initial_delay
+        self.max_delay = max_delay
+        self.multiplier = multiplier
+        self.jitter = jitter
+
+    def delay(self, attempt: int) -> float:
+        """Return the delay to sleep before poll number ``attempt + 1``."""
+        base = min(self.max_delay, self.initial_delay * (self.multiplier**attempt))
+        if self.jitter:
+            base *= random.uniform(1 - self.jitter, 1 + self.jitter)
+        return max(0.0, min(base, self.max_delay))
+
+
+class StatementWaiter:
+    """Poll a statement until it leaves its pending states."""
+
+    def __init__(
+        self,
+        pending_states: Iterable[str],
+        queued_states: Iterable[str] = (),
+        schedule: Optional[BackoffSchedule] = None,
+        timeout: Optional[float] = None,
+        cancel_event: Optional[threading.Event] = None,
+    ):
+        """
+        Args:
+            pending_states: States in which the statement is still in flight
+            queued_states: Subset of pending_states that count as queued time
+            schedule: Backoff schedule between polls (default BackoffSchedule())
+            timeout: Overall deadline in seconds, or None to wait indefinitely
+            cancel_event: Event that aborts the wait when set
+        """
+        self.pending_states = frozenset(pending_states)
+        self.queued_states = frozenset(queued_states)
+        self.schedule = schedule or BackoffSchedule()
+        self.timeout = timeout
+        self.cancel_event = cancel_event
+
+    def _sleep(self, seconds: float) -> None:
+        if self.cancel_event is not None:
+            self.cancel_event.wait(seconds)
+        else:
+            time.sleep(seconds)
+
+    def wait(
+        self,
+        poll: Callable[[], Any],
+        get_state: Callable[[Any], Optional[str]],
+        initial_response: Any = None,
+        statement_id: Optional[str] = None,
+        cancel: Optional[Callable[[], Any]] = None,
+    ) -> Any:
+        """
+        Wait for a statement to reach a terminal state.
+
+        Args:
+            poll: Fetches the current statement status response
+            get_state: Extracts the state string from a status response
+            initial_response: Response from the submit call, if it already
+                carries a state; polling starts immediately when None
+            statement_id: Statement ID, used for instrumentation only
+            cancel: Best-effort hook that cancels the statement server-side,
+                called on cancellation and when the deadline passes
+
+        Returns:
+            The first status response whose state is not pending
+
+        Raises:
+            StatementTimeoutError: If the deadline passes first
+            StatementCancelledError: If the cancel event is set
+        """
+        start = time.monotonic()
+        timings = StatementTimings(statement_id=statement_id)
+        response = initial_response
+        state = get_state(response) if response is not None else None
+        # Until we observe otherwise, a freshly submitted statement is queued
+        current_phase_queued = state is None or state in self.queued_states
+        phase_start = start
+        attempt = 0
+
+        def close_phase(now: float) -> None:
+            elapsed = now - phase_start
+            if current_phase_queued:
+                timings.queued_seconds += elapsed
+            else:
+                timings.running_seconds += elapsed
+
+        def abort(error: Exception, final_state: str):
+            if cancel is not None:
+                try:
+                    cancel()
+                except Exception as e:
+                    logging.debug(f"Failed to cancel statement {statement_id}: {e}")
+            close_phase(time.monotonic())
+            timings.final_state = final_state
+            timings.total_seconds = time.monotonic() - start
+            _record_timings(timings)
+            raise error
+
+        # With no state to go on (e.g. the submit response only carried an ID),
+        # poll once straight away; afterwards only pending states keep us here.
+        needs_poll = state is None or state in self.pending_states
+        while needs_poll:
+            if self.cancel_event is not None and self.cancel_event.is_set():
+                abort(
+                    StatementCancelledError(f"Statement {statement_id} cancelled"),
+                    "CANCELLED",
+                )
+
+            if state in self.pending_states:
+                delay = self.schedule.delay(attempt)
+                attempt += 1
+                if self.timeout is not None:
+                    remaining = self.timeout - (time.monotonic() - start)
+                    if remaining <= 0:
+                        abort(
+                            StatementTimeoutError(
+                                f"Statement timed out after {self.timeout} seconds"
+                            ),
+                            "TIMED_OUT",
+                        )
+                    delay = min(delay, remaining)
+                sleep_start = time.monotonic()
+                self._sleep(delay)
+                timings.sleep_seconds += time.monotonic() - sleep_start
+                if self.cancel_event is not None and self.cancel_event.is_set():
+                    abort(
+                        StatementCancelledError(f"Statement {statement_id} cancelled"),
+                        "CANCELLED",
+                    )
+
+            poll_start = time.monotonic()
+            response = poll()
+            now = time.monotonic()
+            timings.polling_seconds += now - poll_start
+            timings.polls += 1
+            state = get_state(response)
+
+            close_phase(now)
+            phase_start = now
+            current_phase_queued = state in self.queued_states
+            needs_poll = state in self.pending_states
+
+        timings.final_state = state
+        timings.total_seconds = time.monotonic() - start
+        _record_timings(timings)
+        return response
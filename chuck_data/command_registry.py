@@ -5,6 +5,7 @@ This module provides a central registry for all commands that can be executed
 by both the user interface and LLM agent tools, reducing code duplication.
 """
 
+import threading
 from typing import Dict, Any, Callable, List, Optional
 from dataclasses import dataclass, field
 
@@ -31,6 +32,7 @@ class CommandDefinition:
         display_condition: Optional[Callable] = None (function that takes result dict and returns True for full display, False for condensed)
         condensed_action: Optional[str] = None (friendly action name for condensed display, e.g. "Setting catalog")
         provider: Optional[str] = None (data provider this command applies to: "databricks", "aws_redshift", or None for all)
+        side_effect_free: bool = False (read-only and non-interactive, so the agent may run it concurrently with other such tools)
     """
 
     name: str
@@ -57,12 +59,87 @@ class CommandDefinition:
     provider: Optional[str] = (
         None  # Data provider this command applies to: "databricks", "aws_redshift", or None for all
     )
+    side_effect_free: bool = (
+        False  # Read-only and non-interactive; agent may run it in parallel
+    )
+
+
+_load_lock = threading.RLock()
+_commands_loaded = False
+_commands_loading = False
+
+
+def load_commands() -> None:
+    """
+    Register the built-in commands if that has not happened yet.
+
+    Called on the first read of the registry rather than when chuck_data is
+    imported, so `chuck --version` and code that only needs a helper module
+    never import the command modules. The definitions live in the command
+    modules themselves, so that first read imports all of them; the provider
+    SDKs behind them are still only imported when a handler uses them.
+    """
+    global _commands_loaded, _commands_loading
+    if _commands_loaded:
+        return
+    with _load_lock:
+        # Reads made while registering (same thread) see the partial registry
+        if _commands_loaded or _commands_loading:
+            return
+        _commands_loading = True
+        try:
+            from chuck_data.commands import register_all_commands
+
+            register_all_commands()
+            _commands_loaded = True
+        finally:
+            _commands_loading = False
+
+
+class _LazyCommandTable(dict):
+    """Dict that registers the built-in commands before it is first read.
+
+    Writes (register_command, tests adding their own definitions) do not
+    trigger loading.
+    """
+
+    def __getitem__(self, key):
+        load_commands()
+        return super().__getitem__(key)
+
+    def get(self, key, default=None):
+        load_commands()
+        return super().get(key, default)
+
+    def __contains__(self, key):
+        load_commands()
+        return super().__contains__(key)
+
+    def __iter__(self):
+        load_commands()
+        return super().__iter__()
+
+    def __len__(self):
+        load_commands()
+        return super().__len__()
+
+    def keys(self):
+        load_commands()
+        return super().keys()
+
+    def values(self):
+        load_commands()
+        return super().values()
+
+    def items(self):
+        load_commands()
+        return super().items()
 
 
-# Command registry - populated with all available commands
-COMMAND_REGISTRY: Dict[str, CommandDefinition] = {}
+# Command registry - populated with all available commands on first read
+COMMAND_REGISTRY: Dict[str, CommandDefinition] = _LazyCommandTable()
 TUI_COMMAND_MAP: Dict[str, str] = (
-    {}
+    _LazyCommandTable()
 )  # Maps TUI command names (with slash) to registry names
 
 
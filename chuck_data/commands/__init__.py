@@ -3,148 +3,97 @@ Command registration for Chuck.
 
 This module registers all commands with the unified command registry,
 making them available for both CLI and agent usage.
-"""
-
-from chuck_data.command_registry import register_command
-
-# Import command definitions
-from .list_models import DEFINITION as list_models_definition
-from .model_selection import DEFINITION as model_selection_definition
-from .catalog_selection import DEFINITION as catalog_selection_definition
-from .schema_selection import DEFINITION as schema_selection_definition
-from .tag_pii import DEFINITION as tag_pii_definition
-from .scan_pii import DEFINITION as scan_pii_definition
-from .bulk_tag_pii import DEFINITION as bulk_tag_pii_definition
-from .setup_stitch import DEFINITION as setup_stitch_definition
-from .workspace_selection import DEFINITION as workspace_selection_definition
-from .help import DEFINITION as help_definition
-from .status import DEFINITION as status_definition
-from .redshift_status import DEFINITION as redshift_status_definition
-from .jobs import DEFINITION as jobs_definition
-from .setup_wizard import DEFINITION as setup_wizard_definition
-from .agent import DEFINITION as agent_definition
-from .auth import DEFINITION as auth_definition
-
-# Import new Databricks commands
-from .list_warehouses import DEFINITION as list_warehouses_definition
-from .warehouse import DEFINITION as warehouse_definition
-from .warehouse_selection import DEFINITION as warehouse_selection_definition
-from .create_warehouse import DEFINITION as create_warehouse_definition
-from .run_sql import DEFINITION as run_sql_definition
-from .list_volumes import DEFINITION as list_volumes_definition
-from .create_volume import DEFINITION as create_volume_definition
-from .upload_file import DEFINITION as upload_file_definition
-from .job_status import (
-    DEFINITION as job_status_definition,
-    LIST_JOBS_DEFINITION as list_jobs_definition,
-)
-from .monitor_job import DEFINITION as monitor_job_definition
-from .list_tables import DEFINITION as list_tables_definition
-from .add_stitch_report import DEFINITION as add_stitch_report_definition
-
-# Import catalog/schema/table commands
-from .list_catalogs import DEFINITION as list_catalogs_definition
-from .list_databases import DEFINITION as list_databases_definition
-from .catalog import DEFINITION as catalog_definition
-from .database_selection import DEFINITION as database_selection_definition
-from .list_schemas import DEFINITION as list_schemas_definition
-from .list_redshift_schemas import DEFINITION as list_redshift_schemas_definition
-from .schema import DEFINITION as schema_definition
-from .redshift_schema_selection import (
-    DEFINITION as redshift_schema_selection_definition,
-)
-from .table import DEFINITION as table_definition
 
-# Import bug report command
-from .bug import DEFINITION as bug_definition
-
-# Import getting started command
-from .getting_started import DEFINITION as getting_started_definition
-
-# Import discord community command
-from .discord import DEFINITION as discord_definition
+Command modules are listed here by name and only imported when the registry
+is first read (see chuck_data.command_registry.load_commands), so importing
+chuck_data or one of its helpers such as chuck_data.commands.base does not
+pull in every command and the SDKs behind them.
+"""
 
-# Import support command
-from .support import DEFINITION as support_definition
+import importlib
+from typing import List, Tuple
 
-# Import Snowflake commands
-from .snowflake_status import DEFINITION as snowflake_status_definition
-from .snowflake_list_databases import DEFINITION as snowflake_list_databases_definition
-from .snowflake_database_selection import (
-    DEFINITION as snowflake_database_selection_definition,
-)
-from .snowflake_list_schemas import DEFINITION as snowflake_list_schemas_definition
-from .snowflake_schema_selection import (
-    DEFINITION as snowflake_schema_selection_definition,
-)
-from .snowflake_run_sql import DEFINITION as snowflake_run_sql_definition
-from .snowflake_tag_pii import DEFINITION as snowflake_tag_pii_definition
+from chuck_data.command_registry import CommandDefinition, register_command
 
-# List of all command definitions to register
-ALL_COMMAND_DEFINITIONS = [
+# (module, attribute) of every command definition, in registration order.
+# An attribute may hold a single CommandDefinition or a list of them.
+COMMAND_DEFINITION_SOURCES: List[Tuple[str, str]] = [
     # Authentication & Workspace commands
-    *auth_definition,
-    workspace_selection_definition,
-    setup_wizard_definition,
+    ("auth", "DEFINITION"),
+    ("workspace_selection", "DEFINITION"),
+    ("setup_wizard", "DEFINITION"),
     # Model related commands
-    list_models_definition,
-    model_selection_definition,
+    ("list_models", "DEFINITION"),
+    ("model_selection", "DEFINITION"),
     # Catalog & Schema commands
-    catalog_selection_definition,
-    database_selection_definition,
-    schema_selection_definition,
-    redshift_schema_selection_definition,
-    list_catalogs_definition,
-    list_databases_definition,
-    catalog_definition,
-    list_schemas_definition,
-    list_redshift_schemas_definition,
-    schema_definition,
-    list_tables_definition,
-    table_definition,
+    ("catalog_selection", "DEFINITION"),
+    ("database_selection", "DEFINITION"),
+    ("schema_selection", "DEFINITION"),
+    ("redshift_schema_selection", "DEFINITION"),
+    ("list_catalogs", "DEFINITION"),
+    ("list_databases", "DEFINITION"),
+    ("catalog", "DEFINITION"),
+    ("list_schemas", "DEFINITION"),
+    ("list_redshift_schemas", "DEFINITION"),
+    ("schema", "DEFINITION"),
+    ("list_tables", "DEFINITION"),
+    ("table", "DEFINITION"),
     # PII and Stitch related commands
-    tag_pii_definition,
-    scan_pii_definition,
-    bulk_tag_pii_definition,
-    setup_stitch_definition,
-    add_stitch_report_definition,
+    ("tag_pii", "DEFINITION"),
+    ("scan_pii", "DEFINITION"),
+    ("bulk_tag_pii", "DEFINITION"),
+    ("setup_stitch", "DEFINITION"),
+    ("add_stitch_report", "DEFINITION"),
     # Job commands
-    jobs_definition,
-    job_status_definition,
-    list_jobs_definition,
-    monitor_job_definition,
+    ("jobs", "DEFINITION"),
+    ("job_status", "DEFINITION"),
+    ("job_status", "LIST_JOBS_DEFINITION"),
+    ("monitor_job", "DEFINITION"),
     # Warehouse commands
-    list_warehouses_definition,
-    warehouse_definition,
-    warehouse_selection_definition,
-    create_warehouse_definition,
-    run_sql_definition,
+    ("list_warehouses", "DEFINITION"),
+    ("warehouse", "DEFINITION"),
+    ("warehouse_selection", "DEFINITION"),
+    ("create_warehouse", "DEFINITION"),
+    ("run_sql", "DEFINITION"),
     # Volume commands
-    list_volumes_definition,
-    create_volume_definition,
-    upload_file_definition,
+    ("list_volumes", "DEFINITION"),
+    ("create_volume", "DEFINITION"),
+    ("upload_file", "DEFINITION"),
     # Snowflake commands
-    snowflake_status_definition,
-    snowflake_list_databases_definition,
-    snowflake_database_selection_definition,
-    snowflake_list_schemas_definition,
-    snowflake_schema_selection_definition,
-    snowflake_run_sql_definition,
-    snowflake_tag_pii_definition,
+    ("snowflake_status", "DEFINITION"),
+    ("snowflake_list_databases", "DEFINITION"),
+    ("snowflake_database_selection", "DEFINITION"),
+    ("snowflake_list_schemas", "DEFINITION"),
+    ("snowflake_schema_selection", "DEFINITION"),
+    ("snowflake_run_sql", "DEFINITION"),
+    ("snowflake_tag_pii", "DEFINITION"),
     # Utility commands
-    help_definition,
-    status_definition,
-    redshift_status_definition,
-    bug_definition,
-    getting_started_definition,
-    discord_definition,
-    support_definition,
+    ("help", "DEFINITION"),
+    ("status", "DEFINITION"),
+    ("redshift_status", "DEFINITION"),
+    ("bug", "DEFINITION"),
+    ("getting_started", "DEFINITION"),
+    ("discord", "DEFINITION"),
+    ("support", "DEFINITION"),
     # Agent command
-    agent_definition,
+    ("agent", "DEFINITION"),
 ]
 
 
+def get_all_command_definitions() -> List[CommandDefinition]:
+    """Import every command module and return its definitions in order."""
+    definitions: List[CommandDefinition] = []
+    for module_name, attribute in COMMAND_DEFINITION_SOURCES:
+        module = importlib.import_module(f"{__name__}.{module_name}")
+        definition = getattr(module, attribute)
+        if isinstance(definition, list):
+            definitions.extend(definition)
+        else:
+            definitions.append(definition)
+    return definitions
+
+
 def register_all_commands():
     """Register all commands with the unified registry."""
-    for definition in ALL_COMMAND_DEFINITIONS:
+    for definition in get_all_command_definitions():
         register_command(definition)
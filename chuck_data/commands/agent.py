@@ -30,6 +30,9 @@ def handle_command(
             - raw_args: Unparsed arguments (fallback when command parser fails)
             - catalog_name: Optional catalog name for context
             - schema_name: Optional schema name for context
+            - tool_output_callback: Optional callback for tool output display
+            - stream_callback: Optional callback receiving assistant text
+              deltas as they stream in (None marks the end of a response)
 
     Returns:
         CommandResult with agent response
@@ -71,6 +74,7 @@ def handle_command(
     catalog_name = kwargs.get("catalog_name")
     schema_name = kwargs.get("schema_name")
     tool_output_callback = kwargs.get("tool_output_callback")
+    stream_callback = kwargs.get("stream_callback")
 
     try:
         from chuck_data.agent import AgentManager
@@ -81,7 +85,10 @@ def handle_command(
 
         # Create agent manager with the API client, tool output callback, and optional LLM client
         agent = AgentManager(
-            client, tool_output_callback=tool_output_callback, llm_client=llm_client
+            client,
+            tool_output_callback=tool_output_callback,
+            llm_client=llm_client,
+            stream_callback=stream_callback,
         )
 
         # Load conversation history
@@ -170,7 +177,12 @@ def handle_command(
 
         return CommandResult(
             True,
-            data={"response": response, "conversation": agent.conversation_history},
+            data={
+                "response": response,
+                "conversation": agent.conversation_history,
+                "streamed": agent.last_response_streamed,
+                "turn_timings": agent.turn_timings,
+            },
         )
 
     except Exception as e:
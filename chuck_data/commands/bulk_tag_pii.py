@@ -241,7 +241,12 @@ def _execute_directly(client, **kwargs):
 
         # Use actual scan-pii logic from pii_tools (show progress like scan-pii does)
         scan_summary_data = _helper_scan_schema_for_pii_logic(
-            client, llm_client, catalog_name, schema_name, show_progress=True
+            client,
+            llm_client,
+            catalog_name,
+            schema_name,
+            show_progress=True,
+            refresh=kwargs.get("refresh", False),
         )
 
         # Check for scanning errors
@@ -432,6 +437,9 @@ def _execute_bulk_tagging(client, scan_summary_data, tool_output_callback=None):
     if not tables_with_pii:
         return []
 
+    if provider is None:
+        return [{"error": "No data provider client available", "success": False}]
+
     # Prepare provider-specific parameters
     tag_kwargs = {}
     if not is_redshift and not is_snowflake:
@@ -443,8 +451,30 @@ def _execute_bulk_tagging(client, scan_summary_data, tool_output_callback=None):
             ]
         tag_kwargs["warehouse_id"] = warehouse_id
 
-    # Execute tagging table by table with progress reporting
+    # Execute tagging with progress reporting
     try:
+        if not is_redshift and not is_snowflake:
+            # Databricks batches statements per table and tags tables
+            # concurrently, so hand it every tag at once.
+            all_tags = [
+                tag for table_info in tables_with_pii for tag in table_info["tags"]
+            ]
+
+            def report_table_done(table_name, column_count, tables_done, tables_total):
+                _report_progress(
+                    f"Tagging {column_count} PII columns in {table_name} ({tables_done}/{tables_total})",
+                    tool_output_callback,
+                )
+
+            result = provider.tag_columns(
+                tags=all_tags,
+                catalog=catalog,
+                schema=schema,
+                progress_callback=report_table_done,
+                **tag_kwargs,
+            )
+            return _tagging_results_from_provider(all_tags, result.get("errors", []))
+
         current_table = 0
         for table_info in tables_with_pii:
             current_table += 1
@@ -495,17 +525,7 @@ def _execute_bulk_tagging(client, scan_summary_data, tool_output_callback=None):
                             break
 
             # Add error entries
-            for error in errors:
-                all_tagging_results.append(
-                    {
-                        "table": error.get("table", "unknown"),
-                        "column": error.get("column", "unknown"),
-                        "semantic_type": error.get("semantic_type", ""),
-                        "success": False,
-                        "error": error.get("error", "Unknown error"),
-                        "error_type": "EXECUTION_ERROR",
-                    }
-                )
+            all_tagging_results.extend(_tagging_error_results(errors))
 
         return all_tagging_results
 
@@ -522,6 +542,41 @@ def _execute_bulk_tagging(client, scan_summary_data, tool_output_callback=None):
         return [{"error": error_message, "error_type": error_type, "success": False}]
 
 
+def _tagging_error_results(errors):
+    """Convert provider tag_columns errors into failed tagging result entries."""
+    return [
+        {
+            "table": error.get("table", "unknown"),
+            "column": error.get("column", "unknown"),
+            "semantic_type": error.get("semantic_type", ""),
+            "success": False,
+            "error": error.get("error", "Unknown error"),
+            "error_type": "EXECUTION_ERROR",
+        }
+        for error in errors
+    ]
+
+
+def _tagging_results_from_provider(tags, errors):
+    """Build per-column tagging results from a tag_columns call.
+
+    Every tag without a matching (table, column) error is reported as applied.
+    """
+    error_keys = {(e.get("table"), e.get("column")) for e in errors}
+    results = [
+        {
+            "table": tag["table"],
+            "column": tag["column"],
+            "semantic_type": tag["semantic_type"],
+            "success": True,
+        }
+        for tag in tags
+        if (tag["table"], tag["column"]) not in error_keys
+    ]
+    results.extend(_tagging_error_results(errors))
+    return results
+
+
 def _summarize_failures(tagging_results):
     """Summarize failure reasons for user feedback."""
     failed_results = [r for r in tagging_results if not r.get("success", False)]
@@ -633,7 +688,12 @@ def _start_interactive_mode(client, **kwargs):
 
         # Use actual scan-pii logic from pii_tools (show progress like scan-pii does)
         scan_summary_data = _helper_scan_schema_for_pii_logic(
-            client, llm_client, catalog_name, schema_name, show_progress=True
+            client,
+            llm_client,
+            catalog_name,
+            schema_name,
+            show_progress=True,
+            refresh=kwargs.get("refresh", False),
         )
 
         # Check for scanning errors
@@ -1347,6 +1407,10 @@ DEFINITION = CommandDefinition(
             "type": "boolean",
             "description": "Optional: Skip interactive confirmation and proceed automatically. Default: false",
         },
+        "refresh": {
+            "type": "boolean",
+            "description": "Optional: Reclassify every table instead of reusing cached PII results. Default: false",
+        },
     },
     required_params=[],
     supports_interactive_input=True,
@@ -67,6 +67,7 @@ DEFINITION = CommandDefinition(
     needs_api_client=True,
     visible_to_user=True,
     visible_to_agent=True,
+    side_effect_free=True,
     agent_display="full",  # Show full catalog details to agents
     usage_hint="Usage: /catalog --name <catalog_name>",
     provider="databricks",  # Databricks-specific command for Unity Catalog details
@@ -12,6 +12,7 @@ from difflib import SequenceMatcher
 from chuck_data.clients.databricks import DatabricksAPIClient
 from chuck_data.command_registry import CommandDefinition
 from chuck_data.config import set_active_catalog
+from chuck_data.metadata_cache import invalidate_metadata
 from .base import CommandResult
 
 
@@ -102,10 +103,9 @@ def handle_command(client: Optional[DatabricksAPIClient], **kwargs) -> CommandRe
             )
 
             # Get all catalogs
-            from chuck_data.catalogs import list_catalogs
+            from chuck_data.catalogs import iter_catalogs
 
-            catalogs_result = list_catalogs(client)
-            catalogs = catalogs_result.get("catalogs", [])
+            catalogs = list(iter_catalogs(client))
             if not catalogs:
                 return CommandResult(False, message="No catalogs found in workspace.")
 
@@ -140,6 +140,12 @@ def handle_command(client: Optional[DatabricksAPIClient], **kwargs) -> CommandRe
         catalog_owner = target_catalog.get("owner", "Unknown")
 
         set_active_catalog(catalog_name_to_set)
+        # Schema and table listings under the newly selected catalog are
+        # fetched fresh rather than from a possibly old cache entry
+        invalidate_metadata(
+            catalog=catalog_name_to_set,
+            resources=("schemas", "schema", "tables", "table", "volumes"),
+        )
 
         return CommandResult(
             True,
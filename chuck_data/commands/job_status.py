@@ -3,7 +3,9 @@ Command for checking status of Chuck jobs.
 """
 
 import logging
-from typing import Optional, Any
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Any, Dict, List, Tuple
+import requests
 from prettytable import PrettyTable
 from chuck_data.clients.databricks import DatabricksAPIClient
 from chuck_data.clients.amperity import AmperityAPIClient
@@ -18,11 +20,18 @@ from chuck_data.job_cache import (
     get_last_job_id,
     find_run_id_for_job,
     get_all_cached_jobs,
+    batch_cache_updates,
 )
 
 # Constant for unset Databricks run ID
 UNSET_DATABRICKS_RUN_ID = "UNSET_DATABRICKS_RUN_ID"
 
+# Concurrent status requests made when listing jobs
+LIST_JOBS_MAX_WORKERS = 8
+
+# Seconds each status request may take when listing jobs
+LIST_JOBS_STATUS_TIMEOUT = 15
+
 
 def _is_emr_step_id(id_value: str) -> bool:
     """
@@ -757,9 +766,53 @@ def _cache_job_data(
     logging.debug(log_msg)
 
 
+def _fetch_job_statuses(
+    client: AmperityAPIClient, token: str, job_ids: List[str]
+) -> Dict[str, Tuple[Optional[dict], Optional[Exception]]]:
+    """
+    Fetch job statuses concurrently on a bounded pool.
+
+    Each request is given LIST_JOBS_STATUS_TIMEOUT seconds to respond; one
+    that times out is reported as a TimeoutError.
+
+    Returns:
+        Dict of job_id to (job_data, error), exactly one of which is set
+        (job_data may also be None if the job was not found)
+    """
+    if not job_ids:
+        return {}
+
+    workers = min(LIST_JOBS_MAX_WORKERS, len(job_ids))
+    with ThreadPoolExecutor(
+        max_workers=workers, thread_name_prefix="job-status"
+    ) as executor:
+        futures = {
+            executor.submit(
+                client.get_job_status, job_id, token, timeout=LIST_JOBS_STATUS_TIMEOUT
+            ): job_id
+            for job_id in job_ids
+        }
+
+    results: Dict[str, Tuple[Optional[dict], Optional[Exception]]] = {}
+    for future, job_id in futures.items():
+        try:
+            results[job_id] = (future.result(), None)
+        except requests.Timeout:
+            results[job_id] = (
+                None,
+                TimeoutError(f"No status after {LIST_JOBS_STATUS_TIMEOUT}s"),
+            )
+        except Exception as e:
+            results[job_id] = (None, e)
+    return results
+
+
 def handle_list_jobs(client=None, **kwargs) -> CommandResult:
     """List recent jobs from cache.
 
+    Statuses of jobs that are not known to be finished are fetched
+    concurrently, and the cache is written once for the whole refresh.
+
     Args:
         client: Optional API client (unused, for compatibility)
         **kwargs: Optional arguments (unused)
@@ -798,10 +851,10 @@ def handle_list_jobs(client=None, **kwargs) -> CommandResult:
             + "\n\nNote: Authenticate with Amperity to see full job details.",
         )
 
-    # Fetch details for each job
-    jobs_with_details = []
+    # One row per job, in cache order; rows for jobs being fetched are filled in below
+    rows: List[Optional[dict]] = []
+    to_fetch: List[Tuple[int, dict]] = []
     cache_hits = 0
-    api_calls = 0
 
     for job_entry in cached_jobs:
         job_id = job_entry.get("job_id")
@@ -820,19 +873,32 @@ def handle_list_jobs(client=None, **kwargs) -> CommandResult:
                 logging.debug(
                     f"Using cached data for job {job_id} (state: {state}, cached_at: {cached_at})"
                 )
-                jobs_with_details.append(cached_job_data)
+                rows.append(cached_job_data)
                 cache_hits += 1
                 continue
 
         # Otherwise fetch fresh data from API
         logging.debug(f"Fetching fresh data for job {job_id}")
-        api_calls += 1
-        run_id = job_entry.get("run_id")
+        rows.append(None)
+        to_fetch.append((len(rows) - 1, job_entry))
 
-        try:
-            job_data = client.get_job_status(job_id, token)
-            if job_data:
-                jobs_with_details.append(job_data)
+    fetch_start = time.time()
+    statuses = _fetch_job_statuses(
+        client, token, [job_entry["job_id"] for _, job_entry in to_fetch]
+    )
+    logging.debug(
+        f"Fetched {len(to_fetch)} job statuses in {time.time() - fetch_start:.3f}s"
+    )
+
+    with batch_cache_updates():
+        for index, job_entry in to_fetch:
+            job_id = job_entry["job_id"]
+            run_id = job_entry.get("run_id")
+            cached_job_data = job_entry.get("job_data")
+            job_data, error = statuses[job_id]
+
+            if error is None and job_data:
+                rows[index] = job_data
 
                 # Cache the data if it's in a terminal state
                 state = (job_data.get("state") or "").lower().replace(":", "")
@@ -841,27 +907,24 @@ def handle_list_jobs(client=None, **kwargs) -> CommandResult:
                 # For running/pending jobs, cache them too to maintain proper ordering
                 elif state in ["running", "submitted", "pending"]:
                     _cache_job_data(job_id, run_id, job_data, "active state")
+            elif cached_job_data:
+                # Not found or failed - keep showing what we already had
+                if error is not None:
+                    logging.debug(f"Error fetching job {job_id}: {error}")
+                rows[index] = cached_job_data
             else:
-                # Job not found - only cache as UNKNOWN if not already cached
-                if not cached_job_data:
-                    unknown_data = {"job-id": job_id, "state": "UNKNOWN"}
-                    jobs_with_details.append(unknown_data)
-                    _cache_job_data(job_id, run_id, unknown_data, "not found")
-                else:
-                    # Use existing cached data
-                    jobs_with_details.append(cached_job_data)
-        except Exception as e:
-            # On error - only cache as UNKNOWN if not already cached
-            logging.debug(f"Error fetching job {job_id}: {e}")
-            if not cached_job_data:
+                # Only cache as UNKNOWN if not already cached. A request that
+                # timed out is not cached, so the next listing asks again.
                 unknown_data = {"job-id": job_id, "state": "UNKNOWN"}
-                jobs_with_details.append(unknown_data)
-                _cache_job_data(job_id, run_id, unknown_data, "error")
-            else:
-                # Use existing cached data
-                jobs_with_details.append(cached_job_data)
+                rows[index] = unknown_data
+                if error is None:
+                    _cache_job_data(job_id, run_id, unknown_data, "not found")
+                elif not isinstance(error, TimeoutError):
+                    logging.debug(f"Error fetching job {job_id}: {error}")
+                    _cache_job_data(job_id, run_id, unknown_data, "error")
 
-    logging.debug(f"Jobs list: {cache_hits} cache hits, {api_calls} API calls")
+    jobs_with_details = [row for row in rows if row is not None]
+    logging.debug(f"Jobs list: {cache_hits} cache hits, {len(to_fetch)} API calls")
 
     # Format and display the table
     format_start = time.time()
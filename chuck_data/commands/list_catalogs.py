@@ -135,6 +135,7 @@ DEFINITION = CommandDefinition(
     needs_api_client=True,
     visible_to_user=True,
     visible_to_agent=True,
+    side_effect_free=True,
     agent_display="conditional",  # Use conditional display based on display parameter
     display_condition=lambda result: result.get(
         "display", False
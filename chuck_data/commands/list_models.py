@@ -108,5 +108,6 @@ DEFINITION = CommandDefinition(
     tui_aliases=["/models", "/list-models"],
     visible_to_user=True,
     visible_to_agent=True,
+    side_effect_free=True,
     agent_display="full",  # Show full model list in tables
 )
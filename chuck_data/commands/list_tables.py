@@ -2,7 +2,8 @@
 Command for listing tables in a schema (works with both Databricks and Redshift).
 """
 
-from typing import Optional, Any, Union
+from typing import Optional, Any, Dict, List, Union, cast
+from chuck_data.catalogs import iter_tables
 from chuck_data.clients.databricks import DatabricksAPIClient
 from chuck_data.clients.redshift import RedshiftAPIClient
 from chuck_data.clients.snowflake import SnowflakeAPIClient
@@ -10,8 +11,192 @@ from chuck_data.command_registry import CommandDefinition
 from chuck_data.commands.base import CommandResult
 from chuck_data.config import get_active_catalog, get_active_schema, get_active_database
 from chuck_data.data_providers import is_redshift_client, is_snowflake_client
+import concurrent.futures
 import logging
 
+# Cap on concurrent per-table statements (COUNT(*) or describe_table) so a
+# large schema does not flood the Data API's active statement limit
+REDSHIFT_METADATA_MAX_CONCURRENCY = 8
+
+
+def _redshift_records(result: Optional[Dict[str, Any]]) -> List[List[Dict[str, Any]]]:
+    """Return the Records of a Redshift Data API result, or an empty list."""
+    if result and "result" in result and "Records" in result["result"]:
+        return result["result"]["Records"]
+    return []
+
+
+def _redshift_int(field: Dict[str, Any]) -> Optional[int]:
+    """Read an integer Data API field, which may arrive as a long or a string."""
+    if field.get("isNull"):
+        return None
+    for key in ("longValue", "stringValue", "doubleValue"):
+        if key in field:
+            return int(field[key])
+    return None
+
+
+def _run_per_table(fn, table_names: List[str]) -> Dict[str, Any]:
+    """Call fn(table_name) for every table concurrently, capped; failures map to None."""
+    results: Dict[str, Any] = {}
+    if not table_names:
+        return results
+    max_workers = min(REDSHIFT_METADATA_MAX_CONCURRENCY, len(table_names))
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {executor.submit(fn, name): name for name in table_names}
+        for future in concurrent.futures.as_completed(futures):
+            name = futures[future]
+            try:
+                results[name] = future.result()
+            except Exception as e:
+                logging.warning(f"Metadata request for table {name} failed: {str(e)}")
+                results[name] = None
+    return results
+
+
+def _fetch_redshift_column_counts(
+    client: RedshiftAPIClient, database: str, schema_name: str, table_names: List[str]
+) -> Dict[str, int]:
+    """Column counts for all tables from one pg_table_def query, falling back
+    to concurrent describe_table calls when the catalog view is unavailable.
+
+    pg_table_def only covers schemas on the search_path, so an empty result is
+    common and not an error.
+    """
+    column_counts: Dict[str, int] = {}
+    table_names_str = ", ".join([f"'{name}'" for name in table_names])
+    # Note: Redshift uses 'column' not 'columnname' in pg_table_def
+    metadata_sql = f"""
+    SELECT
+        tablename as table_name,
+        COUNT(DISTINCT "column") as column_count
+    FROM pg_table_def
+    WHERE schemaname = '{schema_name}'
+        AND tablename IN ({table_names_str})
+    GROUP BY tablename
+    """
+    try:
+        result = client.execute_sql(metadata_sql, database=database)
+        for record in _redshift_records(result):
+            column_counts[record[0].get("stringValue", "")] = (
+                _redshift_int(record[1]) or 0
+            )
+    except Exception as e:
+        logging.error(
+            f"Failed to fetch table metadata via SQL: {str(e)}",
+            exc_info=True,
+        )
+
+    missing = [name for name in table_names if name not in column_counts]
+    if column_counts or not missing:
+        return column_counts
+
+    logging.warning(
+        "pg_table_def returned no rows, falling back to describe_table for each table"
+    )
+
+    def describe(table_name: str) -> int:
+        table_details = client.describe_table(
+            database=database, schema=schema_name, table=table_name
+        )
+        return len(table_details.get("ColumnList", []))
+
+    for table_name, count in _run_per_table(describe, missing).items():
+        column_counts[table_name] = count or 0
+    return column_counts
+
+
+def _fetch_redshift_table_stats(
+    client: RedshiftAPIClient, database: str, schema_name: str
+) -> Dict[str, Dict[str, int]]:
+    """Row estimates and sizes for every table in a schema from SVV_TABLE_INFO.
+
+    SVV_TABLE_INFO only lists tables that hold data and does not cover views;
+    those keep the "-" / "Unknown" placeholders.
+    """
+    stats_sql = f"""
+    SELECT
+        "table" as table_name,
+        CAST(tbl_rows AS BIGINT) as row_count,
+        size as size_mb
+    FROM svv_table_info
+    WHERE "schema" = '{schema_name}'
+    """
+    stats: Dict[str, Dict[str, int]] = {}
+    try:
+        result = client.execute_sql(stats_sql, database=database)
+        for record in _redshift_records(result):
+            if len(record) < 3:
+                continue
+            entry = {}
+            row_count = _redshift_int(record[1])
+            size_mb = _redshift_int(record[2])
+            if row_count is not None:
+                entry["row_count"] = row_count
+            if size_mb is not None:
+                # SVV_TABLE_INFO reports size in 1 MB blocks
+                entry["size_bytes"] = size_mb * 1024 * 1024
+            stats[record[0].get("stringValue", "")] = entry
+    except Exception as e:
+        logging.warning(f"Failed to fetch table statistics from svv_table_info: {e}")
+    return stats
+
+
+def _fetch_redshift_exact_row_counts(
+    client: RedshiftAPIClient, database: str, schema_name: str, table_names: List[str]
+) -> Dict[str, Optional[int]]:
+    """Exact row counts via concurrent COUNT(*) statements."""
+
+    def count(table_name: str) -> Optional[int]:
+        count_sql = f'SELECT COUNT(*) as row_count FROM "{schema_name}"."{table_name}"'
+        records = _redshift_records(client.execute_sql(count_sql, database=database))
+        return _redshift_int(records[0][0]) if records else None
+
+    logging.info(f"Fetching exact row counts for {len(table_names)} tables...")
+    return _run_per_table(count, table_names)
+
+
+def _fetch_redshift_table_metadata(
+    client: RedshiftAPIClient,
+    database: str,
+    schema_name: str,
+    table_names: List[str],
+    exact_counts: bool = False,
+) -> Dict[str, Dict[str, Any]]:
+    """
+    Collect column counts, row counts and sizes for a Redshift schema.
+
+    Two bulk system-view queries cover every table: pg_table_def for column
+    counts and SVV_TABLE_INFO for row estimates and sizes. With exact_counts
+    the row counts are instead taken from COUNT(*) statements, run
+    concurrently up to REDSHIFT_METADATA_MAX_CONCURRENCY at a time.
+
+    Returns:
+        Mapping of table name to {"column_count", "row_count", "size_bytes"}
+    """
+    column_counts = _fetch_redshift_column_counts(
+        client, database, schema_name, table_names
+    )
+    stats = _fetch_redshift_table_stats(client, database, schema_name)
+    exact = (
+        _fetch_redshift_exact_row_counts(client, database, schema_name, table_names)
+        if exact_counts
+        else {}
+    )
+
+    table_metadata: Dict[str, Dict[str, Any]] = {}
+    for table_name in table_names:
+        table_stats = stats.get(table_name, {})
+        row_count = exact.get(table_name)
+        if row_count is None:
+            row_count = table_stats.get("row_count", "-")
+        table_metadata[table_name] = {
+            "column_count": column_counts.get(table_name, 0),
+            "row_count": row_count,
+            "size_bytes": table_stats.get("size_bytes", "Unknown"),
+        }
+    return table_metadata
+
 
 def handle_command(
     client: Optional[Union[DatabricksAPIClient, RedshiftAPIClient]], **kwargs: Any
@@ -31,7 +216,8 @@ def handle_command(
             For Redshift:
                 - database: Database name
                 - schema_name: Schema name to list tables from
-                - Column counts are automatically fetched via describe_table API
+                - exact_counts: Run COUNT(*) per table instead of using the
+                  SVV_TABLE_INFO row estimates (optional, slower)
             Common:
                 - display: bool, whether to display the table (default: False)
 
@@ -132,141 +318,21 @@ def handle_command(
             # Extract tables from response (now returns {"tables": [...]})
             result_tables = tables_response.get("tables", [])
 
-            # Fetch table metadata using SQL query to system tables
-            # This gives us column counts, row counts, and timestamps in a single query
+            # Fetch table metadata with bulk queries against system views so
+            # the cost does not grow with the number of tables
             table_metadata = {}
             if result_tables:
                 logging.info(
                     f"Fetching metadata for {len(result_tables)} tables in {database}.{schema_name}"
                 )
-
-                # Build a SQL query to get metadata for all tables at once
-                table_names = [t.get("name") for t in result_tables]
-                table_names_str = ", ".join([f"'{name}'" for name in table_names])
-
-                # Query system tables for metadata
-                # Note: Redshift uses 'column' not 'columnname' in pg_table_def
-                # We get column counts from pg_table_def
-                # For row counts, we'll fetch them separately using COUNT queries for accuracy
-                metadata_sql = f"""
-                SELECT
-                    tablename as table_name,
-                    COUNT(DISTINCT "column") as column_count
-                FROM pg_table_def
-                WHERE schemaname = '{schema_name}'
-                    AND tablename IN ({table_names_str})
-                GROUP BY tablename
-                """
-
-                try:
-                    result = client.execute_sql(metadata_sql, database=database)
-
-                    # AWS Redshift Data API returns results in result["result"]["Records"]
-                    # Each record is a list of dicts with keys like "stringValue", "longValue", etc.
-                    if result and "result" in result and "Records" in result["result"]:
-                        for record in result["result"]["Records"]:
-                            # Extract table_name (first column - stringValue)
-                            table_name = record[0].get("stringValue", "")
-                            # Extract column_count (second column - longValue)
-                            column_count = int(record[1].get("longValue", 0))
-
-                            table_metadata[table_name] = {
-                                "column_count": column_count,
-                                "row_count": "-",  # Will be fetched separately
-                            }
-                            logging.info(f"Table {table_name}: {column_count} columns")
-
-                    # If the SQL query succeeded but returned no rows, fall back to describe_table
-                    # This can happen if pg_table_def is not accessible or empty
-                    if not table_metadata:
-                        logging.warning(
-                            f"SQL query to pg_table_def returned 0 rows, falling back to describe_table for each table"
-                        )
-                        for table in result_tables:
-                            table_name = table.get("name")
-                            try:
-                                table_details = client.describe_table(
-                                    database=database,
-                                    schema=schema_name,
-                                    table=table_name,
-                                )
-                                columns = table_details.get("ColumnList", [])
-                                table_metadata[table_name] = {
-                                    "column_count": len(columns),
-                                    "row_count": "-",
-                                }
-                                logging.info(
-                                    f"Table {table_name}: {len(columns)} columns (from describe_table)"
-                                )
-                            except Exception as e2:
-                                logging.error(
-                                    f"Failed to fetch columns for table {table_name}: {str(e2)}"
-                                )
-                                table_metadata[table_name] = {
-                                    "column_count": 0,
-                                    "row_count": "-",
-                                }
-                    else:
-                        # Note: Redshift doesn't provide table creation/modification timestamps
-                        # in accessible system tables without special permissions (STL_DDLTEXT requires elevated access)
-
-                        # Now fetch row counts for each table using actual COUNT queries
-                        # This is more accurate but slower than system table statistics
-                        logging.info(
-                            f"Fetching row counts for {len(table_metadata)} tables..."
-                        )
-                        for table_name in table_metadata.keys():
-                            try:
-                                count_sql = f'SELECT COUNT(*) as row_count FROM "{schema_name}"."{table_name}"'
-                                count_result = client.execute_sql(
-                                    count_sql, database=database
-                                )
-
-                                if (
-                                    count_result
-                                    and "result" in count_result
-                                    and "Records" in count_result["result"]
-                                    and len(count_result["result"]["Records"]) > 0
-                                ):
-                                    row_count = int(
-                                        count_result["result"]["Records"][0][0].get(
-                                            "longValue", 0
-                                        )
-                                    )
-                                    table_metadata[table_name]["row_count"] = row_count
-                                    logging.info(
-                                        f"Table {table_name}: {row_count} rows"
-                                    )
-                            except Exception as e_count:
-                                logging.warning(
-                                    f"Failed to get row count for {table_name}: {str(e_count)}"
-                                )
-                                # Keep row_count as "-" if count fails
-                except Exception as e:
-                    logging.error(
-                        f"Failed to fetch table metadata via SQL: {str(e)}",
-                        exc_info=True,
-                    )
-                    # Fallback: fetch column counts using describe_table
-                    for table in result_tables:
-                        table_name = table.get("name")
-                        try:
-                            table_details = client.describe_table(
-                                database=database, schema=schema_name, table=table_name
-                            )
-                            columns = table_details.get("ColumnList", [])
-                            table_metadata[table_name] = {
-                                "column_count": len(columns),
-                                "row_count": "-",
-                            }
-                        except Exception as e2:
-                            logging.error(
-                                f"Failed to fetch columns for table {table_name}: {str(e2)}"
-                            )
-                            table_metadata[table_name] = {
-                                "column_count": 0,
-                                "row_count": "-",
-                            }
+                table_names = [t.get("name", "") for t in result_tables]
+                table_metadata = _fetch_redshift_table_metadata(
+                    cast(RedshiftAPIClient, client),
+                    database,
+                    schema_name,
+                    table_names,
+                    exact_counts=kwargs.get("exact_counts", False),
+                )
 
                 logging.info(f"Table metadata collected: {table_metadata}")
 
@@ -294,17 +360,18 @@ def handle_command(
                         message="No schema specified and no active schema selected. Please provide a schema_name or select a schema first using /select-schema.",
                     )
 
-            # List tables in Databricks
-            result = client.list_tables(
-                catalog_name=catalog_name,
-                schema_name=schema_name,
-                include_delta_metadata=include_delta_metadata,
-                omit_columns=omit_columns,
-                include_browse=include_browse,
+            # List tables in Databricks, following every page
+            result_tables = list(
+                iter_tables(
+                    client,
+                    catalog_name,
+                    schema_name,
+                    include_delta_metadata=include_delta_metadata,
+                    omit_columns=omit_columns,
+                    include_browse=include_browse,
+                )
             )
 
-            result_tables = result.get("tables", [])
-
         if not result_tables:
             # Build appropriate message based on provider
             if is_redshift:
@@ -336,7 +403,7 @@ def handle_command(
         for table in result_tables:
             if is_redshift:
                 # Redshift table format
-                table_name = table.get("name")
+                table_name = table.get("name", "")
                 table_info = {
                     "name": table_name,
                     "full_name": f"{database}.{schema_name}.{table_name}",
@@ -348,7 +415,7 @@ def handle_command(
                     "created_by": "",  # Not available
                     "owner": "",  # Not available from list_tables
                     "row_count": "-",  # Will be set from table_metadata below
-                    "size_bytes": "Unknown",  # Not available from list_tables
+                    "size_bytes": "Unknown",  # Will be set from table_metadata below
                 }
 
                 # Add column count and row count from the fetched metadata
@@ -359,9 +426,10 @@ def handle_command(
                         logging.info(
                             f"Set column_count={metadata.get('column_count', 0)} for table {table_name}"
                         )
-                    table_info["row_count"] = metadata.get("row_count", 0)
+                    table_info["row_count"] = metadata.get("row_count", "-")
+                    table_info["size_bytes"] = metadata.get("size_bytes", "Unknown")
                     logging.info(
-                        f"Set row_count={metadata.get('row_count', 0)} for table {table_name}"
+                        f"Set row_count={metadata.get('row_count', '-')} for table {table_name}"
                     )
                 elif not omit_columns:
                     table_info["column_count"] = 0
@@ -449,7 +517,7 @@ def handle_command(
 
 DEFINITION = CommandDefinition(
     name="list_tables",
-    description="List tables in a schema (works with both Databricks and Redshift). By default returns data without showing table. Use display=true when user asks to see tables. For Databricks, use catalog_name and schema_name. For Redshift, use database and schema_name. Redshift automatically fetches column counts.",
+    description="List tables in a schema (works with both Databricks and Redshift). By default returns data without showing table. Use display=true when user asks to see tables. For Databricks, use catalog_name and schema_name. For Redshift, use database and schema_name. Redshift fetches column counts, row estimates and sizes from system tables; set exact_counts=true for exact row counts.",
     handler=handle_command,
     parameters={
         "catalog_name": {
@@ -479,6 +547,11 @@ DEFINITION = CommandDefinition(
             "description": "Whether to include tables with selective metadata access.",
             "default": False,
         },
+        "exact_counts": {
+            "type": "boolean",
+            "description": "Redshift only: compute exact row counts with COUNT(*) instead of system table estimates. Slower on large tables.",
+            "default": False,
+        },
         "display": {
             "type": "boolean",
             "description": "Whether to display the table list to the user (default: false). Set to true when user asks to see tables.",
@@ -489,10 +562,11 @@ DEFINITION = CommandDefinition(
     needs_api_client=True,
     visible_to_user=True,
     visible_to_agent=True,
+    side_effect_free=True,
     agent_display="conditional",  # Use conditional display based on display parameter
     display_condition=lambda result: result.get(
         "display", False
     ),  # Show full table only when display=True
     condensed_action="Listing tables",  # Friendly name for condensed display
-    usage_hint="Usage: /list-tables [--catalog_name <catalog>] [--database <database>] [--schema_name <schema>] [--display true|false]\n(Uses active catalog/database/schema if not specified. Redshift automatically fetches column counts)",
+    usage_hint="Usage: /list-tables [--catalog_name <catalog>] [--database <database>] [--schema_name <schema>] [--exact-counts] [--display true|false]\n(Uses active catalog/database/schema if not specified. Redshift row counts are system table estimates unless --exact-counts is given)",
 )
@@ -3,6 +3,7 @@ Command for listing volumes in a Unity Catalog schema.
 """
 
 from typing import Optional, Any
+from chuck_data.catalogs import iter_volumes
 from chuck_data.clients.databricks import DatabricksAPIClient
 from chuck_data.commands.base import CommandResult
 from chuck_data.config import get_active_catalog, get_active_schema
@@ -56,15 +57,13 @@ def handle_command(
             )
 
     try:
-        # List volumes in the schema
-        result = client.list_volumes(
-            catalog_name=catalog_name,
-            schema_name=schema_name,
-            include_browse=include_browse,
+        # List volumes in the schema, following every page
+        volumes = list(
+            iter_volumes(
+                client, catalog_name, schema_name, include_browse=include_browse
+            )
         )
 
-        volumes = result.get("volumes", [])
-
         if not volumes:
             return CommandResult(
                 True,
@@ -126,6 +125,7 @@ DEFINITION = CommandDefinition(
     needs_api_client=True,
     visible_to_user=True,
     visible_to_agent=True,
+    side_effect_free=True,
     agent_display="full",  # Show full volume list in tables
     usage_hint="Usage: /list-volumes [--catalog_name <catalog>] [--schema_name <schema>] [--include_browse true|false]\n(Uses active catalog/schema if not specified)",
     provider="databricks",  # Databricks-specific command for Unity Catalog volumes
@@ -78,20 +78,28 @@ def _monitor_job_completion(
     timeout: int = 1800,
 ) -> Dict[str, Any]:
     """
-    Poll job status from Chuck backend until completion or timeout.
+    Follow job status from Chuck backend until completion or timeout.
+
+    The job is polled by the shared job watcher; this function only waits for
+    its events, so the job stays watched in the background (and the TUI is
+    told when it finishes) if monitoring is interrupted or times out.
 
     Args:
         job_id: Chuck job identifier
         run_id: Databricks run ID (for fallback/reference)
-        poll_interval: Seconds between status checks (default: 30s)
+        poll_interval: Seconds between status checks (default: 30s); the
+            watcher checks pending jobs more often and backs off while a
+            running job does not change
         timeout: Maximum seconds to wait (default: 1800s = 30min)
 
     Returns:
         Dict with final job status from Chuck backend
     """
+    import queue
     import time
     from chuck_data.clients.amperity import AmperityAPIClient
     from chuck_data.config import get_amperity_token
+    from chuck_data.job_watcher import KIND_AMPERITY, get_job_watcher
     from chuck_data.ui.tui import get_console
     from chuck_data.ui.theme import INFO_STYLE, SUCCESS_STYLE, ERROR_STYLE
 
@@ -116,21 +124,40 @@ def _monitor_job_completion(
     )
     logging.info(f"Monitoring job {job_id} for completion...")
 
-    while True:
-        elapsed = time.time() - monitor_start_time
-        if elapsed > timeout:
-            timeout_msg = f"Job monitoring timed out after {timeout}s"
-            console.print(f"[{ERROR_STYLE}]{timeout_msg}[/{ERROR_STYLE}]")
-            return {
-                "success": False,
-                "error": timeout_msg,
-                "job_id": job_id,
-                "state": "TIMEOUT",
-            }
-
-        # Query Chuck backend for job status
-        try:
-            job_data = amperity_client.get_job_status(job_id, token)
+    watcher = get_job_watcher()
+    events: "queue.Queue" = queue.Queue()
+    unsubscribe = watcher.subscribe(events.put, key=(KIND_AMPERITY, job_id))
+    try:
+        watcher.watch_amperity_job(
+            job_id, token, client=amperity_client, poll_interval=poll_interval
+        )
+
+        while True:
+            elapsed = time.time() - monitor_start_time
+            if elapsed > timeout:
+                timeout_msg = f"Job monitoring timed out after {timeout}s"
+                console.print(f"[{ERROR_STYLE}]{timeout_msg}[/{ERROR_STYLE}]")
+                return {
+                    "success": False,
+                    "error": timeout_msg,
+                    "job_id": job_id,
+                    "state": "TIMEOUT",
+                }
+
+            # Wait for the watcher to report a change
+            try:
+                event = events.get(timeout=timeout - elapsed)
+            except queue.Empty:
+                continue
+
+            if event.error is not None:
+                logging.warning(f"Error querying Chuck backend: {event.error}")
+                console.print(
+                    f"[{INFO_STYLE}]Still monitoring... (elapsed: {int(elapsed)}s)[/{INFO_STYLE}]"
+                )
+                continue
+
+            job_data = event.data
 
             # Use shared terminal state checker
             is_terminal, result = _check_terminal_state(job_data)
@@ -229,16 +256,150 @@ def _monitor_job_completion(
             if record_count:
                 progress_msg += f", Records: {record_count:,}"
             console.print(f"[{INFO_STYLE}]{progress_msg}[/{INFO_STYLE}]")
+    finally:
+        unsubscribe()
+
+
+def _monitor_databricks_run(
+    client: DatabricksAPIClient,
+    run_id: str,
+    poll_interval: int = 30,
+    timeout: int = 1800,
+) -> Dict[str, Any]:
+    """
+    Follow a Databricks job run until it finishes or the timeout passes.
+
+    Used for run IDs with no Chuck job ID to check through the backend. The
+    shared job watcher reads the run from the list of active runs, together
+    with any other runs it is watching.
+
+    Args:
+        client: DatabricksAPIClient the run belongs to
+        run_id: Databricks run ID
+        poll_interval: Seconds between status checks (default: 30s)
+        timeout: Maximum seconds to wait (default: 1800s = 30min)
+
+    Returns:
+        Dict with the final run state
+    """
+    import queue
+    import time
+    from chuck_data.job_watcher import KIND_DATABRICKS, get_job_watcher
+    from chuck_data.ui.tui import get_console
+    from chuck_data.ui.theme import INFO_STYLE, SUCCESS_STYLE, ERROR_STYLE
+
+    console = get_console()
+    monitor_start_time = time.time()
+    console.print(
+        f"\n[{INFO_STYLE}]Monitoring Databricks run {run_id}... (Press Ctrl+C to exit)[/{INFO_STYLE}]"
+    )
+
+    watcher = get_job_watcher()
+    events: "queue.Queue" = queue.Queue()
+    unsubscribe = watcher.subscribe(events.put, key=(KIND_DATABRICKS, run_id))
+    try:
+        watcher.watch_databricks_run(run_id, client, poll_interval=poll_interval)
+
+        while True:
+            elapsed = time.time() - monitor_start_time
+            if elapsed > timeout:
+                timeout_msg = f"Run monitoring timed out after {timeout}s"
+                console.print(f"[{ERROR_STYLE}]{timeout_msg}[/{ERROR_STYLE}]")
+                return {
+                    "success": False,
+                    "error": timeout_msg,
+                    "databricks_run_id": run_id,
+                    "state": "TIMEOUT",
+                }
+
+            try:
+                event = events.get(timeout=timeout - elapsed)
+            except queue.Empty:
+                continue
+
+            if event.error is not None:
+                logging.warning(
+                    f"Error querying Databricks run {run_id}: {event.error}"
+                )
+                continue
+
+            if event.terminal:
+                if event.succeeded:
+                    console.print(
+                        f"[{SUCCESS_STYLE}]Run completed successfully![/{SUCCESS_STYLE}]"
+                    )
+                    return {
+                        "success": True,
+                        "databricks_run_id": run_id,
+                        "state": event.state,
+                        "run_data": event.data,
+                    }
+                run_state = event.data.get("state") or {}
+                error_msg = run_state.get("state_message") or (
+                    f"Run ended in state {event.state}"
+                )
+                console.print(f"[{ERROR_STYLE}]Run failed: {error_msg}[/{ERROR_STYLE}]")
+                return {
+                    "success": False,
+                    "databricks_run_id": run_id,
+                    "state": event.state,
+                    "error": error_msg,
+                    "run_data": event.data,
+                }
 
-        except Exception as e:
-            logging.warning(f"Error querying Chuck backend: {e}")
             console.print(
-                f"[{INFO_STYLE}]Still monitoring... (elapsed: {int(elapsed)}s)[/{INFO_STYLE}]"
+                f"[{INFO_STYLE}]Run in progress... State: {event.state}, "
+                f"Elapsed: {int(elapsed)}s[/{INFO_STYLE}]"
             )
+    finally:
+        unsubscribe()
+
 
-        # Still running - wait and poll again
-        logging.info(f"Job {job_id} still running... (elapsed: {int(elapsed)}s)")
-        time.sleep(poll_interval)
+def _handle_databricks_run(
+    client: DatabricksAPIClient,
+    run_id: str,
+    poll_interval: int,
+    timeout: int,
+    background: bool,
+) -> CommandResult:
+    """Monitor a Databricks run that has no Chuck job ID."""
+    if background:
+        from chuck_data.job_watcher import get_job_watcher
+
+        get_job_watcher().watch_databricks_run(
+            run_id, client, poll_interval=poll_interval
+        )
+        return CommandResult(
+            True,
+            message=f"Watching Databricks run {run_id} in the background. "
+            "You'll be notified when it finishes.",
+            data={"databricks_run_id": run_id, "background": True},
+        )
+
+    monitor_result = _monitor_databricks_run(client, run_id, poll_interval, timeout)
+    if monitor_result.get("success"):
+        message = f"Databricks run {run_id} completed successfully!"
+    else:
+        message = (
+            f"Databricks run {run_id} monitoring ended: "
+            f"{monitor_result.get('error', 'Unknown error')}"
+        )
+    return CommandResult(
+        monitor_result.get("success", False), message=message, data=monitor_result
+    )
+
+
+def _watch_in_background(job_id: str, token: str, poll_interval: int) -> CommandResult:
+    """Hand a job to the shared watcher and return straight to the prompt."""
+    from chuck_data.job_watcher import get_job_watcher
+
+    get_job_watcher().watch_amperity_job(job_id, token, poll_interval=poll_interval)
+    return CommandResult(
+        True,
+        message=f"Watching job {job_id} in the background. "
+        "You'll be notified when it finishes.",
+        data={"job_id": job_id, "background": True},
+    )
 
 
 def handle_command(
@@ -252,10 +413,12 @@ def handle_command(
     Args:
         **kwargs: Command parameters
             - job_id or job-id: Chuck job identifier (optional, uses cached if not provided)
-            - run_id or run-id: Databricks run ID (optional, will attempt to find it)
+            - run_id or run-id: Databricks run ID (optional, will attempt to find it;
+              a run with no Chuck job is followed through the Databricks Jobs API)
             - step_id or step-id: EMR step ID (optional, treated same as run_id)
             - poll_interval: Seconds between checks (default: 30)
             - timeout: Maximum seconds to wait (default: 1800 = 30 minutes)
+            - background: Watch without waiting and report when it finishes
 
     Returns:
         CommandResult with monitoring results
@@ -269,6 +432,7 @@ def handle_command(
     step_id = kwargs.get("step_id") or kwargs.get("step-id")
     poll_interval = kwargs.get("poll_interval", 30)
     timeout = kwargs.get("timeout", 1800)
+    background = kwargs.get("background", False)
 
     # Treat step_id as run_id (same field in backend)
     # If both are provided, step_id takes precedence
@@ -335,6 +499,11 @@ def handle_command(
         # IMPORTANT: Always check the current job state before monitoring
         # This prevents monitoring jobs that are already in terminal states
         if not job_id:
+            # A Databricks run can still be followed through the Jobs API
+            if isinstance(client, DatabricksAPIClient) and not step_id:
+                return _handle_databricks_run(
+                    client, str(run_id), poll_interval, timeout, background
+                )
             return CommandResult(
                 False,
                 message="Cannot monitor job: No job ID available. "
@@ -386,6 +555,9 @@ def handle_command(
                     error=e,
                 )
 
+        if background:
+            return _watch_in_background(job_id, token, poll_interval)
+
         # Monitor the job (run_id is required at this point)
         monitor_result = _monitor_job_completion(
             job_id=job_id or "unknown",  # Provide fallback for type safety
@@ -430,7 +602,7 @@ DEFINITION = CommandDefinition(
         },
         "run_id": {
             "type": "string",
-            "description": "Databricks run ID to monitor.",
+            "description": "Databricks run ID to monitor. Runs not launched by chuck are followed through the Databricks Jobs API.",
         },
         "step_id": {
             "type": "string",
@@ -444,12 +616,17 @@ DEFINITION = CommandDefinition(
             "type": "number",
             "description": "Maximum seconds to wait (default: 1800).",
         },
+        "background": {
+            "type": "boolean",
+            "description": "Keep watching the job in the background and return "
+            "immediately; a notice is shown when it finishes.",
+        },
     },
     required_params=[],
     tui_aliases=["/monitor-job", "/monitor"],
     needs_api_client=False,
     visible_to_user=True,
     visible_to_agent=True,
-    usage_hint="Usage: /monitor-job [--job_id <id> | --run_id <id> | --step_id <id>] OR /monitor-job (monitors last job)",
+    usage_hint="Usage: /monitor-job [--job_id <id> | --run_id <id> | --step_id <id>] [--background] OR /monitor-job (monitors last job)",
     condensed_action="Monitoring job",
 )
@@ -5,16 +5,107 @@ This module contains helper functions for detecting and tagging PII (Personally
 Identifiable Information) in database tables.
 """
 
+import asyncio
+import inspect
+import itertools
 import logging
 import json
 import concurrent.futures
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional, Tuple
 
+from chuck_data.catalogs import iter_tables
 from chuck_data.clients.databricks import DatabricksAPIClient
 from chuck_data.clients.redshift import RedshiftAPIClient
 from chuck_data.llm.provider import LLMProvider
 from chuck_data.ui.tui import get_console
 from chuck_data.data_providers import is_redshift_client, is_snowflake_client
+from chuck_data.commands.scan_scheduler import AsyncScanDriver, ScanScheduler
+from chuck_data.config import (
+    get_active_model,
+    get_pii_scan_async,
+    get_pii_scan_batch_max_columns,
+    get_pii_scan_batch_max_tokens,
+    get_pii_scan_batching,
+    get_pii_scan_databricks_metadata,
+    get_pii_scan_incremental,
+    get_warehouse_id,
+)
+from chuck_data.pii_cache import PIIClassificationCache, get_pii_cache, make_cache_key
+from chuck_data.scan_snapshot import get_scan_snapshots, snapshot_key
+
+# Bump whenever the classification prompt changes so cached results expire
+PII_PROMPT_VERSION = "1"
+
+# How Databricks scans get each table's columns: one get_table call per table,
+# columns included in the paginated table listing, or one
+# system.information_schema.columns query per schema
+DATABRICKS_METADATA_PER_TABLE = "per_table"
+DATABRICKS_METADATA_LIST_TABLES = "list_tables"
+DATABRICKS_METADATA_INFORMATION_SCHEMA = "information_schema"
+
+# Default budgets for one batched classification request
+DEFAULT_BATCH_MAX_COLUMNS = 100
+DEFAULT_BATCH_MAX_TOKENS = 4000
+
+# Tagging rules shared by the single-table and multi-table prompts
+_PII_TAGGING_INSTRUCTIONS = (
+    "You are an expert PII detection assistant. Your task is to analyze a list of database columns (name and type) "
+    "and assign a PII semantic tag to each column if applicable.\n\n"
+    "ALLOWED SEMANTIC TAGS (use ONLY these exact values):\n"
+    "- pk (for primary key columns that uniquely identify records - prefer uuid columns)\n"
+    "- address, address2 (physical address)\n"
+    "- birthdate (date of birth)\n"
+    "- city, country, state, postal (location)\n"
+    "- create-dt, update-dt (timestamps)\n"
+    "- email (email addresses)\n"
+    "- full-name, given-name, surname, title, generational-suffix (name components)\n"
+    "- gender\n"
+    "- phone (phone numbers)\n\n"
+    "CRITICAL RULE - NUMERIC TYPES CANNOT HAVE SEMANTICS:\n"
+    "The following column types MUST ALWAYS have semantic: null (never assign any semantic tag to these):\n"
+    "LONG, BIGINT, INT, INTEGER, SMALLINT, TINYINT, DOUBLE, FLOAT, DECIMAL, NUMERIC, NUMBER\n"
+    "This is a hard technical constraint - the downstream system will fail if you assign semantics to numeric types.\n\n"
+    "If a column does not contain PII or is a numeric type, assign null.\n\n"
+)
+
+
+def _scheduled(scheduler: Optional[ScanScheduler], kind: str, fn, *args, **kwargs):
+    """Run fn under the scheduler's limiter for ``kind``, or directly if none."""
+    if scheduler is None:
+        return fn(*args, **kwargs)
+    return scheduler.run(kind, fn, *args, **kwargs)
+
+
+def _provider_name(client) -> str:
+    """Data provider name used in cache and snapshot keys."""
+    if is_redshift_client(client):
+        return "redshift"
+    if is_snowflake_client(client):
+        return "snowflake"
+    return "databricks"
+
+
+def _llm_model_name(llm_client_instance) -> Optional[str]:
+    """Best-effort identifier of the model a provider will classify with."""
+    return getattr(llm_client_instance, "default_model", None) or get_active_model()
+
+
+def _table_pii_result(
+    base_name: str, full_name: str, tagged_columns: list, **extra: Any
+) -> Dict[str, Any]:
+    """Build the per-table result dict from classified columns."""
+    pii_cols = [col for col in tagged_columns if col["semantic"]]
+    return {
+        "table_name": base_name,
+        "full_name": full_name,
+        "column_count": len(tagged_columns),
+        "pii_column_count": len(pii_cols),
+        "has_pii": bool(pii_cols),
+        "columns": tagged_columns,
+        "pii_columns": pii_cols,
+        "skipped": False,
+        **extra,
+    }
 
 
 def _helper_tag_pii_columns_logic(
@@ -23,9 +114,28 @@ def _helper_tag_pii_columns_logic(
     table_name_param: str,
     catalog_or_database_context: Optional[str] = None,
     schema_name_context: Optional[str] = None,
+    scheduler: Optional[ScanScheduler] = None,
+    pii_cache: Optional[PIIClassificationCache] = None,
+    refresh_cache: bool = False,
+    defer_classification: bool = False,
+    table_info: Optional[Dict[str, Any]] = None,
 ) -> Dict[str, Any]:
-    """Internal logic for PII tagging of a single table (provider-aware)."""
-    response_content_for_error = ""
+    """Internal logic for PII tagging of a single table (provider-aware).
+
+    When a scheduler is given, the metadata and LLM calls run under its
+    adaptive concurrency limits. When a cache is given, an unchanged table
+    reuses its cached classification instead of calling the LLM (unless
+    refresh_cache is set), and fresh classifications are stored in it. The
+    result then carries "cache_hit".
+
+    With defer_classification, a table that still needs the LLM is returned
+    as a "pending_classification" dict instead, so the caller can batch it
+    with other tables (see _classify_pending_in_batches).
+
+    For Databricks, table_info with "full_name" and "columns" may be passed
+    when the scan already fetched the schema's metadata in bulk; get_table is
+    then not called.
+    """
     is_redshift = is_redshift_client(client)
     is_snowflake = is_snowflake_client(client)
 
@@ -50,7 +160,10 @@ def _helper_tag_pii_columns_logic(
             # Use direct API call - different for each provider
             if is_snowflake:
                 # Snowflake: use describe_table (same hierarchy as Redshift)
-                table_info = client.describe_table(
+                table_info = _scheduled(
+                    scheduler,
+                    "metadata",
+                    client.describe_table,
                     database=catalog_or_database_context,
                     schema=schema_name_context,
                     table=table_name_param,
@@ -78,7 +191,10 @@ def _helper_tag_pii_columns_logic(
                 ]
             elif is_redshift:
                 # Redshift: use describe_table
-                table_info = client.describe_table(
+                table_info = _scheduled(
+                    scheduler,
+                    "metadata",
+                    client.describe_table,
                     database=catalog_or_database_context,
                     schema=schema_name_context,
                     table=table_name_param,
@@ -104,8 +220,14 @@ def _helper_tag_pii_columns_logic(
                     for col in columns_raw
                 ]
             else:
-                # Databricks: use get_table
-                table_info = client.get_table(full_name=resolved_table_name)
+                # Databricks: use get_table unless the scan already has the columns
+                if table_info is None:
+                    table_info = _scheduled(
+                        scheduler,
+                        "metadata",
+                        client.get_table,
+                        full_name=resolved_table_name,
+                    )
                 if not table_info:
                     error_msg = f"Failed to retrieve table details for PII tagging: {table_name_param}"
                     return {
@@ -156,80 +278,67 @@ def _helper_tag_pii_columns_logic(
             for col in columns
         ]
 
-        system_message = (
-            "You are an expert PII detection assistant. Your task is to analyze a list of database columns (name and type) "
-            "and assign a PII semantic tag to each column if applicable.\n\n"
-            "ALLOWED SEMANTIC TAGS (use ONLY these exact values):\n"
-            "- pk (for primary key columns that uniquely identify records - prefer uuid columns)\n"
-            "- address, address2 (physical address)\n"
-            "- birthdate (date of birth)\n"
-            "- city, country, state, postal (location)\n"
-            "- create-dt, update-dt (timestamps)\n"
-            "- email (email addresses)\n"
-            "- full-name, given-name, surname, title, generational-suffix (name components)\n"
-            "- gender\n"
-            "- phone (phone numbers)\n\n"
-            "CRITICAL RULE - NUMERIC TYPES CANNOT HAVE SEMANTICS:\n"
-            "The following column types MUST ALWAYS have semantic: null (never assign any semantic tag to these):\n"
-            "LONG, BIGINT, INT, INTEGER, SMALLINT, TINYINT, DOUBLE, FLOAT, DECIMAL, NUMERIC, NUMBER\n"
-            "This is a hard technical constraint - the downstream system will fail if you assign semantics to numeric types.\n\n"
-            "If a column does not contain PII or is a numeric type, assign null.\n\n"
-            "Respond ONLY with a valid JSON list of objects, where each object represents a column and has the following structure: "
-            '{"name": "column_name", "semantic": "pii_tag_or_null"}. '
-            "Maintain original order. No explanations or introductory text."
-        )
-        user_prompt = f"Analyze the following columns from table '{resolved_full_name}' and provide PII semantic tags in the specified JSON format: {json.dumps(column_details_for_llm, indent=2)}"
-
-        llm_response_obj = llm_client_instance.chat(
-            messages=[
-                {"role": "system", "content": system_message},
-                {"role": "user", "content": user_prompt},
-            ]
-        )
-        response_content_for_error = (
-            llm_response_obj.choices[0].message.content or ""
-        )  # Store for potential error reporting
-        response_content_clean = response_content_for_error.strip()
-        if response_content_clean.startswith("```json"):
-            response_content_clean = response_content_clean[7:-3].strip()
-        elif response_content_clean.startswith("```"):
-            response_content_clean = response_content_clean[3:-3].strip()
-
-        llm_tags = json.loads(response_content_clean)
-        if not isinstance(llm_tags, list) or len(llm_tags) != len(columns):
-            raise ValueError(
-                f"LLM PII tag response format error. Expected {len(columns)} items, got {len(llm_tags)}."
-            )
-
-        semantic_map = {
-            item["name"]: item["semantic"]
-            for item in llm_tags
-            if isinstance(item, dict) and "name" in item
-        }
-        tagged_columns_list = []
-        for col in columns:
-            col_name = col.get("name", "")
-            # Handle both Databricks (type_name) and Redshift (type) column formats
-            col_type = col.get("type_name", col.get("type", ""))
-            tagged_columns_list.append(
-                {
-                    "name": col_name,
-                    "type": col_type,
-                    "semantic": semantic_map.get(col_name),
-                }
+        cache_key = None
+        if pii_cache is not None:
+            cache_key = make_cache_key(
+                _provider_name(client),
+                resolved_full_name,
+                column_details_for_llm,
+                PII_PROMPT_VERSION,
+                _llm_model_name(llm_client_instance),
             )
+            cached_columns = None if refresh_cache else pii_cache.get(cache_key)
+            if cached_columns is not None and len(cached_columns) == len(columns):
+                return _table_pii_result(
+                    base_name_of_resolved,
+                    resolved_full_name,
+                    cached_columns,
+                    cache_hit=True,
+                )
 
-        pii_cols = [col for col in tagged_columns_list if col["semantic"]]
-        return {
+        pending = {
+            "pending_classification": True,
+            "table_name_param": table_name_param,
             "table_name": base_name_of_resolved,
             "full_name": resolved_full_name,
-            "column_count": len(columns),
-            "pii_column_count": len(pii_cols),
-            "has_pii": bool(pii_cols),
-            "columns": tagged_columns_list,
-            "pii_columns": pii_cols,
-            "skipped": False,
+            "columns": columns,
+            "column_details": column_details_for_llm,
+            "cache_key": cache_key,
         }
+        if defer_classification:
+            return pending
+    except Exception as e_tag:
+        logging.error(
+            f"_helper_tag_pii_columns_logic error for '{table_name_param}': {e_tag}",
+            exc_info=True,
+        )
+        return {
+            "error": f"Error during PII tagging for '{table_name_param}': {str(e_tag)}",
+            "skipped": True,
+        }
+
+    return _classify_pending_table(llm_client_instance, pending, scheduler, pii_cache)
+
+
+def _classify_pending_table(
+    llm_client_instance: LLMProvider,
+    pending: Dict[str, Any],
+    scheduler: Optional[ScanScheduler] = None,
+    pii_cache: Optional[PIIClassificationCache] = None,
+) -> Dict[str, Any]:
+    """Classify one table prepared by _helper_tag_pii_columns_logic with its own LLM call."""
+    response_content_for_error = ""
+    table_name_param = pending["table_name_param"]
+    try:
+        system_message, user_prompt = _single_table_prompt(
+            pending["full_name"], pending["column_details"]
+        )
+        response_content_for_error = _request_pii_tags(
+            llm_client_instance, system_message, user_prompt, scheduler
+        )  # Store for potential error reporting
+        llm_tags = _parse_llm_json(response_content_for_error)
+        tagged_columns_list = _apply_llm_tags(pending["columns"], llm_tags)
+        return _classified_table_result(pending, tagged_columns_list, pii_cache)
     except json.JSONDecodeError as e_json:
         logging.error(
             f"_helper_tag_pii_columns_logic: JSONDecodeError: {e_json} from LLM response: {response_content_for_error[:500]}"
@@ -246,14 +355,500 @@ def _helper_tag_pii_columns_logic(
         }
 
 
+async def _aclassify_pending_table(
+    llm_client_instance: LLMProvider,
+    pending: Dict[str, Any],
+    driver: AsyncScanDriver,
+    pii_cache: Optional[PIIClassificationCache] = None,
+) -> Dict[str, Any]:
+    """Coroutine version of _classify_pending_table using the provider's achat()."""
+    response_content_for_error = ""
+    table_name_param = pending["table_name_param"]
+    try:
+        system_message, user_prompt = _single_table_prompt(
+            pending["full_name"], pending["column_details"]
+        )
+        llm_response_obj = await driver.run(
+            llm_client_instance.achat,
+            messages=[
+                {"role": "system", "content": system_message},
+                {"role": "user", "content": user_prompt},
+            ],
+        )
+        response_content_for_error = llm_response_obj.choices[0].message.content or ""
+        llm_tags = _parse_llm_json(response_content_for_error)
+        tagged_columns_list = _apply_llm_tags(pending["columns"], llm_tags)
+        return _classified_table_result(pending, tagged_columns_list, pii_cache)
+    except json.JSONDecodeError as e_json:
+        logging.error(
+            f"_aclassify_pending_table: JSONDecodeError: {e_json} from LLM response: {response_content_for_error[:500]}"
+        )
+        return {"error": f"Failed to parse PII LLM response: {e_json}", "skipped": True}
+    except Exception as e_tag:
+        logging.error(
+            f"_aclassify_pending_table error for '{table_name_param}': {e_tag}",
+            exc_info=True,
+        )
+        return {
+            "error": f"Error during PII tagging for '{table_name_param}': {str(e_tag)}",
+            "skipped": True,
+        }
+
+
+def _supports_async_chat(llm_client_instance) -> bool:
+    """True if the provider implements the achat() coroutine."""
+    return inspect.iscoroutinefunction(getattr(llm_client_instance, "achat", None))
+
+
+def _classify_pending_async(
+    llm_client_instance: LLMProvider,
+    pending_tables: List[Dict[str, Any]],
+    driver: Optional[AsyncScanDriver] = None,
+    pii_cache: Optional[PIIClassificationCache] = None,
+) -> List[Dict[str, Any]]:
+    """Classify deferred tables concurrently from a single asyncio event loop.
+
+    Each table gets its own achat() request; the driver caps how many are in
+    flight at once (pii_scan_async_max_in_flight, default 32). The provider's
+    async resources are closed before the loop ends, and if this thread is
+    already running a loop the scan gets a loop of its own on a worker thread.
+    """
+    driver = driver or AsyncScanDriver()
+
+    async def classify_all():
+        try:
+            return await asyncio.gather(
+                *(
+                    _aclassify_pending_table(
+                        llm_client_instance, pending, driver, pii_cache
+                    )
+                    for pending in pending_tables
+                )
+            )
+        finally:
+            aclose = getattr(llm_client_instance, "aclose", None)
+            if inspect.iscoroutinefunction(aclose):
+                await aclose()
+
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return list(asyncio.run(classify_all()))
+
+    # asyncio.run cannot nest inside a running loop
+    with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+        return list(executor.submit(asyncio.run, classify_all()).result())
+
+
+def _classified_table_result(
+    pending: Dict[str, Any],
+    tagged_columns_list: list,
+    pii_cache: Optional[PIIClassificationCache],
+) -> Dict[str, Any]:
+    """Build a table result from fresh LLM tags, storing them in the cache if any."""
+    if pii_cache is None:
+        return _table_pii_result(
+            pending["table_name"], pending["full_name"], tagged_columns_list
+        )
+    pii_cache.put(pending["cache_key"], pending["full_name"], tagged_columns_list)
+    return _table_pii_result(
+        pending["table_name"],
+        pending["full_name"],
+        tagged_columns_list,
+        cache_hit=False,
+    )
+
+
+def _single_table_prompt(full_name: str, column_details: list):
+    """Return the (system, user) messages for classifying one table."""
+    system_message = _PII_TAGGING_INSTRUCTIONS + (
+        "Respond ONLY with a valid JSON list of objects, where each object represents a column and has the following structure: "
+        '{"name": "column_name", "semantic": "pii_tag_or_null"}. '
+        "Maintain original order. No explanations or introductory text."
+    )
+    user_prompt = f"Analyze the following columns from table '{full_name}' and provide PII semantic tags in the specified JSON format: {json.dumps(column_details, indent=2)}"
+    return system_message, user_prompt
+
+
+def _batch_prompt(pending_tables: list):
+    """Return the (system, user) messages for classifying several tables at once."""
+    system_message = _PII_TAGGING_INSTRUCTIONS + (
+        "You will be given several tables. Respond ONLY with a valid JSON object whose keys are the exact "
+        "table names given and whose values are JSON lists of objects, one per column, with the following structure: "
+        '{"name": "column_name", "semantic": "pii_tag_or_null"}. '
+        "Include every table and every column, and maintain original column order. "
+        "No explanations or introductory text."
+    )
+    tables = {p["full_name"]: p["column_details"] for p in pending_tables}
+    user_prompt = f"Analyze the columns of the following tables and provide PII semantic tags in the specified JSON format: {json.dumps(tables, indent=2)}"
+    return system_message, user_prompt
+
+
+def _estimate_tokens(text: str) -> int:
+    """Rough token count for prompt budgeting (about four characters per token)."""
+    return max(1, len(text) // 4)
+
+
+def _request_pii_tags(
+    llm_client_instance: LLMProvider,
+    system_message: str,
+    user_prompt: str,
+    scheduler: Optional[ScanScheduler] = None,
+) -> str:
+    """Send a classification prompt and return the raw response text."""
+    llm_response_obj = _scheduled(
+        scheduler,
+        "llm",
+        llm_client_instance.chat,
+        messages=[
+            {"role": "system", "content": system_message},
+            {"role": "user", "content": user_prompt},
+        ],
+    )
+    return llm_response_obj.choices[0].message.content or ""
+
+
+def _parse_llm_json(response_content: str) -> Any:
+    """Parse a JSON LLM response, tolerating a surrounding markdown code fence."""
+    response_content_clean = response_content.strip()
+    if response_content_clean.startswith("```json"):
+        response_content_clean = response_content_clean[7:-3].strip()
+    elif response_content_clean.startswith("```"):
+        response_content_clean = response_content_clean[3:-3].strip()
+    return json.loads(response_content_clean)
+
+
+def _apply_llm_tags(columns: list, llm_tags: Any) -> list:
+    """Merge the LLM's per-column tags into the table's columns.
+
+    Raises:
+        ValueError: If the response is not a list with one item per column,
+            or an item is not an object with "name" and "semantic"
+    """
+    if not isinstance(llm_tags, list) or len(llm_tags) != len(columns):
+        got = len(llm_tags) if isinstance(llm_tags, list) else type(llm_tags).__name__
+        raise ValueError(
+            f"LLM PII tag response format error. Expected {len(columns)} items, got {got}."
+        )
+    for item in llm_tags:
+        if (
+            not isinstance(item, dict)
+            or not isinstance(item.get("name"), str)
+            or "semantic" not in item
+        ):
+            raise ValueError(
+                f"LLM PII tag response format error. Malformed item: {item!r}"
+            )
+
+    semantic_map = {item["name"]: item["semantic"] for item in llm_tags}
+    tagged_columns_list = []
+    for col in columns:
+        col_name = col.get("name", "")
+        # Handle both Databricks (type_name) and Redshift (type) column formats
+        col_type = col.get("type_name", col.get("type", ""))
+        tagged_columns_list.append(
+            {
+                "name": col_name,
+                "type": col_type,
+                "semantic": semantic_map.get(col_name),
+            }
+        )
+    return tagged_columns_list
+
+
+def _pack_classification_batches(
+    pending_tables: List[Dict[str, Any]], max_columns: int, max_tokens: int
+) -> List[List[Dict[str, Any]]]:
+    """Greedily pack pending tables into batches within the column and token budgets.
+
+    A table that exceeds a budget on its own ends up in a batch of one.
+    """
+    batches: List[List[Dict[str, Any]]] = []
+    current: List[Dict[str, Any]] = []
+    current_columns = current_tokens = 0
+    for pending in pending_tables:
+        columns = len(pending["columns"])
+        tokens = _estimate_tokens(
+            json.dumps({pending["full_name"]: pending["column_details"]}, indent=2)
+        )
+        if current and (
+            current_columns + columns > max_columns
+            or current_tokens + tokens > max_tokens
+        ):
+            batches.append(current)
+            current, current_columns, current_tokens = [], 0, 0
+        current.append(pending)
+        current_columns += columns
+        current_tokens += tokens
+    if current:
+        batches.append(current)
+    return batches
+
+
+def _classify_batch(
+    llm_client_instance: LLMProvider,
+    batch: List[Dict[str, Any]],
+    scheduler: Optional[ScanScheduler] = None,
+    pii_cache: Optional[PIIClassificationCache] = None,
+) -> Tuple[List[Dict[str, Any]], Dict[str, int]]:
+    """Classify a batch of tables with one LLM request.
+
+    Tables whose part of the response is missing or has the wrong number of
+    columns (or all of them, if the response cannot be parsed) are retried
+    with their own per-table request.
+
+    Returns:
+        Tuple of (table results, {"requests", "prompt_tokens", "fallback_tables"})
+    """
+    stats = {"requests": 0, "prompt_tokens": 0, "fallback_tables": 0}
+
+    def classify_alone(pending):
+        stats["requests"] += 1
+        stats["prompt_tokens"] += _estimate_tokens(
+            "".join(
+                _single_table_prompt(pending["full_name"], pending["column_details"])
+            )
+        )
+        return _classify_pending_table(
+            llm_client_instance, pending, scheduler, pii_cache
+        )
+
+    if len(batch) == 1:
+        return [classify_alone(batch[0])], stats
+
+    system_message, user_prompt = _batch_prompt(batch)
+    stats["requests"] += 1
+    stats["prompt_tokens"] += _estimate_tokens(system_message + user_prompt)
+    response = None
+    try:
+        response = _parse_llm_json(
+            _request_pii_tags(
+                llm_client_instance, system_message, user_prompt, scheduler
+            )
+        )
+    except Exception as e:
+        logging.warning(
+            f"Batched PII classification of {len(batch)} tables failed, falling back to per-table requests: {e}"
+        )
+
+    results = []
+    failed = []
+    for pending in batch:
+        try:
+            if not isinstance(response, dict):
+                raise ValueError("Batched response is not a JSON object")
+            tagged_columns_list = _apply_llm_tags(
+                pending["columns"], response.get(pending["full_name"])
+            )
+        except ValueError as e:
+            logging.debug(f"Batched PII tags for '{pending['full_name']}' invalid: {e}")
+            failed.append(pending)
+            continue
+        results.append(
+            _classified_table_result(pending, tagged_columns_list, pii_cache)
+        )
+
+    stats["fallback_tables"] = len(failed)
+    results.extend(classify_alone(pending) for pending in failed)
+    return results, stats
+
+
+def _classify_pending_in_batches(
+    llm_client_instance: LLMProvider,
+    pending_tables: List[Dict[str, Any]],
+    executor: concurrent.futures.Executor,
+    scheduler: Optional[ScanScheduler] = None,
+    pii_cache: Optional[PIIClassificationCache] = None,
+    max_columns: Optional[int] = None,
+    max_tokens: Optional[int] = None,
+) -> Tuple[List[Dict[str, Any]], Dict[str, int]]:
+    """Classify tables deferred by _helper_tag_pii_columns_logic, several per request.
+
+    Args:
+        llm_client_instance: LLM provider to classify with
+        pending_tables: "pending_classification" dicts
+        executor: Pool the batch requests run on
+        scheduler: Optional scheduler limiting concurrent LLM calls
+        pii_cache: Optional cache fresh classifications are stored in
+        max_columns: Column budget per request (defaults to config, then 100)
+        max_tokens: Estimated prompt token budget per request (defaults to
+            config, then 4000)
+
+    Returns:
+        Tuple of (table results, batching stats for the scan summary)
+    """
+    column_budget: int = (
+        max_columns or get_pii_scan_batch_max_columns() or DEFAULT_BATCH_MAX_COLUMNS
+    )
+    token_budget: int = (
+        max_tokens or get_pii_scan_batch_max_tokens() or DEFAULT_BATCH_MAX_TOKENS
+    )
+    batches = _pack_classification_batches(pending_tables, column_budget, token_budget)
+    # What the same tables would have cost with one request each
+    per_table_tokens = sum(
+        _estimate_tokens(
+            "".join(_single_table_prompt(p["full_name"], p["column_details"]))
+        )
+        for p in pending_tables
+    )
+
+    results: List[Dict[str, Any]] = []
+    requests = prompt_tokens = fallback_tables = 0
+    futures = [
+        executor.submit(
+            _classify_batch, llm_client_instance, batch, scheduler, pii_cache
+        )
+        for batch in batches
+    ]
+    for future in concurrent.futures.as_completed(futures):
+        batch_results, batch_stats = future.result()
+        results.extend(batch_results)
+        requests += batch_stats["requests"]
+        prompt_tokens += batch_stats["prompt_tokens"]
+        fallback_tables += batch_stats["fallback_tables"]
+
+    return results, {
+        "tables_classified": len(pending_tables),
+        "batched_requests": sum(1 for batch in batches if len(batch) > 1),
+        "llm_requests": requests,
+        "fallback_tables": fallback_tables,
+        # Fallbacks can cost more requests than batching saved
+        "requests_saved": max(len(pending_tables) - requests, 0),
+        "estimated_prompt_tokens_saved": per_table_tokens - prompt_tokens,
+    }
+
+
+def _table_change_markers(
+    client, catalog_or_database_name: str, schema_name: str, tables: List[Dict]
+) -> Dict[str, Optional[str]]:
+    """Cheap per-table change markers for incremental scans.
+
+    Databricks uses the listing's ``updated_at``; Redshift hashes each
+    table's columns from pg_table_def; Snowflake reads LAST_ALTERED from
+    INFORMATION_SCHEMA.TABLES. Both of the latter take one query per schema.
+
+    Returns:
+        Mapping of table name to marker, or None where no marker is
+        available (such tables are always rescanned)
+    """
+    markers: Dict[str, Optional[str]] = {tbl.get("name", ""): None for tbl in tables}
+    try:
+        if is_redshift_client(client):
+            found = client.get_table_column_signatures(
+                catalog_or_database_name, schema_name
+            )
+        elif is_snowflake_client(client):
+            found = client.get_table_last_altered(catalog_or_database_name, schema_name)
+        else:
+            found = {
+                tbl.get("name"): f"{tbl.get('table_id', '')}:{tbl['updated_at']}"
+                for tbl in tables
+                if tbl.get("updated_at") is not None
+            }
+    except Exception as e:
+        logging.warning(
+            f"Could not read change markers for {catalog_or_database_name}.{schema_name}, rescanning every table: {e}"
+        )
+        return markers
+
+    for name in markers:
+        if found.get(name) is not None:
+            markers[name] = str(found[name])
+    return markers
+
+
+def _fetch_schema_columns(
+    client,
+    catalog_name: str,
+    schema_name: str,
+    scheduler: Optional[ScanScheduler] = None,
+) -> Optional[Dict[str, List[Dict[str, Any]]]]:
+    """Columns of every table in a Databricks schema from information_schema.
+
+    Returns:
+        Mapping of table name to columns, or None if the query cannot run
+        (no warehouse configured, or it failed), in which case tables fall
+        back to one get_table call each
+    """
+    warehouse_id = get_warehouse_id()
+    if not warehouse_id or not hasattr(client, "get_schema_columns"):
+        logging.warning(
+            "information_schema column metadata needs an active warehouse; "
+            "fetching columns per table instead"
+        )
+        return None
+    try:
+        return _scheduled(
+            scheduler,
+            "metadata",
+            client.get_schema_columns,
+            catalog_name,
+            schema_name,
+            warehouse_id,
+        )
+    except Exception as e:
+        logging.warning(
+            f"Bulk column query for {catalog_name}.{schema_name} failed, "
+            f"fetching columns per table instead: {e}"
+        )
+        return None
+
+
 def _helper_scan_schema_for_pii_logic(
     client,
     llm_client_instance: LLMProvider,
     catalog_or_database_name: str,
     schema_name: str,
     show_progress: bool = True,
+    scheduler: Optional[ScanScheduler] = None,
+    refresh: bool = False,
+    pii_cache: Optional[PIIClassificationCache] = None,
+    batch: Optional[bool] = None,
+    incremental: Optional[bool] = None,
+    use_async: Optional[bool] = None,
+    tables: Optional[List[Dict[str, Any]]] = None,
+    metadata_mode: Optional[str] = None,
 ) -> Dict[str, Any]:
-    """Internal logic for scanning all tables in a schema for PII (provider-aware)."""
+    """Internal logic for scanning all tables in a schema for PII (provider-aware).
+
+    Tables are scanned on a thread pool whose effective parallelism is set by
+    the scheduler's adaptive limits (see scan_scheduler). A default
+    ScanScheduler, sized from config, is created when none is given.
+
+    Classifications are reused from the PII cache (the shared on-disk cache
+    by default) for tables whose columns are unchanged; refresh=True
+    reclassifies every table and overwrites the cached entries.
+
+    With batching (batch=True, or the pii_scan_batching config setting when
+    batch is None), tables that need the LLM are packed several per request
+    and the summary reports the requests and tokens saved under
+    "llm_batching".
+
+    With incremental scanning (incremental=True, or the pii_scan_incremental
+    config setting when incremental is None), tables whose change marker
+    matches the last scan's snapshot are not described or classified again;
+    their previous result is carried forward into results_detail (flagged
+    "carried_forward"). Added, altered and dropped tables are reported under
+    "incremental". refresh=True rescans every table.
+
+    With async classification (use_async=True, or the pii_scan_async config
+    setting when use_async is None) and a provider that implements achat(),
+    metadata is still fetched on the thread pool but the per-table LLM
+    requests run on one event loop under an AsyncScanDriver, and the summary
+    reports its stats under "async_stats". Batching takes precedence.
+
+    Databricks tables are listed page by page and, unless scanning
+    incrementally, each page's tables are submitted for scanning while the
+    next page loads. Callers that already listed the schema (e.g. several
+    schemas at once) can pass the table summaries as tables.
+
+    metadata_mode (default: the pii_scan_databricks_metadata config setting,
+    else "per_table") selects how Databricks columns are fetched: one
+    get_table call per table, columns included in the table listing
+    ("list_tables"), or one system.information_schema.columns query on the
+    active warehouse ("information_schema", falling back to per-table calls
+    if the query fails). Workers then start from the fetched columns.
+    """
     if not catalog_or_database_name or not schema_name:
         return {
             "error": "Catalog/database and schema names are required for bulk PII scan."
@@ -262,33 +857,57 @@ def _helper_scan_schema_for_pii_logic(
     # Determine provider
     is_redshift = is_redshift_client(client)
     is_snowflake = is_snowflake_client(client)
+    if metadata_mode is None:
+        metadata_mode = (
+            get_pii_scan_databricks_metadata() or DATABRICKS_METADATA_PER_TABLE
+        )
 
     # Use direct API call instead of handle_tables
     try:
-        if is_redshift or is_snowflake:
+        if tables is not None:
+            listed_tables = iter(tables)
+        elif is_redshift or is_snowflake:
             # Both Redshift and Snowflake use database + schema_pattern
             tables_response = client.list_tables(
                 database=catalog_or_database_name,
                 schema_pattern=schema_name,
                 omit_columns=True,
             )
+            listed_tables = iter(tables_response.get("tables", []))
         else:
-            tables_response = client.list_tables(
-                catalog_name=catalog_or_database_name,
-                schema_name=schema_name,
-                omit_columns=True,
+            listed_tables = iter_tables(
+                client,
+                catalog_or_database_name,
+                schema_name,
+                omit_columns=metadata_mode != DATABRICKS_METADATA_LIST_TABLES,
             )
-        all_tables_in_schema = tables_response.get("tables", [])
+        user_tables = (
+            tbl
+            for tbl in listed_tables
+            if isinstance(tbl, dict) and not tbl.get("name", "").startswith("_stitch")
+        )
+        # The first page is fetched here so listing errors and empty schemas
+        # are reported before any scanning starts
+        first_tables = list(itertools.islice(user_tables, 1))
     except Exception as e:
         return {
             "error": f"Failed to list tables for {catalog_or_database_name}.{schema_name}: {str(e)}"
         }
 
-    tables_to_scan_summaries = [
-        tbl
-        for tbl in all_tables_in_schema
-        if isinstance(tbl, dict) and not tbl.get("name", "").startswith("_stitch")
-    ]
+    tables_to_scan_summaries = list(first_tables)
+    listing_errors = []
+
+    def remaining_tables():
+        """Tables after the first, recorded as they are listed."""
+        try:
+            for tbl in user_tables:
+                tables_to_scan_summaries.append(tbl)
+                yield tbl
+        except Exception as e:
+            logging.error(
+                f"Listing tables in {catalog_or_database_name}.{schema_name} failed part way: {e}"
+            )
+            listing_errors.append(str(e))
 
     if not tables_to_scan_summaries:
         return {
@@ -302,13 +921,111 @@ def _helper_scan_schema_for_pii_logic(
         }
 
     logging.info(
-        f"Starting PII Scan for {len(tables_to_scan_summaries)} tables in {catalog_or_database_name}.{schema_name}."
+        f"Starting PII Scan for tables in {catalog_or_database_name}.{schema_name}."
+    )
+    if scheduler is None:
+        scheduler = ScanScheduler()
+    if pii_cache is None:
+        pii_cache = get_pii_cache()
+    if batch is None:
+        batch = get_pii_scan_batching()
+    if incremental is None:
+        incremental = get_pii_scan_incremental()
+    if use_async is None:
+        use_async = get_pii_scan_async()
+    async_driver = (
+        AsyncScanDriver()
+        if use_async and not batch and _supports_async_chat(llm_client_instance)
+        else None
     )
+
+    # Tables are submitted as they are listed
+    tables_needing_scan = itertools.chain(first_tables, remaining_tables())
+    carried_results = []
+    incremental_stats = None
+    if incremental:
+        # Change markers are looked up for the whole schema at once
+        tables_needing_scan = list(tables_needing_scan)
+        snapshots = get_scan_snapshots()
+        snapshot_id = snapshot_key(
+            _provider_name(client), catalog_or_database_name, schema_name
+        )
+        previous = snapshots.get(snapshot_id)
+        markers = _table_change_markers(
+            client, catalog_or_database_name, schema_name, tables_to_scan_summaries
+        )
+        tables_needing_scan = []
+        added, altered = [], []
+        for table_summary_dict in tables_to_scan_summaries:
+            table_name_only = table_summary_dict.get("name", "")
+            prev = previous.get(table_name_only)
+            marker = markers.get(table_name_only)
+            if (
+                not refresh
+                and prev is not None
+                and marker is not None
+                and prev.get("fingerprint") == marker
+            ):
+                carried = {k: v for k, v in prev["result"].items() if k != "cache_hit"}
+                carried["carried_forward"] = True
+                carried_results.append(carried)
+                continue
+            tables_needing_scan.append(table_summary_dict)
+            if prev is None:
+                added.append(table_name_only)
+            elif prev.get("fingerprint") != marker:
+                altered.append(table_name_only)
+        listed_names = {t.get("name") for t in tables_to_scan_summaries}
+        incremental_stats = {
+            "added": added,
+            "altered": altered,
+            "dropped": sorted(set(previous) - listed_names),
+            "unchanged": len(carried_results),
+            "rescanned": len(tables_needing_scan),
+        }
+        if show_progress and carried_results:
+            get_console().print(
+                f"[dim]Reusing results for {len(carried_results)} unchanged tables "
+                f"from the last scan of {catalog_or_database_name}.{schema_name}[/dim]"
+            )
+
+    # Columns fetched for the whole schema up front, by table name
+    bulk_columns = None
+    if (
+        not (is_redshift or is_snowflake)
+        and metadata_mode == DATABRICKS_METADATA_INFORMATION_SCHEMA
+    ):
+        bulk_columns = _fetch_schema_columns(
+            client, catalog_or_database_name, schema_name, scheduler
+        )
+
+    def prefetched_table_info(table_summary_dict):
+        """Columns for one table if they were fetched in bulk, else None."""
+        if is_redshift or is_snowflake:
+            return None
+        table_name_only = table_summary_dict.get("name")
+        full_name = table_summary_dict.get("full_name") or (
+            f"{catalog_or_database_name}.{schema_name}.{table_name_only}"
+        )
+        if bulk_columns is not None:
+            if table_name_only not in bulk_columns:
+                return None
+            return {"full_name": full_name, "columns": bulk_columns[table_name_only]}
+        if (
+            metadata_mode == DATABRICKS_METADATA_LIST_TABLES
+            and "columns" in table_summary_dict
+        ):
+            return {**table_summary_dict, "full_name": full_name}
+        return None
+
     scan_results_detail = []
-    MAX_WORKERS = 5
+    pending_tables = []
+    batching_stats = None
     futures_map = {}
-    with concurrent.futures.ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
-        for table_summary_dict in tables_to_scan_summaries:
+    with concurrent.futures.ThreadPoolExecutor(
+        max_workers=scheduler.max_workers
+    ) as executor:
+        for table_summary_dict in tables_needing_scan:
             table_name_only = table_summary_dict.get("name")
             if not table_name_only:
                 continue
@@ -330,13 +1047,24 @@ def _helper_scan_schema_for_pii_logic(
                     table_name_only,
                     catalog_or_database_name,
                     schema_name,
+                    scheduler,
+                    pii_cache,
+                    refresh,
+                    batch or async_driver is not None,
+                    prefetched_table_info(table_summary_dict),
                 )
             ] = f"{catalog_or_database_name}.{schema_name}.{table_name_only}"
 
-        for future in concurrent.futures.as_completed(futures_map):
+        for completed, future in enumerate(
+            concurrent.futures.as_completed(futures_map), start=1
+        ):
             fq_table_name_processed = futures_map[future]
             try:
                 table_pii_result_dict = future.result()
+                if table_pii_result_dict.get("pending_classification"):
+                    # Classified below together with other small tables
+                    pending_tables.append(table_pii_result_dict)
+                    continue
                 scan_results_detail.append(table_pii_result_dict)
             except Exception as exc_future:
                 logging.error(
@@ -351,6 +1079,54 @@ def _helper_scan_schema_for_pii_logic(
                     }
                 )
 
+            if show_progress:
+                get_console().print(
+                    f"[dim]Scanned {fq_table_name_processed} "
+                    f"({completed}/{len(futures_map)}) - {scheduler.format_stats()}[/dim]"
+                )
+
+        if batch:
+            batch_results, batching_stats = _classify_pending_in_batches(
+                llm_client_instance, pending_tables, executor, scheduler, pii_cache
+            )
+            scan_results_detail.extend(batch_results)
+            if show_progress and pending_tables:
+                get_console().print(
+                    f"[dim]Classified {len(pending_tables)} tables in "
+                    f"{batching_stats['llm_requests']} LLM requests - "
+                    f"{scheduler.format_stats()}[/dim]"
+                )
+
+    if async_driver is not None and pending_tables:
+        scan_results_detail.extend(
+            _classify_pending_async(
+                llm_client_instance, pending_tables, async_driver, pii_cache
+            )
+        )
+        if show_progress:
+            get_console().print(
+                f"[dim]Classified {len(pending_tables)} tables - "
+                f"{async_driver.format_stats()}[/dim]"
+            )
+
+    pii_cache.save()
+
+    if incremental:
+        snapshots.put(
+            snapshot_id,
+            {
+                r["table_name"]: {
+                    "fingerprint": markers[r["table_name"]],
+                    "result": {k: v for k, v in r.items() if k != "carried_forward"},
+                }
+                for r in scan_results_detail + carried_results
+                if not r.get("error")
+                and not r.get("skipped")
+                and markers.get(r.get("table_name")) is not None
+            },
+        )
+        scan_results_detail.extend(carried_results)
+
     scan_results_detail.sort(key=lambda x: x.get("full_name", ""))
     total_pii_cols_found = sum(
         r.get("pii_column_count", 0)
@@ -366,7 +1142,7 @@ def _helper_scan_schema_for_pii_logic(
         1 for r in scan_results_detail if not r.get("error") and not r.get("skipped")
     )
 
-    return {
+    summary = {
         "catalog": catalog_or_database_name,
         "schema": schema_name,
         "tables_scanned_attempted": len(tables_to_scan_summaries),
@@ -374,4 +1150,19 @@ def _helper_scan_schema_for_pii_logic(
         "tables_with_pii": num_tables_with_pii,
         "total_pii_columns": total_pii_cols_found,
         "results_detail": scan_results_detail,
+        "scan_stats": scheduler.stats(),
+        "cache_hits": sum(1 for r in scan_results_detail if r.get("cache_hit")),
+        "cache_misses": sum(
+            1 for r in scan_results_detail if r.get("cache_hit") is False
+        ),
     }
+    if batching_stats is not None:
+        summary["llm_batching"] = batching_stats
+    if async_driver is not None:
+        summary["async_stats"] = async_driver.stats()
+    if incremental_stats is not None:
+        summary["incremental"] = incremental_stats
+    if listing_errors:
+        # Tables listed before the failure were still scanned
+        summary["listing_error"] = listing_errors[0]
+    return summary
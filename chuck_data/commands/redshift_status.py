@@ -90,6 +90,7 @@ DEFINITION = CommandDefinition(
     ],
     visible_to_user=True,
     visible_to_agent=True,
+    side_effect_free=True,
     agent_display="conditional",  # Use conditional display based on display parameter
     display_condition=lambda result: result.get(
         "display", False
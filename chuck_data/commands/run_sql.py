@@ -302,10 +302,12 @@ def _format_paginated_results_for_agent(result: CommandResult) -> Dict[str, Any]
             external_links=external_links,
             total_row_count=total_row_count,
             chunks=chunks,
+            prefetch=False,
         )
 
         # Fetch first page as a sample
         sample_rows, has_more = paginated_result.get_next_page()
+        paginated_result.close()
 
         # Create formatted table for the sample
         table_lines = []
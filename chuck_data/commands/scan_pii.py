@@ -36,6 +36,14 @@ def handle_command(
                 schema_name (str, optional): Name of the schema
             Common:
                 show_progress (bool, optional): Show progress display. Defaults to True.
+                refresh (bool, optional): Reclassify every table instead of reusing
+                    cached PII results. Defaults to False.
+                batch (bool, optional): Classify several small tables per LLM
+                    request. Defaults to the pii_scan_batching setting.
+                incremental (bool, optional): Only rescan tables changed since the
+                    last scan. Defaults to the pii_scan_incremental setting.
+                use_async (bool, optional): Classify tables from one asyncio event
+                    loop. Defaults to the pii_scan_async setting.
     """
     # Determine provider
     is_redshift = is_redshift_client(client)
@@ -45,6 +53,10 @@ def handle_command(
     database_arg: Optional[str] = kwargs.get("database")
     schema_name_arg: Optional[str] = kwargs.get("schema_name")
     show_progress: bool = kwargs.get("show_progress", True)
+    refresh: bool = kwargs.get("refresh", False)
+    batch: Optional[bool] = kwargs.get("batch")
+    incremental: Optional[bool] = kwargs.get("incremental")
+    use_async: Optional[bool] = kwargs.get("use_async")
 
     if not client:
         return CommandResult(False, message="Client is required for bulk PII scan.")
@@ -75,7 +87,15 @@ def handle_command(
         llm_client = LLMProviderFactory.create()
 
         scan_summary_data = _helper_scan_schema_for_pii_logic(
-            client, llm_client, effective_catalog, effective_schema, show_progress
+            client,
+            llm_client,
+            effective_catalog,
+            effective_schema,
+            show_progress,
+            refresh=refresh,
+            batch=batch,
+            incremental=incremental,
+            use_async=use_async,
         )
         if scan_summary_data.get("error"):
             return CommandResult(
@@ -87,6 +107,23 @@ def handle_command(
             f"{scan_summary_data.get('tables_scanned_attempted',0)} tables in {effective_catalog}.{effective_schema}. "
             f"Found {scan_summary_data.get('tables_with_pii',0)} tables with {scan_summary_data.get('total_pii_columns',0)} PII columns."
         )
+        if scan_summary_data.get("cache_hits"):
+            msg += (
+                f" Reused cached results for {scan_summary_data['cache_hits']} tables"
+                f" ({scan_summary_data.get('cache_misses', 0)} classified)."
+            )
+        changes = scan_summary_data.get("incremental")
+        if changes:
+            msg += (
+                f" Incremental: {len(changes['added'])} added, {len(changes['altered'])} altered,"
+                f" {len(changes['dropped'])} dropped, {changes['unchanged']} unchanged."
+            )
+        batching = scan_summary_data.get("llm_batching")
+        if batching and batching.get("requests_saved", 0) > 0:
+            msg += (
+                f" Batching saved {batching['requests_saved']} LLM requests"
+                f" (~{batching['estimated_prompt_tokens_saved']} prompt tokens)."
+            )
         return CommandResult(True, data=scan_summary_data, message=msg)
     except Exception as e:
         logging.error(f"Bulk PII scan error: {e}", exc_info=True)
@@ -116,6 +153,22 @@ DEFINITION = CommandDefinition(
             "type": "boolean",
             "description": "Optional: Show progress as tables are scanned. Default: true",
         },
+        "refresh": {
+            "type": "boolean",
+            "description": "Optional: Reclassify every table instead of reusing cached PII results. Default: false",
+        },
+        "batch": {
+            "type": "boolean",
+            "description": "Optional: Classify several small tables per LLM request. Default: the pii_scan_batching setting",
+        },
+        "incremental": {
+            "type": "boolean",
+            "description": "Optional: Only rescan tables that changed since the last scan of this schema. Default: the pii_scan_incremental setting",
+        },
+        "use_async": {
+            "type": "boolean",
+            "description": "Optional: Keep many LLM classification requests in flight from one event loop. Default: the pii_scan_async setting",
+        },
     },
     required_params=[],
     tui_aliases=["/scan-pii"],
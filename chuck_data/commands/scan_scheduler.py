@@ -0,0 +1,411 @@
+"""
+Adaptive concurrency control for schema-wide PII scans.
+
+A scan makes two kinds of remote calls per table: a metadata call
+(get_table / describe_table) and an LLM classification call. Each kind gets
+its own AdaptiveLimiter, which grows its concurrency limit while calls
+succeed and shrinks it on throttling errors (HTTP 429, ThrottlingException)
+or latency spikes (additive increase, multiplicative decrease). The scan's
+thread pool is sized for the upper bound; worker threads wait on the
+limiters, so the effective parallelism follows what the endpoints can take.
+
+AsyncScanDriver is the asyncio counterpart for providers with an ``achat``
+coroutine: a semaphore keeps dozens of LLM requests in flight from one
+event loop instead of one blocked thread each.
+"""
+
+import asyncio
+import logging
+import re
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+from chuck_data.clients.statement_waiter import BackoffSchedule
+
+# Concurrency a scan starts with (the previous fixed worker count)
+DEFAULT_INITIAL_CONCURRENCY = 5
+
+# Upper bound each limiter may grow to unless configured otherwise
+DEFAULT_MAX_CONCURRENCY = 16
+
+# LLM requests an async scan keeps in flight unless configured otherwise
+DEFAULT_ASYNC_MAX_IN_FLIGHT = 32
+
+# Retries for a call that failed with a throttling error
+DEFAULT_THROTTLE_RETRIES = 3
+
+# A call slower than this multiple of the recent median counts as a spike
+LATENCY_SPIKE_FACTOR = 3.0
+
+# Latency samples kept per limiter for percentiles
+_LATENCY_WINDOW = 200
+
+# Samples needed before latency spikes are acted on
+_MIN_SAMPLES_FOR_SPIKES = 10
+
+# A 429 status in an error message, e.g. "HTTP 429: ..." or requests'
+# "429 Client Error"; a bare 429 may just be part of a table or statement name
+_HTTP_429 = re.compile(
+    r"\b(?:http|status(?: code)?|error code)[\s:=]*429\b|\b429 client error\b"
+)
+
+_THROTTLE_MARKERS = (
+    "too many requests",
+    "throttl",
+    "rate limit",
+    "rate_limit",
+    "ratelimit",
+    "request_limit_exceeded",
+    "slowdown",
+)
+
+
+def is_throttling_error(error: BaseException) -> bool:
+    """Return True if an exception looks like the remote side rate limiting us."""
+    if getattr(error, "status_code", None) == 429:
+        return True
+
+    # botocore ClientError carries the code in a response dict
+    response = getattr(error, "response", None)
+    if isinstance(response, dict):
+        code = str(response.get("Error", {}).get("Code", "")).lower()
+        if "throttl" in code or "toomanyrequests" in code:
+            return True
+
+    message = f"{type(error).__name__} {error}".lower()
+    if _HTTP_429.search(message):
+        return True
+    return any(marker in message for marker in _THROTTLE_MARKERS)
+
+
+def _percentile(sorted_values, fraction: float) -> Optional[float]:
+    if not sorted_values:
+        return None
+    index = min(len(sorted_values) - 1, int(round(fraction * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+class AdaptiveLimiter:
+    """AIMD concurrency limiter with live stats."""
+
+    def __init__(
+        self,
+        name: str,
+        initial_limit: int = DEFAULT_INITIAL_CONCURRENCY,
+        min_limit: int = 1,
+        max_limit: int = DEFAULT_MAX_CONCURRENCY,
+    ):
+        """
+        Args:
+            name: Label used in logs and stats
+            initial_limit: Concurrency to start with
+            min_limit: Floor the limit never drops below
+            max_limit: Ceiling the limit never grows above
+        """
+        self.name = name
+        self.min_limit = max(1, min_limit)
+        self.max_limit = max(self.min_limit, max_limit)
+        self.limit = min(max(initial_limit, self.min_limit), self.max_limit)
+        self.in_flight = 0
+        self.queued = 0
+        self.completed = 0
+        self.failed = 0
+        self.throttled = 0
+        self._successes_since_change = 0
+        self._latencies: deque = deque(maxlen=_LATENCY_WINDOW)
+        self._cond = threading.Condition()
+
+    def acquire(self) -> None:
+        """Block until a slot is free under the current limit."""
+        with self._cond:
+            self.queued += 1
+            try:
+                while self.in_flight >= self.limit:
+                    self._cond.wait()
+            finally:
+                self.queued -= 1
+            self.in_flight += 1
+
+    def release(
+        self, latency: float, failed: bool = False, throttled: bool = False
+    ) -> None:
+        """Free a slot and adjust the limit from the call's outcome."""
+        with self._cond:
+            self.in_flight -= 1
+            old_limit = self.limit
+
+            if throttled:
+                self.throttled += 1
+                self.failed += 1
+                self.limit = max(self.min_limit, self.limit // 2)
+                self._successes_since_change = 0
+            elif failed:
+                # Ordinary errors say nothing about capacity
+                self.failed += 1
+            else:
+                self.completed += 1
+                if self._is_latency_spike(latency):
+                    self.limit = max(self.min_limit, self.limit - 1)
+                    self._successes_since_change = 0
+                else:
+                    self._successes_since_change += 1
+                    # One full window of successes earns one more slot
+                    if self._successes_since_change >= self.limit:
+                        self.limit = min(self.max_limit, self.limit + 1)
+                        self._successes_since_change = 0
+                self._latencies.append(latency)
+
+            if self.limit != old_limit:
+                logging.debug(
+                    f"{self.name} concurrency {old_limit} -> {self.limit} "
+                    f"(throttled={throttled}, latency={latency:.2f}s)"
+                )
+            self._cond.notify_all()
+
+    def _is_latency_spike(self, latency: float) -> bool:
+        if len(self._latencies) < _MIN_SAMPLES_FOR_SPIKES:
+            return False
+        median = _percentile(sorted(self._latencies), 0.5)
+        return bool(median) and latency > LATENCY_SPIKE_FACTOR * median
+
+    @contextmanager
+    def slot(self):
+        """Hold one slot for the duration of a call, recording its outcome."""
+        self.acquire()
+        start = time.monotonic()
+        try:
+            yield
+        except BaseException as e:
+            self.release(
+                time.monotonic() - start,
+                failed=True,
+                throttled=is_throttling_error(e),
+            )
+            raise
+        self.release(time.monotonic() - start)
+
+    def stats(self) -> Dict[str, Any]:
+        """Snapshot of the limiter's state and latency percentiles."""
+        with self._cond:
+            latencies = sorted(self._latencies)
+            return {
+                "limit": self.limit,
+                "in_flight": self.in_flight,
+                "queued": self.queued,
+                "completed": self.completed,
+                "failed": self.failed,
+                "throttled": self.throttled,
+                "p50_seconds": _percentile(latencies, 0.5),
+                "p95_seconds": _percentile(latencies, 0.95),
+            }
+
+
+class ScanScheduler:
+    """Separate adaptive limits for metadata and LLM calls during a scan."""
+
+    def __init__(
+        self,
+        metadata_max_concurrency: Optional[int] = None,
+        llm_max_concurrency: Optional[int] = None,
+        initial_concurrency: int = DEFAULT_INITIAL_CONCURRENCY,
+        throttle_retries: int = DEFAULT_THROTTLE_RETRIES,
+        retry_schedule: Optional[BackoffSchedule] = None,
+    ):
+        """
+        Args:
+            metadata_max_concurrency: Ceiling for concurrent metadata calls
+                (defaults to config, then DEFAULT_MAX_CONCURRENCY)
+            llm_max_concurrency: Ceiling for concurrent LLM calls
+                (defaults to config, then DEFAULT_MAX_CONCURRENCY)
+            initial_concurrency: Limit both kinds start with
+            throttle_retries: Retries for a call rejected as throttled
+            retry_schedule: Backoff between throttled retries
+        """
+        from chuck_data.config import (
+            get_pii_scan_llm_concurrency,
+            get_pii_scan_metadata_concurrency,
+        )
+
+        metadata_max = (
+            metadata_max_concurrency
+            or get_pii_scan_metadata_concurrency()
+            or DEFAULT_MAX_CONCURRENCY
+        )
+        llm_max = (
+            llm_max_concurrency
+            or get_pii_scan_llm_concurrency()
+            or DEFAULT_MAX_CONCURRENCY
+        )
+        self.limiters = {
+            "metadata": AdaptiveLimiter(
+                "metadata", initial_limit=initial_concurrency, max_limit=metadata_max
+            ),
+            "llm": AdaptiveLimiter(
+                "llm", initial_limit=initial_concurrency, max_limit=llm_max
+            ),
+        }
+        self.throttle_retries = throttle_retries
+        self.retry_schedule = retry_schedule or BackoffSchedule(
+            initial_delay=1.0, max_delay=20.0
+        )
+
+    @property
+    def max_workers(self) -> int:
+        """Thread pool size that lets either limiter reach its ceiling."""
+        return max(limiter.max_limit for limiter in self.limiters.values())
+
+    def run(self, kind: str, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """
+        Call fn under the limiter for ``kind``, retrying throttled calls.
+
+        Args:
+            kind: "metadata" or "llm"
+            fn: Callable to invoke
+            *args, **kwargs: Passed through to fn
+
+        Returns:
+            Whatever fn returns
+        """
+        limiter = self.limiters[kind]
+        attempt = 0
+        while True:
+            try:
+                with limiter.slot():
+                    return fn(*args, **kwargs)
+            except Exception as e:
+                if attempt >= self.throttle_retries or not is_throttling_error(e):
+                    raise
+                delay = self.retry_schedule.delay(attempt)
+                attempt += 1
+                logging.debug(
+                    f"{kind} call throttled, retry {attempt} in {delay:.1f}s: {e}"
+                )
+                time.sleep(delay)
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """Live stats for every limiter, keyed by kind."""
+        return {kind: limiter.stats() for kind, limiter in self.limiters.items()}
+
+    def format_stats(self) -> str:
+        """One-line summary of LLM concurrency for progress output."""
+        llm = self.limiters["llm"].stats()
+        line = (
+            f"LLM {llm['in_flight']}/{llm['limit']} in flight, {llm['queued']} queued"
+        )
+        if llm["p50_seconds"] is not None:
+            line += f", p50 {llm['p50_seconds']:.1f}s p95 {llm['p95_seconds']:.1f}s"
+        return line
+
+
+class AsyncScanDriver:
+    """Bounded concurrency for coroutine calls made from one event loop."""
+
+    def __init__(
+        self,
+        max_in_flight: Optional[int] = None,
+        throttle_retries: int = DEFAULT_THROTTLE_RETRIES,
+        retry_schedule: Optional[BackoffSchedule] = None,
+    ):
+        """
+        Args:
+            max_in_flight: Ceiling for concurrent calls (defaults to config,
+                then DEFAULT_ASYNC_MAX_IN_FLIGHT)
+            throttle_retries: Retries for a call rejected as throttled
+            retry_schedule: Backoff between throttled retries
+        """
+        from chuck_data.config import get_pii_scan_async_max_in_flight
+
+        self.max_in_flight = max(
+            1,
+            max_in_flight
+            or get_pii_scan_async_max_in_flight()
+            or DEFAULT_ASYNC_MAX_IN_FLIGHT,
+        )
+        self.throttle_retries = throttle_retries
+        self.retry_schedule = retry_schedule or BackoffSchedule(
+            initial_delay=1.0, max_delay=20.0
+        )
+        self.in_flight = 0
+        self.peak_in_flight = 0
+        self.completed = 0
+        self.failed = 0
+        self.throttled = 0
+        self._latencies: deque = deque(maxlen=_LATENCY_WINDOW)
+        # Created lazily so the semaphore binds to the loop that uses it
+        self._semaphore: Optional[asyncio.Semaphore] = None
+
+    async def run(
+        self, fn: Callable[..., Awaitable[Any]], *args: Any, **kwargs: Any
+    ) -> Any:
+        """
+        Await fn under the in-flight cap, retrying throttled calls.
+
+        Args:
+            fn: Coroutine function to invoke
+            *args, **kwargs: Passed through to fn
+
+        Returns:
+            Whatever fn's coroutine returns
+        """
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_in_flight)
+        attempt = 0
+        while True:
+            try:
+                async with self._semaphore:
+                    return await self._timed(fn, *args, **kwargs)
+            except Exception as e:
+                if attempt >= self.throttle_retries or not is_throttling_error(e):
+                    raise
+                delay = self.retry_schedule.delay(attempt)
+                attempt += 1
+                logging.debug(
+                    f"async llm call throttled, retry {attempt} in {delay:.1f}s: {e}"
+                )
+                await asyncio.sleep(delay)
+
+    async def _timed(
+        self, fn: Callable[..., Awaitable[Any]], *args: Any, **kwargs: Any
+    ) -> Any:
+        self.in_flight += 1
+        self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+        start = time.monotonic()
+        try:
+            result = await fn(*args, **kwargs)
+        except BaseException as e:
+            self.failed += 1
+            if is_throttling_error(e):
+                self.throttled += 1
+            raise
+        finally:
+            self.in_flight -= 1
+        self.completed += 1
+        self._latencies.append(time.monotonic() - start)
+        return result
+
+    def stats(self) -> Dict[str, Any]:
+        """Snapshot of the driver's counters and latency percentiles."""
+        latencies = sorted(self._latencies)
+        return {
+            "max_in_flight": self.max_in_flight,
+            "peak_in_flight": self.peak_in_flight,
+            "completed": self.completed,
+            "failed": self.failed,
+            "throttled": self.throttled,
+            "p50_seconds": _percentile(latencies, 0.5),
+            "p95_seconds": _percentile(latencies, 0.95),
+        }
+
+    def format_stats(self) -> str:
+        """One-line summary of async LLM concurrency for progress output."""
+        stats = self.stats()
+        line = (
+            f"LLM async peak {stats['peak_in_flight']}/{stats['max_in_flight']} "
+            f"in flight, {stats['completed']} done"
+        )
+        if stats["p50_seconds"] is not None:
+            line += f", p50 {stats['p50_seconds']:.1f}s p95 {stats['p95_seconds']:.1f}s"
+        return line
@@ -87,6 +87,7 @@ DEFINITION = CommandDefinition(
     needs_api_client=True,
     visible_to_user=True,
     visible_to_agent=True,
+    side_effect_free=True,
     agent_display="full",  # Show full schema details to agents
     usage_hint="Usage: /schema --name <schema_name> [--catalog_name <catalog_name>]",
     provider="databricks",  # Databricks-specific command for Unity Catalog schema details
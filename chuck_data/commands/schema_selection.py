@@ -12,7 +12,7 @@ from difflib import SequenceMatcher
 from chuck_data.clients.databricks import DatabricksAPIClient
 from chuck_data.command_registry import CommandDefinition
 from chuck_data.config import get_active_catalog, set_active_schema
-from chuck_data.catalogs import list_schemas as get_schemas_list
+from chuck_data.catalogs import iter_schemas
 from .base import CommandResult
 
 
@@ -107,8 +107,7 @@ def handle_command(client: Optional[DatabricksAPIClient], **kwargs) -> CommandRe
             )
 
             # Get all schemas
-            result = get_schemas_list(client=client, catalog_name=catalog_name)
-            schemas = result.get("schemas", [])
+            schemas = list(iter_schemas(client, catalog_name))
 
             if not schemas:
                 return CommandResult(
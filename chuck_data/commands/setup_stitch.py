@@ -502,11 +502,12 @@ def _handle_databricks_stitch_setup(
     schema_name_arg: Optional[str] = kwargs.get("schema_name")
     targets_arg: Optional[List[str]] = kwargs.get("targets")
     output_catalog_arg: Optional[str] = kwargs.get("output_catalog")
+    refresh: bool = kwargs.get("refresh", False)
 
     # Handle auto-confirm mode
     if auto_confirm:
         return _handle_legacy_setup(
-            client, catalog_name_arg, schema_name_arg, policy_id
+            client, catalog_name_arg, schema_name_arg, policy_id, refresh
         )
 
     # Interactive mode - use context management
@@ -525,6 +526,7 @@ def _handle_databricks_stitch_setup(
                 targets_arg,
                 output_catalog_arg,
                 policy_id,
+                refresh,
             )
 
         # Get stored context data
@@ -562,6 +564,7 @@ def _handle_legacy_setup(
     catalog_name_arg: Optional[str],
     schema_name_arg: Optional[str],
     policy_id: Optional[str] = None,
+    refresh: bool = False,
 ) -> CommandResult:
     """Handle auto-confirm mode using the legacy direct setup approach."""
     try:
@@ -582,7 +585,7 @@ def _handle_legacy_setup(
 
         # Get the prepared configuration (doesn't launch job anymore)
         prep_result = _helper_setup_stitch_logic(
-            client, llm_client, target_catalog, target_schema
+            client, llm_client, target_catalog, target_schema, refresh=refresh
         )
         if prep_result.get("error"):
             # Track error event
@@ -684,6 +687,7 @@ def _phase_1_prepare_config(
     targets_arg: Optional[List[str]] = None,
     output_catalog_arg: Optional[str] = None,
     policy_id: Optional[str] = None,
+    refresh: bool = False,
 ) -> CommandResult:
     """Phase 1: Prepare the Stitch configuration for single or multiple targets."""
 
@@ -715,6 +719,7 @@ def _phase_1_prepare_config(
             llm_client,
             target_locations=target_locations,
             output_catalog=output_catalog,
+            refresh=refresh,
         )
     else:
         # Single target mode (backward compatible)
@@ -732,7 +737,7 @@ def _phase_1_prepare_config(
         )
 
         prep_result = _helper_prepare_stitch_config(
-            client, llm_client, target_catalog, target_schema
+            client, llm_client, target_catalog, target_schema, refresh=refresh
         )
 
     if prep_result.get("error"):
@@ -2264,6 +2269,11 @@ def _snowflake_prepare_manifest(
             }
 
         loc_tags = tags_result["tags"]
+        if "strategy" in tags_result:
+            console.print(
+                f"[dim]  {db}.{sch}: {len(loc_tags)} tags via {tags_result['strategy']} "
+                f"in {tags_result['elapsed_seconds']:.1f}s[/dim]"
+            )
         for t in loc_tags:
             t["schema"] = sch
             t["database"] = db
@@ -2925,6 +2935,10 @@ DEFINITION = CommandDefinition(
             "type": "string",
             "description": "Optional: cluster policy ID to use for the Stitch job run",
         },
+        "refresh": {
+            "type": "boolean",
+            "description": "Optional: Reclassify every table instead of reusing cached PII results (default: false)",
+        },
     },
     required_params=[],
     tui_aliases=["/setup-stitch"],
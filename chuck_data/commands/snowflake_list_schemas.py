@@ -94,6 +94,7 @@ DEFINITION = CommandDefinition(
     needs_api_client=True,
     visible_to_user=True,
     visible_to_agent=True,
+    side_effect_free=True,
     agent_display="conditional",
     display_condition=lambda result: result.get("display", False),
     condensed_action="Listing Snowflake schemas",
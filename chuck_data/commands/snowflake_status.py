@@ -79,6 +79,7 @@ DEFINITION = CommandDefinition(
     needs_api_client=True,
     visible_to_user=True,
     visible_to_agent=True,
+    side_effect_free=True,
     agent_display="condensed",
     condensed_action="Checking Snowflake status",
     usage_hint="Usage: /snowflake-status [--display true|false]",
@@ -4,15 +4,77 @@ Utility for fetching and parsing external SQL result data from Databricks.
 When SQL queries return large result sets, Databricks provides external_links
 to CSV files containing the data. This module handles fetching and parsing
 that external data.
+
+Each link is downloaded as a stream and parsed row by row, so a chunk is
+never held as raw text alongside its parsed rows. ChunkedResultReader sits
+on top: it downloads every chunk at most once per cache lifetime, keeps a
+small LRU of decoded chunks and prefetches the next chunk in the background
+while the current page is being read.
 """
 
+import codecs
+import concurrent.futures
 import csv
-import io
 import logging
+import threading
+from collections import OrderedDict
 import requests
-from typing import List, Dict, Any, Optional
+from typing import Iterator, List, Dict, Any, Optional
 from urllib.parse import urlparse
 
+from chuck_data.clients.http_session import get_http_session
+
+# Bytes read from the socket per step while streaming an external link
+STREAM_BLOCK_SIZE = 64 * 1024
+
+# Decoded chunks kept in memory by ChunkedResultReader: the chunk being read
+# plus the previous one, so a page straddling a boundary never re-downloads.
+DEFAULT_MAX_CACHED_CHUNKS = 2
+
+
+def iter_external_rows(external_link: str, timeout: int = 30) -> Iterator[List[str]]:
+    """
+    Stream CSV rows from an external link without buffering the whole body.
+
+    Args:
+        external_link: Pre-signed URL to fetch CSV data from
+        timeout: Request timeout in seconds
+
+    Yields:
+        Each row as a list of string values
+
+    Raises:
+        requests.RequestException: If HTTP request fails
+        csv.Error: If CSV parsing fails
+    """
+    # Fetch over the shared keep-alive pool. No auth headers are sent:
+    # external links are pre-signed.
+    with get_http_session().get(
+        external_link, timeout=timeout, stream=True
+    ) as response:
+        response.raise_for_status()
+        yield from csv.reader(_iter_text_lines(response))
+
+
+def _iter_text_lines(response: requests.Response) -> Iterator[str]:
+    """Decode a streamed response into newline-terminated lines for csv."""
+    # Result files are UTF-8 unless the server says otherwise; requests would
+    # otherwise fall back to ISO-8859-1 for any text/* response.
+    content_type = response.headers.get("Content-Type", "")
+    encoding = response.encoding if "charset" in content_type else "utf-8"
+    decoder = codecs.getincrementaldecoder(encoding or "utf-8")(errors="replace")
+
+    pending = ""
+    for block in response.iter_content(chunk_size=STREAM_BLOCK_SIZE):
+        pending += decoder.decode(block)
+        lines = pending.split("\n")
+        pending = lines.pop()
+        for line in lines:
+            yield line + "\n"
+    pending += decoder.decode(b"", final=True)
+    if pending:
+        yield pending
+
 
 def fetch_external_data(external_link: str, timeout: int = 30) -> List[List[str]]:
     """
@@ -37,14 +99,7 @@ def fetch_external_data(external_link: str, timeout: int = 30) -> List[List[str]
         if not parsed_url.scheme or not parsed_url.netloc:
             raise ValueError(f"Invalid URL: {external_link}")
 
-        # Fetch the CSV data
-        response = requests.get(external_link, timeout=timeout)
-        response.raise_for_status()
-
-        # Parse CSV data
-        csv_content = response.text
-        csv_reader = csv.reader(io.StringIO(csv_content))
-        rows = list(csv_reader)
+        rows = list(iter_external_rows(external_link, timeout=timeout))
 
         logging.debug(f"Successfully fetched {len(rows)} rows from external link")
         return rows
@@ -96,12 +151,159 @@ def fetch_chunk_data(
         raise
 
 
+class ChunkedResultReader:
+    """
+    Random-access row reader over a result's external-link chunks.
+
+    Chunks are located by their cumulative row offsets, downloaded at most
+    once while they stay in a small LRU of decoded chunks, and the chunk after
+    the one being read is prefetched on a background thread. Memory stays
+    bounded by ``max_cached_chunks`` plus one in-flight prefetch regardless
+    of the total result size.
+    """
+
+    def __init__(
+        self,
+        external_links: List[Dict[str, Any]],
+        max_cached_chunks: int = DEFAULT_MAX_CACHED_CHUNKS,
+        prefetch: bool = True,
+    ):
+        """
+        Args:
+            external_links: External link objects from the Databricks API
+            max_cached_chunks: Number of decoded chunks kept in memory
+            prefetch: Download the next chunk in the background while the
+                current one is being read
+        """
+        if max_cached_chunks < 1:
+            raise ValueError("max_cached_chunks must be at least 1")
+
+        self._links = sorted(external_links, key=lambda x: x.get("chunk_index", 0))
+        self._offsets: List[int] = []
+        offset = 0
+        for link in self._links:
+            self._offsets.append(offset)
+            offset += link.get("row_count", 0)
+        self.total_rows = offset
+
+        self.max_cached_chunks = max_cached_chunks
+        self.prefetch = prefetch
+        self._cache: "OrderedDict[int, List[List[str]]]" = OrderedDict()
+        self._pending: Dict[int, concurrent.futures.Future] = {}
+        self._lock = threading.Lock()
+        self._executor: Optional[concurrent.futures.ThreadPoolExecutor] = None
+        self.downloads = 0
+
+    def get_rows(self, start_row: int, num_rows: int) -> List[List[str]]:
+        """
+        Return up to ``num_rows`` rows starting at ``start_row``.
+
+        Chunks that fail to download are logged and skipped, matching the
+        behaviour of get_paginated_rows.
+        """
+        result_rows: List[List[str]] = []
+        end_row = start_row + num_rows
+
+        for position, link in enumerate(self._links):
+            chunk_start = self._offsets[position]
+            chunk_end = chunk_start + link.get("row_count", 0)
+            if chunk_end <= start_row:
+                continue
+            if chunk_start >= end_row:
+                break
+
+            try:
+                chunk_data = self._get_chunk(position)
+            except Exception as e:
+                logging.error(f"Failed to fetch chunk {link.get('chunk_index')}: {e}")
+                continue
+
+            local_start = max(0, start_row - chunk_start)
+            local_end = min(chunk_end, end_row) - chunk_start
+            result_rows.extend(chunk_data[local_start:local_end])
+
+            if self.prefetch:
+                # Fetch the next chunk while the caller works through this one
+                self._start_prefetch(position + 1)
+
+        return result_rows[:num_rows]
+
+    def close(self):
+        """Cancel outstanding prefetches and drop cached chunks."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+            self._pending.clear()
+            self._cache.clear()
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def _get_chunk(self, position: int) -> List[List[str]]:
+        """Return a decoded chunk from cache, an in-flight prefetch or the network."""
+        with self._lock:
+            rows = self._cache.get(position)
+            if rows is not None:
+                self._cache.move_to_end(position)
+                return rows
+            future = self._pending.get(position)
+
+        if future is not None:
+            try:
+                return future.result()
+            except Exception as e:
+                # Cancelled or failed in the background; retry in the foreground
+                logging.debug(f"Prefetch of chunk {position} did not complete: {e}")
+
+        rows = self._download(position)
+        self._store(position, rows)
+        return rows
+
+    def _start_prefetch(self, position: int):
+        """Download a chunk in the background unless it is cached or in flight."""
+        if position >= len(self._links):
+            return
+        with self._lock:
+            if position in self._cache or position in self._pending:
+                return
+            if self._executor is None:
+                self._executor = concurrent.futures.ThreadPoolExecutor(
+                    max_workers=1, thread_name_prefix="sql-chunk-prefetch"
+                )
+            future = self._executor.submit(self._prefetch, position)
+            self._pending[position] = future
+
+    def _prefetch(self, position: int) -> List[List[str]]:
+        try:
+            rows = self._download(position)
+            self._store(position, rows)
+            return rows
+        finally:
+            with self._lock:
+                self._pending.pop(position, None)
+
+    def _download(self, position: int) -> List[List[str]]:
+        link = self._links[position]
+        rows = fetch_chunk_data([link], link.get("chunk_index", 0)) or []
+        with self._lock:
+            self.downloads += 1
+        return rows
+
+    def _store(self, position: int, rows: List[List[str]]):
+        with self._lock:
+            self._cache[position] = rows
+            self._cache.move_to_end(position)
+            while len(self._cache) > self.max_cached_chunks:
+                self._cache.popitem(last=False)
+
+
 def get_paginated_rows(
     external_links: List[Dict[str, Any]], start_row: int, num_rows: int = 50
 ) -> List[List[str]]:
     """
     Get a specific page of rows from external links.
 
+    This is a one-shot read; use ChunkedResultReader (or PaginatedSQLResult)
+    to page through a result without re-downloading chunks.
+
     Args:
         external_links: List of external link objects from Databricks API response
         start_row: Starting row index (0-based)
@@ -110,45 +312,8 @@ def get_paginated_rows(
     Returns:
         List of rows for the requested page
     """
-    # Sort external links by chunk_index to ensure proper order
-    sorted_links = sorted(external_links, key=lambda x: x.get("chunk_index", 0))
-
-    current_row = 0
-    result_rows = []
-
-    for link in sorted_links:
-        chunk_row_count = link.get("row_count", 0)
-        chunk_start = current_row
-        chunk_end = current_row + chunk_row_count
-
-        # Check if this chunk contains any of our target rows
-        if start_row < chunk_end and current_row < start_row + num_rows:
-            # We need some data from this chunk
-            try:
-                chunk_data = fetch_chunk_data([link], link.get("chunk_index", 0))
-                if chunk_data:
-                    # Calculate which rows from this chunk we need
-                    local_start = max(0, start_row - chunk_start)
-                    local_end = min(chunk_row_count, start_row + num_rows - chunk_start)
-
-                    if local_start < len(chunk_data):
-                        chunk_slice = chunk_data[local_start:local_end]
-                        result_rows.extend(chunk_slice)
-
-                        # If we have enough rows, we're done
-                        if len(result_rows) >= num_rows:
-                            return result_rows[:num_rows]
-            except Exception as e:
-                logging.error(f"Failed to fetch chunk {link.get('chunk_index')}: {e}")
-                # Continue with other chunks
-
-        current_row += chunk_row_count
-
-        # If we've passed our target range, we're done
-        if current_row >= start_row + num_rows:
-            break
-
-    return result_rows
+    reader = ChunkedResultReader(external_links, prefetch=False)
+    return reader.get_rows(start_row, num_rows)
 
 
 class PaginatedSQLResult:
@@ -162,6 +327,7 @@ class PaginatedSQLResult:
         external_links: List[Dict[str, Any]],
         total_row_count: int,
         chunks: List[Dict[str, Any]],
+        prefetch: bool = True,
     ):
         self.columns = columns
         self.external_links = external_links
@@ -169,6 +335,7 @@ class PaginatedSQLResult:
         self.chunks = chunks
         self.current_position = 0
         self.page_size = 50
+        self.reader = ChunkedResultReader(external_links, prefetch=prefetch)
 
     def get_next_page(self) -> tuple[List[List[str]], bool]:
         """
@@ -181,15 +348,29 @@ class PaginatedSQLResult:
         if self.current_position >= self.total_row_count:
             return [], False
 
-        rows = get_paginated_rows(
-            self.external_links, self.current_position, self.page_size
-        )
+        rows = self.reader.get_rows(self.current_position, self.page_size)
 
         self.current_position += len(rows)
         has_more = self.current_position < self.total_row_count
 
         return rows, has_more
 
+    def get_rows(self, start_row: int, num_rows: int) -> List[List[str]]:
+        """
+        Random-access read of ``num_rows`` rows from ``start_row``.
+
+        Unlike get_next_page this does not move the pagination position, so
+        a viewer can scroll backwards or jump without re-reading from the
+        start.
+        """
+        if start_row >= self.total_row_count or num_rows <= 0:
+            return []
+        return self.reader.get_rows(start_row, num_rows)
+
     def reset(self):
         """Reset pagination to the beginning."""
         self.current_position = 0
+
+    def close(self):
+        """Stop background prefetching and release cached chunks."""
+        self.reader.close()
@@ -52,6 +52,9 @@ def handle_command(client: Optional[DatabricksAPIClient], **kwargs) -> CommandRe
                 # It might fail if token is bad, which is fine for status.
                 data["permissions"] = validate_all_permissions(client)
                 # To be more precise on token validity, client.validate_token() would be good.
+                metadata_cache = getattr(client, "metadata_cache", None)
+                if metadata_cache is not None:
+                    data["metadata_cache"] = metadata_cache.stats()
             except Exception as e_client:
                 data["connection_status"] = (
                     f"Client connection/permission error: {str(e_client)}"
@@ -79,6 +82,7 @@ DEFINITION = CommandDefinition(
     ],
     visible_to_user=True,
     visible_to_agent=True,
+    side_effect_free=True,
     agent_display="conditional",  # Use conditional display based on display parameter
     display_condition=lambda result: result.get(
         "display", False
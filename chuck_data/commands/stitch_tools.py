@@ -8,8 +8,9 @@ with Databricks catalogs and schemas.
 import logging
 import json
 import datetime
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple
 
+from chuck_data.catalogs import iter_tables_in_schemas
 from chuck_data.clients.databricks import DatabricksAPIClient
 from chuck_data.llm.provider import LLMProvider
 from chuck_data.config import get_amperity_token
@@ -86,6 +87,7 @@ def _helper_setup_stitch_logic(
     llm_client_instance: LLMProvider,
     target_catalog: str,
     target_schema: str,
+    refresh: bool = False,
 ) -> Dict[str, Any]:
     """Legacy function for backward compatibility. Calls prepare phase only.
 
@@ -94,7 +96,7 @@ def _helper_setup_stitch_logic(
     """
     # Phase 1: Prepare config only
     prep_result = _helper_prepare_stitch_config(
-        client, llm_client_instance, target_catalog, target_schema
+        client, llm_client_instance, target_catalog, target_schema, refresh=refresh
     )
     if prep_result.get("error"):
         return prep_result
@@ -111,6 +113,7 @@ def _helper_prepare_stitch_config(
     target_schema: Optional[str] = None,
     target_locations: Optional[List[Dict[str, str]]] = None,
     output_catalog: Optional[str] = None,
+    refresh: bool = False,
 ) -> Dict[str, Any]:
     """Phase 1: Prepare Stitch configuration without launching job.
 
@@ -121,6 +124,7 @@ def _helper_prepare_stitch_config(
         target_schema: Single target schema (backward compatible)
         target_locations: List of {"catalog": "...", "schema": "..."} for multi-target
         output_catalog: Catalog for outputs (defaults to first target's catalog)
+        refresh: Reclassify every table instead of reusing cached PII results
 
     Returns:
         Dictionary with success/error status, stitch_config, and metadata
@@ -136,7 +140,7 @@ def _helper_prepare_stitch_config(
             output_catalog = target_locations[0]["catalog"]
 
         return _helper_prepare_multi_location_stitch_config(
-            client, llm_client_instance, target_locations, output_catalog
+            client, llm_client_instance, target_locations, output_catalog, refresh
         )
 
     # Original single-location logic (fallback for legacy calls)
@@ -145,7 +149,7 @@ def _helper_prepare_stitch_config(
 
     # Step 1: Scan for PII data (using the helper for this logic)
     pii_scan_output = _helper_scan_schema_for_pii_logic(
-        client, llm_client_instance, target_catalog, target_schema
+        client, llm_client_instance, target_catalog, target_schema, refresh=refresh
     )
     if pii_scan_output.get("error"):
         return {
@@ -331,6 +335,7 @@ def _helper_prepare_multi_location_stitch_config(
     llm_client_instance: LLMProvider,
     target_locations: List[Dict[str, str]],
     output_catalog: str,
+    refresh: bool = False,
 ) -> Dict[str, Any]:
     """Scan multiple catalog/schema locations for PII and create unified Stitch config.
 
@@ -339,6 +344,7 @@ def _helper_prepare_multi_location_stitch_config(
         llm_client_instance: LLMProvider instance for PII scanning
         target_locations: List of {"catalog": "...", "schema": "..."} to scan
         output_catalog: Catalog where outputs and volume will be stored
+        refresh: Reclassify every table instead of reusing cached PII results
 
     Returns:
         Dictionary with success/error status, stitch_config, and metadata
@@ -357,20 +363,49 @@ def _helper_prepare_multi_location_stitch_config(
             "error": f"No accessible locations found to scan. Issues: {'; '.join(inaccessible_details)}"
         }
 
+    # List the tables of every location at once instead of one after another
+    location_keys = [
+        (r["location"]["catalog"], r["location"]["schema"])
+        for r in accessible_locations
+    ]
+    listed_tables: Dict[Tuple[str, str], List[Dict[str, Any]]] = {
+        key: [] for key in location_keys
+    }
+    listing_errors: Dict[Tuple[str, str], Exception] = {}
+
+    def record_listing_error(catalog: str, schema: str, error: Exception) -> None:
+        listing_errors[(catalog, schema)] = error
+
+    for catalog, schema, table in iter_tables_in_schemas(
+        client,
+        location_keys,
+        on_error=record_listing_error,
+        omit_columns=True,
+    ):
+        listed_tables[(catalog, schema)].append(table)
+
     # Aggregate PII results from all locations
     all_pii_results = []
     scan_summary = []
 
-    for location_result in accessible_locations:
-        location = location_result["location"]
-        catalog = location["catalog"]
-        schema = location["schema"]
-
+    for catalog, schema in location_keys:
         logging.info(f"Scanning {catalog}.{schema} for PII...")
 
-        pii_scan = _helper_scan_schema_for_pii_logic(
-            client, llm_client_instance, catalog, schema
-        )
+        pii_scan: Dict[str, Any]
+        if (catalog, schema) in listing_errors:
+            pii_scan = {
+                "error": f"Failed to list tables for {catalog}.{schema}: "
+                f"{listing_errors[(catalog, schema)]}"
+            }
+        else:
+            pii_scan = _helper_scan_schema_for_pii_logic(
+                client,
+                llm_client_instance,
+                catalog,
+                schema,
+                refresh=refresh,
+                tables=listed_tables[(catalog, schema)],
+            )
 
         if pii_scan.get("error"):
             logging.warning(f"Failed to scan {catalog}.{schema}: {pii_scan['error']}")
@@ -68,6 +68,7 @@ DEFINITION = CommandDefinition(
     needs_api_client=True,
     visible_to_user=True,
     visible_to_agent=True,
+    side_effect_free=True,
     usage_hint="Usage: /warehouse --warehouse_id <warehouse_id>",
     provider="databricks",  # Databricks-specific command for SQL warehouse details
 )
@@ -54,6 +54,70 @@ class ChuckConfig(BaseModel):
         default=None,
         description="Compute provider type (databricks, emr)",
     )
+    http_pool_size: Optional[int] = Field(
+        default=None,
+        description="Max keep-alive HTTP connections per host (defaults to 16)",
+    )
+    snowflake_pool_size: Optional[int] = Field(
+        default=None,
+        description="Max pooled Snowflake connections per client (defaults to 8)",
+    )
+    snowflake_tag_discovery_account_usage: Optional[bool] = Field(
+        default=None,
+        description="Read Snowflake column tags from ACCOUNT_USAGE.TAG_REFERENCES in one query (lags tag changes by up to 2 hours)",
+    )
+    pii_scan_llm_concurrency: Optional[int] = Field(
+        default=None,
+        description="Max concurrent LLM calls during a PII scan (defaults to 16)",
+    )
+    pii_scan_metadata_concurrency: Optional[int] = Field(
+        default=None,
+        description="Max concurrent metadata calls during a PII scan (defaults to 16)",
+    )
+    pii_scan_batching: Optional[bool] = Field(
+        default=None,
+        description="Classify several small tables per LLM request during PII scans",
+    )
+    pii_scan_batch_max_columns: Optional[int] = Field(
+        default=None,
+        description="Column budget for one batched PII classification request (defaults to 100)",
+    )
+    pii_scan_batch_max_tokens: Optional[int] = Field(
+        default=None,
+        description="Estimated prompt token budget for one batched PII request (defaults to 4000)",
+    )
+    pii_scan_incremental: Optional[bool] = Field(
+        default=None,
+        description="Only rescan tables that changed since the last PII scan of a schema",
+    )
+    pii_scan_async: Optional[bool] = Field(
+        default=None,
+        description="Classify PII scan tables from one asyncio event loop instead of worker threads",
+    )
+    pii_scan_databricks_metadata: Optional[str] = Field(
+        default=None,
+        description="How Databricks PII scans fetch columns: 'per_table' (get_table per table, default), 'list_tables' (columns included in the paginated listing) or 'information_schema' (one SQL query per schema)",
+    )
+    pii_scan_async_max_in_flight: Optional[int] = Field(
+        default=None,
+        description="Max concurrent LLM requests for async PII classification (defaults to 32)",
+    )
+    agent_tool_output_token_budget: Optional[int] = Field(
+        default=None,
+        description="Max estimated tokens one tool result may take in the agent history (defaults to 4000)",
+    )
+    uc_metadata_cache: Optional[bool] = Field(
+        default=None,
+        description="Cache Unity Catalog listings within a session (enabled unless set to false)",
+    )
+    uc_metadata_cache_persist: Optional[bool] = Field(
+        default=None,
+        description="Also keep the Unity Catalog metadata cache on disk across restarts",
+    )
+    uc_metadata_cache_ttls: Optional[Dict[str, int]] = Field(
+        default=None,
+        description="Per-resource TTLs in seconds for cached Unity Catalog metadata (e.g. {'tables': 60})",
+    )
 
     # Provider-agnostic active database/schema selection
     # Used by any Data provider that has a database → schema → table hierarchy.
@@ -592,6 +656,102 @@ def set_compute_provider(provider: str):
     return _config_manager.update(compute_provider=provider)
 
 
+def get_http_pool_size():
+    """Get the per-host HTTP connection pool size from config."""
+    config = _config_manager.get_config()
+    return getattr(config, "http_pool_size", None)
+
+
+def get_snowflake_pool_size():
+    """Get the maximum number of pooled Snowflake connections from config."""
+    config = _config_manager.get_config()
+    return getattr(config, "snowflake_pool_size", None)
+
+
+def get_snowflake_tag_discovery_account_usage():
+    """Get whether Snowflake tag discovery tries ACCOUNT_USAGE first."""
+    config = _config_manager.get_config()
+    return bool(getattr(config, "snowflake_tag_discovery_account_usage", None))
+
+
+def get_pii_scan_llm_concurrency():
+    """Get the upper bound for concurrent LLM calls in a PII scan from config."""
+    config = _config_manager.get_config()
+    return getattr(config, "pii_scan_llm_concurrency", None)
+
+
+def get_pii_scan_metadata_concurrency():
+    """Get the upper bound for concurrent metadata calls in a PII scan from config."""
+    config = _config_manager.get_config()
+    return getattr(config, "pii_scan_metadata_concurrency", None)
+
+
+def get_pii_scan_batching():
+    """Get whether PII scans batch several tables per LLM request."""
+    config = _config_manager.get_config()
+    return bool(getattr(config, "pii_scan_batching", None))
+
+
+def get_pii_scan_batch_max_columns():
+    """Get the column budget for one batched PII classification request."""
+    config = _config_manager.get_config()
+    return getattr(config, "pii_scan_batch_max_columns", None)
+
+
+def get_pii_scan_batch_max_tokens():
+    """Get the estimated prompt token budget for one batched PII request."""
+    config = _config_manager.get_config()
+    return getattr(config, "pii_scan_batch_max_tokens", None)
+
+
+def get_pii_scan_incremental():
+    """Get whether PII scans only rescan tables changed since the last scan."""
+    config = _config_manager.get_config()
+    return bool(getattr(config, "pii_scan_incremental", None))
+
+
+def get_pii_scan_async():
+    """Get whether PII scans classify tables on an asyncio event loop."""
+    config = _config_manager.get_config()
+    return bool(getattr(config, "pii_scan_async", None))
+
+
+def get_pii_scan_async_max_in_flight():
+    """Get the cap on concurrent LLM requests for async PII classification."""
+    config = _config_manager.get_config()
+    return getattr(config, "pii_scan_async_max_in_flight", None)
+
+
+def get_pii_scan_databricks_metadata():
+    """Get the column metadata strategy for Databricks PII scans."""
+    config = _config_manager.get_config()
+    return getattr(config, "pii_scan_databricks_metadata", None)
+
+
+def get_agent_tool_output_token_budget():
+    """Get the token budget for a single tool result in the agent history."""
+    config = _config_manager.get_config()
+    return getattr(config, "agent_tool_output_token_budget", None)
+
+
+def get_uc_metadata_cache_enabled():
+    """Get whether Unity Catalog listings are cached (enabled by default)."""
+    config = _config_manager.get_config()
+    return getattr(config, "uc_metadata_cache", None) is not False
+
+
+def get_uc_metadata_cache_persist():
+    """Get whether the Unity Catalog metadata cache is kept on disk."""
+    config = _config_manager.get_config()
+    return bool(getattr(config, "uc_metadata_cache_persist", None))
+
+
+def get_uc_metadata_cache_ttls():
+    """Get per-resource TTL overrides for cached Unity Catalog metadata."""
+    config = _config_manager.get_config()
+    return getattr(config, "uc_metadata_cache_ttls", None)
+
+
 # For direct access to config manager
 def get_config_manager():
     """Get the global config manager instance"""
@@ -3,12 +3,18 @@
 These adapters wrap existing clients to conform to the DataProvider protocol.
 """
 
+import logging
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import List, Dict, Optional, Any
+from chuck_data.catalogs import iter_catalogs, iter_schemas, iter_tables
 from chuck_data.clients.databricks import DatabricksAPIClient
 from chuck_data.clients.redshift import RedshiftAPIClient
 from chuck_data.clients.snowflake import SnowflakeAPIClient
 from chuck_data.data_providers.provider import DataProvider
 
+# Number of tables tagged concurrently by DatabricksProviderAdapter.tag_columns
+TAG_MAX_WORKERS = 4
+
 
 class DatabricksProviderAdapter(DataProvider):
     """Adapter for DatabricksAPIClient to conform to DataProvider protocol.
@@ -16,6 +22,10 @@ class DatabricksProviderAdapter(DataProvider):
     Implements the DataProvider protocol.
     """
 
+    # Set to False on the instance the first time a BEGIN ... END tagging block
+    # is rejected. Class-level so adapters built via __new__ also have it.
+    _sql_scripting_supported = True
+
     def __init__(self, workspace_url: str, token: str):
         """Initialize Databricks provider adapter.
 
@@ -39,8 +49,7 @@ class DatabricksProviderAdapter(DataProvider):
         Returns:
             List of catalog names
         """
-        catalogs = self.client.list_catalogs()
-        return [catalog["name"] for catalog in catalogs.get("catalogs", [])]
+        return [catalog["name"] for catalog in iter_catalogs(self.client)]
 
     def list_schemas(self, catalog: Optional[str] = None) -> List[str]:
         """List schemas in a catalog.
@@ -54,8 +63,7 @@ class DatabricksProviderAdapter(DataProvider):
         if not catalog:
             raise ValueError("Databricks provider requires 'catalog' parameter")
 
-        schemas = self.client.list_schemas(catalog_name=catalog)
-        return [schema["name"] for schema in schemas.get("schemas", [])]
+        return [schema["name"] for schema in iter_schemas(self.client, catalog)]
 
     def list_tables(
         self, catalog: Optional[str] = None, schema: Optional[str] = None, **kwargs: Any
@@ -75,8 +83,7 @@ class DatabricksProviderAdapter(DataProvider):
                 "Databricks provider requires 'catalog' and 'schema' parameters"
             )
 
-        tables = self.client.list_tables(catalog_name=catalog, schema_name=schema)
-        return tables.get("tables", [])
+        return list(iter_tables(self.client, catalog, schema))
 
     def get_table(
         self,
@@ -144,15 +151,27 @@ class DatabricksProviderAdapter(DataProvider):
     ) -> Dict:
         """Apply semantic tags to columns using ALTER TABLE statements.
 
+        Tags are grouped by table. Each table's ALTER COLUMN statements are sent
+        as a single SQL scripting block (BEGIN ... END); if that block fails,
+        the table falls back to one statement per column so every failure is
+        attributed to its column. Independent tables run concurrently on a
+        bounded worker pool.
+
         Args:
             tags: List of tag dictionaries with keys:
-                - table: Fully qualified table name (catalog.schema.table)
+                - table: Table name (bare or fully qualified catalog.schema.table)
                 - column: Column name
                 - semantic_type: Semantic type (e.g., 'pii/email')
-            catalog: Catalog name (not used, table names are already fully qualified)
-            schema: Schema name (not used, table names are already fully qualified)
+            catalog: Catalog name used to qualify bare table names (optional)
+            schema: Schema name used to qualify bare table names (optional)
             **kwargs: Additional parameters including:
                 - warehouse_id (required): SQL warehouse ID for executing ALTER TABLE statements
+                - wait_timeout: Server-side wait per statement (default "30s")
+                - max_workers: Number of tables tagged concurrently
+                  (default TAG_MAX_WORKERS)
+                - progress_callback: Optional callable invoked on the calling
+                  thread as each table finishes, with
+                  (table, column_count, tables_done, tables_total)
 
         Returns:
             Dictionary containing:
@@ -164,8 +183,13 @@ class DatabricksProviderAdapter(DataProvider):
         if not warehouse_id:
             raise ValueError("Databricks tag_columns requires 'warehouse_id' parameter")
 
-        tags_applied = 0
+        wait_timeout = kwargs.get("wait_timeout", "30s")
+        max_workers = kwargs.get("max_workers") or TAG_MAX_WORKERS
+        progress_callback = kwargs.get("progress_callback")
+
         errors = []
+        # Group by table, preserving first-seen order
+        tags_by_table: Dict[str, List[Dict[str, str]]] = {}
 
         for tag in tags:
             table_name = tag.get("table")
@@ -182,51 +206,130 @@ class DatabricksProviderAdapter(DataProvider):
                 )
                 continue
 
-            # Construct ALTER TABLE statement
-            sql = f"""
-            ALTER TABLE {table_name}
-            ALTER COLUMN {column_name}
-            SET TAGS ('semantic' = '{semantic_type}')
-            """
+            tags_by_table.setdefault(table_name, []).append(tag)
 
+        tags_applied = 0
+        total_tables = len(tags_by_table)
+        if total_tables:
+            workers = max(1, min(max_workers, total_tables))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                futures = {
+                    executor.submit(
+                        self._tag_table,
+                        table_name,
+                        table_tags,
+                        catalog,
+                        schema,
+                        warehouse_id,
+                        wait_timeout,
+                    ): (table_name, table_tags)
+                    for table_name, table_tags in tags_by_table.items()
+                }
+                tables_done = 0
+                for future in as_completed(futures):
+                    table_name, table_tags = futures[future]
+                    applied, table_errors = future.result()
+                    tags_applied += applied
+                    errors.extend(table_errors)
+                    tables_done += 1
+                    if progress_callback:
+                        progress_callback(
+                            table_name, len(table_tags), tables_done, total_tables
+                        )
+
+        return {
+            "success": len(errors) == 0,
+            "tags_applied": tags_applied,
+            "errors": errors,
+        }
+
+    @staticmethod
+    def _qualify_table_name(
+        table_name: str, catalog: Optional[str], schema: Optional[str]
+    ) -> str:
+        """Qualify a bare table name with catalog and schema when both are known."""
+        if "." not in table_name and catalog and schema:
+            return f"{catalog}.{schema}.{table_name}"
+        return table_name
+
+    @staticmethod
+    def _statement_error(result: Dict) -> Optional[str]:
+        """Return the error message of a finished statement, or None on success."""
+        status = result.get("status", {})
+        if status.get("state") == "SUCCEEDED":
+            return None
+
+        error_info = status.get("error", {})
+        if isinstance(error_info, dict):
+            return error_info.get("message", "Unknown SQL error")
+        return str(error_info) if error_info else "Unknown error"
+
+    def _tag_table(
+        self,
+        table_name: str,
+        table_tags: List[Dict[str, str]],
+        catalog: Optional[str],
+        schema: Optional[str],
+        warehouse_id: str,
+        wait_timeout: str,
+    ):
+        """Tag every column of one table, batching where the warehouse allows.
+
+        Returns:
+            Tuple of (tags_applied, errors) for this table
+        """
+        qualified_name = self._qualify_table_name(table_name, catalog, schema)
+        statements = [
+            f"ALTER TABLE {qualified_name} "
+            f"ALTER COLUMN {tag['column']} "
+            f"SET TAGS ('semantic' = '{tag['semantic_type']}')"
+            for tag in table_tags
+        ]
+
+        if len(statements) > 1 and self._sql_scripting_supported:
+            script = "BEGIN\n" + "".join(f"  {stmt};\n" for stmt in statements) + "END"
             try:
                 result = self.client.submit_sql_statement(
-                    sql_text=sql,
+                    sql_text=script,
                     warehouse_id=warehouse_id,
-                    wait_timeout=kwargs.get("wait_timeout", "30s"),
+                    wait_timeout=wait_timeout,
                 )
+                if self._statement_error(result) is None:
+                    return len(statements), []
+            except Exception as e:
+                logging.debug(f"Batched tagging of {qualified_name} failed: {e}")
 
-                if result.get("status", {}).get("state") == "SUCCEEDED":
-                    tags_applied += 1
-                else:
-                    # Extract error information
-                    status = result.get("status", {})
-                    error_info = status.get("error", {})
-
-                    if isinstance(error_info, dict):
-                        error_message = error_info.get("message", "Unknown SQL error")
-                    else:
-                        error_message = (
-                            str(error_info) if error_info else "Unknown error"
-                        )
-
-                    errors.append(
-                        {
-                            "table": table_name,
-                            "column": column_name,
-                            "error": error_message,
-                        }
-                    )
+        applied = 0
+        errors = []
+        for tag, sql in zip(table_tags, statements):
+            try:
+                result = self.client.submit_sql_statement(
+                    sql_text=sql,
+                    warehouse_id=warehouse_id,
+                    wait_timeout=wait_timeout,
+                )
+                error_message = self._statement_error(result)
             except Exception as e:
+                error_message = str(e)
+
+            if error_message is None:
+                applied += 1
+            else:
                 errors.append(
-                    {"table": table_name, "column": column_name, "error": str(e)}
+                    {
+                        "table": table_name,
+                        "column": tag["column"],
+                        "error": error_message,
+                    }
                 )
 
-        return {
-            "success": len(errors) == 0,
-            "tags_applied": tags_applied,
-            "errors": errors,
-        }
+        if len(statements) > 1 and self._sql_scripting_supported and not errors:
+            # Every column succeeded on its own, so the block itself was rejected:
+            # this warehouse doesn't support SQL scripting. Stop trying it.
+            logging.debug("SQL scripting unavailable; tagging one column at a time")
+            self._sql_scripting_supported = False
+
+        return applied, errors
 
 
 class RedshiftProviderAdapter(DataProvider):
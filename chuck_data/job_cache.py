@@ -2,15 +2,23 @@
 Job ID caching for quick status lookups.
 
 This module provides caching for Chuck job IDs and their corresponding Databricks
-run IDs. The cache maintains the last 20 job launches to enable quick status checks
-without requiring the user to specify job IDs.
+run IDs. The cache maintains the last MAX_CACHE_SIZE job launches to enable quick
+status checks without requiring the user to specify job IDs.
+
+Entries are kept in an OrderedDict keyed by job ID (most recent first) with a
+second index from run ID to job ID, so lookups in either direction do not scan
+the cache. Saves write a temporary file and rename it over the cache file, and
+can be deferred with batch_updates() so a refresh of many jobs writes once.
 """
 
 import json
 import logging
 import os
-from typing import Optional, List, Dict, Tuple, Any
-from collections import deque
+import tempfile
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import Optional, List, Dict, Tuple, Any, Iterator
 
 
 # Cache file location
@@ -20,20 +28,30 @@ def _get_cache_file_path() -> str:
 
 
 # Maximum number of job entries to cache
-MAX_CACHE_SIZE = 20
+MAX_CACHE_SIZE = 200
 
 
 class JobCache:
     """Cache for job IDs with LRU eviction policy."""
 
-    def __init__(self, cache_file: Optional[str] = None):
+    def __init__(
+        self, cache_file: Optional[str] = None, max_size: int = MAX_CACHE_SIZE
+    ):
         """Initialize job cache.
 
         Args:
             cache_file: Optional path to cache file (for testing)
+            max_size: Maximum number of jobs kept; the oldest are evicted
         """
         self.cache_file = cache_file or _get_cache_file_path()
-        self._cache: deque = deque(maxlen=MAX_CACHE_SIZE)
+        self.max_size = max_size
+        # job_id -> entry, most recent first
+        self._entries: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        # run_id -> job_id
+        self._run_index: Dict[str, str] = {}
+        self._lock = threading.RLock()
+        self._batch_depth = 0
+        self._dirty = False
         self._load()
 
     def _load(self):
@@ -42,26 +60,76 @@ class JobCache:
             try:
                 with open(self.cache_file, "r") as f:
                     data = json.load(f)
-                    # Load as deque with maxlen
-                    self._cache = deque(data.get("jobs", []), maxlen=MAX_CACHE_SIZE)
-                    logging.debug(f"Loaded {len(self._cache)} jobs from cache")
+                for job in data.get("jobs", []):
+                    job_id = job.get("job_id")
+                    if job_id is None or job_id in self._entries:
+                        continue
+                    if len(self._entries) >= self.max_size:
+                        break
+                    self._entries[job_id] = job
+                    self._index(job)
+                logging.debug(f"Loaded {len(self._entries)} jobs from cache")
             except (json.JSONDecodeError, Exception) as e:
                 logging.warning(f"Failed to load job cache: {e}")
-                self._cache = deque(maxlen=MAX_CACHE_SIZE)
+                self._entries = OrderedDict()
+                self._run_index = {}
+
+    def _index(self, entry: Dict[str, Any]):
+        run_id = entry.get("run_id")
+        if run_id is not None:
+            self._run_index[run_id] = entry["job_id"]
+
+    def _unindex(self, entry: Dict[str, Any]):
+        run_id = entry.get("run_id")
+        if run_id is not None and self._run_index.get(run_id) == entry["job_id"]:
+            del self._run_index[run_id]
 
     def _save(self):
-        """Save cache to file."""
+        """Save cache to file, or mark it for saving at the end of a batch."""
+        with self._lock:
+            self._dirty = True
+            if self._batch_depth:
+                return
+            self._dirty = False
+            jobs = list(self._entries.values())
+            tmp_file = None
+            try:
+                # Ensure directory exists
+                directory = os.path.dirname(self.cache_file)
+                if directory:
+                    os.makedirs(directory, exist_ok=True)
+
+                # Write a temporary file of our own, then rename it, so readers
+                # never see a partial file and other writers cannot clobber it
+                with tempfile.NamedTemporaryFile(
+                    "w",
+                    dir=directory or None,
+                    prefix=f"{os.path.basename(self.cache_file)}.",
+                    suffix=".tmp",
+                    delete=False,
+                ) as f:
+                    tmp_file = f.name
+                    json.dump({"jobs": jobs}, f, indent=2)
+                os.replace(tmp_file, self.cache_file)
+                logging.debug(f"Saved {len(jobs)} jobs to cache")
+            except Exception as e:
+                logging.error(f"Failed to save job cache: {e}")
+                if tmp_file and os.path.exists(tmp_file):
+                    os.remove(tmp_file)
+
+    @contextmanager
+    def batch_updates(self) -> Iterator[None]:
+        """Defer saves until the outermost batch ends, then write at most once."""
+        with self._lock:
+            self._batch_depth += 1
         try:
-            # Ensure directory exists
-            directory = os.path.dirname(self.cache_file)
-            if directory:
-                os.makedirs(directory, exist_ok=True)
-
-            with open(self.cache_file, "w") as f:
-                json.dump({"jobs": list(self._cache)}, f, indent=2)
-            logging.debug(f"Saved {len(self._cache)} jobs to cache")
-        except Exception as e:
-            logging.error(f"Failed to save job cache: {e}")
+            yield
+        finally:
+            with self._lock:
+                self._batch_depth -= 1
+                flush = self._batch_depth == 0 and self._dirty
+            if flush:
+                self._save()
 
     def add_job(
         self, job_id: str, run_id: Optional[str] = None, job_data: Optional[dict] = None
@@ -76,13 +144,6 @@ class JobCache:
             run_id: Optional Databricks run identifier
             job_data: Optional full job data dictionary (state, records, credits, dates, etc.)
         """
-        # Remove existing entry for this job_id if present
-        self._cache = deque(
-            [job for job in self._cache if job.get("job_id") != job_id],
-            maxlen=MAX_CACHE_SIZE,
-        )
-
-        # Add new entry at the front (most recent)
         from datetime import datetime, timezone
 
         entry: Dict[str, Any] = {"job_id": job_id}
@@ -94,7 +155,21 @@ class JobCache:
             entry["job_data"] = job_data
             entry["cached_at"] = datetime.now(timezone.utc).isoformat()
 
-        self._cache.appendleft(entry)
+        with self._lock:
+            # Replace any existing entry for this job_id
+            previous = self._entries.pop(job_id, None)
+            if previous is not None:
+                self._unindex(previous)
+
+            # Add new entry at the front (most recent)
+            self._entries[job_id] = entry
+            self._entries.move_to_end(job_id, last=False)
+            self._index(entry)
+
+            while len(self._entries) > self.max_size:
+                _, evicted = self._entries.popitem(last=True)
+                self._unindex(evicted)
+
         self._save()
         logging.debug(
             f"Cached job: {job_id}, run_id: {run_id}, has_data: {job_data is not None}"
@@ -107,8 +182,9 @@ class JobCache:
             Dictionary with 'job_id', optional 'run_id', optional 'job_data',
             and optional 'cached_at' (ISO timestamp), or None if cache is empty
         """
-        if self._cache:
-            return dict(self._cache[0])
+        with self._lock:
+            for entry in self._entries.values():
+                return dict(entry)
         return None
 
     def get_all_jobs(self) -> List[Dict[str, Any]]:
@@ -118,7 +194,14 @@ class JobCache:
             List of job dictionaries with 'job_id', optional 'run_id', optional 'job_data',
             and optional 'cached_at' (ISO timestamp)
         """
-        return [dict(job) for job in self._cache]
+        with self._lock:
+            return [dict(job) for job in self._entries.values()]
+
+    def get_job(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """Get the cached entry for a Chuck job ID, or None."""
+        with self._lock:
+            entry = self._entries.get(job_id)
+            return dict(entry) if entry is not None else None
 
     def find_run_id(self, job_id: str) -> Optional[str]:
         """Find Databricks run ID for a given Chuck job ID.
@@ -129,10 +212,9 @@ class JobCache:
         Returns:
             Databricks run ID if found, None otherwise
         """
-        for job in self._cache:
-            if job.get("job_id") == job_id:
-                return job.get("run_id")
-        return None
+        with self._lock:
+            entry = self._entries.get(job_id)
+            return entry.get("run_id") if entry is not None else None
 
     def find_job_id(self, run_id: str) -> Optional[str]:
         """Find Chuck job ID for a given Databricks run ID.
@@ -143,17 +225,20 @@ class JobCache:
         Returns:
             Chuck job ID if found, None otherwise
         """
-        for job in self._cache:
-            if job.get("run_id") == run_id:
-                return job.get("job_id")
-        return None
+        with self._lock:
+            return self._run_index.get(run_id)
 
     def clear(self):
         """Clear all cached jobs."""
-        self._cache.clear()
+        with self._lock:
+            self._entries.clear()
+            self._run_index.clear()
         self._save()
         logging.debug("Cleared job cache")
 
+    def __len__(self) -> int:
+        return len(self._entries)
+
 
 # Global cache instance
 _job_cache = JobCache()
@@ -274,6 +359,17 @@ def find_job_id_for_run(run_id: str) -> Optional[str]:
     return _job_cache.find_job_id(run_id)
 
 
+def batch_cache_updates():
+    """Context manager that coalesces cache writes into one save at the end.
+
+    Example:
+        >>> with batch_cache_updates():
+        ...     for job_id, job_data in refreshed:
+        ...         cache_job(job_id, job_data=job_data)
+    """
+    return _job_cache.batch_updates()
+
+
 def clear_cache():
     """Clear the job cache."""
     _job_cache.clear()
@@ -0,0 +1,558 @@
+"""
+Background status polling for launched jobs.
+
+Monitoring a job used to mean a loop that slept on the calling thread between
+status checks, one job at a time. JobWatcher tracks any number of Amperity
+jobs, Databricks runs and EMR steps from a single daemon thread and publishes
+a JobEvent to subscribers whenever a job's state or data changes.
+
+Status calls are batched where the APIs allow it: all watched steps on an EMR
+cluster are read with one ListSteps call, and Databricks runs that are still
+active are read from the runs list. Only jobs that are missing from a batch
+(typically because they just finished) are fetched one by one.
+
+Each job is polled on its own schedule. Jobs that have not started are checked
+often, running jobs back off while nothing changes, and failed status calls
+back off exponentially. Finished jobs are dropped after their final event.
+"""
+
+import logging
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+KIND_AMPERITY = "amperity"
+KIND_DATABRICKS = "databricks"
+KIND_EMR = "emr"
+
+PHASE_PENDING = "pending"
+PHASE_RUNNING = "running"
+PHASE_TERMINAL = "terminal"
+
+# Longest gap between checks of a job that has not started yet
+PENDING_POLL_INTERVAL = 10
+
+# Longest gap between checks of a running job, however long it runs
+MAX_POLL_INTERVAL = 120
+
+# Growth of a running job's interval for every poll that saw no change
+IDLE_BACKOFF = 1.5
+
+# Jobs are forgotten if they have not finished after this many seconds
+DEFAULT_WATCH_TIMEOUT = 6 * 60 * 60
+
+# Pages of active Databricks runs read per poll before falling back to runs/get
+DATABRICKS_RUN_LIST_PAGES = 4
+
+AMPERITY_TERMINAL_STATES = {"succeeded", "success", "failed", "error", "unauthorized"}
+AMPERITY_PENDING_STATES = {"pending", "submitted", "queued", "created", "starting"}
+DATABRICKS_TERMINAL_STATES = {"TERMINATED", "SKIPPED", "INTERNAL_ERROR"}
+DATABRICKS_PENDING_STATES = {"PENDING", "QUEUED", "BLOCKED", "WAITING_FOR_RETRY"}
+EMR_TERMINAL_STATES = {"COMPLETED", "CANCELLED", "FAILED", "INTERRUPTED"}
+EMR_PENDING_STATES = {"PENDING", "CANCEL_PENDING"}
+
+# Final states, lowercased and without the backend's ":" prefix, that mean success
+SUCCESS_STATES = {"succeeded", "success", "completed"}
+
+JobKey = Tuple[str, str]
+
+
+@dataclass
+class JobEvent:
+    """A change in a watched job, or a failed attempt to read its status."""
+
+    kind: str
+    job_id: str
+    state: Optional[str]
+    previous_state: Optional[str]
+    phase: str
+    data: Dict[str, Any]
+    error: Optional[Exception] = None
+    # True when a caller subscribed to this job specifically and reports it
+    awaited: bool = False
+
+    @property
+    def key(self) -> JobKey:
+        return (self.kind, self.job_id)
+
+    @property
+    def terminal(self) -> bool:
+        return self.phase == PHASE_TERMINAL
+
+    @property
+    def succeeded(self) -> bool:
+        state = (self.state or "").lower().replace(":", "")
+        return self.terminal and state in SUCCESS_STATES
+
+
+@dataclass
+class WatchedJob:
+    """Polling state for one job."""
+
+    kind: str
+    job_id: str
+    client: Any
+    poll_interval: float
+    expires_at: float
+    cluster_id: Optional[str] = None
+    token: Optional[str] = None
+    state: Optional[str] = None
+    phase: str = PHASE_PENDING
+    data: Dict[str, Any] = field(default_factory=dict)
+    next_poll: float = 0.0
+    unchanged_polls: int = 0
+    errors: int = 0
+    publish_next: bool = True
+
+    @property
+    def key(self) -> JobKey:
+        return (self.kind, self.job_id)
+
+
+def amperity_phase(job_data: Optional[Dict[str, Any]]) -> Tuple[str, str]:
+    """State and phase of a Chuck backend job status payload."""
+    if not job_data:
+        return "NOT_FOUND", PHASE_TERMINAL
+    state = (job_data.get("state") or "").lower()
+    normalized = state.replace(":", "")
+    if not normalized or normalized == "unknown":
+        return state, PHASE_TERMINAL
+    if normalized in AMPERITY_TERMINAL_STATES:
+        return state, PHASE_TERMINAL
+    if normalized in AMPERITY_PENDING_STATES:
+        return state, PHASE_PENDING
+    return state, PHASE_RUNNING
+
+
+def databricks_phase(run: Dict[str, Any]) -> Tuple[str, str]:
+    """State and phase of a Databricks run; finished runs report the result state."""
+    run_state = run.get("state") or {}
+    life_cycle = run_state.get("life_cycle_state", "UNKNOWN")
+    if life_cycle in DATABRICKS_TERMINAL_STATES:
+        return run_state.get("result_state") or life_cycle, PHASE_TERMINAL
+    if life_cycle in DATABRICKS_PENDING_STATES:
+        return life_cycle, PHASE_PENDING
+    return life_cycle, PHASE_RUNNING
+
+
+def emr_phase(status: Dict[str, Any]) -> Tuple[str, str]:
+    """State and phase of an EMRAPIClient step status dictionary."""
+    state = status.get("status", "UNKNOWN")
+    if state in EMR_TERMINAL_STATES:
+        return state, PHASE_TERMINAL
+    if state in EMR_PENDING_STATES:
+        return state, PHASE_PENDING
+    return state, PHASE_RUNNING
+
+
+_PHASES = {
+    KIND_AMPERITY: amperity_phase,
+    KIND_DATABRICKS: databricks_phase,
+    KIND_EMR: emr_phase,
+}
+
+
+def next_poll_interval(job: WatchedJob) -> float:
+    """Seconds until a job should be checked again."""
+    base = job.poll_interval
+    ceiling = max(base, MAX_POLL_INTERVAL)
+    if job.errors:
+        return min(base * 2 ** min(job.errors, 10), ceiling)
+    if job.phase == PHASE_PENDING:
+        return min(base, PENDING_POLL_INTERVAL)
+    return min(base * IDLE_BACKOFF ** min(job.unchanged_polls, 20), ceiling)
+
+
+class JobWatcher:
+    """Polls watched jobs from one background thread and publishes changes."""
+
+    def __init__(
+        self, clock: Callable[[], float] = time.monotonic, background: bool = True
+    ):
+        """
+        Args:
+            clock: Monotonic time source, replaceable for tests
+            background: Poll from a daemon thread. When False nothing is
+                polled until the caller runs poll_once.
+        """
+        self._clock = clock
+        self._background = background
+        self._jobs: Dict[JobKey, WatchedJob] = {}
+        self._subscribers: List[Tuple[Optional[JobKey], Callable[[JobEvent], Any]]] = []
+        self._lock = threading.RLock()
+        self._wakeup = threading.Condition(self._lock)
+        self._thread: Optional[threading.Thread] = None
+        self._stopped = False
+
+    #
+    # Watching
+    #
+
+    def watch_amperity_job(
+        self,
+        job_id: str,
+        token: str,
+        client: Any = None,
+        poll_interval: float = 30,
+        timeout: float = DEFAULT_WATCH_TIMEOUT,
+    ) -> JobKey:
+        """Watch a Chuck job through the Amperity backend."""
+        if client is None:
+            from chuck_data.clients.amperity import AmperityAPIClient
+
+            client = AmperityAPIClient()
+        return self._watch(
+            KIND_AMPERITY, str(job_id), client, poll_interval, timeout, token=token
+        )
+
+    def watch_databricks_run(
+        self,
+        run_id: Any,
+        client: Any,
+        poll_interval: float = 30,
+        timeout: float = DEFAULT_WATCH_TIMEOUT,
+    ) -> JobKey:
+        """Watch a Databricks job run."""
+        return self._watch(KIND_DATABRICKS, str(run_id), client, poll_interval, timeout)
+
+    def watch_emr_step(
+        self,
+        step_id: str,
+        client: Any,
+        cluster_id: Optional[str] = None,
+        poll_interval: float = 10,
+        timeout: float = DEFAULT_WATCH_TIMEOUT,
+    ) -> JobKey:
+        """Watch an EMR step; cluster_id defaults to the client's cluster."""
+        return self._watch(
+            KIND_EMR,
+            step_id,
+            client,
+            poll_interval,
+            timeout,
+            cluster_id=cluster_id or getattr(client, "cluster_id", None),
+        )
+
+    def _watch(
+        self,
+        kind: str,
+        job_id: str,
+        client: Any,
+        poll_interval: float,
+        timeout: float,
+        cluster_id: Optional[str] = None,
+        token: Optional[str] = None,
+    ) -> JobKey:
+        now = self._clock()
+        with self._wakeup:
+            job = self._jobs.get((kind, job_id))
+            if job is None:
+                job = WatchedJob(
+                    kind=kind,
+                    job_id=job_id,
+                    client=client,
+                    poll_interval=poll_interval,
+                    expires_at=now + timeout,
+                    cluster_id=cluster_id,
+                    token=token,
+                    next_poll=now,
+                )
+                self._jobs[job.key] = job
+            else:
+                # Already watched: take the newest client and credentials, the
+                # shorter interval, and report the current state promptly
+                job.client = client
+                job.token = token or job.token
+                job.cluster_id = cluster_id or job.cluster_id
+                job.poll_interval = min(job.poll_interval, poll_interval)
+                job.expires_at = max(job.expires_at, now + timeout)
+                job.next_poll = now
+                job.publish_next = True
+            self._ensure_thread()
+            self._wakeup.notify()
+        logging.debug(f"Watching {kind} job {job_id}")
+        return job.key
+
+    def unwatch(self, key: JobKey):
+        """Stop polling a job. Unknown keys are ignored."""
+        with self._lock:
+            self._jobs.pop(key, None)
+
+    def is_watching(self, key: JobKey) -> bool:
+        with self._lock:
+            return key in self._jobs
+
+    def get_watched_jobs(self) -> List[Dict[str, Any]]:
+        """Snapshot of watched jobs as dicts with kind, job_id, state and phase."""
+        with self._lock:
+            return [
+                {
+                    "kind": job.kind,
+                    "job_id": job.job_id,
+                    "state": job.state,
+                    "phase": job.phase,
+                }
+                for job in self._jobs.values()
+            ]
+
+    #
+    # Subscriptions
+    #
+
+    def subscribe(
+        self, callback: Callable[[JobEvent], Any], key: Optional[JobKey] = None
+    ) -> Callable[[], None]:
+        """
+        Call callback with every JobEvent, or only those for one job.
+
+        Callbacks run on the poller thread and should hand work off quickly,
+        e.g. by putting the event on a queue.
+
+        Returns:
+            Function that removes the subscription
+        """
+        entry = (key, callback)
+        with self._lock:
+            self._subscribers.append(entry)
+
+        def unsubscribe():
+            with self._lock:
+                if entry in self._subscribers:
+                    self._subscribers.remove(entry)
+
+        return unsubscribe
+
+    def _publish(self, events: List[JobEvent]):
+        with self._lock:
+            subscribers = list(self._subscribers)
+        awaited_keys = {key for key, _ in subscribers if key is not None}
+        for event in events:
+            event.awaited = event.key in awaited_keys
+            for key, callback in subscribers:
+                if key is not None and key != event.key:
+                    continue
+                try:
+                    callback(event)
+                except Exception as e:
+                    logging.warning(f"Job event subscriber failed: {e}")
+
+    #
+    # Polling
+    #
+
+    def poll_once(self, now: Optional[float] = None) -> List[JobEvent]:
+        """
+        Check every job that is due, publish the resulting events and return them.
+
+        The background thread calls this whenever the earliest job is due; it
+        can also be called directly to poll synchronously.
+        """
+        now = self._clock() if now is None else now
+        with self._lock:
+            for job in list(self._jobs.values()):
+                if job.expires_at <= now:
+                    logging.info(f"Stopped watching {job.kind} job {job.job_id}")
+                    del self._jobs[job.key]
+            due = [job for job in self._jobs.values() if job.next_poll <= now]
+
+        results: Dict[JobKey, Tuple[Optional[Dict[str, Any]], Optional[Exception]]] = {}
+        self._poll_amperity([j for j in due if j.kind == KIND_AMPERITY], results)
+        self._poll_emr([j for j in due if j.kind == KIND_EMR], results)
+        self._poll_databricks([j for j in due if j.kind == KIND_DATABRICKS], results)
+
+        events = []
+        for job in due:
+            data, error = results.get(job.key, (None, None))
+            event = self._apply(job, data, error, now)
+            if event is not None:
+                events.append(event)
+        self._publish(events)
+        return events
+
+    def _poll_amperity(self, jobs: List[WatchedJob], results):
+        # The backend has no batch status endpoint
+        for job in jobs:
+            try:
+                results[job.key] = (
+                    job.client.get_job_status(job.job_id, job.token),
+                    None,
+                )
+            except Exception as e:
+                results[job.key] = (None, e)
+
+    def _poll_emr(self, jobs: List[WatchedJob], results):
+        groups: Dict[Tuple[int, Optional[str]], List[WatchedJob]] = {}
+        for job in jobs:
+            groups.setdefault((id(job.client), job.cluster_id), []).append(job)
+
+        for group in groups.values():
+            client, cluster_id = group[0].client, group[0].cluster_id
+            try:
+                statuses = client.get_steps_status(
+                    [job.job_id for job in group], cluster_id
+                )
+            except Exception as e:
+                logging.debug(f"Batched EMR step status failed: {e}")
+                statuses = {}
+            for job in group:
+                try:
+                    status = statuses.get(job.job_id)
+                    if status is None:
+                        status = client.get_step_status(job.job_id, cluster_id)
+                    results[job.key] = (status, None)
+                except Exception as e:
+                    results[job.key] = (None, e)
+
+    def _poll_databricks(self, jobs: List[WatchedJob], results):
+        groups: Dict[int, List[WatchedJob]] = {}
+        for job in jobs:
+            groups.setdefault(id(job.client), []).append(job)
+
+        for group in groups.values():
+            client = group[0].client
+            active = self._active_databricks_runs(client, {j.job_id for j in group})
+            for job in group:
+                try:
+                    run = active.get(job.job_id)
+                    if run is None:
+                        # Not active any more (or not listed): read it directly
+                        run = client.get_job_run_status(job.job_id)
+                    results[job.key] = (run, None)
+                except Exception as e:
+                    results[job.key] = (None, e)
+
+    def _active_databricks_runs(self, client, wanted: set) -> Dict[str, Dict[str, Any]]:
+        found: Dict[str, Dict[str, Any]] = {}
+        page_token = None
+        try:
+            for _ in range(DATABRICKS_RUN_LIST_PAGES):
+                response = client.list_job_runs(active_only=True, page_token=page_token)
+                for run in response.get("runs", []):
+                    run_id = str(run.get("run_id"))
+                    if run_id in wanted:
+                        found[run_id] = run
+                page_token = response.get("next_page_token")
+                if len(found) == len(wanted) or not response.get("has_more"):
+                    break
+        except Exception as e:
+            logging.debug(f"Listing active Databricks runs failed: {e}")
+        return found
+
+    def _apply(
+        self,
+        job: WatchedJob,
+        data: Optional[Dict[str, Any]],
+        error: Optional[Exception],
+        now: float,
+    ) -> Optional[JobEvent]:
+        """Record one poll result on the job and return the event to publish, if any."""
+        with self._lock:
+            if self._jobs.get(job.key) is not job:
+                return None  # Unwatched while its status was being read
+
+            data = data or {}
+            if error is None:
+                try:
+                    state, phase = _PHASES[job.kind](data)
+                except Exception as e:
+                    # A malformed payload counts as a failed check and backs off
+                    error = e
+
+            if error is not None:
+                job.errors += 1
+                job.next_poll = now + next_poll_interval(job)
+                logging.debug(
+                    f"Status check for {job.kind} job {job.job_id} failed: {error}"
+                )
+                return JobEvent(
+                    job.kind,
+                    job.job_id,
+                    job.state,
+                    job.state,
+                    job.phase,
+                    job.data,
+                    error,
+                )
+
+            previous_state = job.state
+            changed = state != job.state or data != job.data
+            publish = changed or job.publish_next
+
+            job.state, job.phase, job.data = state, phase, data
+            job.errors = 0
+            job.unchanged_polls = 0 if changed else job.unchanged_polls + 1
+            job.publish_next = False
+            job.next_poll = now + next_poll_interval(job)
+            if phase == PHASE_TERMINAL:
+                del self._jobs[job.key]
+
+        if not publish:
+            return None
+        return JobEvent(job.kind, job.job_id, state, previous_state, phase, data)
+
+    #
+    # Background thread
+    #
+
+    def _ensure_thread(self):
+        if not self._background:
+            return
+        if self._thread is None or not self._thread.is_alive():
+            self._stopped = False
+            self._thread = threading.Thread(
+                target=self._run, name="chuck-job-watcher", daemon=True
+            )
+            self._thread.start()
+
+    def _seconds_until_due(self) -> Optional[float]:
+        if not self._jobs:
+            return None
+        return min(job.next_poll for job in self._jobs.values()) - self._clock()
+
+    def _run(self):
+        while True:
+            with self._wakeup:
+                while not self._stopped:
+                    delay = self._seconds_until_due()
+                    if delay is not None and delay <= 0:
+                        break
+                    self._wakeup.wait(delay)
+                if self._stopped:
+                    return
+            try:
+                self.poll_once()
+            except Exception as e:
+                logging.error(f"Job watcher poll failed: {e}")
+
+    def stop(self):
+        """Stop the background thread; watched jobs are kept."""
+        with self._wakeup:
+            self._stopped = True
+            self._wakeup.notify_all()
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join(timeout=5)
+        self._thread = None
+
+
+_job_watcher: Optional[JobWatcher] = None
+_job_watcher_lock = threading.Lock()
+
+
+def get_job_watcher() -> JobWatcher:
+    """Return the process-wide job watcher, creating it on first use."""
+    global _job_watcher
+    if _job_watcher is None:
+        with _job_watcher_lock:
+            if _job_watcher is None:
+                _job_watcher = JobWatcher()
+    return _job_watcher
+
+
+def reset_job_watcher():
+    """Stop and forget the process-wide watcher, with everything it was watching."""
+    global _job_watcher
+    with _job_watcher_lock:
+        if _job_watcher is not None:
+            _job_watcher.stop()
+        _job_watcher = None
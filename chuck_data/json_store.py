@@ -0,0 +1,116 @@
+"""
+Shared on-disk persistence for chuck's JSON caches.
+
+The PII classification cache, the scan snapshots and the Unity Catalog
+metadata cache each keep one mapping in a JSON file in the home directory.
+The file is tagged with a format version and is discarded when the version
+changes. Saves write a temporary file of their own and rename it over the
+target, so readers never see a partial file. Each module also keeps one
+process-wide instance, created on first use.
+"""
+
+import json
+import logging
+import os
+import tempfile
+import threading
+from typing import Any, Callable, Dict, Generic, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+def home_path(filename: str) -> str:
+    """Path of a chuck file in the user's home directory."""
+    return os.path.join(os.path.expanduser("~"), filename)
+
+
+def load_mapping(path: str, version: int, field: str, label: str) -> Dict[str, Any]:
+    """
+    Read the mapping stored under field by save_mapping.
+
+    Args:
+        path: JSON file to read
+        version: Format version the caller understands
+        field: Key of the mapping in the file
+        label: What is stored, for log messages (e.g. "PII cache")
+
+    Returns:
+        The stored mapping; empty if the file is missing, unreadable or has
+        another format version
+    """
+    if not os.path.exists(path):
+        return {}
+    try:
+        with open(path, "r") as f:
+            data = json.load(f)
+        if data.get("version") != version:
+            logging.debug(f"Discarding {label} with unknown format version")
+            return {}
+        mapping = data.get(field, {})
+        if not isinstance(mapping, dict):
+            raise ValueError(f"'{field}' is not a mapping")
+        return mapping
+    except Exception as e:
+        logging.warning(f"Failed to load {label}: {e}")
+        return {}
+
+
+def save_mapping(
+    path: str, version: int, field: str, mapping: Dict[str, Any], label: str
+) -> bool:
+    """
+    Write a mapping under field, tagged with the format version.
+
+    Returns:
+        True if the file was written; failures are logged, not raised
+    """
+    tmp_file = None
+    try:
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with tempfile.NamedTemporaryFile(
+            "w",
+            dir=directory or None,
+            prefix=f"{os.path.basename(path)}.",
+            suffix=".tmp",
+            delete=False,
+        ) as f:
+            tmp_file = f.name
+            json.dump({"version": version, field: mapping}, f, separators=(",", ":"))
+        os.replace(tmp_file, path)
+        logging.debug(f"Saved {len(mapping)} items to {label}")
+        return True
+    except Exception as e:
+        logging.error(f"Failed to save {label}: {e}")
+        if tmp_file and os.path.exists(tmp_file):
+            os.remove(tmp_file)
+        return False
+
+
+class LazyInstance(Generic[T]):
+    """A process-wide instance created by factory on first use."""
+
+    def __init__(self, factory: Callable[[], T]):
+        self._factory = factory
+        self._instance: Optional[T] = None
+        self._lock = threading.Lock()
+
+    def get(self) -> T:
+        """Return the instance, creating it if needed."""
+        instance = self._instance
+        if instance is None:
+            with self._lock:
+                if self._instance is None:
+                    self._instance = self._factory()
+                instance = self._instance
+        return instance
+
+    def peek(self) -> Optional[T]:
+        """Return the instance if it has been created, without creating it."""
+        return self._instance
+
+    def reset(self):
+        """Forget the instance so the next get() creates a new one."""
+        with self._lock:
+            self._instance = None
@@ -0,0 +1,37 @@
+"""
+Deferred imports for heavy SDKs.
+
+Modules such as the Redshift, EMR and S3 clients are imported whenever the
+command registry loads, but most sessions never talk to AWS. Binding the SDK
+through LazyModule keeps a module-level name (so call sites and tests that
+patch e.g. ``chuck_data.clients.redshift.boto3`` are unchanged) while the
+real import only happens on first attribute access.
+"""
+
+import importlib
+from types import ModuleType
+
+
+class LazyModule:
+    """Stand-in for a module that is imported on first attribute access."""
+
+    def __init__(self, name: str):
+        """
+        Args:
+            name: Fully qualified module name, e.g. "boto3"
+        """
+        self._lazy_name = name
+
+    def _load(self) -> ModuleType:
+        # Resolved through sys.modules on every access rather than cached, so
+        # a module swapped in sys.modules (as tests do) is always honoured
+        return importlib.import_module(self._lazy_name)
+
+    def __getattr__(self, attr: str):
+        return getattr(self._load(), attr)
+
+    def __dir__(self):
+        return dir(self._load())
+
+    def __repr__(self) -> str:
+        return f"<lazy module '{self._lazy_name}'>"
@@ -12,8 +12,11 @@ This client now delegates to DatabricksProvider via the factory.
 """
 
 import logging
-from typing import Optional, List, Dict, Any
-from openai.types.chat import ChatCompletion
+from typing import TYPE_CHECKING, Optional, List, Dict, Any, Iterator
+
+if TYPE_CHECKING:
+    # openai is only needed once a provider is created
+    from openai.types.chat import ChatCompletion, ChatCompletionChunk
 
 logger = logging.getLogger(__name__)
 
@@ -42,7 +45,7 @@ class LLMClient:
         tools: Optional[List[Dict[str, Any]]] = None,
         stream: bool = False,
         tool_choice: str = "auto",
-    ) -> ChatCompletion:
+    ) -> "ChatCompletion":
         """Send chat request (delegates to DatabricksProvider).
 
         Args:
@@ -62,3 +65,59 @@ class LLMClient:
             stream=stream,
             tool_choice=tool_choice,
         )
+
+    async def achat(
+        self,
+        messages: List[Dict[str, Any]],
+        model: Optional[str] = None,
+        tools: Optional[List[Dict[str, Any]]] = None,
+        tool_choice: str = "auto",
+    ) -> "ChatCompletion":
+        """Send chat request asynchronously (delegates to DatabricksProvider).
+
+        Args:
+            messages: List of message objects
+            model: Model to use (default from config)
+            tools: List of tools to provide
+            tool_choice: Tool selection strategy
+
+        Returns:
+            Response from the API
+        """
+        return await self._provider.achat(
+            messages=messages,
+            model=model,
+            tools=tools,
+            tool_choice=tool_choice,
+        )
+
+    async def aclose(self):
+        """Close the provider's async resources (delegates to DatabricksProvider)."""
+        aclose = getattr(self._provider, "aclose", None)
+        if aclose is not None:
+            await aclose()
+
+    def stream_chat(
+        self,
+        messages: List[Dict[str, Any]],
+        model: Optional[str] = None,
+        tools: Optional[List[Dict[str, Any]]] = None,
+        tool_choice: str = "auto",
+    ) -> Iterator["ChatCompletionChunk"]:
+        """Stream chat response chunks (delegates to DatabricksProvider).
+
+        Args:
+            messages: List of message objects
+            model: Model to use (default from config)
+            tools: List of tools to provide
+            tool_choice: Tool selection strategy
+
+        Returns:
+            Iterator of response chunks
+        """
+        return self._provider.stream_chat(
+            messages=messages,
+            model=model,
+            tools=tools,
+            tool_choice=tool_choice,
+        )
@@ -1,7 +1,19 @@
 """LLM Provider Protocol."""
 
-from typing import Protocol, Optional, List, Dict, Any, TypedDict
-from openai.types.chat import ChatCompletion
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Protocol,
+    TypedDict,
+)
+
+if TYPE_CHECKING:
+    # openai is only needed once a provider is created
+    from openai.types.chat import ChatCompletion, ChatCompletionChunk
 
 
 class _ModelInfoRequired(TypedDict):
@@ -35,14 +47,15 @@ class LLMProvider(Protocol):
         tools: Optional[List[Dict[str, Any]]] = None,
         stream: bool = False,
         tool_choice: str = "auto",
-    ) -> ChatCompletion:
+    ) -> "ChatCompletion":
         """Send chat request to LLM.
 
         Args:
             messages: List of message dicts with 'role' and 'content'
             model: Model identifier (provider-specific)
             tools: Optional tool definitions (OpenAI format)
-            stream: Whether to stream response
+            stream: Whether to stream response; the chunks are assembled, so a
+                ChatCompletion is returned either way (use stream_chat for chunks)
             tool_choice: "auto", "required", or "none"
 
         Returns:
@@ -50,6 +63,53 @@ class LLMProvider(Protocol):
         """
         ...
 
+    async def achat(
+        self,
+        messages: List[Dict[str, Any]],
+        model: Optional[str] = None,
+        tools: Optional[List[Dict[str, Any]]] = None,
+        tool_choice: str = "auto",
+    ) -> "ChatCompletion":
+        """Send chat request to LLM without blocking the event loop.
+
+        Same contract as chat() minus streaming, so many requests can be in
+        flight from one asyncio task group instead of one thread each.
+
+        Args:
+            messages: List of message dicts with 'role' and 'content'
+            model: Model identifier (provider-specific)
+            tools: Optional tool definitions (OpenAI format)
+            tool_choice: "auto", "required", or "none"
+
+        Returns:
+            OpenAI ChatCompletion object
+        """
+        ...
+
+    def stream_chat(
+        self,
+        messages: List[Dict[str, Any]],
+        model: Optional[str] = None,
+        tools: Optional[List[Dict[str, Any]]] = None,
+        tool_choice: str = "auto",
+    ) -> Iterator["ChatCompletionChunk"]:
+        """Send chat request to LLM and yield the response as it is generated.
+
+        Text arrives as content deltas; tool calls arrive as indexed deltas
+        whose arguments are split across chunks. StreamAssembler (see
+        chuck_data.llm.streaming) rebuilds the ChatCompletion.
+
+        Args:
+            messages: List of message dicts with 'role' and 'content'
+            model: Model identifier (provider-specific)
+            tools: Optional tool definitions (OpenAI format)
+            tool_choice: "auto", "required", or "none"
+
+        Returns:
+            Iterator of OpenAI ChatCompletionChunk objects
+        """
+        ...
+
     def list_models(self, tool_calling_only: bool = True) -> List[ModelInfo]:
         """List available models from this provider.
 
@@ -13,16 +13,25 @@ Supports both direct model IDs and cross-region inference profiles for
 higher throughput and better resilience.
 """
 
+import asyncio
 import json
 import logging
 import os
 import re
 import time
-from typing import Any, Dict, List, Literal, Optional
+from typing import Any, Dict, Iterator, List, Literal, Optional
 
 from openai.types.chat.chat_completion import ChatCompletion, Choice
+from openai.types.chat.chat_completion_chunk import (
+    ChatCompletionChunk,
+    Choice as ChunkChoice,
+    ChoiceDelta,
+    ChoiceDeltaToolCall,
+    ChoiceDeltaToolCallFunction,
+)
 
 from chuck_data.llm.provider import ModelInfo
+from chuck_data.llm.streaming import StreamAssembler
 from openai.types.chat.chat_completion_message import ChatCompletionMessage
 from openai.types.completion_usage import CompletionUsage
 from openai.types.chat.chat_completion_message_tool_call import (
@@ -33,11 +42,28 @@ from openai.types.chat.chat_completion_message_tool_call import (
 # Import boto3 at module level for testability
 try:
     import boto3  # type: ignore[reportMissingImports]
+    from botocore.config import Config as BotoConfig  # type: ignore[reportMissingImports]
 except ImportError:
     boto3 = None  # type: ignore
+    BotoConfig = None  # type: ignore
 
 logger = logging.getLogger(__name__)
 
+# HTTP connections the runtime client keeps, so concurrent achat() calls
+# are not serialized behind botocore's default pool of 10
+BEDROCK_MAX_POOL_CONNECTIONS = 64
+
+# Bedrock stopReason -> OpenAI finish_reason
+_FINISH_REASON_MAP: Dict[
+    str, Literal["stop", "length", "tool_calls", "content_filter"]
+] = {
+    "end_turn": "stop",
+    "tool_use": "tool_calls",
+    "max_tokens": "length",
+    "stop_sequence": "stop",
+    "content_filtered": "content_filter",
+}
+
 
 class AWSBedrockProvider:
     """LLM provider for AWS Bedrock foundation models.
@@ -117,7 +143,13 @@ class AWSBedrockProvider:
         # boto3 automatically handles AWS_PROFILE, env vars, ~/.aws/credentials, IAM roles, etc.
         try:
             self.bedrock_runtime = boto3.client(
-                "bedrock-runtime", region_name=self.region
+                "bedrock-runtime",
+                region_name=self.region,
+                config=(
+                    BotoConfig(max_pool_connections=BEDROCK_MAX_POOL_CONNECTIONS)
+                    if BotoConfig is not None
+                    else None
+                ),
             )
             self.bedrock = boto3.client("bedrock", region_name=self.region)
         except Exception as e:
@@ -159,7 +191,8 @@ class AWSBedrockProvider:
                    - Direct: "amazon.nova-pro-v1:0" (default)
                    - Profile: "us.anthropic.claude-sonnet-4-5-20250929-v1:0"
             tools: Optional tool definitions (OpenAI format)
-            stream: Whether to stream response (not implemented yet)
+            stream: Assemble the response from the ConverseStream API (see
+                stream_chat) instead of calling Converse
             tool_choice: "auto", "required", or "none"
 
         Returns:
@@ -169,14 +202,115 @@ class AWSBedrockProvider:
             ValueError: If model is not supported or request is invalid
             Exception: If Bedrock API call fails
         """
-        # Resolve model
+        if stream:
+            return StreamAssembler.collect(
+                self.stream_chat(messages, model, tools, tool_choice)
+            )
+
+        model_id = model or self.default_model
+        request = self._build_converse_request(messages, model_id, tools, tool_choice)
+
+        # Call Bedrock Converse API
+        try:
+            response = self.bedrock_runtime.converse(**request)
+            logger.debug(
+                f"Bedrock Converse response: {json.dumps(response, indent=2, default=str)}"
+            )
+
+        except Exception as e:
+            logger.error(f"Bedrock Converse API error: {e}")
+            raise
+
+        # Convert response to OpenAI format
+        return self._convert_response_to_openai(response, model_id)
+
+    def stream_chat(
+        self,
+        messages: List[Dict[str, Any]],
+        model: Optional[str] = None,
+        tools: Optional[List[Dict[str, Any]]] = None,
+        tool_choice: str = "auto",
+    ) -> Iterator[ChatCompletionChunk]:
+        """Stream a chat response from AWS Bedrock using the ConverseStream API.
+
+        Bedrock events are translated into OpenAI chunks: text deltas become
+        content deltas, and each toolUse block becomes an indexed tool-call
+        delta whose input JSON arrives across several chunks.
+
+        Args:
+            messages: List of message dicts with 'role' and 'content' (OpenAI format)
+            model: Model ID or inference profile (uses default if not provided)
+            tools: Optional tool definitions (OpenAI format)
+            tool_choice: "auto", "required", or "none"
+
+        Yields:
+            OpenAI ChatCompletionChunk objects
+        """
+        model_id = model or self.default_model
+        request = self._build_converse_request(messages, model_id, tools, tool_choice)
+
+        try:
+            response = self.bedrock_runtime.converse_stream(**request)
+        except Exception as e:
+            logger.error(f"Bedrock ConverseStream API error: {e}")
+            raise
+
+        chunk_id = f"bedrock-{int(time.time())}"
+        # Bedrock content block index -> OpenAI tool call index
+        tool_indexes: Dict[int, int] = {}
+        for event in response["stream"]:
+            chunk = self._convert_stream_event_to_openai(
+                event, chunk_id, model_id, tool_indexes
+            )
+            if chunk is not None:
+                yield chunk
+
+    async def achat(
+        self,
+        messages: List[Dict[str, Any]],
+        model: Optional[str] = None,
+        tools: Optional[List[Dict[str, Any]]] = None,
+        tool_choice: str = "auto",
+    ) -> ChatCompletion:
+        """Send chat request to AWS Bedrock without blocking the event loop.
+
+        boto3 has no native asyncio transport, so the Converse call runs on
+        the default executor; the runtime client is thread-safe and its
+        connection pool is sized for many concurrent requests.
+
+        Args:
+            messages: List of message dicts with 'role' and 'content' (OpenAI format)
+            model: Model ID or inference profile (uses default if not provided)
+            tools: Optional tool definitions (OpenAI format)
+            tool_choice: "auto", "required", or "none"
+
+        Returns:
+            OpenAI ChatCompletion object
+        """
         model_id = model or self.default_model
+        request = self._build_converse_request(messages, model_id, tools, tool_choice)
+
+        try:
+            response = await asyncio.to_thread(self.bedrock_runtime.converse, **request)
+        except Exception as e:
+            logger.error(f"Bedrock Converse API error: {e}")
+            raise
 
+        return self._convert_response_to_openai(response, model_id)
+
+    def _build_converse_request(
+        self,
+        messages: List[Dict[str, Any]],
+        model_id: str,
+        tools: Optional[List[Dict[str, Any]]],
+        tool_choice: str,
+    ) -> Dict[str, Any]:
+        """Build the Converse API request for OpenAI-format messages and tools."""
         # Convert messages to Bedrock format
         system_messages, conversation = self._convert_messages_to_bedrock(messages)
 
         # Build Converse API request
-        request = {"modelId": model_id, "messages": conversation}
+        request: Dict[str, Any] = {"modelId": model_id, "messages": conversation}
 
         # Add system messages if present
         if system_messages:
@@ -188,27 +322,7 @@ class AWSBedrockProvider:
 
         # Log request for debugging
         logger.debug(f"Bedrock Converse request: {json.dumps(request, indent=2)}")
-
-        # Call Bedrock Converse API
-        try:
-            if stream:
-                # TODO: Implement streaming support
-                logger.warning(
-                    "Streaming not yet implemented for Bedrock, using non-streaming"
-                )
-                stream = False
-
-            response = self.bedrock_runtime.converse(**request)
-            logger.debug(
-                f"Bedrock Converse response: {json.dumps(response, indent=2, default=str)}"
-            )
-
-        except Exception as e:
-            logger.error(f"Bedrock Converse API error: {e}")
-            raise
-
-        # Convert response to OpenAI format
-        return self._convert_response_to_openai(response, model_id)
+        return request
 
     def _convert_messages_to_bedrock(
         self, messages: List[Dict[str, Any]]
@@ -498,16 +612,7 @@ class AWSBedrockProvider:
 
         # Map Bedrock stopReason to OpenAI finish_reason
         stop_reason = bedrock_response.get("stopReason", "stop")
-        finish_reason_map: Dict[
-            str, Literal["stop", "length", "tool_calls", "content_filter"]
-        ] = {
-            "end_turn": "stop",
-            "tool_use": "tool_calls",
-            "max_tokens": "length",
-            "stop_sequence": "stop",
-            "content_filtered": "content_filter",
-        }
-        finish_reason = finish_reason_map.get(stop_reason, "stop")
+        finish_reason = _FINISH_REASON_MAP.get(stop_reason, "stop")
 
         # Build ChatCompletionMessage
         message = ChatCompletionMessage(
@@ -534,6 +639,99 @@ class AWSBedrockProvider:
             usage=usage,
         )
 
+    def _convert_stream_event_to_openai(
+        self,
+        event: Dict[str, Any],
+        chunk_id: str,
+        model_id: str,
+        tool_indexes: Dict[int, int],
+    ) -> Optional[ChatCompletionChunk]:
+        """Convert one ConverseStream event to an OpenAI chunk.
+
+        Returns None for events that carry nothing OpenAI streams
+        (messageStart, contentBlockStop).
+
+        Args:
+            event: Bedrock ConverseStream event
+            chunk_id: ID shared by every chunk of the response
+            model_id: Model ID used for the request
+            tool_indexes: Maps Bedrock content block indexes to tool call
+                indexes; updated as toolUse blocks start
+
+        Returns:
+            OpenAI ChatCompletionChunk, or None
+        """
+        delta = None
+        finish_reason = None
+        usage = None
+
+        if "contentBlockStart" in event:
+            start = event["contentBlockStart"]
+            tool_use = start.get("start", {}).get("toolUse")
+            if tool_use is None:
+                return None
+            index = tool_indexes.setdefault(
+                start.get("contentBlockIndex", 0), len(tool_indexes)
+            )
+            delta = ChoiceDelta(
+                tool_calls=[
+                    ChoiceDeltaToolCall(
+                        index=index,
+                        id=tool_use["toolUseId"],
+                        type="function",
+                        function=ChoiceDeltaToolCallFunction(
+                            name=tool_use["name"], arguments=""
+                        ),
+                    )
+                ]
+            )
+        elif "contentBlockDelta" in event:
+            block = event["contentBlockDelta"]
+            block_delta = block.get("delta", {})
+            if "text" in block_delta:
+                delta = ChoiceDelta(role="assistant", content=block_delta["text"])
+            elif "toolUse" in block_delta:
+                index = tool_indexes.get(block.get("contentBlockIndex", 0), 0)
+                delta = ChoiceDelta(
+                    tool_calls=[
+                        ChoiceDeltaToolCall(
+                            index=index,
+                            function=ChoiceDeltaToolCallFunction(
+                                arguments=block_delta["toolUse"].get("input", "")
+                            ),
+                        )
+                    ]
+                )
+            else:
+                return None
+        elif "messageStop" in event:
+            delta = ChoiceDelta()
+            finish_reason = _FINISH_REASON_MAP.get(
+                event["messageStop"].get("stopReason", "end_turn"), "stop"
+            )
+        elif "metadata" in event:
+            usage_data = event["metadata"].get("usage", {})
+            usage = CompletionUsage(
+                prompt_tokens=usage_data.get("inputTokens", 0),
+                completion_tokens=usage_data.get("outputTokens", 0),
+                total_tokens=usage_data.get("totalTokens", 0),
+            )
+        else:
+            return None
+
+        return ChatCompletionChunk(
+            id=chunk_id,
+            model=model_id,
+            created=int(time.time()),
+            object="chat.completion.chunk",
+            choices=(
+                [ChunkChoice(index=0, delta=delta, finish_reason=finish_reason)]
+                if delta is not None
+                else []
+            ),
+            usage=usage,
+        )
+
     @staticmethod
     def _supports_tool_calling(model_id: str, provider: str) -> bool:
         """Determine if a model supports tool calling based on provider and model ID.
@@ -1,13 +1,15 @@
 """Databricks LLM provider implementation."""
 
+import asyncio
 import logging
-from typing import Optional, List, Dict, Any
-from openai import OpenAI
-from openai.types.chat import ChatCompletion
+from typing import Optional, List, Dict, Any, Iterator
+from openai import AsyncOpenAI, OpenAI
+from openai.types.chat import ChatCompletion, ChatCompletionChunk
 
 from chuck_data.config import get_workspace_url, get_active_model
 from chuck_data.databricks_auth import get_databricks_token
 from chuck_data.llm.provider import ModelInfo
+from chuck_data.llm.streaming import StreamAssembler
 from chuck_data.clients.databricks import DatabricksAPIClient
 
 # Silence verbose OpenAI logging
@@ -48,6 +50,9 @@ class DatabricksProvider:
         self.workspace_url = workspace_url or get_workspace_url()
         self.default_model = model
         self._client = client  # Store injected client for testing
+        # AsyncOpenAI client and the event loop its connection pool belongs to
+        self._async_client: Optional[AsyncOpenAI] = None
+        self._async_client_loop: Optional[asyncio.AbstractEventLoop] = None
 
     def chat(
         self,
@@ -63,16 +68,52 @@ class DatabricksProvider:
             messages: List of message dicts with 'role' and 'content'
             model: Model endpoint name (uses default/active model if not provided)
             tools: Optional tool definitions (OpenAI format)
-            stream: Whether to stream response
+            stream: Assemble the response from the streaming API (see
+                stream_chat) instead of requesting it whole
             tool_choice: "auto", "required", or "none"
 
         Returns:
             OpenAI ChatCompletion object
         """
-        # Resolve model
-        resolved_model = model or self.default_model
-        if not resolved_model:
-            resolved_model = get_active_model()
+        if stream:
+            return StreamAssembler.collect(
+                self.stream_chat(messages, model, tools, tool_choice)
+            )
+        return self._create(messages, model, tools, tool_choice, stream=False)
+
+    def stream_chat(
+        self,
+        messages: List[Dict[str, Any]],
+        model: Optional[str] = None,
+        tools: Optional[List[Dict[str, Any]]] = None,
+        tool_choice: str = "auto",
+    ) -> Iterator[ChatCompletionChunk]:
+        """Stream a chat response from a Databricks model serving endpoint.
+
+        Serving endpoints speak the OpenAI streaming protocol, so the SDK's
+        chunk stream is returned as is.
+
+        Args:
+            messages: List of message dicts with 'role' and 'content'
+            model: Model endpoint name (uses default/active model if not provided)
+            tools: Optional tool definitions (OpenAI format)
+            tool_choice: "auto", "required", or "none"
+
+        Returns:
+            Iterator of OpenAI ChatCompletionChunk objects
+        """
+        return self._create(messages, model, tools, tool_choice, stream=True)
+
+    def _create(
+        self,
+        messages: List[Dict[str, Any]],
+        model: Optional[str],
+        tools: Optional[List[Dict[str, Any]]],
+        tool_choice: str,
+        stream: bool,
+    ) -> Any:
+        """Send a chat completions request; a stream of chunks if stream is set."""
+        resolved_model = self._resolve_model(model)
 
         # Create OpenAI client configured for Databricks
         client = OpenAI(
@@ -80,28 +121,94 @@ class DatabricksProvider:
             base_url=f"{self.workspace_url}/serving-endpoints",
         )
 
-        # Ensure we have a model - raise if none available
-        if not resolved_model:
-            raise ValueError("No model specified and no active model configured")
-
         # Make request - using type: ignore for OpenAI SDK strict typing
         # The runtime behavior is correct as OpenAI accepts these formats
         if tools:
-            response = client.chat.completions.create(
+            return client.chat.completions.create(
                 model=resolved_model,
                 messages=messages,  # type: ignore[arg-type]
                 tools=tools,  # type: ignore[arg-type]
                 stream=stream,
                 tool_choice=tool_choice,  # type: ignore[arg-type]
             )
-        else:
-            response = client.chat.completions.create(
+        return client.chat.completions.create(
+            model=resolved_model,
+            messages=messages,  # type: ignore[arg-type]
+            stream=stream,
+        )
+
+    async def achat(
+        self,
+        messages: List[Dict[str, Any]],
+        model: Optional[str] = None,
+        tools: Optional[List[Dict[str, Any]]] = None,
+        tool_choice: str = "auto",
+    ) -> ChatCompletion:
+        """Send chat request to Databricks model serving endpoint asynchronously.
+
+        Uses one AsyncOpenAI client per event loop, so concurrent requests
+        share its connection pool.
+
+        Args:
+            messages: List of message dicts with 'role' and 'content'
+            model: Model endpoint name (uses default/active model if not provided)
+            tools: Optional tool definitions (OpenAI format)
+            tool_choice: "auto", "required", or "none"
+
+        Returns:
+            OpenAI ChatCompletion object
+        """
+        resolved_model = self._resolve_model(model)
+        client = self._get_async_client()
+
+        if tools:
+            return await client.chat.completions.create(
                 model=resolved_model,
                 messages=messages,  # type: ignore[arg-type]
-                stream=stream,
+                tools=tools,  # type: ignore[arg-type]
+                tool_choice=tool_choice,  # type: ignore[arg-type]
             )
+        return await client.chat.completions.create(
+            model=resolved_model,
+            messages=messages,  # type: ignore[arg-type]
+        )
+
+    def _resolve_model(self, model: Optional[str]) -> str:
+        """Pick the requested, default or active model, raising if there is none."""
+        resolved_model = model or self.default_model or get_active_model()
+        if not resolved_model:
+            raise ValueError("No model specified and no active model configured")
+        return resolved_model
+
+    async def aclose(self):
+        """Close the AsyncOpenAI client of the running event loop, if any.
+
+        Call before the loop ends (e.g. at the end of the coroutine passed to
+        asyncio.run) so its httpx connection pool is not left open.
+        """
+        client = self._async_client
+        if client is None or self._async_client_loop is not asyncio.get_running_loop():
+            return
+        self._async_client = None
+        self._async_client_loop = None
+        await client.close()
 
-        return response
+    def _get_async_client(self) -> AsyncOpenAI:
+        """Return the AsyncOpenAI client for the running event loop.
+
+        httpx connection pools are bound to the loop they were created on, so
+        a new client is made when called from a different loop. A client left
+        over from an earlier loop cannot be closed from this one; use aclose()
+        before a loop ends.
+        """
+        loop = asyncio.get_running_loop()
+        if self._async_client is None or self._async_client_loop is not loop:
+            self._async_client = AsyncOpenAI(
+                api_key=self.token,
+                base_url=f"{self.workspace_url}/serving-endpoints",
+            )
+            self._async_client_loop = loop
+        return self._async_client
 
     def list_models(self, tool_calling_only: bool = True) -> List[ModelInfo]:
         """List available models from Databricks serving endpoints.
@@ -0,0 +1,131 @@
+"""Assembly of streamed chat completions.
+
+Providers stream OpenAI ChatCompletionChunk objects from stream_chat().
+StreamAssembler folds them back into the ChatCompletion chat() would have
+returned: text deltas are concatenated and tool calls are assembled by
+index, since their JSON arguments arrive in pieces. It also records when
+the first token arrived.
+"""
+
+import time
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+from openai.types.chat import ChatCompletion, ChatCompletionChunk
+from openai.types.chat.chat_completion import Choice
+from openai.types.chat.chat_completion_message import ChatCompletionMessage
+from openai.types.chat.chat_completion_message_tool_call import (
+    ChatCompletionMessageToolCall,
+    Function,
+)
+
+
+class StreamAssembler:
+    """Accumulate ChatCompletionChunks into a single ChatCompletion."""
+
+    def __init__(
+        self,
+        on_text: Optional[Callable[[str], None]] = None,
+        started_at: Optional[float] = None,
+    ):
+        """
+        Args:
+            on_text: Called with each assistant text delta as it arrives
+            started_at: time.monotonic() of the request, for time to first
+                token (defaults to now)
+        """
+        self.on_text = on_text
+        self.started_at = time.monotonic() if started_at is None else started_at
+        self.first_token_at: Optional[float] = None
+        self.id = ""
+        self.model = ""
+        self.usage: Any = None
+        self.finish_reason: Optional[str] = None
+        self._text: List[str] = []
+        self._tool_calls: Dict[int, Dict[str, str]] = {}
+
+    @classmethod
+    def collect(
+        cls,
+        chunks: Iterable[ChatCompletionChunk],
+        on_text: Optional[Callable[[str], None]] = None,
+    ) -> ChatCompletion:
+        """Consume a whole stream and return the assembled completion."""
+        assembler = cls(on_text=on_text)
+        for chunk in chunks:
+            assembler.add(chunk)
+        return assembler.to_completion()
+
+    @property
+    def time_to_first_token(self) -> Optional[float]:
+        """Seconds from the request to the first text or tool-call delta."""
+        if self.first_token_at is None:
+            return None
+        return self.first_token_at - self.started_at
+
+    @property
+    def text(self) -> str:
+        """Assistant text received so far."""
+        return "".join(self._text)
+
+    def add(self, chunk: ChatCompletionChunk) -> None:
+        """Fold one chunk into the response, forwarding its text to on_text."""
+        self.id = self.id or chunk.id
+        self.model = self.model or chunk.model
+        if getattr(chunk, "usage", None) is not None:
+            self.usage = chunk.usage
+
+        for choice in chunk.choices:
+            delta = choice.delta
+            if delta.content:
+                self._mark_first_token()
+                self._text.append(delta.content)
+                if self.on_text is not None:
+                    self.on_text(delta.content)
+            for tool_call in delta.tool_calls or []:
+                self._mark_first_token()
+                entry = self._tool_calls.setdefault(
+                    tool_call.index, {"id": "", "name": "", "arguments": ""}
+                )
+                if tool_call.id:
+                    entry["id"] = tool_call.id
+                if tool_call.function is not None:
+                    if tool_call.function.name:
+                        entry["name"] = tool_call.function.name
+                    if tool_call.function.arguments:
+                        entry["arguments"] += tool_call.function.arguments
+            if choice.finish_reason:
+                self.finish_reason = choice.finish_reason
+
+    def to_completion(self) -> ChatCompletion:
+        """Build the ChatCompletion for everything received."""
+        tool_calls: List[Any] = [
+            ChatCompletionMessageToolCall(
+                id=entry["id"],
+                type="function",
+                # A tool called without arguments may stream none at all
+                function=Function(
+                    name=entry["name"], arguments=entry["arguments"] or "{}"
+                ),
+            )
+            for _, entry in sorted(self._tool_calls.items())
+        ]
+        finish_reason = self.finish_reason or ("tool_calls" if tool_calls else "stop")
+        message = ChatCompletionMessage(
+            role="assistant",
+            content=self.text or None,
+            tool_calls=tool_calls or None,
+        )
+        return ChatCompletion(
+            id=self.id or f"stream-{int(time.time())}",
+            model=self.model,
+            choices=[
+                Choice(index=0, message=message, finish_reason=finish_reason)  # type: ignore[arg-type]
+            ],
+            created=int(time.time()),
+            object="chat.completion",
+            usage=self.usage,
+        )
+
+    def _mark_first_token(self) -> None:
+        if self.first_token_at is None:
+            self.first_token_at = time.monotonic()
@@ -0,0 +1,323 @@
+"""
+Unity Catalog metadata caching within a session.
+
+Catalog, schema, table and volume listings are requested over and over by
+/list-tables, catalog and schema selection, PII scans, Stitch setup and agent
+tool calls. DatabricksAPIClient keeps their responses here, keyed by
+workspace, token, endpoint and query parameters, for a per-resource TTL.
+
+Entries remember the catalog, schema and table they describe so that chuck's
+own mutations (create volume, tag columns, DDL through the SQL API, selecting
+a catalog) can drop exactly the entries they make stale. Optionally the cache
+is written to disk on exit so a restart starts warm.
+"""
+
+import atexit
+import copy
+import hashlib
+import json
+import logging
+import re
+import threading
+import time
+from typing import Any, Dict, Iterable, Optional
+
+from chuck_data import json_store
+
+# Seconds an entry stays fresh, by resource
+DEFAULT_TTLS = {
+    "catalogs": 600,
+    "catalog": 600,
+    "schemas": 300,
+    "schema": 300,
+    "tables": 120,
+    "table": 120,
+    "volumes": 120,
+}
+
+# Bump when the on-disk layout changes; older files are discarded
+_CACHE_FORMAT_VERSION = 1
+
+# DDL whose target's metadata is cached: CREATE/ALTER/DROP/COMMENT ON of a
+# table, view, schema, catalog or volume
+_DDL_PATTERN = re.compile(
+    r"\b(?:CREATE|ALTER|DROP|COMMENT\s+ON)\s+"
+    r"(?:OR\s+REPLACE\s+)?(?:TEMPORARY\s+|EXTERNAL\s+|MATERIALIZED\s+)*"
+    r"(TABLE|VIEW|SCHEMA|DATABASE|CATALOG|VOLUME)\s+"
+    r"(?:IF\s+(?:NOT\s+)?EXISTS\s+)?"
+    r"([`\w.-]+)",
+    re.IGNORECASE,
+)
+
+
+# Cache file name in the home directory
+CACHE_FILE_NAME = ".chuck_metadata_cache.json"
+
+
+def make_cache_key(identity: str, endpoint: str, params: Optional[Dict] = None) -> str:
+    """Build the cache key for one request.
+
+    Args:
+        identity: Workspace and credential the response was fetched with
+        endpoint: API endpoint
+        params: Query parameters, if any
+
+    Returns:
+        Stable string key
+    """
+    return json.dumps(
+        [identity, endpoint, sorted((params or {}).items())], separators=(",", ":")
+    )
+
+
+def client_identity(workspace_url: str, token: Optional[str]) -> str:
+    """Identify a workspace and credential without storing the token."""
+    token_hash = hashlib.sha256((token or "").encode("utf-8")).hexdigest()[:16]
+    return f"{workspace_url}:{token_hash}"
+
+
+class MetadataCache:
+    """TTL cache of Unity Catalog API responses with scoped invalidation."""
+
+    def __init__(
+        self,
+        ttls: Optional[Dict[str, int]] = None,
+        cache_file: Optional[str] = None,
+        persist: bool = False,
+    ):
+        """Initialize the metadata cache.
+
+        Args:
+            ttls: Per-resource TTLs in seconds, overriding DEFAULT_TTLS
+            cache_file: Optional path to the cache file (for testing)
+            persist: Load from and save to cache_file
+        """
+        self.ttls = {**DEFAULT_TTLS, **(ttls or {})}
+        self.cache_file = cache_file or json_store.home_path(CACHE_FILE_NAME)
+        self.persist = persist
+        self.hits = 0
+        self.misses = 0
+        self._by_resource: Dict[str, Dict[str, int]] = {}
+        self._entries: Dict[str, Dict[str, Any]] = {}
+        self._dirty = False
+        self._lock = threading.Lock()
+        if persist:
+            self._load()
+
+    def _load(self):
+        """Load unexpired entries from file."""
+        entries = json_store.load_mapping(
+            self.cache_file, _CACHE_FORMAT_VERSION, "entries", "metadata cache"
+        )
+        now = time.time()
+        for key, entry in entries.items():
+            if entry.get("expires_at", 0) > now:
+                self._entries[key] = entry
+        logging.debug(f"Loaded {len(self._entries)} cached metadata responses")
+
+    def save(self):
+        """Write unexpired entries to disk if persistence is on and they changed."""
+        if not self.persist:
+            return
+        with self._lock:
+            if not self._dirty:
+                return
+            now = time.time()
+            entries = {k: e for k, e in self._entries.items() if e["expires_at"] > now}
+            self._dirty = False
+        json_store.save_mapping(
+            self.cache_file, _CACHE_FORMAT_VERSION, "entries", entries, "metadata cache"
+        )
+
+    def _count(self, resource: str, outcome: str):
+        counts = self._by_resource.setdefault(resource, {"hits": 0, "misses": 0})
+        counts[outcome] += 1
+
+    def get(self, key: str, resource: str) -> Optional[Any]:
+        """Look up a fresh response.
+
+        Returns:
+            A copy of the cached response, or None on a miss or expired entry
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry["expires_at"] <= time.time():
+                del self._entries[key]
+                self._dirty = True
+                entry = None
+            if entry is None:
+                self.misses += 1
+                self._count(resource, "misses")
+                return None
+            self.hits += 1
+            self._count(resource, "hits")
+            value = entry["value"]
+        # Callers may modify what they get back
+        return copy.deepcopy(value)
+
+    def put(
+        self,
+        key: str,
+        resource: str,
+        value: Any,
+        catalog: Optional[str] = None,
+        schema: Optional[str] = None,
+        table: Optional[str] = None,
+    ):
+        """Store a response.
+
+        Args:
+            key: Key from make_cache_key
+            resource: Resource kind, selecting the TTL (see DEFAULT_TTLS)
+            value: JSON-serializable API response
+            catalog: Catalog the response describes, for invalidation
+            schema: Schema the response describes, for invalidation
+            table: Fully qualified table the response describes
+        """
+        ttl = self.ttls.get(resource, 0)
+        if ttl <= 0:
+            return
+        entry = {
+            "resource": resource,
+            "catalog": catalog,
+            "schema": schema,
+            "table": table,
+            "expires_at": time.time() + ttl,
+            "value": copy.deepcopy(value),
+        }
+        with self._lock:
+            self._entries[key] = entry
+            self._dirty = True
+
+    def invalidate(
+        self,
+        catalog: Optional[str] = None,
+        schema: Optional[str] = None,
+        table: Optional[str] = None,
+        resources: Optional[Iterable[str]] = None,
+    ) -> int:
+        """Drop entries matching every given filter; with no filters, drop all.
+
+        Names are compared case-insensitively, as Unity Catalog does.
+
+        Returns:
+            Number of entries dropped
+        """
+        wanted = {
+            field: value.lower()
+            for field, value in (
+                ("catalog", catalog),
+                ("schema", schema),
+                ("table", table),
+            )
+            if value is not None
+        }
+        resource_set = set(resources) if resources is not None else None
+
+        def matches(entry):
+            if resource_set is not None and entry["resource"] not in resource_set:
+                return False
+            return all(
+                (entry.get(field) or "").lower() == value
+                for field, value in wanted.items()
+            )
+
+        with self._lock:
+            stale = [k for k, e in self._entries.items() if matches(e)]
+            for key in stale:
+                del self._entries[key]
+            if stale:
+                self._dirty = True
+        if stale:
+            logging.debug(f"Invalidated {len(stale)} cached metadata responses")
+        return len(stale)
+
+    def invalidate_for_sql(self, sql: str) -> int:
+        """Drop entries made stale by DDL in a SQL statement or script.
+
+        Tables and views named without catalog and schema, and DDL on schemas
+        or catalogs, drop everything that could be affected.
+
+        Returns:
+            Number of entries dropped
+        """
+        dropped = 0
+        for match in _DDL_PATTERN.finditer(sql):
+            kind = match.group(1).upper()
+            parts = [p.strip("`") for p in match.group(2).split(".")]
+            if kind in ("TABLE", "VIEW"):
+                if len(parts) != 3:
+                    dropped += self.invalidate(resources=("tables", "table"))
+                    continue
+                catalog, schema, _ = parts
+                dropped += self.invalidate(table=".".join(parts))
+                dropped += self.invalidate(catalog, schema, resources=("tables",))
+            elif kind == "VOLUME":
+                if len(parts) != 3:
+                    dropped += self.invalidate(resources=("volumes",))
+                    continue
+                dropped += self.invalidate(parts[0], parts[1], resources=("volumes",))
+            elif kind == "CATALOG":
+                dropped += self.invalidate(resources=("catalogs",))
+                dropped += self.invalidate(catalog=parts[0])
+            else:  # SCHEMA / DATABASE
+                catalog = parts[0] if len(parts) == 2 else None
+                dropped += self.invalidate(catalog, resources=("schemas",))
+                dropped += self.invalidate(catalog, parts[-1])
+        return dropped
+
+    def clear(self):
+        """Remove every cached response."""
+        with self._lock:
+            self._entries.clear()
+            self._dirty = True
+        self.save()
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit and miss counters since the cache was created."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "entries": len(self._entries),
+                "by_resource": {r: dict(c) for r, c in self._by_resource.items()},
+            }
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+def _create_metadata_cache() -> MetadataCache:
+    from chuck_data.config import (
+        get_uc_metadata_cache_persist,
+        get_uc_metadata_cache_ttls,
+    )
+
+    cache = MetadataCache(
+        ttls=get_uc_metadata_cache_ttls(),
+        persist=get_uc_metadata_cache_persist(),
+    )
+    if cache.persist:
+        atexit.register(cache.save)
+    return cache
+
+
+_metadata_cache = json_store.LazyInstance(_create_metadata_cache)
+
+
+def get_metadata_cache() -> MetadataCache:
+    """Return the process-wide metadata cache, creating it on first use."""
+    return _metadata_cache.get()
+
+
+def invalidate_metadata(**filters) -> int:
+    """Invalidate the process-wide cache if it exists; see MetadataCache.invalidate."""
+    cache = _metadata_cache.peek()
+    return cache.invalidate(**filters) if cache is not None else 0
+
+
+def reset_metadata_cache():
+    """Forget the in-memory cache so the next access starts fresh."""
+    _metadata_cache.reset()
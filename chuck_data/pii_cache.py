@@ -0,0 +1,182 @@
+"""
+PII classification caching across scans.
+
+Classifying a table's columns costs one LLM call. The result only depends on
+the table's columns, the prompt and the model, so it is cached on disk keyed
+by a hash of (provider, fully qualified table name, ordered column names and
+types, prompt version, model). Repeated scan-pii / bulk-tag-pii /
+setup-stitch runs then only send new or changed tables to the LLM.
+
+The cache is bounded by its serialized size; least recently used entries are
+evicted first.
+"""
+
+import hashlib
+import json
+import logging
+import threading
+from collections import OrderedDict
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional
+
+from chuck_data import json_store
+
+# Cache file name in the home directory
+CACHE_FILE_NAME = ".chuck_pii_cache.json"
+
+# Upper bound for the serialized cache, in bytes
+MAX_CACHE_BYTES = 10 * 1024 * 1024
+
+# Bump when the on-disk layout changes; older files are discarded
+_CACHE_FORMAT_VERSION = 1
+
+
+def make_cache_key(
+    provider: str,
+    full_name: str,
+    columns: List[Dict[str, Any]],
+    prompt_version: str,
+    model: Optional[str],
+) -> str:
+    """Build the cache key for one table's classification.
+
+    Args:
+        provider: Data provider name (databricks, redshift, snowflake)
+        full_name: Fully qualified table name
+        columns: Ordered column dicts with "name" and "type"
+        prompt_version: Version of the classification prompt
+        model: LLM model identifier
+
+    Returns:
+        Hex SHA-256 digest identifying the classification inputs
+    """
+    signature = json.dumps(
+        [
+            provider,
+            full_name,
+            [[col.get("name", ""), col.get("type", "")] for col in columns],
+            prompt_version,
+            model or "",
+        ],
+        separators=(",", ":"),
+    )
+    return hashlib.sha256(signature.encode("utf-8")).hexdigest()
+
+
+def _entry_size(key: str, entry: Dict[str, Any]) -> int:
+    return len(key) + len(json.dumps(entry, separators=(",", ":")))
+
+
+class PIIClassificationCache:
+    """On-disk cache of per-table PII classifications with LRU eviction."""
+
+    def __init__(
+        self, cache_file: Optional[str] = None, max_bytes: int = MAX_CACHE_BYTES
+    ):
+        """Initialize PII classification cache.
+
+        Args:
+            cache_file: Optional path to cache file (for testing)
+            max_bytes: Size bound for the serialized entries
+        """
+        self.cache_file = cache_file or json_store.home_path(CACHE_FILE_NAME)
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._size = 0
+        self._dirty = False
+        self._lock = threading.Lock()
+        self._load()
+
+    def _load(self):
+        """Load cache from file."""
+        entries = json_store.load_mapping(
+            self.cache_file, _CACHE_FORMAT_VERSION, "entries", "PII cache"
+        )
+        for key, entry in entries.items():
+            self._entries[key] = entry
+            self._size += _entry_size(key, entry)
+        self._evict()
+        logging.debug(f"Loaded {len(self._entries)} PII classifications")
+
+    def save(self):
+        """Write the cache to disk if it changed since the last save."""
+        with self._lock:
+            if not self._dirty:
+                return
+            entries = dict(self._entries)
+            self._dirty = False
+        json_store.save_mapping(
+            self.cache_file, _CACHE_FORMAT_VERSION, "entries", entries, "PII cache"
+        )
+
+    def _evict(self):
+        while self._entries and self._size > self.max_bytes:
+            key, entry = self._entries.popitem(last=False)
+            self._size -= _entry_size(key, entry)
+            self._dirty = True
+
+    def get(self, key: str) -> Optional[List[Dict[str, Any]]]:
+        """Look up the classified columns for a cache key.
+
+        Returns:
+            List of {"name", "type", "semantic"} dicts, or None on a miss
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            self._entries.move_to_end(key)
+            return [dict(col) for col in entry["columns"]]
+
+    def put(self, key: str, full_name: str, columns: List[Dict[str, Any]]):
+        """Store classified columns under a cache key.
+
+        Args:
+            key: Key from make_cache_key
+            full_name: Table the classification belongs to
+            columns: List of {"name", "type", "semantic"} dicts
+        """
+        entry = {
+            "full_name": full_name,
+            "columns": [
+                {
+                    "name": col.get("name"),
+                    "type": col.get("type"),
+                    "semantic": col.get("semantic"),
+                }
+                for col in columns
+            ],
+            "cached_at": datetime.now(timezone.utc).isoformat(),
+        }
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._size -= _entry_size(key, previous)
+            self._entries[key] = entry
+            self._size += _entry_size(key, entry)
+            self._dirty = True
+            self._evict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def clear(self):
+        """Remove every cached classification."""
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+            self._dirty = True
+        self.save()
+
+
+_pii_cache = json_store.LazyInstance(PIIClassificationCache)
+
+
+def get_pii_cache() -> PIIClassificationCache:
+    """Return the process-wide PII classification cache, loading it on first use."""
+    return _pii_cache.get()
+
+
+def reset_pii_cache():
+    """Forget the in-memory cache so the next access reloads from disk."""
+    _pii_cache.reset()
@@ -1,9 +1,40 @@
 import logging
 import datetime
-import time
 import base64
 import json
 
+from chuck_data.clients.statement_waiter import (
+    DATABRICKS_PENDING_STATES,
+    DATABRICKS_QUEUED_STATES,
+    StatementWaiter,
+    databricks_statement_state,
+)
+
+
+def _wait_for_statement(client, statement_id, initial_response=None):
+    """
+    Poll a submitted SQL statement until it leaves PENDING/RUNNING.
+
+    Args:
+        client: DatabricksAPIClient instance
+        statement_id: ID returned by the statements endpoint
+        initial_response: Submit response, used to skip polling when the
+            statement already finished within the server-side wait
+
+    Returns:
+        Final statement status response
+    """
+    waiter = StatementWaiter(
+        pending_states=DATABRICKS_PENDING_STATES,
+        queued_states=DATABRICKS_QUEUED_STATES,
+    )
+    return waiter.wait(
+        poll=lambda: client.get(f"/api/2.0/sql/statements/{statement_id}"),
+        get_state=databricks_statement_state,
+        initial_response=initial_response,
+        statement_id=statement_id,
+    )
+
 
 def list_tables(client, warehouse_id):
     """
@@ -30,13 +61,8 @@ def list_tables(client, warehouse_id):
     statement_id = response.get("statement_id")
 
     # Poll until complete
-    state = None
-    while True:
-        status = client.get(f"/api/2.0/sql/statements/{statement_id}")
-        state = status.get("status", {}).get("state", status.get("state"))
-        if state not in ["PENDING", "RUNNING"]:
-            break
-        time.sleep(1)
+    status = _wait_for_statement(client, statement_id, response)
+    state = databricks_statement_state(status)
 
     # Get results
     if state != "SUCCEEDED":
@@ -77,13 +103,8 @@ def get_table_schema(client, warehouse_id, catalog_name, schema_name, table_name
     statement_id = response.get("statement_id")
 
     # Poll until complete
-    state = None
-    while True:
-        status = client.get(f"/api/2.0/sql/statements/{statement_id}")
-        state = status.get("status", {}).get("state", status.get("state"))
-        if state not in ["PENDING", "RUNNING"]:
-            break
-        time.sleep(1)
+    status = _wait_for_statement(client, statement_id, response)
+    state = databricks_statement_state(status)
 
     # Get results
     if state != "SUCCEEDED":
@@ -129,13 +150,8 @@ def get_sample_data(client, warehouse_id, catalog_name, schema_name, table_name)
     statement_id = response.get("statement_id")
 
     # Poll until complete
-    state = None
-    while True:
-        status = client.get(f"/api/2.0/sql/statements/{statement_id}")
-        state = status.get("status", {}).get("state", status.get("state"))
-        if state not in ["PENDING", "RUNNING"]:
-            break
-        time.sleep(1)
+    status = _wait_for_statement(client, statement_id, response)
+    state = databricks_statement_state(status)
 
     # Get results
     if state != "SUCCEEDED":
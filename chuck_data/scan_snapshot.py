@@ -0,0 +1,118 @@
+"""
+Per-schema snapshots of the last PII scan for incremental rescans.
+
+For every scanned schema the snapshot records, per table, a cheap change
+marker taken from the table listing (Unity Catalog ``updated_at``, a hash of
+Redshift ``pg_table_def`` columns, Snowflake ``LAST_ALTERED``) together with
+the table's scan result. An incremental scan compares fresh markers against
+the snapshot and only describes and classifies tables that were added or
+altered; the others carry their previous result forward.
+"""
+
+import logging
+import threading
+from collections import OrderedDict
+from datetime import datetime, timezone
+from typing import Any, Dict, Optional
+
+from chuck_data import json_store
+
+# Snapshot file name in the home directory
+SNAPSHOT_FILE_NAME = ".chuck_scan_snapshots.json"
+
+# Maximum number of schemas to keep snapshots for
+MAX_SNAPSHOTS = 50
+
+# Bump when the on-disk layout changes; older files are discarded
+_SNAPSHOT_FORMAT_VERSION = 1
+
+
+def snapshot_key(provider: str, catalog_or_database: str, schema: str) -> str:
+    """Key identifying one schema's snapshot."""
+    return f"{provider}:{catalog_or_database}.{schema}"
+
+
+class ScanSnapshotStore:
+    """On-disk store of per-schema scan snapshots with LRU eviction."""
+
+    def __init__(self, snapshot_file: Optional[str] = None):
+        """Initialize the snapshot store.
+
+        Args:
+            snapshot_file: Optional path to snapshot file (for testing)
+        """
+        self.snapshot_file = snapshot_file or json_store.home_path(SNAPSHOT_FILE_NAME)
+        self._snapshots: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._load()
+
+    def _load(self):
+        """Load snapshots from file."""
+        self._snapshots.update(
+            json_store.load_mapping(
+                self.snapshot_file,
+                _SNAPSHOT_FORMAT_VERSION,
+                "snapshots",
+                "scan snapshots",
+            )
+        )
+        logging.debug(f"Loaded {len(self._snapshots)} scan snapshots")
+
+    def _save(self):
+        """Save snapshots to file."""
+        json_store.save_mapping(
+            self.snapshot_file,
+            _SNAPSHOT_FORMAT_VERSION,
+            "snapshots",
+            dict(self._snapshots),
+            "scan snapshots",
+        )
+
+    def get(self, key: str) -> Dict[str, Dict[str, Any]]:
+        """Return the table entries of a schema's snapshot.
+
+        Returns:
+            Mapping of table name to {"fingerprint", "result"}; empty when
+            the schema has not been scanned before
+        """
+        with self._lock:
+            snapshot = self._snapshots.get(key)
+            if snapshot is None:
+                return {}
+            return dict(snapshot.get("tables", {}))
+
+    def put(self, key: str, tables: Dict[str, Dict[str, Any]]):
+        """Replace a schema's snapshot and persist the store.
+
+        Args:
+            key: Key from snapshot_key
+            tables: Mapping of table name to {"fingerprint", "result"}
+        """
+        with self._lock:
+            self._snapshots.pop(key, None)
+            self._snapshots[key] = {
+                "scanned_at": datetime.now(timezone.utc).isoformat(),
+                "tables": tables,
+            }
+            while len(self._snapshots) > MAX_SNAPSHOTS:
+                self._snapshots.popitem(last=False)
+            self._save()
+
+    def clear(self):
+        """Remove every snapshot."""
+        with self._lock:
+            self._snapshots.clear()
+            self._save()
+
+
+_scan_snapshots = json_store.LazyInstance(ScanSnapshotStore)
+
+
+def get_scan_snapshots() -> ScanSnapshotStore:
+    """Return the process-wide snapshot store, loading it on first use."""
+    return _scan_snapshots.get()
+
+
+def reset_scan_snapshots():
+    """Forget the in-memory store so the next access reloads from disk."""
+    _scan_snapshots.reset()
@@ -468,6 +468,7 @@ class ChuckService:
         *raw_args: str,
         interactive_input: Optional[str] = None,
         tool_output_callback: Optional[Callable[..., Any]] = None,
+        stream_callback: Optional[Callable[..., Any]] = None,
         **raw_kwargs: Any,  # For future TUI use, e.g. /cmd --named_arg value
     ) -> CommandResult:
         """
@@ -557,6 +558,8 @@ class ChuckService:
         # Pass tool output callback for agent commands
         if command_def.name == "agent" and tool_output_callback:
             args_for_handler["tool_output_callback"] = tool_output_callback
+        if command_def.name == "agent" and stream_callback:
+            args_for_handler["stream_callback"] = stream_callback
 
         # Handler Execution
         try:
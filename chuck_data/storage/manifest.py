@@ -12,9 +12,13 @@ app/service/stitch/stitch-standalone/doc/redshift-integration.md
 import json
 import logging
 from typing import Dict, Any, List, Optional
-import boto3
 from botocore.exceptions import ClientError
 
+from chuck_data.lazy_imports import LazyModule
+
+# Imported on first use; see chuck_data.lazy_imports
+boto3 = LazyModule("boto3")
+
 
 def generate_manifest_from_scan(
     scan_results: Dict[str, Any],
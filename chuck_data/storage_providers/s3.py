@@ -6,9 +6,13 @@ Handles uploading files to Amazon S3.
 import logging
 from typing import Optional
 
-import boto3
 from botocore.exceptions import ClientError
 
+from chuck_data.lazy_imports import LazyModule
+
+# Imported on first use; see chuck_data.lazy_imports
+boto3 = LazyModule("boto3")
+
 
 class S3Storage:
     """Upload files to Amazon S3.
@@ -0,0 +1,366 @@
+"""
+Windowed viewer for large SQL result sets.
+
+Paging through a result used to print a complete Rich table for every page
+into the scrollback, and only forwards. ResultViewer instead renders just the
+rows that fit on screen from a columnar buffer of fixed-size blocks that are
+read from the row source on demand. The user can scroll forwards and
+backwards or jump to any row, and the cost of a redraw depends only on the
+window size, not on the size of the result.
+
+Column widths are worked out incrementally as blocks are loaded and only ever
+grow, so the layout stays put while scrolling back over rows already seen.
+"""
+
+import logging
+import sys
+from collections import OrderedDict
+from typing import Any, List, Optional, Protocol, Sequence
+
+from rich.console import Console, Group
+from rich.live import Live
+from rich.table import Table
+from rich.text import Text
+
+from chuck_data.exceptions import PaginationCancelled
+from chuck_data.ui.table_formatter import create_table
+from chuck_data.ui.theme import INFO_STYLE, TABLE_TITLE_STYLE, WARNING_STYLE
+
+# Rows read from the source at a time
+DEFAULT_BLOCK_SIZE = 500
+
+# Decoded blocks kept in memory
+DEFAULT_MAX_BLOCKS = 8
+
+# Widest a column is drawn; longer values are cut with an ellipsis
+MAX_COLUMN_WIDTH = 40
+
+# Rows per printed page when there is no terminal to redraw in
+NON_INTERACTIVE_PAGE_SIZE = 50
+
+# Screen lines taken by the title, borders, header, status and prompt
+WINDOW_CHROME_LINES = 8
+
+HELP_TEXT = (
+    "[bold]SPACE[/bold]/[bold]n[/bold] next page, [bold]b[/bold] previous page, "
+    "[bold]j[/bold]/[bold]k[/bold] scroll, [bold]g[/bold]/[bold]G[/bold] top/bottom, "
+    "[bold]:[/bold] jump to row, [bold]q[/bold] quit"
+)
+
+
+class RowSource(Protocol):
+    """Random-access rows, e.g. PaginatedSQLResult."""
+
+    def get_rows(self, start_row: int, num_rows: int) -> List[List[Any]]: ...
+
+
+class LocalRowSource:
+    """RowSource over rows already in memory."""
+
+    def __init__(self, rows: Sequence[Sequence[Any]]):
+        self.rows = rows
+
+    def get_rows(self, start_row: int, num_rows: int) -> List[List[Any]]:
+        return [list(row) for row in self.rows[start_row : start_row + num_rows]]
+
+
+class ColumnarRowBuffer:
+    """
+    LRU of row blocks stored column by column as display strings.
+
+    Each block holds one list of strings per column, so a window is sliced out
+    of a handful of lists rather than assembled from row dicts.
+    """
+
+    def __init__(
+        self,
+        source: RowSource,
+        columns: List[str],
+        total_rows: int,
+        block_size: int = DEFAULT_BLOCK_SIZE,
+        max_blocks: int = DEFAULT_MAX_BLOCKS,
+        max_column_width: int = MAX_COLUMN_WIDTH,
+    ):
+        if block_size < 1 or max_blocks < 1:
+            raise ValueError("block_size and max_blocks must be at least 1")
+        self.source = source
+        self.columns = columns
+        self.total_rows = total_rows
+        self.block_size = block_size
+        self.max_blocks = max_blocks
+        self.max_column_width = max_column_width
+        self.widths = [min(len(c), max_column_width) for c in columns]
+        self.loads = 0
+        self._blocks: "OrderedDict[int, List[List[str]]]" = OrderedDict()
+
+    def get_window(self, start_row: int, num_rows: int) -> List[List[str]]:
+        """
+        Return the rows in [start_row, start_row + num_rows) column by column.
+
+        Returns:
+            One list of strings per column. The lists are shorter than
+            num_rows at the end of the result or if the source returned fewer
+            rows than expected.
+        """
+        window: List[List[str]] = [[] for _ in self.columns]
+        end_row = min(start_row + num_rows, self.total_rows)
+        row = max(0, start_row)
+        while row < end_row:
+            index, offset = divmod(row, self.block_size)
+            block = self._block(index)
+            take = min(end_row - row, self.block_size - offset)
+            for column, values in zip(window, block):
+                column.extend(values[offset : offset + take])
+            if len(block[0] if block else []) < offset + take:
+                break  # Short block: the source ran out of rows
+            row += take
+        return window
+
+    def _block(self, index: int) -> List[List[str]]:
+        block = self._blocks.get(index)
+        if block is not None:
+            self._blocks.move_to_end(index)
+            return block
+
+        rows = self.source.get_rows(index * self.block_size, self.block_size)
+        self.loads += 1
+        block = []
+        for position in range(len(self.columns)):
+            values = [
+                (
+                    ""
+                    if position >= len(row) or row[position] is None
+                    else str(row[position])
+                )
+                for row in rows
+            ]
+            if values:
+                widest = max(map(len, values))
+                if widest > self.widths[position]:
+                    self.widths[position] = min(widest, self.max_column_width)
+            block.append(values)
+
+        self._blocks[index] = block
+        while len(self._blocks) > self.max_blocks:
+            self._blocks.popitem(last=False)
+        return block
+
+
+class ResultViewer:
+    """Interactive, windowed view over a RowSource."""
+
+    def __init__(
+        self,
+        console: Console,
+        columns: List[str],
+        source: RowSource,
+        total_rows: int,
+        title: str = "SQL Query Results",
+        execution_time: Optional[Any] = None,
+        window_size: Optional[int] = None,
+        block_size: int = DEFAULT_BLOCK_SIZE,
+        max_blocks: int = DEFAULT_MAX_BLOCKS,
+    ):
+        """
+        Args:
+            console: Console to draw on
+            columns: Column names
+            source: Where rows are read from
+            total_rows: Number of rows in the result
+            title: Table title; the visible row range is appended
+            execution_time: Query time in ms, shown in the title
+            window_size: Rows per screen (default: fit the console height)
+            block_size: Rows read from the source at a time
+            max_blocks: Blocks kept in memory
+        """
+        self.console = console
+        self.columns = columns
+        self.total_rows = total_rows
+        self.title = title
+        self.execution_time = execution_time
+        self._window_size = window_size
+        self.buffer = ColumnarRowBuffer(
+            source, columns, total_rows, block_size=block_size, max_blocks=max_blocks
+        )
+        self.top = 0
+        # Message shown under the window until the next key, e.g. a bad row number
+        self._notice: Optional[str] = None
+
+    @property
+    def window_size(self) -> int:
+        if self._window_size:
+            return self._window_size
+        return max(5, self.console.size.height - WINDOW_CHROME_LINES)
+
+    @property
+    def last_top(self) -> int:
+        """Highest top row that still fills a window."""
+        return max(0, self.total_rows - self.window_size)
+
+    @property
+    def at_end(self) -> bool:
+        return self.top >= self.last_top
+
+    def scroll(self, rows: int):
+        """Move the window by a number of rows, either direction."""
+        self.top = min(max(0, self.top + rows), self.last_top)
+
+    def page_down(self):
+        self.scroll(self.window_size)
+
+    def page_up(self):
+        self.scroll(-self.window_size)
+
+    def home(self):
+        self.top = 0
+        # Message shown under the window until the next key, e.g. a bad row number
+        self._notice: Optional[str] = None
+
+    def end(self):
+        self.top = self.last_top
+
+    def goto(self, row_number: int):
+        """Show the window starting at a 1-based row number."""
+        self.top = min(max(0, row_number - 1), self.last_top)
+
+    def render(self) -> Table:
+        """Build a table for the visible window only."""
+        window = self.buffer.get_window(self.top, self.window_size)
+        shown = len(window[0]) if window else 0
+
+        title = (
+            f"{self.title} (Rows {self.top + 1}-{self.top + shown} of {self.total_rows}"
+        )
+        if self.execution_time is not None:
+            title += f", {self.execution_time}ms"
+        title += ")"
+
+        table = create_table(
+            title=title,
+            headers=self.columns,
+            title_style=TABLE_TITLE_STYLE,
+            show_lines=False,
+        )
+        for column, width in zip(table.columns, self.buffer.widths):
+            column.width = width
+            column.no_wrap = True
+            column.overflow = "ellipsis"
+
+        add_row = table.add_row
+        for cells in zip(*window):
+            add_row(*[Text(value) for value in cells])
+        return table
+
+    def show(self):
+        """Print the current window."""
+        self.console.print(self.render())
+
+    def render_screen(self) -> Group:
+        """The window plus the help line, end marker and any notice."""
+        end_row = min(self.top + self.window_size, self.total_rows)
+        lines = [
+            self.render(),
+            f"\n[dim]{HELP_TEXT} ({self.top + 1}-{end_row}/{self.total_rows} rows)[/dim]",
+        ]
+        if self.at_end:
+            lines.append(self._end_text())
+        if self._notice:
+            lines.append(self._notice)
+        return Group(*lines)
+
+    def run(self, interactive: Optional[bool] = None):
+        """
+        Show the result until the user quits.
+
+        Interactive sessions redraw the window on the terminal's alternate
+        screen, so the chat above it is left as it was once the viewer exits.
+        Without a terminal every window is printed in turn, as the old pager
+        did.
+
+        Raises:
+            PaginationCancelled: When the user quits or the end of a
+                non-interactive result is reached, to return to the prompt
+        """
+        if interactive is None:
+            interactive = sys.stdin.isatty()
+
+        if not interactive:
+            if not self._window_size:
+                self._window_size = NON_INTERACTIVE_PAGE_SIZE
+            while True:
+                self.show()
+                if self.top + self.window_size >= self.total_rows:
+                    self._print_end()
+                    raise PaginationCancelled()
+                self.console.print(
+                    "[dim]Auto-continuing (not in interactive terminal)...[/dim]"
+                )
+                # Step a whole page so the last page does not repeat rows
+                self.top += self.window_size
+
+        if self.console.no_color:
+            # Keep output plain: print each window instead of redrawing
+            while True:
+                self.console.print(self.render_screen())
+                self.handle_key(self._read_key())
+
+        with Live(
+            self.render_screen(),
+            console=self.console,
+            screen=True,
+            auto_refresh=False,
+        ) as live:
+            while True:
+                key = self._read_key()
+                self._notice = None
+                self.handle_key(key)
+                live.update(self.render_screen(), refresh=True)
+
+    def handle_key(self, key: str):
+        """Apply one key press to the window position."""
+        import readchar
+
+        if key in ("q", "Q"):
+            raise PaginationCancelled()
+        if key in (" ", "n", readchar.key.PAGE_DOWN):
+            self.page_down()
+        elif key in ("b", readchar.key.PAGE_UP):
+            self.page_up()
+        elif key in ("j", readchar.key.DOWN, readchar.key.ENTER):
+            self.scroll(1)
+        elif key in ("k", readchar.key.UP):
+            self.scroll(-1)
+        elif key in ("g", readchar.key.HOME):
+            self.home()
+        elif key in ("G", readchar.key.END):
+            self.end()
+        elif key == ":":
+            self._prompt_goto()
+        # Any other key redraws the same window; the help line is always shown
+
+    def _read_key(self) -> str:
+        try:
+            import readchar
+
+            return readchar.readkey()
+        except (KeyboardInterrupt, EOFError):
+            raise  # Re-raise to bubble up to main TUI loop
+        except Exception as e:
+            logging.debug(f"Key input failed, falling back to line input: {e}")
+            response = input("Type 'q' to quit or press ENTER for the next page: ")
+            return "q" if response.strip().lower() == "q" else " "
+
+    def _prompt_goto(self):
+        response = input(f"Go to row (1-{self.total_rows}): ").strip()
+        try:
+            self.goto(int(response.replace(",", "")))
+        except ValueError:
+            self._notice = (
+                f"[{WARNING_STYLE}]Not a row number: {response}[/{WARNING_STYLE}]"
+            )
+
+    def _end_text(self) -> str:
+        return f"\n[{INFO_STYLE}]End of results ({self.total_rows} total rows)[/{INFO_STYLE}]"
+
+    def _print_end(self):
+        self.console.print(self._end_text())
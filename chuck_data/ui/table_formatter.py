@@ -5,7 +5,8 @@ This module provides standardized table formatting functions using Rich library
 to ensure consistent display of tabular data throughout the application.
 """
 
-from typing import Any, Dict, List, Union, Optional, cast
+import inspect
+from typing import Any, Callable, Dict, List, Union, Optional, cast
 
 from rich.console import Console
 from rich.table import Table
@@ -176,11 +177,137 @@ def add_row_with_styles(
     table.add_row(*formatted_cells)
 
 
+# Style applied to cells whose value is None
+NONE_STYLE = "dim italic"
+
+
+def _style_accepts_row(style_func: Callable) -> bool:
+    """Whether a style function takes the row as well as the value."""
+    try:
+        return len(inspect.signature(style_func).parameters) > 1
+    except (TypeError, ValueError):
+        # Builtins and other callables without an inspectable signature
+        return False
+
+
+def compile_style(style: Any) -> Callable[[Any, Dict[str, Any]], Any]:
+    """
+    Resolve a style_map entry into a function of (value, row).
+
+    The style function's arity is inspected once here instead of for every
+    cell. Functions taking more than one parameter are passed the row too;
+    if that call fails the value alone is tried, and a function that fails
+    either way leaves the cell unstyled.
+
+    Args:
+        style: A style string, a style function, or None
+
+    Returns:
+        Function returning the style for one cell
+    """
+    if not callable(style):
+        return lambda value, row: style
+
+    style_func = style
+    if _style_accepts_row(style_func):
+
+        def resolve(value: Any, row: Dict[str, Any]) -> Any:
+            try:
+                return style_func(value, row)
+            except Exception:
+                try:
+                    return style_func(value)
+                except Exception:
+                    return None
+
+    else:
+
+        def resolve(value: Any, row: Dict[str, Any]) -> Any:
+            try:
+                return style_func(value)
+            except Exception:
+                return None
+
+    return resolve
+
+
+def render_column_cells(
+    data: List[Dict[str, Any]],
+    columns: List[str],
+    style_map: Optional[Dict[str, Any]] = None,
+    plain: bool = False,
+    none_display: str = "N/A",
+) -> List[List[Text]]:
+    """
+    Render table cells one column at a time.
+
+    Each column's style is compiled once (see compile_style) and applied to
+    the whole column. In plain mode styles are skipped entirely, which is
+    what the console would do anyway with colors off or a non-terminal
+    output.
+
+    Args:
+        data: List of dictionaries containing row data
+        columns: List of column keys to extract from each dictionary
+        style_map: Optional dictionary mapping column names to styles or style functions
+        plain: Render unstyled text without calling any style functions
+        none_display: What to display for None values
+
+    Returns:
+        One list of cells per column, each with one cell per row
+    """
+    style_map = style_map or {}
+    batches = []
+
+    for col in columns:
+        values = [item.get(col) for item in data]
+        style = style_map.get(col)
+
+        if plain:
+            cells = [
+                (
+                    Text(none_display)
+                    if value is None
+                    else Text(value if isinstance(value, str) else str(value))
+                )
+                for value in values
+            ]
+        elif callable(style):
+            resolve = compile_style(style)
+            cells = [
+                (
+                    Text(none_display, style=NONE_STYLE)
+                    if value is None
+                    else Text(
+                        value if isinstance(value, str) else str(value),
+                        style=cast(Any, resolve(value, item)),
+                    )
+                )
+                for value, item in zip(values, data)
+            ]
+        else:
+            cells = [
+                (
+                    Text(none_display, style=NONE_STYLE)
+                    if value is None
+                    else Text(
+                        value if isinstance(value, str) else str(value),
+                        style=cast(Any, style),
+                    )
+                )
+                for value in values
+            ]
+        batches.append(cells)
+
+    return batches
+
+
 def add_rows_from_data(
     table: Table,
     data: List[Dict[str, Any]],
     columns: List[str],
     style_map: Optional[Dict[str, Any]] = None,
+    plain: bool = False,
 ) -> None:
     """
     Add multiple rows from a list of dictionaries.
@@ -191,48 +318,22 @@ def add_rows_from_data(
         columns: List of column keys to extract from each dictionary
         style_map: Optional dictionary mapping column names to styles or style functions
                Style functions can take the value, or both value and row
+        plain: Skip styling, for no-color or non-terminal output
     """
-    if style_map is None:
-        style_map = {}
+    if not columns:
+        for _ in data:
+            table.add_row()
+        return
 
-    for item in data:
-        row_data = []
-        row_styles = []
-
-        for col in columns:
-            # Get the value for this column
-            value = item.get(col)
-            row_data.append(value)
-
-            # Get the style for this column
-            style_func_or_value = style_map.get(col)
-
-            # If the style is callable, it might expect the row as additional context
-            if callable(style_func_or_value):
-                try:
-                    # First try calling with both value and row
-                    import inspect
-
-                    sig = inspect.signature(style_func_or_value)
-                    if len(sig.parameters) > 1:
-                        # Function accepts multiple parameters, pass value and row
-                        style = style_func_or_value(value, item)
-                    else:
-                        # Function accepts only one parameter, just pass value
-                        style = style_func_or_value(value)
-                except Exception:
-                    # Fall back to just passing the value
-                    try:
-                        style = style_func_or_value(value)
-                    except Exception:
-                        style = None
-            else:
-                # Not a function, just use the style value directly
-                style = style_func_or_value
+    batches = render_column_cells(data, columns, style_map, plain=plain)
+    add_row = table.add_row
+    for cells in zip(*batches):
+        add_row(*cells)
 
-            row_styles.append(style)
 
-        add_row_with_styles(table, row_data, row_styles)
+def is_plain_console(console: Console) -> bool:
+    """Whether a console would print styled text without any styling."""
+    return bool(console.no_color) or console.color_system is None
 
 
 def display_table(
@@ -251,6 +352,7 @@ def display_table(
     padding: Union[int, tuple] = (0, 1),
     expand: bool = False,
     column_alignments: Optional[Dict[str, str]] = None,
+    plain: Optional[bool] = None,
 ) -> None:
     """
     Create, populate and display a table in one operation.
@@ -277,6 +379,8 @@ def display_table(
         expand: Whether the table should expand to fill available width. Defaults
             to False so the table width matches its content.
         column_alignments: Optional dict mapping header names to alignment ("left", "center", "right")
+        plain: Render cells without styles. Defaults to plain when the console
+            has colors disabled or is not writing to a terminal.
     """
     try:
         # Use columns as headers if not provided
@@ -304,7 +408,9 @@ def display_table(
             return
 
         # Add rows
-        add_rows_from_data(table, data, columns, style_map)
+        if plain is None:
+            plain = is_plain_console(console)
+        add_rows_from_data(table, data, columns, style_map, plain=plain)
 
         # Display the table
         console.print(table)
@@ -3,14 +3,16 @@ Main TUI interface for CHUCK AI.
 """
 
 import os
+import queue
 import shlex
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 import logging
 
 from rich.console import Console
 import traceback
 
 # Rich imports for TUI rendering
+from rich.live import Live
 from rich.panel import Panel
 
 # Prompt Toolkit imports for enhanced CLI experience
@@ -39,6 +41,7 @@ from chuck_data.service import ChuckService
 from chuck_data.commands.base import CommandResult
 from chuck_data.command_registry import get_command
 from chuck_data.config import get_active_model
+from chuck_data.job_watcher import JobEvent, get_job_watcher
 
 # Import the interactive context manager
 from chuck_data.interactive_context import InteractiveContext
@@ -46,6 +49,11 @@ from chuck_data.interactive_context import InteractiveContext
 # Global reference to TUI instance for service access
 _tui_instance = None
 
+# Seconds between redraws of the watched-jobs toolbar while at the prompt
+JOB_TOOLBAR_REFRESH_SECONDS = 5
+
+JOB_KIND_LABELS = {"amperity": "Job", "databricks": "Databricks run", "emr": "EMR step"}
+
 
 def get_chuck_service():
     """Get the global ChuckService instance."""
@@ -85,6 +93,13 @@ class ChuckTUI:
         self.debug = False  # Debug state
         self.no_color = no_color
 
+        # Live panel showing the assistant response currently streaming in
+        self._stream_live: Optional[Live] = None
+        self._stream_text = ""
+
+        # Events from the background job watcher, shown before the next prompt
+        self._job_events: "queue.Queue[JobEvent]" = queue.Queue()
+
         # Register this instance as the global TUI instance
         # This allows other modules to access the service instance
         global _tui_instance
@@ -234,9 +249,13 @@ class ChuckTUI:
             # Just call the setup command - it will handle its own context
             result = self.service.execute_command("/setup")
 
+        # Jobs watched in the background report here instead of blocking input
+        get_job_watcher().subscribe(self._job_events.put)
+
         # Main TUI application loop
         while self.running:
             try:
+                self._print_job_notifications()
                 # Check if we're in interactive mode
                 if interactive_context.is_in_interactive_mode():
                     current_cmd = interactive_context.current_command
@@ -323,6 +342,7 @@ class ChuckTUI:
                 else:
                     # Regular command mode - use prompt toolkit
                     prompt_message = HTML("<prompt>chuck ></prompt> ")
+                    self._update_job_toolbar(session)
                     command = session.prompt(prompt_message).strip()
 
                     # Skip empty commands
@@ -359,6 +379,45 @@ class ChuckTUI:
                     if self.debug:
                         self.console.print("[dim]" + traceback.format_exc() + "[/dim]")
 
+    def _print_job_notifications(self) -> None:
+        """Report background jobs that finished since the last prompt."""
+        while True:
+            try:
+                event = self._job_events.get_nowait()
+            except queue.Empty:
+                return
+            # Jobs a command is waiting on are reported by that command
+            if event.awaited or not event.terminal:
+                continue
+            label = JOB_KIND_LABELS.get(event.kind, "Job")
+            style = SUCCESS_STYLE if event.succeeded else ERROR_STYLE
+            message = f"{label} {event.job_id} finished: {event.state}"
+            record_count = event.data.get("record-count")
+            if record_count:
+                message += f" (Records: {record_count:,})"
+            self.console.print(f"[{style}]{message}[/{style}]")
+
+    def _job_toolbar(self) -> str:
+        """One-line summary of watched jobs for the prompt's bottom toolbar."""
+        jobs = get_job_watcher().get_watched_jobs()
+        if not jobs:
+            return ""
+        shown = ", ".join(
+            f"{job['job_id']} {job['state'] or 'starting'}" for job in jobs[:3]
+        )
+        if len(jobs) > 3:
+            shown += f" and {len(jobs) - 3} more"
+        return f" Watching {len(jobs)} job(s): {shown}"
+
+    def _update_job_toolbar(self, session: PromptSession) -> None:
+        """Show the watched-jobs toolbar only while something is being watched."""
+        if get_job_watcher().get_watched_jobs():
+            session.bottom_toolbar = self._job_toolbar
+            session.refresh_interval = JOB_TOOLBAR_REFRESH_SECONDS
+        else:
+            session.bottom_toolbar = None
+            session.refresh_interval = 0
+
     def _needs_shlex_parsing(self, command: str) -> bool:
         """Determine if command needs shlex parsing (has quotes or flags)."""
         # Never use shlex for agent commands - they need simple splitting
@@ -443,7 +502,10 @@ class ChuckTUI:
         # Pass display callback for agent commands to show tool outputs immediately
         if cmd in ["/agent", "/ask"]:
             result = self.service.execute_command(
-                cmd, *args, tool_output_callback=self.display_tool_output
+                cmd,
+                *args,
+                tool_output_callback=self.display_tool_output,
+                stream_callback=self.display_agent_stream,
             )
         elif cmd in ["/warehouses", "/list-warehouses"]:
             # For TUI warehouse commands, always show the full table
@@ -612,6 +674,7 @@ class ChuckTUI:
                 and result.data[
                     "response"
                 ].strip()  # Only show if response is not empty
+                and not result.data.get("streamed")  # Already rendered live
             ):
                 # Agent response - print directly or format nicely
                 self.console.print(
@@ -643,6 +706,32 @@ class ChuckTUI:
             f"[{SUCCESS_STYLE}]Debug mode is now {status}[/{SUCCESS_STYLE}]"
         )
 
+    def display_agent_stream(self, delta: Optional[str]) -> None:
+        """Render assistant text live as it streams in from the agent.
+
+        Args:
+            delta: Next piece of assistant text, or None when the response
+                is complete (the panel then stays in the scrollback)
+        """
+        if delta is None:
+            if self._stream_live is not None:
+                self._stream_live.stop()
+                self._stream_live = None
+            self._stream_text = ""
+            return
+
+        self._stream_text += delta
+        # Same filtering the agent applies to its final response
+        visible_text = "\n".join(
+            line for line in self._stream_text.splitlines() if "<function" not in line
+        )
+        panel = Panel(visible_text, title="Agent Response", border_style=DIALOG_BORDER)
+        if self._stream_live is None:
+            self._stream_live = Live(panel, console=self.console, refresh_per_second=12)
+            self._stream_live.start()
+        else:
+            self._stream_live.update(panel)
+
     def display_tool_output(self, tool_name: str, tool_result: Dict[str, Any]) -> None:
         """Display tool output immediately during agent execution."""
         try:
@@ -1589,6 +1678,15 @@ class ChuckTUI:
                 {"setting": "Active Warehouse", "value": warehouse_id},
                 {"setting": "Connection Status", "value": connection_status},
             ]
+            cache_stats = data.get("metadata_cache")
+            if cache_stats:
+                cache_summary = (
+                    f"{cache_stats['hits']} hits / {cache_stats['misses']} misses "
+                    f"({cache_stats['hit_rate']:.0%}), {cache_stats['entries']} entries"
+                )
+                status_items.append(
+                    {"setting": "Metadata Cache", "value": cache_summary}
+                )
 
         # Define styling functions
         def value_style(value, row):
@@ -2090,10 +2188,9 @@ class ChuckTUI:
         self._display_sql_results(data)
 
     def _display_paginated_sql_results(self, data: Dict[str, Any]) -> None:
-        """Display paginated SQL query results with interactive navigation."""
-        import sys
+        """Display external-link SQL results in a scrollable, windowed viewer."""
         from chuck_data.commands.sql_external_data import PaginatedSQLResult
-        from chuck_data.ui.table_formatter import display_table
+        from chuck_data.ui.result_viewer import ResultViewer
         from chuck_data.exceptions import PaginationCancelled
 
         columns = data.get("columns", [])
@@ -2116,123 +2213,29 @@ class ChuckTUI:
             chunks=chunks,
         )
 
-        rows_displayed = 0
-        page_num = 1
-
         try:
-            while True:
-                # Get the next page of data
-                try:
-                    rows, has_more = paginated_result.get_next_page()
-                except Exception as e:
-                    self.console.print(
-                        f"[{ERROR_STYLE}]Error fetching data: {str(e)}[/{ERROR_STYLE}]"
-                    )
-                    break
-
-                if not rows and rows_displayed == 0:
-                    self.console.print(
-                        f"[{WARNING_STYLE}]Query returned no results.[/{WARNING_STYLE}]"
-                    )
-                    break
-
-                if rows:
-                    # Convert rows to the format expected by display_table
-                    formatted_data = []
-                    for row in rows:
-                        row_dict = {}
-                        for i, value in enumerate(row):
-                            if i < len(columns):
-                                row_dict[columns[i]] = (
-                                    value if value is not None else ""
-                                )
-                        formatted_data.append(row_dict)
-
-                    # Create title with pagination info
-                    start_row = rows_displayed + 1
-                    end_row = rows_displayed + len(rows)
-                    title = f"SQL Query Results (Rows {start_row}-{end_row} of {total_row_count}"
-                    if execution_time is not None and page_num == 1:
-                        title += f", {execution_time}ms"
-                    title += ")"
-
-                    # Display the current page
-                    display_table(
-                        console=self.console,
-                        data=formatted_data,
-                        columns=columns,
-                        headers=columns,
-                        title=title,
-                        title_style=TABLE_TITLE_STYLE,
-                        show_lines=True,
-                    )
-
-                    rows_displayed += len(rows)
-                    page_num += 1
-
-                # Check if there are more pages
-                if not has_more:
-                    self.console.print(
-                        f"\n[{INFO_STYLE}]End of results ({total_row_count} total rows)[/{INFO_STYLE}]"
-                    )
-                    # Raise PaginationCancelled to return to chuck > prompt immediately
-                    raise PaginationCancelled()
-
-                # Show pagination prompt
+            viewer = ResultViewer(
+                self.console,
+                columns,
+                paginated_result,
+                total_row_count,
+                execution_time=execution_time,
+            )
+            try:
+                first_window = viewer.buffer.get_window(0, 1)
+            except Exception as e:
                 self.console.print(
-                    f"\n[dim]Press [bold]SPACE[/bold] for next page, or [bold]q[/bold] to quit... ({rows_displayed}/{total_row_count} rows shown)[/dim]"
+                    f"[{ERROR_STYLE}]Error fetching data: {str(e)}[/{ERROR_STYLE}]"
                 )
+                return
 
-                # Get user input
-                try:
-                    if sys.stdin.isatty():
-                        import readchar
-
-                        char = readchar.readchar()
-
-                        # Handle user input
-                        if char.lower() == "q":
-                            raise PaginationCancelled()
-                        elif char == " ":
-                            # Continue to next page
-                            self.console.print()  # Add spacing
-                            continue
-                        else:
-                            # Invalid input, show help
-                            self.console.print(
-                                f"[{WARNING_STYLE}]Press SPACE for next page or 'q' to quit[/{WARNING_STYLE}]"
-                            )
-                            continue
-                    else:
-                        # Not a TTY (e.g., running in a script), auto-continue
-                        self.console.print(
-                            "[dim]Auto-continuing (not in interactive terminal)...[/dim]"
-                        )
-                        continue
+            if not first_window or not first_window[0]:
+                self.console.print(
+                    f"[{WARNING_STYLE}]Query returned no results.[/{WARNING_STYLE}]"
+                )
+                return
 
-                except (KeyboardInterrupt, EOFError):
-                    raise  # Re-raise to bubble up to main TUI loop
-                except Exception as e:
-                    if isinstance(e, PaginationCancelled):
-                        raise  # Re-raise PaginationCancelled to bubble up
-                    self.console.print(
-                        f"\n[{ERROR_STYLE}]Input error: {str(e)}[/{ERROR_STYLE}]"
-                    )
-                    # Fall back to regular input
-                    try:
-                        response = (
-                            input(
-                                "[dim]Type 'q' to quit or press ENTER to continue: [/dim]"
-                            )
-                            .strip()
-                            .lower()
-                        )
-                        if response == "q":
-                            raise PaginationCancelled()
-                        else:
-                            continue
-                    except (KeyboardInterrupt, EOFError):
-                        raise  # Re-raise to bubble up to main TUI loop
+            viewer.run()
 
         except Exception as e:
             if isinstance(e, PaginationCancelled):
@@ -2240,17 +2243,18 @@ class ChuckTUI:
             self.console.print(
                 f"[{ERROR_STYLE}]Error during pagination: {str(e)}[/{ERROR_STYLE}]"
             )
+        finally:
+            # Stop any background chunk prefetch once the user is done paging
+            paginated_result.close()
 
     def _display_paginated_sql_results_local(self, data: Dict[str, Any]) -> None:
-        """Display paginated SQL query results with interactive navigation for local data."""
-        import sys
-        from chuck_data.ui.table_formatter import display_table
+        """Display large in-memory SQL results in a scrollable, windowed viewer."""
+        from chuck_data.ui.result_viewer import LocalRowSource, ResultViewer
         from chuck_data.exceptions import PaginationCancelled
 
         columns = data.get("columns", [])
         rows = data.get("rows", [])
         execution_time = data.get("execution_time_ms")
-        total_rows = len(rows)
 
         # Check if this has external links (true pagination) or local rows (chunked display)
         if data.get("is_paginated", False) and data.get("external_links"):
@@ -2258,114 +2262,14 @@ class ChuckTUI:
             self._display_paginated_sql_results(data)
             return
 
-        # Local pagination for large row sets
-        page_size = 50
-        current_position = 0
-        page_num = 1
-
         try:
-            while current_position < total_rows:
-                # Get current page of rows
-                end_position = min(current_position + page_size, total_rows)
-                page_rows = rows[current_position:end_position]
-
-                if page_rows:
-                    # Convert rows to the format expected by display_table
-                    formatted_data = []
-                    for row in page_rows:
-                        row_dict = {}
-                        for i, value in enumerate(row):
-                            if i < len(columns):
-                                row_dict[columns[i]] = (
-                                    value if value is not None else ""
-                                )
-                        formatted_data.append(row_dict)
-
-                    # Create title with pagination info
-                    start_row = current_position + 1
-                    title = f"SQL Query Results (Rows {start_row}-{end_position} of {total_rows}"
-                    if execution_time is not None and page_num == 1:
-                        title += f", {execution_time}ms"
-                    title += ")"
-
-                    # Display the current page
-                    display_table(
-                        console=self.console,
-                        data=formatted_data,
-                        columns=columns,
-                        headers=columns,
-                        title=title,
-                        title_style=TABLE_TITLE_STYLE,
-                        show_lines=True,
-                    )
-
-                    current_position = end_position
-                    page_num += 1
-
-                # Check if there are more pages
-                if current_position >= total_rows:
-                    self.console.print(
-                        f"\n[{INFO_STYLE}]End of results ({total_rows} total rows)[/{INFO_STYLE}]"
-                    )
-                    # Raise PaginationCancelled to return to chuck > prompt immediately
-                    raise PaginationCancelled()
-
-                # Show pagination prompt
-                self.console.print(
-                    f"\n[dim]Press [bold]SPACE[/bold] for next page, or [bold]q[/bold] to quit... ({current_position}/{total_rows} rows shown)[/dim]"
-                )
-
-                # Get user input
-                try:
-                    if sys.stdin.isatty():
-                        import readchar
-
-                        char = readchar.readchar()
-
-                        # Handle user input
-                        if char.lower() == "q":
-                            raise PaginationCancelled()
-                        elif char == " ":
-                            # Continue to next page
-                            self.console.print()  # Add spacing
-                            continue
-                        else:
-                            # Invalid input, show help
-                            self.console.print(
-                                f"[{WARNING_STYLE}]Press SPACE for next page or 'q' to quit[/{WARNING_STYLE}]"
-                            )
-                            continue
-                    else:
-                        # Not a TTY (e.g., running in a script), auto-continue
-                        self.console.print(
-                            "[dim]Auto-continuing (not in interactive terminal)...[/dim]"
-                        )
-                        continue
-
-                except (KeyboardInterrupt, EOFError):
-                    raise  # Re-raise to bubble up to main TUI loop
-                except Exception as e:
-                    if isinstance(e, PaginationCancelled):
-                        raise  # Re-raise PaginationCancelled to bubble up
-                    self.console.print(
-                        f"\n[{ERROR_STYLE}]Input error: {str(e)}[/{ERROR_STYLE}]"
-                    )
-                    # Fall back to regular input
-                    try:
-                        response = (
-                            input(
-                                "[dim]Type 'q' to quit or press ENTER to continue: [/dim]"
-                            )
-                            .strip()
-                            .lower()
-                        )
-                        if response == "q":
-                            raise PaginationCancelled()
-                        else:
-                            continue
-                    except (KeyboardInterrupt, EOFError):
-                        raise  # Re-raise to bubble up to main TUI loop
-
+            ResultViewer(
+                self.console,
+                columns,
+                LocalRowSource(rows),
+                len(rows),
+                execution_time=execution_time,
+            ).run()
         except Exception as e:
             if isinstance(e, PaginationCancelled):
                 raise  # Re-raise PaginationCancelled to bubble up
@@ -2,9 +2,15 @@
 Utility functions for Chuck TUI.
 """
 
-import time
 import logging
 
+from chuck_data.clients.statement_waiter import (
+    DATABRICKS_PENDING_STATES,
+    DATABRICKS_QUEUED_STATES,
+    StatementWaiter,
+    databricks_statement_state,
+)
+
 
 def build_query_params(params):
     """
@@ -69,14 +75,18 @@ def execute_sql_statement(
     response = client.post("/api/2.0/sql/statements", data)
     statement_id = response.get("statement_id")
 
-    # Poll until complete
-    state = None
-    while True:
-        status = client.get(f"/api/2.0/sql/statements/{statement_id}")
-        state = status.get("status", {}).get("state", status.get("state"))
-        if state not in ["PENDING", "RUNNING"]:
-            break
-        time.sleep(1)
+    # Poll until complete, unless the statement finished within wait_timeout
+    waiter = StatementWaiter(
+        pending_states=DATABRICKS_PENDING_STATES,
+        queued_states=DATABRICKS_QUEUED_STATES,
+    )
+    status = waiter.wait(
+        poll=lambda: client.get(f"/api/2.0/sql/statements/{statement_id}"),
+        get_state=databricks_statement_state,
+        initial_response=response,
+        statement_id=statement_id,
+    )
+    state = databricks_statement_state(status)
 
     # Check result
     if state != "SUCCEEDED":
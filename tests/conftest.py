@@ -55,6 +55,34 @@ def mock_job_cache():
         yield mock_cache
 
 
+@pytest.fixture(autouse=True)
+def isolated_json_stores(tmp_path):
+    """
+    Give each test empty PII, scan snapshot and metadata caches.
+
+    Points chuck_data.json_store's home-directory files at the test's
+    tmp_path, so tests never read or write ~/.chuck_pii_cache.json,
+    ~/.chuck_scan_snapshots.json or ~/.chuck_metadata_cache.json, and
+    forgets the process-wide instances so no state leaks between tests.
+    """
+    from chuck_data import metadata_cache, pii_cache, scan_snapshot
+
+    resets = (
+        pii_cache.reset_pii_cache,
+        scan_snapshot.reset_scan_snapshots,
+        metadata_cache.reset_metadata_cache,
+    )
+    for reset in resets:
+        reset()
+    with patch(
+        "chuck_data.json_store.home_path",
+        side_effect=lambda filename: str(tmp_path / filename.lstrip(".")),
+    ):
+        yield
+    for reset in resets:
+        reset()
+
+
 @pytest.fixture
 def databricks_client_stub():
     """Create a fresh DatabricksClientStub for each test."""
@@ -105,3 +133,22 @@ def temp_config():
 def mock_console():
     """Create a mock console for TUI testing."""
     return MagicMock()
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--run-benchmarks",
+        action="store_true",
+        default=False,
+        help="Run the timing benchmarks marked with @pytest.mark.benchmark",
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    """Skip benchmarks unless --run-benchmarks is given."""
+    if config.getoption("--run-benchmarks"):
+        return
+    skip = pytest.mark.skip(reason="benchmark; run with --run-benchmarks -s")
+    for item in items:
+        if "benchmark" in item.keywords:
+            item.add_marker(skip)
@@ -1,5 +1,8 @@
 """LLM client fixtures."""
 
+import asyncio
+import json
+
 
 class LLMClientStub:
     """Comprehensive stub for LLMClient with predictable responses."""
@@ -200,3 +203,82 @@ class MockFunction:
     def __init__(self, name, arguments):
         self.name = name
         self.arguments = arguments
+
+
+class PIIClassifyingLLMStub:
+    """LLM fake that answers PII classification prompts from column names.
+
+    Handles single-table prompts (a JSON list of columns) and batched prompts
+    (a JSON object of table name to columns), tagging every column named
+    "email" as an email. achat() answers the same way after an optional
+    delay and records how many calls were in flight at once.
+    """
+
+    def __init__(
+        self, delay=0.0, drop_tables=(), malformed_tables=(), broken_batches=False
+    ):
+        self.delay = delay
+        # Batched replies leave these tables out, or omit their "semantic"s
+        self.drop_tables = set(drop_tables)
+        self.malformed_tables = set(malformed_tables)
+        # Batched replies are not JSON at all
+        self.broken_batches = broken_batches
+
+        # Prompt payloads received by chat() and achat()
+        self.chat_calls = []
+        self.achat_calls = []
+        self.in_flight = 0
+        self.peak_in_flight = 0
+
+    def chat(self, messages, **kwargs):
+        payload = self._payload(messages)
+        self.chat_calls.append(payload)
+        return self._response(payload)
+
+    async def achat(self, messages, **kwargs):
+        payload = self._payload(messages)
+        self.achat_calls.append(payload)
+        self.in_flight += 1
+        self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.delay)
+        finally:
+            self.in_flight -= 1
+        return self._response(payload)
+
+    @staticmethod
+    def _payload(messages):
+        prompt = messages[1]["content"]
+        return json.loads(prompt[prompt.index(": ") + 2 :])
+
+    @staticmethod
+    def _tags(columns):
+        return [
+            {"name": c["name"], "semantic": "email" if c["name"] == "email" else None}
+            for c in columns
+        ]
+
+    def _response(self, payload):
+        if not isinstance(payload, dict):
+            content = json.dumps(self._tags(payload))
+        elif self.broken_batches:
+            content = "not json"
+        else:
+            content = json.dumps(
+                {
+                    table: (
+                        [{"name": c["name"]} for c in columns]
+                        if table in self.malformed_tables
+                        else self._tags(columns)
+                    )
+                    for table, columns in payload.items()
+                    if table not in self.drop_tables
+                }
+            )
+        message = MockMessage()
+        message.content = content
+        choice = MockChoice()
+        choice.message = message
+        response = MockChatResponse()
+        response.choices = [choice]
+        return response
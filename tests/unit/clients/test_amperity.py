@@ -64,6 +64,18 @@ def test_get_job_status_success(mock_get):
     assert call_args[1]["headers"]["Authorization"] == "Bearer test-token"
 
 
+@patch("chuck_data.clients.amperity.requests.get")
+def test_get_job_status_passes_timeout(mock_get):
+    """The request timeout can be set per call."""
+    client = AmperityAPIClient()
+    mock_get.return_value = Mock(status_code=200)
+    mock_get.return_value.json.return_value = {"data": {"state": "running"}}
+
+    client.get_job_status("chk-123", "test-token", timeout=3)
+
+    assert mock_get.call_args[1]["timeout"] == 3
+
+
 @patch("chuck_data.clients.amperity.requests.get")
 def test_get_job_status_404(mock_get):
     """Test job status retrieval for non-existent job."""
@@ -645,6 +645,43 @@ class TestJobExecution:
         status = emr_client.wait_for_step("s-STEP123", timeout=5)
         assert status["status"] == "COMPLETED"
 
+    def test_get_steps_status_lists_ten_steps_per_call(
+        self, emr_client, mock_emr_client
+    ):
+        """Test batched status reads step IDs in chunks of ten."""
+        step_ids = [f"s-{n}" for n in range(12)]
+        mock_emr_client.list_steps.side_effect = lambda **kw: {
+            "Steps": [
+                {"Id": step_id, "Status": {"State": "RUNNING"}}
+                for step_id in kw["StepIds"]
+                if step_id != "s-11"
+            ]
+        }
+
+        statuses = emr_client.get_steps_status(step_ids)
+
+        assert mock_emr_client.list_steps.call_count == 2
+        assert mock_emr_client.list_steps.call_args.kwargs["StepIds"] == [
+            "s-10",
+            "s-11",
+        ]
+        assert set(statuses) == set(step_ids) - {"s-11"}
+        assert statuses["s-0"]["status"] == "RUNNING"
+
+    def test_wait_for_step_uses_batched_listing(self, emr_client, mock_emr_client):
+        """Test waiting reads the step through ListSteps, not DescribeStep."""
+        mock_emr_client.list_steps.return_value = {
+            "Steps": [{"Id": "s-STEP123", "Status": {"State": "COMPLETED"}}]
+        }
+
+        status = emr_client.wait_for_step("s-STEP123", timeout=5, poll_interval=0.01)
+
+        assert status["status"] == "COMPLETED"
+        mock_emr_client.list_steps.assert_called_once_with(
+            ClusterId="j-TESTCLUSTER123", StepIds=["s-STEP123"]
+        )
+        mock_emr_client.describe_step.assert_not_called()
+
     def test_wait_for_step_failed(self, emr_client, mock_emr_client):
         """Test waiting for a step that fails."""
         mock_emr_client.describe_step.return_value = {
@@ -0,0 +1,132 @@
+"""Tests for the shared pooled HTTP session."""
+
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import patch
+
+import pytest
+import requests
+
+from chuck_data.api_client import APIClient
+from chuck_data.clients import http_session
+from chuck_data.clients.databricks import DatabricksAPIClient
+from chuck_data.commands.sql_external_data import fetch_external_data
+
+
+class _CSVHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def setup(self):
+        super().setup()
+        self.server.connections += 1
+
+    def do_GET(self):
+        body = b"a,b\n1,2\n"
+        self.send_response(200)
+        self.send_header("Content-Type", "text/csv")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def stub_server():
+    """Local HTTP/1.1 server that counts accepted TCP connections."""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _CSVHandler)
+    server.connections = 0
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture(autouse=True)
+def fresh_session():
+    http_session.reset_http_session()
+    yield
+    http_session.reset_http_session()
+
+
+def test_shared_session_is_reused():
+    assert http_session.get_http_session() is http_session.get_http_session()
+
+
+def test_clients_share_the_pooled_session():
+    databricks_client = DatabricksAPIClient("workspace", "token")
+    api_client = APIClient("https://workspace", "token")
+
+    assert databricks_client.session is http_session.get_http_session()
+    assert api_client.session is databricks_client.session
+
+
+def test_client_accepts_explicit_session():
+    session = requests.Session()
+    client = DatabricksAPIClient("workspace", "token", session=session)
+    assert client.session is session
+
+
+def test_session_does_not_carry_auth_headers():
+    DatabricksAPIClient("workspace", "token")
+    assert "Authorization" not in http_session.get_http_session().headers
+
+
+def test_create_session_configures_pool():
+    session = http_session.create_session(pool_size=32)
+    adapter = session.get_adapter("https://example.com")
+
+    assert adapter._pool_maxsize == 32
+    assert adapter._pool_block is False
+    assert session.headers["Connection"] == "keep-alive"
+    assert "gzip" in session.headers["Accept-Encoding"]
+
+
+def test_create_session_rejects_empty_pool():
+    with pytest.raises(ValueError):
+        http_session.create_session(pool_size=0)
+
+
+def test_pool_size_read_from_config():
+    with patch("chuck_data.config.get_http_pool_size", return_value=4):
+        session = http_session.get_http_session()
+    assert session.get_adapter("https://example.com")._pool_maxsize == 4
+
+
+def test_external_fetches_reuse_one_connection(stub_server):
+    url = f"http://127.0.0.1:{stub_server.server_address[1]}/chunk"
+
+    for _ in range(20):
+        assert fetch_external_data(url) == [["a", "b"], ["1", "2"]]
+
+    assert stub_server.connections == 1
+
+
+def test_exhausted_pool_does_not_block(stub_server):
+    """A caller holding the only pooled connection must not stall the others."""
+    url = f"http://127.0.0.1:{stub_server.server_address[1]}/chunk"
+    session = http_session.create_session(pool_size=1)
+    held = session.get(url, stream=True, timeout=5)
+
+    results = []
+    thread = threading.Thread(
+        target=lambda: results.append(session.get(url, timeout=5).status_code),
+        daemon=True,
+    )
+    thread.start()
+    thread.join(timeout=5)
+    held.close()
+
+    assert results == [200]
+
+
+def test_unpooled_requests_open_a_connection_per_call(stub_server):
+    """Baseline for the test above: module-level requests.get never reuses."""
+    url = f"http://127.0.0.1:{stub_server.server_address[1]}/chunk"
+
+    for _ in range(5):
+        requests.get(url, timeout=5)
+
+    assert stub_server.connections == 5
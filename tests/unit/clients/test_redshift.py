@@ -851,6 +851,267 @@ class TestDescribeTable:
         assert "Error describing table" in str(exc_info.value)
 
 
+class TestTableColumnSignatures:
+    """Test get_table_column_signatures method."""
+
+    @patch("chuck_data.clients.redshift.boto3")
+    def test_signatures_change_only_with_columns(self, mock_boto3):
+        """One pg_table_def query yields a per-table signature of its columns."""
+        setup_mock_session(mock_boto3)
+        client = RedshiftAPIClient(
+            aws_access_key_id="test-key",
+            aws_secret_access_key="test-secret",
+            region="us-west-2",
+            cluster_identifier="test-cluster",
+            database="analytics",
+        )
+
+        def records(*rows):
+            return {
+                "result": {
+                    "Records": [[{"stringValue": v} for v in row] for row in rows]
+                }
+            }
+
+        client.execute_sql = Mock(
+            side_effect=[
+                records(
+                    ("customers", "id", "integer"),
+                    ("customers", "email", "varchar(256)"),
+                    ("orders", "id", "integer"),
+                ),
+                records(
+                    ("customers", "id", "integer"),
+                    ("customers", "email", "varchar(512)"),
+                    ("orders", "id", "integer"),
+                ),
+            ]
+        )
+
+        before = client.get_table_column_signatures("analytics", "public")
+        after = client.get_table_column_signatures("analytics", "public")
+
+        assert set(before) == {"customers", "orders"}
+        assert before["orders"] == after["orders"]
+        assert before["customers"] != after["customers"]
+        sql = client.execute_sql.call_args_list[0].args[0]
+        assert "pg_table_def" in sql and "schemaname = 'public'" in sql
+
+
+class TestReadTableSchemas:
+    """Test read_table_schemas method."""
+
+    @patch("chuck_data.clients.redshift.boto3")
+    def test_reads_all_tagged_tables_in_one_statement(self, mock_boto3):
+        """Columns for every tagged table come from one paginated query."""
+        _, mock_redshift_data, _, _ = setup_mock_session(mock_boto3)
+        client = RedshiftAPIClient(
+            aws_access_key_id="test-key",
+            aws_secret_access_key="test-secret",
+            region="us-west-2",
+            cluster_identifier="test-cluster",
+            database="analytics",
+        )
+
+        def row(table, column, data_type):
+            return [
+                {"stringValue": table},
+                {"stringValue": column},
+                {"stringValue": data_type},
+            ]
+
+        mock_redshift_data.execute_statement.return_value = {"Id": "stmt-1"}
+        mock_redshift_data.describe_statement.return_value = {
+            "Status": "FINISHED",
+            "HasResultSet": True,
+        }
+        mock_redshift_data.get_statement_result.side_effect = [
+            {
+                "Records": [
+                    row("customers", "id", "integer"),
+                    row("customers", "email", "character varying"),
+                ],
+                "NextToken": "page-2",
+            },
+            {"Records": [row("orders", "customer_email", "character varying")]},
+        ]
+        semantic_tags = [
+            {"table": "customers", "column": "email", "semantic": "email"},
+            {"table": "orders", "column": "customer_email", "semantic": "email"},
+            {"table": "dropped", "column": "x", "semantic": "name"},
+        ]
+
+        result = client.read_table_schemas("analytics", "public", semantic_tags)
+
+        assert result["success"]
+        assert mock_redshift_data.execute_statement.call_count == 1
+        sql = mock_redshift_data.execute_statement.call_args.kwargs["Sql"]
+        assert "IN ('customers', 'orders', 'dropped')" in sql
+        mock_redshift_data.get_statement_result.assert_called_with(
+            Id="stmt-1", NextToken="page-2"
+        )
+        assert result["tables"] == [
+            {
+                "table_name": "customers",
+                "columns": [
+                    {"name": "id", "type": "integer", "semantic": None},
+                    {"name": "email", "type": "character varying", "semantic": "email"},
+                ],
+            },
+            {
+                "table_name": "orders",
+                "columns": [
+                    {
+                        "name": "customer_email",
+                        "type": "character varying",
+                        "semantic": "email",
+                    }
+                ],
+            },
+        ]
+
+
+class TestPagination:
+    """Test NextToken handling across Data API calls."""
+
+    def _client(self, mock_boto3):
+        _, mock_redshift_data, _, _ = setup_mock_session(mock_boto3)
+        client = RedshiftAPIClient(
+            aws_access_key_id="test-key",
+            aws_secret_access_key="test-secret",
+            region="us-west-2",
+            cluster_identifier="test-cluster",
+            database="analytics",
+        )
+        return client, mock_redshift_data
+
+    @patch("chuck_data.clients.redshift.boto3")
+    def test_list_tables_follows_next_token(self, mock_boto3):
+        """Tables on later pages are not dropped."""
+        client, mock_redshift_data = self._client(mock_boto3)
+        mock_redshift_data.list_tables.side_effect = [
+            {"Tables": [{"name": "a"}], "NextToken": "t1"},
+            {"Tables": [{"name": "b"}], "NextToken": "t2"},
+            {"Tables": [{"name": "c"}]},
+        ]
+
+        tables = client.list_tables(schema_pattern="public")
+
+        assert [t["name"] for t in tables["tables"]] == ["a", "b", "c"]
+        assert mock_redshift_data.list_tables.call_args_list[2].kwargs == {
+            "Database": "analytics",
+            "ClusterIdentifier": "test-cluster",
+            "SchemaPattern": "public",
+            "NextToken": "t2",
+        }
+
+    @patch("chuck_data.clients.redshift.boto3")
+    def test_list_schemas_follows_next_token(self, mock_boto3):
+        """Schemas on later pages are not dropped."""
+        client, mock_redshift_data = self._client(mock_boto3)
+        mock_redshift_data.list_schemas.side_effect = [
+            {"Schemas": ["public"], "NextToken": "t1"},
+            {"Schemas": ["sales"]},
+        ]
+
+        schemas = client.list_schemas()
+
+        assert schemas == {"schemas": [{"name": "public"}, {"name": "sales"}]}
+
+    @patch("chuck_data.clients.redshift.boto3")
+    def test_describe_table_merges_column_pages(self, mock_boto3):
+        """Wide tables return every column."""
+        client, mock_redshift_data = self._client(mock_boto3)
+        mock_redshift_data.describe_table.side_effect = [
+            {"TableName": "wide", "ColumnList": [{"name": "c1"}], "NextToken": "t1"},
+            {"TableName": "wide", "ColumnList": [{"name": "c2"}]},
+        ]
+
+        table = client.describe_table(schema="public", table="wide")
+
+        assert table == {
+            "TableName": "wide",
+            "ColumnList": [{"name": "c1"}, {"name": "c2"}],
+        }
+
+    @patch("chuck_data.clients.redshift.boto3")
+    def test_get_statement_result_reads_every_page(self, mock_boto3):
+        """Large result sets are no longer truncated to the first page."""
+        client, mock_redshift_data = self._client(mock_boto3)
+        mock_redshift_data.get_statement_result.side_effect = [
+            {"Records": [[{"longValue": 1}]], "TotalNumRows": 2, "NextToken": "t1"},
+            {"Records": [[{"longValue": 2}]], "TotalNumRows": 2},
+        ]
+
+        result = client.get_statement_result("stmt-1")
+
+        assert result == {
+            "Records": [[{"longValue": 1}], [{"longValue": 2}]],
+            "TotalNumRows": 2,
+        }
+
+    @patch("chuck_data.clients.redshift.boto3")
+    def test_iter_sql_records_streams_pages(self, mock_boto3):
+        """Rows are yielded page by page without materializing the result."""
+        client, mock_redshift_data = self._client(mock_boto3)
+        mock_redshift_data.execute_statement.return_value = {"Id": "stmt-1"}
+        mock_redshift_data.describe_statement.return_value = {
+            "Status": "FINISHED",
+            "HasResultSet": True,
+        }
+        mock_redshift_data.get_statement_result.side_effect = [
+            {"Records": [[{"longValue": i}] for i in range(page, page + 2)]}
+            | ({"NextToken": f"t{page}"} if page < 4 else {})
+            for page in (0, 2, 4)
+        ]
+
+        rows = client.iter_sql_records("SELECT n FROM big")
+
+        assert [r[0]["longValue"] for r in rows] == [0, 1, 2, 3, 4, 5]
+        assert mock_redshift_data.get_statement_result.call_count == 3
+        assert mock_redshift_data.get_statement_result.call_args_list[0].kwargs == {
+            "Id": "stmt-1"
+        }
+
+    @patch("chuck_data.clients.redshift.boto3")
+    def test_read_semantic_tags_streams_every_page(self, mock_boto3):
+        """Tags on later result pages are read."""
+        client, mock_redshift_data = self._client(mock_boto3)
+        mock_redshift_data.execute_statement.return_value = {"Id": "stmt-1"}
+        mock_redshift_data.describe_statement.return_value = {
+            "Status": "FINISHED",
+            "HasResultSet": True,
+        }
+        row = [{"stringValue": "t"}, {"stringValue": "c"}, {"stringValue": "email"}]
+        mock_redshift_data.get_statement_result.side_effect = [
+            {"Records": [row], "NextToken": "t1"},
+            {"Records": [row]},
+        ]
+
+        result = client.read_semantic_tags("analytics", "public")
+
+        assert result["success"]
+        assert len(result["tags"]) == 2
+
+    @patch("chuck_data.clients.redshift.boto3")
+    def test_read_semantic_tags_without_result_set_is_an_error(self, mock_boto3):
+        """A lookup that returns no result set is not reported as "no tags"."""
+        client, mock_redshift_data = self._client(mock_boto3)
+        mock_redshift_data.execute_statement.return_value = {"Id": "stmt-1"}
+        mock_redshift_data.describe_statement.return_value = {
+            "Status": "FINISHED",
+            "HasResultSet": False,
+        }
+
+        result = client.read_semantic_tags("analytics", "public")
+
+        assert result == {
+            "success": False,
+            "error": "No results returned from semantic_tags query",
+        }
+        mock_redshift_data.get_statement_result.assert_not_called()
+
+
 class TestSQLExecution:
     """Test SQL execution methods."""
 
@@ -875,7 +1136,7 @@ class TestSQLExecution:
         mock_redshift_data.execute_statement.assert_called_once()
 
     @patch("chuck_data.clients.redshift.boto3")
-    @patch("chuck_data.clients.redshift.time.sleep")
+    @patch("chuck_data.clients.statement_waiter.time.sleep")
     def test_execute_sql_with_wait_success(self, mock_sleep, mock_boto3):
         """Test SQL execution with successful completion."""
         mock_redshift_data = Mock()
@@ -906,7 +1167,7 @@ class TestSQLExecution:
         )
 
     @patch("chuck_data.clients.redshift.boto3")
-    @patch("chuck_data.clients.redshift.time.sleep")
+    @patch("chuck_data.clients.statement_waiter.time.sleep")
     def test_execute_sql_with_wait_failure(self, mock_sleep, mock_boto3):
         """Test SQL execution with statement failure."""
         mock_redshift_data = Mock()
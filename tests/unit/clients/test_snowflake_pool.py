@@ -0,0 +1,195 @@
+"""Tests for the pooled Snowflake connections."""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from chuck_data.clients.snowflake import SnowflakeAPIClient
+from chuck_data.clients.snowflake_pool import SnowflakeConnectionPool
+
+
+class StubCursor:
+    def __init__(self, conn):
+        self.conn = conn
+        self.sfqid = "query-id"
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def execute(self, sql):
+        if self.conn.closed:
+            raise RuntimeError("connection closed")
+        self.conn.statements.append(sql)
+        time.sleep(self.conn.connector.delay)
+
+    def fetchall(self):
+        return [{"name": "ROW"}]
+
+
+class StubConnection:
+    def __init__(self, connector):
+        self.connector = connector
+        self.statements = []
+        self.closed = False
+
+    def cursor(self, *args):
+        return StubCursor(self)
+
+    def is_closed(self):
+        return self.closed
+
+    def close(self):
+        self.closed = True
+
+
+class StubConnector:
+    """Records every connection opened through it."""
+
+    def __init__(self, delay=0.0):
+        self.delay = delay
+        self.connections = []
+        self.lock = threading.Lock()
+
+    def connect(self):
+        with self.lock:
+            conn = StubConnection(self)
+            self.connections.append(conn)
+            return conn
+
+
+@pytest.fixture
+def connector():
+    return StubConnector()
+
+
+@pytest.fixture
+def client(connector):
+    client = SnowflakeAPIClient(
+        account="acct", user="user", database="DB", password="pw", pool_size=4
+    )
+    client._connect = connector.connect
+    yield client
+    client.close()
+
+
+def test_sequential_calls_reuse_one_connection(client, connector):
+    for _ in range(10):
+        client.execute_sql("SELECT 1", database="DB")
+
+    assert len(connector.connections) == 1
+    assert client.pool_stats()["reused"] == 9
+    # The session was opened with DB, so no USE DATABASE round trips
+    assert connector.connections[0].statements == ["SELECT 1"] * 10
+
+
+def test_use_database_only_when_context_changes(client, connector):
+    client.execute_sql("SELECT 1", database="OTHER")
+    client.execute_sql("SELECT 2", database="OTHER")
+    client.execute_sql("SELECT 3")
+
+    assert connector.connections[0].statements == [
+        "USE DATABASE OTHER",
+        "SELECT 1",
+        "SELECT 2",
+        "SELECT 3",
+    ]
+
+
+def test_caller_use_statements_reset_the_tracked_database(client, connector):
+    client.execute_sql("SELECT 1", database="DB")
+    client.execute_sql("  -- switch\nuse database OTHER")
+    client.execute_sql("SELECT 2", database="DB")
+
+    assert connector.connections[0].statements == [
+        "SELECT 1",
+        "  -- switch\nuse database OTHER",
+        "USE DATABASE DB",
+        "SELECT 2",
+    ]
+
+
+def test_parallel_calls_use_separate_connections_up_to_the_cap(client, connector):
+    connector.delay = 0.05
+
+    def describe(i):
+        return client.describe_table(schema="S", table=f"T{i}")
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(executor.map(describe, range(16)))
+
+    assert len(results) == 16
+    assert 1 < len(connector.connections) <= 4
+    assert client.pool_stats()["open"] == len(connector.connections)
+
+
+def test_nested_use_on_one_thread_shares_the_connection(connector):
+    pool = SnowflakeConnectionPool(connector.connect, max_size=1, checkout_timeout=1)
+
+    with pool.connection() as outer:
+        with pool.connection() as inner:
+            assert inner is outer
+
+    assert len(connector.connections) == 1
+
+
+def test_closed_connections_are_replaced(connector):
+    pool = SnowflakeConnectionPool(connector.connect, max_size=2)
+    with pool.connection() as conn:
+        first = conn
+    first.raw.close()
+
+    with pool.connection() as conn:
+        assert conn is not first
+
+    assert pool.stats()["discarded"] == 1
+    assert len(connector.connections) == 2
+
+
+def test_long_idle_connections_are_probed(connector):
+    pool = SnowflakeConnectionPool(connector.connect, max_size=2, health_check_after=0)
+    with pool.connection():
+        pass
+    with pool.connection() as conn:
+        assert conn.raw.statements == ["SELECT 1"]
+
+    assert len(connector.connections) == 1
+
+
+def test_idle_connections_are_reaped(connector):
+    pool = SnowflakeConnectionPool(connector.connect, max_size=2, idle_timeout=0)
+    with pool.connection():
+        pass
+    time.sleep(0.01)
+    with pool.connection():
+        pass
+
+    assert pool.stats()["reaped"] == 1
+    assert connector.connections[0].closed
+    assert len(connector.connections) == 2
+
+
+def test_checkout_times_out_when_pool_is_exhausted(connector):
+    pool = SnowflakeConnectionPool(connector.connect, max_size=1, checkout_timeout=0.05)
+    held = threading.Event()
+    release = threading.Event()
+
+    def hold():
+        with pool.connection():
+            held.set()
+            release.wait(1)
+
+    thread = threading.Thread(target=hold)
+    thread.start()
+    held.wait(1)
+    try:
+        with pytest.raises(TimeoutError):
+            with pool.connection():
+                pass
+    finally:
+        release.set()
+        thread.join()
@@ -0,0 +1,133 @@
+"""Tests for Snowflake semantic tag discovery."""
+
+import threading
+import time
+
+import pytest
+
+from chuck_data.clients.snowflake import SnowflakeAPIClient
+
+TABLES = [f"T{i}" for i in range(12)]
+
+
+class RoutedCursor:
+    def __init__(self, conn):
+        self.conn = conn
+        self.rows = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def execute(self, sql):
+        self.conn.server.record(sql)
+        self.rows = self.conn.server.answer(sql)
+
+    def fetchall(self):
+        return self.rows
+
+
+class RoutedConnection:
+    def __init__(self, server):
+        self.server = server
+
+    def cursor(self, *args):
+        return RoutedCursor(self)
+
+    def is_closed(self):
+        return False
+
+    def close(self):
+        pass
+
+
+class FakeSnowflake:
+    """Answers SHOW TABLES, TAG_REFERENCES_ALL_COLUMNS and ACCOUNT_USAGE queries."""
+
+    def __init__(self, account_usage=True, delay=0.0):
+        self.account_usage = account_usage
+        self.delay = delay
+        self.statements = []
+        self.connections = 0
+        self.lock = threading.Lock()
+
+    def connect(self):
+        with self.lock:
+            self.connections += 1
+        return RoutedConnection(self)
+
+    def record(self, sql):
+        with self.lock:
+            self.statements.append(sql)
+
+    def answer(self, sql):
+        if "ACCOUNT_USAGE" in sql:
+            if not self.account_usage:
+                raise RuntimeError("Object 'SNOWFLAKE.ACCOUNT_USAGE' does not exist")
+            return [
+                {"OBJECT_NAME": t, "COLUMN_NAME": "EMAIL", "TAG_VALUE": "email"}
+                for t in TABLES
+            ]
+        if sql.startswith("SHOW TABLES"):
+            return [{"name": t} for t in TABLES]
+        if "TAG_REFERENCES_ALL_COLUMNS" in sql:
+            time.sleep(self.delay)
+            return [{"COLUMN_NAME": "EMAIL", "TAG_VALUE": "email"}]
+        raise AssertionError(f"unexpected SQL: {sql}")
+
+
+def _client(server):
+    client = SnowflakeAPIClient(
+        account="acct", user="user", database="DB", password="pw", pool_size=4
+    )
+    client._connect = server.connect
+    return client
+
+
+@pytest.fixture(autouse=True)
+def no_account_usage_config(temp_config):
+    """Tag discovery reads its default from the (empty) test config."""
+
+
+def test_account_usage_reads_all_tags_in_one_query():
+    server = FakeSnowflake()
+
+    result = _client(server).read_snowflake_semantic_tags(
+        "DB", "S", use_account_usage=True
+    )
+
+    assert result["success"]
+    assert result["strategy"] == "account_usage"
+    assert len(server.statements) == 1
+    assert {t["table"] for t in result["tags"]} == set(TABLES)
+    assert result["elapsed_seconds"] >= 0
+
+
+def test_falls_back_to_per_table_without_account_usage_access():
+    server = FakeSnowflake(account_usage=False)
+
+    result = _client(server).read_snowflake_semantic_tags(
+        "DB", "S", use_account_usage=True
+    )
+
+    assert result["strategy"] == "per_table"
+    assert [t["table"] for t in result["tags"]] == TABLES
+    assert result["tags"][0] == {"table": "T0", "column": "EMAIL", "semantic": "email"}
+
+
+def test_per_table_is_default_and_runs_concurrently():
+    server = FakeSnowflake(delay=0.05)
+    client = _client(server)
+
+    started = time.monotonic()
+    result = client.read_snowflake_semantic_tags("DB", "S")
+    elapsed = time.monotonic() - started
+
+    assert result["strategy"] == "per_table"
+    assert not any("ACCOUNT_USAGE" in sql for sql in server.statements)
+    assert len(result["tags"]) == len(TABLES)
+    # 12 tables at 50ms each over 4 connections, well under the serial 600ms
+    assert elapsed < 0.4
+    assert 1 < server.connections <= 4
@@ -0,0 +1,157 @@
+"""Tests for the shared SQL statement waiter."""
+
+import threading
+from unittest.mock import Mock, patch
+
+import pytest
+
+from chuck_data.clients.databricks import DatabricksAPIClient
+from chuck_data.clients.statement_waiter import (
+    DATABRICKS_PENDING_STATES,
+    DATABRICKS_QUEUED_STATES,
+    BackoffSchedule,
+    StatementCancelledError,
+    StatementTimeoutError,
+    StatementWaiter,
+    clear_statement_timings,
+    databricks_statement_state,
+    get_recent_statement_timings,
+)
+
+
+def _databricks_waiter(**kwargs):
+    return StatementWaiter(
+        pending_states=DATABRICKS_PENDING_STATES,
+        queued_states=DATABRICKS_QUEUED_STATES,
+        **kwargs,
+    )
+
+
+def _states(*states):
+    return [{"status": {"state": s}} for s in states]
+
+
+@pytest.fixture(autouse=True)
+def reset_timings():
+    clear_statement_timings()
+    yield
+    clear_statement_timings()
+
+
+def test_backoff_grows_exponentially_and_caps():
+    schedule = BackoffSchedule(initial_delay=0.1, max_delay=1.0, jitter=0)
+
+    delays = [schedule.delay(i) for i in range(6)]
+
+    assert delays[:4] == pytest.approx([0.1, 0.2, 0.4, 0.8])
+    assert delays[4:] == [1.0, 1.0]
+
+
+def test_backoff_jitter_stays_in_band():
+    schedule = BackoffSchedule(initial_delay=1.0, max_delay=10.0, jitter=0.2)
+
+    for _ in range(50):
+        assert 0.8 <= schedule.delay(0) <= 1.2
+
+
+def test_terminal_initial_response_skips_polling():
+    poll = Mock()
+    initial = {"statement_id": "s1", "status": {"state": "SUCCEEDED"}}
+
+    result = _databricks_waiter().wait(
+        poll, databricks_statement_state, initial_response=initial
+    )
+
+    assert result is initial
+    poll.assert_not_called()
+
+
+@patch("chuck_data.clients.statement_waiter.time.sleep")
+def test_polls_with_backoff_until_terminal(mock_sleep):
+    poll = Mock(side_effect=_states("PENDING", "RUNNING", "SUCCEEDED"))
+    waiter = _databricks_waiter(schedule=BackoffSchedule(jitter=0))
+
+    result = waiter.wait(
+        poll,
+        databricks_statement_state,
+        initial_response={"status": {"state": "PENDING"}},
+        statement_id="s1",
+    )
+
+    assert databricks_statement_state(result) == "SUCCEEDED"
+    assert poll.call_count == 3
+    delays = [c.args[0] for c in mock_sleep.call_args_list]
+    assert delays == pytest.approx([0.1, 0.2, 0.4])
+
+
+def test_records_timings():
+    poll = Mock(side_effect=_states("RUNNING", "SUCCEEDED"))
+    waiter = _databricks_waiter(schedule=BackoffSchedule(initial_delay=0))
+
+    waiter.wait(poll, databricks_statement_state, statement_id="s1")
+
+    [timings] = get_recent_statement_timings()
+    assert timings.statement_id == "s1"
+    assert timings.final_state == "SUCCEEDED"
+    assert timings.polls == 2
+    assert timings.total_seconds >= timings.polling_seconds
+
+
+@patch("chuck_data.clients.statement_waiter.time.monotonic")
+@patch("chuck_data.clients.statement_waiter.time.sleep")
+def test_deadline_cancels_and_raises(mock_sleep, mock_monotonic):
+    clock = iter(range(0, 1000, 10))
+    mock_monotonic.side_effect = lambda: next(clock)
+    poll = Mock(return_value={"status": {"state": "RUNNING"}})
+    cancel = Mock()
+
+    with pytest.raises(StatementTimeoutError, match="timed out after 25"):
+        _databricks_waiter(timeout=25).wait(
+            poll, databricks_statement_state, cancel=cancel
+        )
+
+    cancel.assert_called_once()
+    assert get_recent_statement_timings()[-1].final_state == "TIMED_OUT"
+
+
+def test_cancel_event_stops_waiting():
+    cancel_event = threading.Event()
+    cancel = Mock()
+
+    def poll():
+        cancel_event.set()
+        return {"status": {"state": "RUNNING"}}
+
+    with pytest.raises(StatementCancelledError):
+        _databricks_waiter(cancel_event=cancel_event).wait(
+            poll, databricks_statement_state, cancel=cancel
+        )
+
+    cancel.assert_called_once()
+
+
+def test_databricks_client_returns_completed_submit_without_polling():
+    client = DatabricksAPIClient("workspace", "token")
+    client.post = Mock(
+        return_value={"statement_id": "s1", "status": {"state": "SUCCEEDED"}}
+    )
+    client.get = Mock()
+
+    result = client.submit_sql_statement("SELECT 1", "wh")
+
+    assert result["status"]["state"] == "SUCCEEDED"
+    client.get.assert_not_called()
+
+
+def test_databricks_client_cancels_statement_on_event():
+    client = DatabricksAPIClient("workspace", "token")
+    client.post = Mock(
+        return_value={"statement_id": "s1", "status": {"state": "RUNNING"}}
+    )
+    cancel_event = threading.Event()
+    cancel_event.set()
+
+    with pytest.raises(StatementCancelledError):
+        client.submit_sql_statement("SELECT 1", "wh", cancel_event=cancel_event)
+
+    client.post.assert_called_with("/api/2.0/sql/statements/s1/cancel", {})
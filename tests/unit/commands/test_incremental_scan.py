@@ -0,0 +1,100 @@
+"""Tests for incremental PII schema scans."""
+
+import pytest
+
+from chuck_data.commands.pii_tools import _helper_scan_schema_for_pii_logic
+
+
+@pytest.fixture
+def schema(databricks_client_stub, llm_client_stub):
+    databricks_client_stub.add_catalog("cat")
+    databricks_client_stub.add_schema("cat", "sch")
+    for name in ("a", "b", "c"):
+        databricks_client_stub.add_table(
+            "cat",
+            "sch",
+            name,
+            columns=[{"name": "email", "type_name": "string"}],
+            updated_at=1000,
+        )
+    llm_client_stub.set_response_content('[{"name":"email","semantic":"email"}]')
+    return databricks_client_stub
+
+
+def _scan(client, llm, **kwargs):
+    return _helper_scan_schema_for_pii_logic(
+        client, llm, "cat", "sch", show_progress=False, incremental=True, **kwargs
+    )
+
+
+def _table(client, name):
+    return next(t for t in client.tables[("cat", "sch")] if t["name"] == name)
+
+
+def test_unchanged_tables_are_carried_forward(schema, llm_client_stub, temp_config):
+    first = _scan(schema, llm_client_stub)
+    schema.get_table_calls.clear()
+
+    second = _scan(schema, llm_client_stub)
+
+    assert first["incremental"]["added"] == ["a", "b", "c"]
+    assert second["incremental"]["unchanged"] == 3
+    assert second["incremental"]["rescanned"] == 0
+    assert schema.get_table_calls == []
+    assert all(r["carried_forward"] for r in second["results_detail"])
+    assert second["total_pii_columns"] == first["total_pii_columns"] == 3
+
+
+def test_added_altered_and_dropped_tables_are_detected(
+    schema, llm_client_stub, temp_config
+):
+    _scan(schema, llm_client_stub)
+    _table(schema, "b")["updated_at"] = 2000
+    schema.tables[("cat", "sch")].remove(_table(schema, "c"))
+    schema.add_table(
+        "cat",
+        "sch",
+        "d",
+        columns=[{"name": "email", "type_name": "string"}],
+        updated_at=1000,
+    )
+    schema.get_table_calls.clear()
+
+    result = _scan(schema, llm_client_stub)
+
+    changes = result["incremental"]
+    assert changes["added"] == ["d"]
+    assert changes["altered"] == ["b"]
+    assert changes["dropped"] == ["c"]
+    assert changes["unchanged"] == 1
+    assert sorted(call[0] for call in schema.get_table_calls) == [
+        "cat.sch.b",
+        "cat.sch.d",
+    ]
+    assert [r["table_name"] for r in result["results_detail"]] == ["a", "b", "d"]
+    assert [r.get("carried_forward", False) for r in result["results_detail"]] == [
+        True,
+        False,
+        False,
+    ]
+
+
+def test_tables_without_markers_are_always_rescanned(
+    schema, llm_client_stub, temp_config
+):
+    del _table(schema, "a")["updated_at"]
+    _scan(schema, llm_client_stub)
+
+    result = _scan(schema, llm_client_stub)
+
+    assert result["incremental"]["rescanned"] == 1
+    assert result["incremental"]["unchanged"] == 2
+
+
+def test_refresh_rescans_everything(schema, llm_client_stub, temp_config):
+    _scan(schema, llm_client_stub)
+
+    result = _scan(schema, llm_client_stub, refresh=True)
+
+    assert result["incremental"]["rescanned"] == 3
+    assert not any(r.get("carried_forward") for r in result["results_detail"])
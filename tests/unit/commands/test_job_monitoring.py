@@ -2,8 +2,19 @@
 
 from unittest.mock import Mock, patch
 
+import pytest
+
 from chuck_data.commands.monitor_job import _monitor_job_completion
 from chuck_data.commands.stitch_tools import _helper_launch_stitch_job
+from chuck_data.job_watcher import reset_job_watcher
+
+
+@pytest.fixture(autouse=True)
+def fresh_job_watcher():
+    """Each test gets its own watcher thread and leaves no jobs behind."""
+    reset_job_watcher()
+    yield
+    reset_job_watcher()
 
 
 class TestMonitorJobCompletion:
@@ -32,7 +43,7 @@ class TestMonitorJobCompletion:
         result = _monitor_job_completion(
             job_id="test-job-123",
             run_id="run-456",
-            poll_interval=1,
+            poll_interval=0.01,
             timeout=10,
         )
 
@@ -71,7 +82,7 @@ class TestMonitorJobCompletion:
         result = _monitor_job_completion(
             job_id="test-job-123",
             run_id="run-456",
-            poll_interval=1,
+            poll_interval=0.01,
             timeout=10,
         )
 
@@ -108,7 +119,7 @@ class TestMonitorJobCompletion:
         result = _monitor_job_completion(
             job_id="test-job-123",
             run_id="run-456",
-            poll_interval=1,
+            poll_interval=0.01,
             timeout=10,
         )
 
@@ -129,7 +140,7 @@ class TestMonitorJobCompletion:
         result = _monitor_job_completion(
             job_id="test-job-123",
             run_id="run-456",
-            poll_interval=1,
+            poll_interval=0.01,
             timeout=10,
         )
 
@@ -160,7 +171,7 @@ class TestMonitorJobCompletion:
         result = _monitor_job_completion(
             job_id="test-job-123",
             run_id="run-456",
-            poll_interval=1,
+            poll_interval=0.01,
             timeout=10,
         )
 
@@ -196,7 +207,7 @@ class TestMonitorJobCompletion:
         result = _monitor_job_completion(
             job_id="test-job-123",
             run_id="run-456",
-            poll_interval=1,
+            poll_interval=0.01,
             timeout=10,
         )
 
@@ -9,6 +9,7 @@ from chuck_data.commands.job_status import (
     _query_by_run_id,
     _format_job_status_message,
     UNSET_DATABRICKS_RUN_ID,
+    LIST_JOBS_STATUS_TIMEOUT,
     handle_list_jobs,
     _format_jobs_table,
     _format_jobs_table_minimal,
@@ -1215,7 +1216,7 @@ def test_list_jobs_with_details(mock_get_cached, mock_get_token, mock_client_cla
     mock_client = Mock()
     mock_client_class.return_value = mock_client
 
-    def get_status_side_effect(job_id, token):
+    def get_status_side_effect(job_id, token, timeout):
         if job_id == "chk-123":
             return {
                 "job-id": "chk-123",
@@ -1543,7 +1544,9 @@ def test_list_jobs_fetches_fresh_data_for_running_jobs(
     assert "10,000" in result.message  # Should show updated count
 
     # Verify API was called (fresh data fetched)
-    mock_client.get_job_status.assert_called_once_with("chk-running", "test-token")
+    mock_client.get_job_status.assert_called_once_with(
+        "chk-running", "test-token", timeout=LIST_JOBS_STATUS_TIMEOUT
+    )
     # Verify cache_job WAS called for running state to maintain proper ordering
     mock_cache_job.assert_called_once_with(
         "chk-running",
@@ -1584,7 +1587,9 @@ def test_list_jobs_fetches_and_caches_terminal_state(
     assert "75,000" in result.message
 
     # Verify API was called
-    mock_client.get_job_status.assert_called_once_with("chk-new", "test-token")
+    mock_client.get_job_status.assert_called_once_with(
+        "chk-new", "test-token", timeout=LIST_JOBS_STATUS_TIMEOUT
+    )
 
     # Verify terminal state was cached
     mock_cache_job.assert_called_once()
@@ -1619,7 +1624,9 @@ def test_list_jobs_caches_unknown_state_on_404(
     assert "Unknown" in result.message
 
     # Verify API was called
-    mock_client.get_job_status.assert_called_once_with("chk-missing", "test-token")
+    mock_client.get_job_status.assert_called_once_with(
+        "chk-missing", "test-token", timeout=LIST_JOBS_STATUS_TIMEOUT
+    )
 
     # Verify UNKNOWN state was cached
     mock_cache_job.assert_called_once()
@@ -1654,7 +1661,9 @@ def test_list_jobs_caches_unknown_state_on_api_error(
     assert "Unknown" in result.message
 
     # Verify API was called
-    mock_client.get_job_status.assert_called_once_with("chk-error", "test-token")
+    mock_client.get_job_status.assert_called_once_with(
+        "chk-error", "test-token", timeout=LIST_JOBS_STATUS_TIMEOUT
+    )
 
     # Verify UNKNOWN state was cached
     mock_cache_job.assert_called_once()
@@ -1748,10 +1757,102 @@ def test_list_jobs_mixed_cache_and_fetch(
     assert "Total credits used: 60" in result.message
 
     # Verify API was called only once (for needs-fetch)
-    mock_client.get_job_status.assert_called_once_with("chk-needs-fetch", "test-token")
+    mock_client.get_job_status.assert_called_once_with(
+        "chk-needs-fetch", "test-token", timeout=LIST_JOBS_STATUS_TIMEOUT
+    )
 
     # Verify only the failed job was cached
     mock_cache_job.assert_called_once()
     call_args = mock_cache_job.call_args
     assert call_args[0][0] == "chk-needs-fetch"
     assert call_args[0][2]["state"] == "failed"
+
+
+@patch("chuck_data.commands.job_status.AmperityAPIClient")
+@patch("chuck_data.commands.job_status.get_amperity_token", return_value="t")
+@patch("chuck_data.commands.job_status.get_all_cached_jobs")
+def test_list_jobs_fetches_statuses_concurrently(
+    mock_get_cached, mock_get_token, mock_client_class
+):
+    """Active jobs are refreshed in parallel and listed in cache order."""
+    import threading
+    import time
+
+    job_ids = [f"chk-{i}" for i in range(8)]
+    mock_get_cached.return_value = [{"job_id": job_id} for job_id in job_ids]
+    in_flight, peak = [0], [0]
+    lock = threading.Lock()
+
+    def get_status(job_id, token, timeout):
+        with lock:
+            in_flight[0] += 1
+            peak[0] = max(peak[0], in_flight[0])
+        time.sleep(0.1)
+        with lock:
+            in_flight[0] -= 1
+        return {"job-id": job_id, "state": "running"}
+
+    mock_client_class.return_value.get_job_status.side_effect = get_status
+
+    result = handle_list_jobs()
+
+    assert [job["job-id"] for job in result.data["jobs"]] == job_ids
+    assert peak[0] > 1
+
+
+@patch("chuck_data.commands.job_status.AmperityAPIClient")
+@patch("chuck_data.commands.job_status.get_amperity_token", return_value="t")
+@patch("chuck_data.commands.job_status.get_all_cached_jobs")
+def test_list_jobs_does_not_cache_timed_out_status_calls(
+    mock_get_cached, mock_get_token, mock_client_class, mock_job_cache
+):
+    """A status call that times out shows as unknown and is not cached."""
+    import requests
+
+    mock_get_cached.return_value = [{"job_id": "chk-slow"}, {"job_id": "chk-fast"}]
+
+    def get_status(job_id, token, timeout):
+        assert timeout == LIST_JOBS_STATUS_TIMEOUT
+        if job_id == "chk-slow":
+            raise requests.Timeout("read timed out")
+        return {"job-id": job_id, "state": "succeeded"}
+
+    mock_client_class.return_value.get_job_status.side_effect = get_status
+    result = handle_list_jobs()
+
+    states = {job["job-id"]: job["state"] for job in result.data["jobs"]}
+    assert states == {"chk-slow": "UNKNOWN", "chk-fast": "succeeded"}
+    assert [c.args[0] for c in mock_job_cache.call_args_list] == ["chk-fast"]
+
+
+@patch("chuck_data.commands.job_status.AmperityAPIClient")
+@patch("chuck_data.commands.job_status.get_amperity_token", return_value="t")
+def test_list_jobs_writes_the_cache_once_per_refresh(
+    mock_get_token, mock_client_class, tmp_path
+):
+    """Refreshing many jobs rewrites the cache file a single time."""
+    import os
+
+    from chuck_data import job_cache
+
+    cache = job_cache.JobCache(str(tmp_path / "jobs.json"))
+    for i in range(30):
+        cache.add_job(f"chk-{i}", f"run-{i}")
+    mock_client_class.return_value.get_job_status.side_effect = (
+        lambda job_id, t, timeout: {
+            "job-id": job_id,
+            "state": "succeeded",
+        }
+    )
+
+    with (
+        patch.object(job_cache, "_job_cache", cache),
+        patch.object(job_cache, "cache_job", cache.add_job),
+        patch("chuck_data.job_cache.os.replace", wraps=os.replace) as replace,
+    ):
+        result = handle_list_jobs()
+
+    assert len(result.data["jobs"]) == 30
+    replace.assert_called_once()
+    assert cache.get_job("chk-7")["job_data"]["state"] == "succeeded"
+    assert cache.find_job_id("run-7") == "chk-7"
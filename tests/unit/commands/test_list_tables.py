@@ -443,3 +443,69 @@ def test_redshift_describe_table_fails_sets_zero_columns(temp_config):
         assert result.success
         assert len(result.data["tables"]) == 1
         assert result.data["tables"][0]["column_count"] == 0
+
+
+def _redshift_metadata_client(table_names):
+    """Mock Redshift client answering pg_table_def, svv_table_info and COUNT(*)."""
+    mock_client = Mock()
+    mock_client.__class__.__name__ = "RedshiftAPIClient"
+    mock_client.list_tables.return_value = {
+        "tables": [{"name": name, "type": "TABLE"} for name in table_names]
+    }
+
+    def execute_sql(sql, database=None):
+        if "pg_table_def" in sql:
+            records = [
+                [{"stringValue": name}, {"longValue": 3}] for name in table_names
+            ]
+        elif "svv_table_info" in sql:
+            records = [
+                [{"stringValue": name}, {"longValue": 1000 + i}, {"longValue": 2}]
+                for i, name in enumerate(table_names)
+            ]
+        else:
+            table = sql.rsplit('"."', 1)[1].rstrip('"')
+            records = [[{"longValue": table_names.index(table) + 7}]]
+        return {"status": "FINISHED", "result": {"Records": records}}
+
+    mock_client.execute_sql.side_effect = execute_sql
+    return mock_client
+
+
+def test_redshift_metadata_uses_bulk_queries_by_default(temp_config):
+    """Row estimates and sizes come from SVV_TABLE_INFO without per-table COUNT(*)."""
+    table_names = [f"t{i}" for i in range(20)]
+    mock_client = _redshift_metadata_client(table_names)
+
+    result = handle_command(mock_client, database="testdb", schema_name="public")
+
+    assert result.success
+    statements = [c.args[0] for c in mock_client.execute_sql.call_args_list]
+    assert len(statements) == 2
+    assert not any("COUNT(*)" in sql for sql in statements)
+    mock_client.describe_table.assert_not_called()
+    first = result.data["tables"][0]
+    assert first["column_count"] == 3
+    assert first["row_count"] == 1000
+    assert first["size_bytes"] == 2 * 1024 * 1024
+
+
+def test_redshift_exact_counts_run_count_per_table(temp_config):
+    """exact_counts replaces the estimates with COUNT(*) results."""
+    table_names = ["customers", "orders", "events"]
+    mock_client = _redshift_metadata_client(table_names)
+
+    result = handle_command(
+        mock_client, database="testdb", schema_name="public", exact_counts=True
+    )
+
+    assert result.success
+    counts = [
+        c.args[0]
+        for c in mock_client.execute_sql.call_args_list
+        if "COUNT(*)" in c.args[0]
+    ]
+    assert len(counts) == 3
+    tables_by_name = {t["name"]: t for t in result.data["tables"]}
+    assert tables_by_name["customers"]["row_count"] == 7
+    assert tables_by_name["events"]["row_count"] == 9
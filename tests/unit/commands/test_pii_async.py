@@ -0,0 +1,216 @@
+"""Tests for asyncio-driven PII classification."""
+
+import asyncio
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from chuck_data.commands.pii_tools import _helper_scan_schema_for_pii_logic
+from chuck_data.commands.scan_scheduler import AsyncScanDriver
+from chuck_data.clients.statement_waiter import BackoffSchedule
+from tests.fixtures.llm import PIIClassifyingLLMStub
+
+
+@pytest.fixture
+def wide_schema(databricks_client_stub):
+    databricks_client_stub.add_catalog("cat")
+    databricks_client_stub.add_schema("cat", "sch")
+    for i in range(40):
+        databricks_client_stub.add_table(
+            "cat",
+            "sch",
+            f"t{i:02d}",
+            columns=[
+                {"name": "id", "type_name": "bigint"},
+                {"name": "email", "type_name": "string"},
+            ],
+        )
+    return databricks_client_stub
+
+
+def test_async_scan_classifies_every_table_with_achat(wide_schema, temp_config):
+    llm = PIIClassifyingLLMStub(delay=0.01)
+
+    result = _helper_scan_schema_for_pii_logic(
+        wide_schema, llm, "cat", "sch", show_progress=False, use_async=True
+    )
+
+    assert len(llm.achat_calls) == 40
+    assert not llm.chat_calls
+    assert result["tables_successfully_processed"] == 40
+    assert result["total_pii_columns"] == 40
+    assert result["async_stats"]["completed"] == 40
+    assert llm.peak_in_flight > 5
+
+
+def test_async_scan_closes_the_provider_and_runs_inside_a_loop(
+    wide_schema, temp_config
+):
+    llm = PIIClassifyingLLMStub()
+    closed = []
+
+    async def aclose():
+        closed.append(True)
+
+    llm.aclose = aclose
+
+    async def scan_from_a_running_loop():
+        return _helper_scan_schema_for_pii_logic(
+            wide_schema, llm, "cat", "sch", show_progress=False, use_async=True
+        )
+
+    result = asyncio.run(scan_from_a_running_loop())
+
+    assert result["tables_successfully_processed"] == 40
+    assert closed == [True]
+
+
+def test_async_scan_respects_max_in_flight(wide_schema, temp_config):
+    llm = PIIClassifyingLLMStub(delay=0.01)
+
+    with patch("chuck_data.config.get_pii_scan_async_max_in_flight", return_value=8):
+        result = _helper_scan_schema_for_pii_logic(
+            wide_schema, llm, "cat", "sch", show_progress=False, use_async=True
+        )
+
+    assert llm.peak_in_flight <= 8
+    assert result["async_stats"]["max_in_flight"] == 8
+
+
+def test_async_scan_falls_back_without_achat(wide_schema, temp_config):
+    llm = MagicMock(spec=["chat"])
+    llm.chat.side_effect = PIIClassifyingLLMStub().chat
+
+    result = _helper_scan_schema_for_pii_logic(
+        wide_schema, llm, "cat", "sch", show_progress=False, use_async=True
+    )
+
+    assert llm.chat.call_count == 40
+    assert "async_stats" not in result
+
+
+def test_async_off_by_default(wide_schema, temp_config):
+    llm = PIIClassifyingLLMStub()
+
+    result = _helper_scan_schema_for_pii_logic(
+        wide_schema, llm, "cat", "sch", show_progress=False
+    )
+
+    assert len(llm.chat_calls) == 40
+    assert not llm.achat_calls
+    assert "async_stats" not in result
+
+
+def test_driver_retries_throttled_calls():
+    driver = AsyncScanDriver(
+        max_in_flight=2, retry_schedule=BackoffSchedule(initial_delay=0, jitter=0)
+    )
+    attempts = []
+
+    async def flaky():
+        attempts.append(1)
+        if len(attempts) < 3:
+            raise RuntimeError("429 Too Many Requests")
+        return "ok"
+
+    assert asyncio.run(driver.run(flaky)) == "ok"
+    assert driver.stats()["throttled"] == 2
+    assert driver.stats()["completed"] == 1
+
+
+def test_driver_does_not_retry_other_errors():
+    driver = AsyncScanDriver(max_in_flight=2)
+
+    async def broken():
+        raise ValueError("bad request")
+
+    with pytest.raises(ValueError):
+        asyncio.run(driver.run(broken))
+    assert driver.stats()["failed"] == 1
+
+
+class _ChatCompletionHandler(BaseHTTPRequestHandler):
+    """Fake serving endpoint that holds requests until enough are in flight."""
+
+    protocol_version = "HTTP/1.1"
+
+    def do_POST(self):
+        server = self.server
+        body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        with server.cond:
+            server.in_flight += 1
+            server.peak_in_flight = max(server.peak_in_flight, server.in_flight)
+            server.cond.notify_all()
+            # Answer once the expected number of requests overlap; the timeout
+            # only keeps a serialized client from hanging the test
+            server.cond.wait_for(
+                lambda: server.peak_in_flight >= server.expected_in_flight, timeout=5
+            )
+            server.in_flight -= 1
+        payload = json.dumps(
+            {
+                "id": "cmpl",
+                "object": "chat.completion",
+                "created": 0,
+                "model": body["model"],
+                "choices": [
+                    {
+                        "index": 0,
+                        "finish_reason": "stop",
+                        "message": {"role": "assistant", "content": "[]"},
+                    }
+                ],
+            }
+        ).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def fake_endpoint():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _ChatCompletionHandler)
+    server.daemon_threads = True
+    server.cond = threading.Condition()
+    server.expected_in_flight = 0
+    server.in_flight = 0
+    server.peak_in_flight = 0
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def test_achat_requests_overlap_against_fake_endpoint(fake_endpoint):
+    """Requests sent through achat() are all in flight at the same time."""
+    pytest.importorskip("openai")
+    from chuck_data.llm.providers.databricks import DatabricksProvider
+
+    provider = DatabricksProvider(
+        workspace_url=f"http://127.0.0.1:{fake_endpoint.server_port}",
+        token="token",
+        model="fake-model",
+    )
+    messages = [{"role": "user", "content": "classify"}]
+    requests = 16
+    fake_endpoint.expected_in_flight = requests
+    driver = AsyncScanDriver(max_in_flight=32)
+
+    async def run_async():
+        await asyncio.gather(
+            *(driver.run(provider.achat, messages) for _ in range(requests))
+        )
+
+    asyncio.run(run_async())
+
+    assert fake_endpoint.peak_in_flight == requests
+    assert driver.stats()["completed"] == requests
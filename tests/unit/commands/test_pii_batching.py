@@ -0,0 +1,121 @@
+"""Tests for multi-table batching of PII classification requests."""
+
+import pytest
+
+from chuck_data.commands.pii_tools import (
+    _helper_scan_schema_for_pii_logic,
+    _pack_classification_batches,
+)
+from tests.fixtures.llm import PIIClassifyingLLMStub
+
+
+@pytest.fixture
+def narrow_schema(databricks_client_stub):
+    databricks_client_stub.add_catalog("cat")
+    databricks_client_stub.add_schema("cat", "sch")
+    for name in ("a", "b", "c", "d"):
+        databricks_client_stub.add_table(
+            "cat",
+            "sch",
+            name,
+            columns=[
+                {"name": "id", "type_name": "bigint"},
+                {"name": "email", "type_name": "string"},
+            ],
+        )
+    return databricks_client_stub
+
+
+def _scan(client, llm):
+    return _helper_scan_schema_for_pii_logic(
+        client, llm, "cat", "sch", show_progress=False, batch=True
+    )
+
+
+def test_pack_respects_column_budget():
+    pending = [
+        {"full_name": f"t{i}", "columns": [{}] * 3, "column_details": []}
+        for i in range(5)
+    ]
+
+    batches = _pack_classification_batches(pending, max_columns=6, max_tokens=10_000)
+
+    assert [len(b) for b in batches] == [2, 2, 1]
+
+
+def test_pack_gives_oversized_tables_their_own_batch():
+    pending = [
+        {"full_name": "small", "columns": [{}], "column_details": []},
+        {"full_name": "wide", "columns": [{}] * 50, "column_details": []},
+        {"full_name": "small2", "columns": [{}], "column_details": []},
+    ]
+
+    batches = _pack_classification_batches(pending, max_columns=10, max_tokens=10_000)
+
+    assert [[p["full_name"] for p in b] for b in batches] == [
+        ["small"],
+        ["wide"],
+        ["small2"],
+    ]
+
+
+def test_batched_scan_uses_one_request(narrow_schema, temp_config):
+    llm = PIIClassifyingLLMStub()
+
+    result = _scan(narrow_schema, llm)
+
+    assert len(llm.chat_calls) == 1
+    assert result["tables_successfully_processed"] == 4
+    assert result["total_pii_columns"] == 4
+    stats = result["llm_batching"]
+    assert stats["llm_requests"] == 1
+    assert stats["requests_saved"] == 3
+    assert stats["estimated_prompt_tokens_saved"] > 0
+
+
+def test_invalid_table_in_batch_falls_back_to_single_request(
+    narrow_schema, temp_config
+):
+    llm = PIIClassifyingLLMStub(drop_tables={"cat.sch.b"})
+
+    result = _scan(narrow_schema, llm)
+
+    assert len(llm.chat_calls) == 2
+    assert isinstance(llm.chat_calls[1], list)
+    assert result["tables_successfully_processed"] == 4
+    assert result["llm_batching"]["fallback_tables"] == 1
+
+
+def test_unparseable_batch_falls_back_for_every_table(narrow_schema, temp_config):
+    llm = PIIClassifyingLLMStub(broken_batches=True)
+
+    result = _scan(narrow_schema, llm)
+
+    assert len(llm.chat_calls) == 5
+    assert result["tables_successfully_processed"] == 4
+    assert result["llm_batching"]["requests_saved"] == 0
+
+
+def test_malformed_items_in_batch_fall_back_to_single_request(
+    narrow_schema, temp_config
+):
+    llm = PIIClassifyingLLMStub(malformed_tables={"cat.sch.c"})
+
+    result = _scan(narrow_schema, llm)
+
+    assert len(llm.chat_calls) == 2
+    assert isinstance(llm.chat_calls[1], list)
+    assert result["tables_successfully_processed"] == 4
+    assert result["total_pii_columns"] == 4
+    assert result["llm_batching"]["fallback_tables"] == 1
+
+
+def test_batching_off_by_default(narrow_schema, temp_config):
+    llm = PIIClassifyingLLMStub()
+
+    result = _helper_scan_schema_for_pii_logic(
+        narrow_schema, llm, "cat", "sch", show_progress=False
+    )
+
+    assert len(llm.chat_calls) == 4
+    assert "llm_batching" not in result
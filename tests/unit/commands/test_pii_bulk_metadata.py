@@ -0,0 +1,156 @@
+"""Tests for bulk Databricks column metadata in PII scans."""
+
+import threading
+from collections import Counter
+from unittest.mock import patch
+
+import pytest
+
+from chuck_data.clients.databricks import DatabricksAPIClient
+from chuck_data.commands.pii_tools import _helper_scan_schema_for_pii_logic
+from chuck_data.pii_cache import PIIClassificationCache
+from tests.fixtures.llm import PIIClassifyingLLMStub
+
+COLUMNS = [
+    {"name": "id", "type_name": "LONG"},
+    {"name": "email", "type_name": "STRING"},
+]
+
+
+class StubCatalogClient:
+    """Databricks client fake for one schema that counts its requests."""
+
+    def __init__(self, table_count, page_size=100):
+        self.names = [f"table_{i:04d}" for i in range(table_count)]
+        self.page_size = page_size
+        self.calls = Counter()
+        self.fail_sql = False
+        self._lock = threading.Lock()
+
+    def _request(self, kind):
+        with self._lock:
+            self.calls[kind] += 1
+
+    def list_tables(
+        self, catalog_name, schema_name, page_token=None, omit_columns=False, **kwargs
+    ):
+        self._request("list_tables")
+        start = int(page_token or 0)
+        end = start + self.page_size
+        tables = []
+        for name in self.names[start:end]:
+            table = {"name": name, "full_name": f"{catalog_name}.{schema_name}.{name}"}
+            if not omit_columns:
+                table["columns"] = [dict(c) for c in COLUMNS]
+            tables.append(table)
+        return {
+            "tables": tables,
+            "next_page_token": str(end) if end < len(self.names) else None,
+        }
+
+    def get_table(self, full_name, **kwargs):
+        self._request("get_table")
+        return {"full_name": full_name, "columns": [dict(c) for c in COLUMNS]}
+
+    def get_schema_columns(self, catalog_name, schema_name, warehouse_id):
+        self._request("sql")
+        if self.fail_sql:
+            raise ValueError("warehouse unavailable")
+        return {name: [dict(c) for c in COLUMNS] for name in self.names}
+
+
+def _scan(client, mode, tmp_path):
+    with patch("chuck_data.commands.pii_tools.get_warehouse_id", return_value="wh"):
+        return _helper_scan_schema_for_pii_logic(
+            client,
+            PIIClassifyingLLMStub(),
+            "main",
+            "sales",
+            show_progress=False,
+            pii_cache=PIIClassificationCache(str(tmp_path / f"{mode}.json")),
+            batch=False,
+            incremental=False,
+            use_async=False,
+            metadata_mode=mode,
+        )
+
+
+@pytest.mark.parametrize(
+    "mode, get_table_calls, sql_calls",
+    [("per_table", 25, 0), ("list_tables", 0, 0), ("information_schema", 0, 1)],
+)
+def test_metadata_modes_give_same_results(
+    mode, get_table_calls, sql_calls, tmp_path, temp_config
+):
+    client = StubCatalogClient(25, page_size=10)
+
+    result = _scan(client, mode, tmp_path)
+
+    assert result["tables_successfully_processed"] == 25
+    assert result["total_pii_columns"] == 25
+    assert client.calls["list_tables"] == 3
+    assert client.calls["get_table"] == get_table_calls
+    assert client.calls["sql"] == sql_calls
+
+
+def test_information_schema_failure_falls_back_to_per_table(tmp_path, temp_config):
+    client = StubCatalogClient(5)
+    client.fail_sql = True
+
+    result = _scan(client, "information_schema", tmp_path)
+
+    assert result["tables_successfully_processed"] == 5
+    assert client.calls["get_table"] == 5
+
+
+def test_get_schema_columns_reads_every_result_chunk():
+    client = DatabricksAPIClient("test-workspace", "fake-token", metadata_cache=False)
+    first = {
+        "status": {"state": "SUCCEEDED"},
+        "result": {
+            "data_array": [
+                ["customers", "id", "LONG", "bigint", "NO", "0"],
+                ["customers", "email", "STRING", "string", "YES", "1"],
+            ],
+            "next_chunk_internal_link": "/api/2.0/sql/statements/s1/result/chunks/1",
+        },
+    }
+    second = {"data_array": [["orders", "id", "LONG", "bigint", "NO", "0"]]}
+
+    with (
+        patch.object(client, "submit_sql_statement", return_value=first) as submit,
+        patch.object(client, "get", return_value=second) as get,
+    ):
+        columns = client.get_schema_columns("main", "o'brien", "wh")
+
+    sql_text = submit.call_args.kwargs["sql_text"]
+    assert "table_catalog = :catalog AND table_schema = :schema" in sql_text
+    assert "o'brien" not in sql_text
+    assert submit.call_args.kwargs["parameters"] == {
+        "catalog": "main",
+        "schema": "o'brien",
+    }
+    get.assert_called_once_with("/api/2.0/sql/statements/s1/result/chunks/1")
+    assert [c["name"] for c in columns["customers"]] == ["id", "email"]
+    assert columns["customers"][0] == {
+        "name": "id",
+        "type_name": "LONG",
+        "type_text": "bigint",
+        "nullable": False,
+        "position": 0,
+    }
+    assert list(columns) == ["customers", "orders"]
+
+
+def test_submit_sql_statement_sends_named_parameters():
+    client = DatabricksAPIClient("test-workspace", "fake-token", metadata_cache=False)
+    done = {"statement_id": "s1", "status": {"state": "SUCCEEDED"}}
+
+    with patch.object(client, "post", return_value=done) as post:
+        client.submit_sql_statement(
+            "SELECT :schema", "wh", parameters={"schema": "o'brien"}
+        )
+
+    assert post.call_args.args[1]["parameters"] == [
+        {"name": "schema", "value": "o'brien", "type": "STRING"}
+    ]
@@ -0,0 +1,162 @@
+"""Tests for adaptive PII scan concurrency."""
+
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from chuck_data.clients.statement_waiter import BackoffSchedule
+from chuck_data.commands.pii_tools import _helper_scan_schema_for_pii_logic
+from chuck_data.commands.scan_scheduler import (
+    AdaptiveLimiter,
+    ScanScheduler,
+    is_throttling_error,
+)
+
+
+class _RateLimited(Exception):
+    status_code = 429
+
+
+def test_is_throttling_error_recognises_common_shapes():
+    assert is_throttling_error(_RateLimited("slow down"))
+    assert is_throttling_error(Exception("Error: 429 Too Many Requests"))
+    assert is_throttling_error(Exception("ThrottlingException: Rate exceeded"))
+
+    client_error = Exception("boom")
+    client_error.response = {"Error": {"Code": "ThrottlingException"}}
+    assert is_throttling_error(client_error)
+
+    assert not is_throttling_error(ValueError("table not found"))
+    assert is_throttling_error(Exception("HTTP 429: slow down"))
+    assert is_throttling_error(Exception("429 Client Error for url: https://x"))
+    assert not is_throttling_error(ValueError("Table main.sales.orders_429 not found"))
+    assert not is_throttling_error(ValueError("Statement 01b2-429-af failed"))
+
+
+def test_limiter_grows_after_a_window_of_successes():
+    limiter = AdaptiveLimiter("llm", initial_limit=2, max_limit=4)
+
+    for _ in range(2):
+        with limiter.slot():
+            pass
+    assert limiter.limit == 3
+
+    for _ in range(20):
+        with limiter.slot():
+            pass
+    assert limiter.limit == 4
+
+
+def test_limiter_halves_on_throttling():
+    limiter = AdaptiveLimiter("llm", initial_limit=8, max_limit=16)
+
+    with pytest.raises(_RateLimited):
+        with limiter.slot():
+            raise _RateLimited()
+
+    assert limiter.limit == 4
+    assert limiter.stats()["throttled"] == 1
+
+
+def test_limiter_ignores_ordinary_errors():
+    limiter = AdaptiveLimiter("llm", initial_limit=4)
+
+    with pytest.raises(ValueError):
+        with limiter.slot():
+            raise ValueError("bad input")
+
+    assert limiter.limit == 4
+    assert limiter.stats()["failed"] == 1
+
+
+def test_limiter_backs_off_on_latency_spike():
+    limiter = AdaptiveLimiter("llm", initial_limit=16, max_limit=16)
+    for _ in range(10):
+        limiter.acquire()
+        limiter.release(0.1)
+
+    limiter.acquire()
+    limiter.release(1.0)
+
+    assert limiter.limit == 15
+
+
+def test_limiter_caps_in_flight_calls():
+    limiter = AdaptiveLimiter("llm", initial_limit=2, max_limit=2)
+    peak = 0
+    lock = threading.Lock()
+
+    def work():
+        nonlocal peak
+        with limiter.slot():
+            with lock:
+                peak = max(peak, limiter.in_flight)
+            time.sleep(0.01)
+
+    threads = [threading.Thread(target=work) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert peak == 2
+    stats = limiter.stats()
+    assert stats["completed"] == 8
+    assert stats["in_flight"] == 0
+    assert stats["p50_seconds"] is not None
+
+
+def test_scheduler_retries_throttled_calls():
+    scheduler = ScanScheduler(
+        llm_max_concurrency=4,
+        metadata_max_concurrency=4,
+        retry_schedule=BackoffSchedule(initial_delay=0, jitter=0),
+    )
+    fn = MagicMock(side_effect=[_RateLimited(), "ok"])
+
+    assert scheduler.run("llm", fn, "arg") == "ok"
+    assert fn.call_count == 2
+    assert scheduler.stats()["llm"]["throttled"] == 1
+
+
+def test_scheduler_does_not_retry_other_errors():
+    scheduler = ScanScheduler(llm_max_concurrency=4, metadata_max_concurrency=4)
+    fn = MagicMock(side_effect=ValueError("nope"))
+
+    with pytest.raises(ValueError):
+        scheduler.run("metadata", fn)
+    assert fn.call_count == 1
+
+
+def test_scheduler_limits_come_from_config(temp_config):
+    with (
+        patch("chuck_data.config.get_pii_scan_llm_concurrency", return_value=3),
+        patch("chuck_data.config.get_pii_scan_metadata_concurrency", return_value=9),
+    ):
+        scheduler = ScanScheduler()
+
+    assert scheduler.limiters["llm"].max_limit == 3
+    assert scheduler.limiters["metadata"].max_limit == 9
+    assert scheduler.max_workers == 9
+
+
+def test_schema_scan_reports_scheduler_stats(
+    databricks_client_stub, llm_client_stub, temp_config
+):
+    databricks_client_stub.add_catalog("cat")
+    databricks_client_stub.add_schema("cat", "sch")
+    for name in ("a", "b", "c"):
+        databricks_client_stub.add_table(
+            "cat", "sch", name, columns=[{"name": "email", "type_name": "string"}]
+        )
+    llm_client_stub.set_response_content('[{"name":"email","semantic":"email"}]')
+
+    result = _helper_scan_schema_for_pii_logic(
+        databricks_client_stub, llm_client_stub, "cat", "sch", show_progress=False
+    )
+
+    assert result["tables_successfully_processed"] == 3
+    assert result["scan_stats"]["llm"]["completed"] == 3
+    assert result["scan_stats"]["metadata"]["completed"] == 3
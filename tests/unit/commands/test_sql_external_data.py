@@ -0,0 +1,124 @@
+"""Tests for streaming and chunk-aware paging of external SQL results."""
+
+import csv
+import threading
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from chuck_data.commands.sql_external_data import (
+    ChunkedResultReader,
+    PaginatedSQLResult,
+    _iter_text_lines,
+    get_paginated_rows,
+)
+
+CHUNK_ROWS = 120
+
+
+def _links(count=3):
+    return [
+        {
+            "chunk_index": i,
+            "row_count": CHUNK_ROWS,
+            "external_link": f"https://example.com/{i}",
+        }
+        for i in range(count)
+    ]
+
+
+class FakeChunks:
+    """Stands in for fetch_chunk_data and records every download."""
+
+    def __init__(self):
+        self.downloads = []
+        self.lock = threading.Lock()
+
+    def __call__(self, links, chunk_index):
+        with self.lock:
+            self.downloads.append(chunk_index)
+        base = chunk_index * CHUNK_ROWS
+        return [[str(base + i)] for i in range(CHUNK_ROWS)]
+
+
+@pytest.fixture
+def fake_chunks():
+    fake = FakeChunks()
+    with patch("chuck_data.commands.sql_external_data.fetch_chunk_data", fake):
+        yield fake
+
+
+def test_paging_downloads_each_chunk_once(fake_chunks):
+    result = PaginatedSQLResult(["n"], _links(), 3 * CHUNK_ROWS, [])
+
+    seen = []
+    has_more = True
+    while has_more:
+        rows, has_more = result.get_next_page()
+        seen.extend(int(r[0]) for r in rows)
+    result.close()
+
+    assert seen == list(range(3 * CHUNK_ROWS))
+    assert sorted(fake_chunks.downloads) == [0, 1, 2]
+
+
+def test_random_access_rows_do_not_move_the_page_position(fake_chunks):
+    result = PaginatedSQLResult(["n"], _links(), 3 * CHUNK_ROWS, [], prefetch=False)
+
+    assert result.get_rows(CHUNK_ROWS * 2 + 5, 2) == [["245"], ["246"]]
+    assert result.get_rows(3 * CHUNK_ROWS, 10) == []
+    rows, _ = result.get_next_page()
+    result.close()
+
+    assert rows[0] == ["0"]
+
+
+def test_next_chunk_is_prefetched(fake_chunks):
+    reader = ChunkedResultReader(_links(), prefetch=True)
+
+    reader.get_rows(0, 50)
+    with reader._lock:
+        pending = list(reader._pending.values())
+    for future in pending:
+        future.result(timeout=5)
+
+    assert fake_chunks.downloads == [0, 1]
+    assert reader.get_rows(CHUNK_ROWS, 1) == [[str(CHUNK_ROWS)]]
+    assert fake_chunks.downloads == [0, 1]
+    reader.close()
+
+
+def test_cache_is_bounded(fake_chunks):
+    reader = ChunkedResultReader(_links(5), max_cached_chunks=2, prefetch=False)
+
+    for start in range(0, 5 * CHUNK_ROWS, 50):
+        reader.get_rows(start, 50)
+        assert len(reader._cache) <= 2
+
+    assert fake_chunks.downloads == [0, 1, 2, 3, 4]
+
+
+def test_failed_chunk_is_skipped(fake_chunks):
+    def flaky(links, chunk_index):
+        if chunk_index == 1:
+            raise RuntimeError("expired link")
+        return fake_chunks(links, chunk_index)
+
+    with patch("chuck_data.commands.sql_external_data.fetch_chunk_data", flaky):
+        rows = get_paginated_rows(_links(), CHUNK_ROWS - 10, 150)
+
+    assert [r[0] for r in rows] == [str(i) for i in range(110, 120)] + [
+        str(i) for i in range(240, 260)
+    ]
+
+
+def test_streamed_lines_survive_block_boundaries():
+    body = 'id,note\n1,"multi\nline"\n2,café\r\n'.encode("utf-8")
+    response = MagicMock()
+    response.headers = {"Content-Type": "text/csv"}
+    # Split inside the quoted field and inside the two-byte "é"
+    response.iter_content.return_value = [body[:14], body[14:29], body[29:]]
+
+    rows = list(csv.reader(_iter_text_lines(response)))
+
+    assert rows == [["id", "note"], ["1", "multi\nline"], ["2", "café"]]
@@ -1208,7 +1208,7 @@ class TestMultiCatalogSupport:
         databricks_client_stub.add_schema("catalog1", "schema2")
 
         # Mock PII scan for first location
-        def pii_scan_side_effect(client, llm, catalog, schema):
+        def pii_scan_side_effect(client, llm, catalog, schema, **kwargs):
             if catalog == "catalog1" and schema == "schema1":
                 return {
                     "results_detail": [
@@ -1302,7 +1302,7 @@ class TestMultiCatalogSupport:
         databricks_client_stub.add_schema("catalog1", "schema1")
 
         # Mock PII scan for successful location
-        def pii_scan_side_effect(client, llm, catalog, schema):
+        def pii_scan_side_effect(client, llm, catalog, schema, **kwargs):
             if catalog == "catalog1" and schema == "schema1":
                 return {
                     "results_detail": [
@@ -1493,7 +1493,7 @@ class TestMultiCatalogSupport:
         databricks_client_stub.add_schema("catalog2", "schema1")
 
         # Mock PII scan
-        def pii_scan_side_effect(client, llm, catalog, schema):
+        def pii_scan_side_effect(client, llm, catalog, schema, **kwargs):
             return {
                 "results_detail": [
                     {
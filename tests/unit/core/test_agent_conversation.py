@@ -0,0 +1,146 @@
+"""Tests for agent conversation history handling."""
+
+import json
+from unittest.mock import MagicMock, patch
+
+from chuck_data.agent import AgentManager
+from chuck_data.agent.conversation import (
+    compact_tool_result,
+    context_breakdown,
+    estimate_message_tokens,
+    sanitize_message,
+    with_system_context,
+)
+from tests.fixtures.llm import MockToolCall
+
+
+def _response(content=None, tool_calls=None):
+    response = MagicMock()
+    response.choices[0].message.content = content
+    response.choices[0].message.tool_calls = tool_calls
+    return response
+
+
+def test_sanitize_fills_empty_user_and_plain_assistant_content():
+    assert sanitize_message({"role": "user", "content": ""})["content"] == " "
+    assert sanitize_message({"role": "assistant", "content": None})["content"] == " "
+
+    tool_call_msg = {"role": "assistant", "content": None, "tool_calls": [{}]}
+    assert sanitize_message(tool_call_msg)["content"] is None
+
+
+def test_with_system_context_shares_every_other_message():
+    history = [
+        {"role": "system", "content": "base"},
+        {"role": "user", "content": "hi"},
+    ]
+
+    messages = with_system_context(history, 0, "base + context")
+
+    assert messages[0] == {"role": "system", "content": "base + context"}
+    assert history[0]["content"] == "base"
+    assert messages[1] is history[1]
+
+
+def test_small_tool_result_is_stored_verbatim():
+    content, truncated = compact_tool_result({"tables": [{"name": "a"}]}, 100)
+
+    assert json.loads(content) == {"tables": [{"name": "a"}]}
+    assert truncated is False
+
+
+def test_large_list_result_keeps_a_prefix_within_budget():
+    result = {"catalog": "main", "tables": [{"name": f"t{i}" * 10} for i in range(500)]}
+
+    content, truncated = compact_tool_result(result, 500)
+
+    compacted = json.loads(content)
+    assert truncated is True
+    assert len(content) // 4 <= 500
+    assert compacted["catalog"] == "main"
+    assert compacted["tables"] == result["tables"][: compacted["_truncated"]["shown"]]
+    assert compacted["_truncated"]["total"] == 500
+    assert compacted["_truncated"]["field"] == "tables"
+
+
+def test_large_non_list_result_is_cut_as_text():
+    content, truncated = compact_tool_result({"text": "x" * 10_000}, 100)
+
+    assert truncated is True
+    assert content.endswith("characters of tool output]")
+    assert len(content) < 500
+
+
+def test_context_breakdown_counts_tool_call_arguments():
+    messages = [
+        {"role": "system", "content": "s" * 400},
+        {
+            "role": "assistant",
+            "content": None,
+            "tool_calls": [{"function": {"name": "list", "arguments": "a" * 40}}],
+        },
+        {"role": "tool", "name": "list", "content": "r" * 800},
+    ]
+
+    breakdown = context_breakdown(messages, top=1)
+
+    assert [m["tokens"] for m in breakdown["messages"]] == [100, 11, 200]
+    assert breakdown["total_tokens"] == 311
+    assert breakdown["by_role"]["tool"] == 200
+    assert breakdown["largest"][0]["name"] == "list"
+    assert estimate_message_tokens(messages[2]) == 200
+
+
+def test_agent_compacts_large_tool_output_and_keeps_full_copy():
+    rows = [{"name": f"table_{i}", "comment": "x" * 50} for i in range(2000)]
+    llm = MagicMock()
+    llm.chat.side_effect = [
+        _response(tool_calls=[MockToolCall(id="call-1", name="list_tables")]),
+        _response(content="Done"),
+    ]
+
+    with (
+        patch("chuck_data.agent.manager.get_data_provider", return_value=None),
+        patch(
+            "chuck_data.agent.tool_executor.execute_tool",
+            return_value={"tables": rows},
+        ),
+        patch(
+            "chuck_data.agent.manager.get_agent_tool_output_token_budget",
+            return_value=1000,
+        ),
+    ):
+        agent = AgentManager(MagicMock(), llm_client=llm)
+        agent.add_user_message("List tables")
+        assert agent.process_with_tools(tools=[]) == "Done"
+
+    tool_message = agent.conversation_history[3]
+    assert tool_message["role"] == "tool"
+    assert len(tool_message["content"]) // 4 <= 1000
+    assert json.loads(tool_message["content"])["_truncated"]["total"] == 2000
+    assert agent.full_tool_outputs["call-1"]["tables"] == rows
+
+
+def test_agent_does_not_copy_history_messages_per_call():
+    llm = MagicMock()
+    llm.chat.return_value = _response(content="Hi")
+
+    with patch("chuck_data.agent.manager.get_data_provider", return_value=None):
+        agent = AgentManager(MagicMock(), llm_client=llm)
+        agent.add_user_message("Hello")
+        user_message = agent.conversation_history[1]
+        agent.process_with_tools(tools=[])
+
+    sent = llm.chat.call_args.kwargs["messages"]
+    assert sent[1] is user_message
+    assert "--- CURRENT CONTEXT ---" in sent[0]["content"]
+    assert "--- CURRENT CONTEXT ---" not in agent.conversation_history[0]["content"]
+
+
+def test_assigned_history_is_sanitized_once():
+    with patch("chuck_data.agent.manager.get_data_provider", return_value=None):
+        agent = AgentManager(MagicMock(), llm_client=MagicMock())
+
+    agent.conversation_history = [{"role": "user", "content": ""}]
+
+    assert agent.conversation_history[0]["content"] == " "
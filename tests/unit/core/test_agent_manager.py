@@ -8,7 +8,10 @@ from unittest.mock import patch, MagicMock
 
 # Mock the optional openai dependency used by LLMClient if it is not
 # installed. This prevents import errors during test collection.
-sys.modules.setdefault("openai", MagicMock())
+try:
+    import openai  # noqa: F401
+except ImportError:
+    sys.modules.setdefault("openai", MagicMock())
 
 from chuck_data.agent import AgentManager  # noqa: E402
 from tests.fixtures.llm import LLMClientStub, MockToolCall  # noqa: E402
@@ -46,7 +49,7 @@ def agent_manager_setup(mock_api_client, llm_client_stub):
             return_value=llm_client_stub,
         ) as mock_llm_factory,
         patch("chuck_data.agent.manager.get_tool_schemas") as mock_get_schemas,
-        patch("chuck_data.agent.manager.execute_tool") as mock_execute_tool,
+        patch("chuck_data.agent.tool_executor.execute_tool") as mock_execute_tool,
     ):
 
         agent_manager = AgentManager(mock_api_client, model="test-model")
@@ -2,6 +2,10 @@
 Tests for the catalogs module.
 """
 
+import threading
+
+import pytest
+
 from chuck_data.catalogs import (
     list_catalogs,
     get_catalog,
@@ -9,9 +13,36 @@ from chuck_data.catalogs import (
     get_schema,
     list_tables,
     get_table,
+    iter_tables,
+    iter_tables_in_schemas,
 )
 
 
+class PagedTablesClient:
+    """Client fake whose list_tables returns page_size tables per page."""
+
+    def __init__(self, tables_by_schema, page_size=2):
+        self.tables_by_schema = tables_by_schema
+        self.page_size = page_size
+        self.page_tokens = []
+        self.failing_schemas = set()
+        self.page_fetched = threading.Event()
+
+    def list_tables(self, catalog_name, schema_name, page_token=None, **kwargs):
+        if schema_name in self.failing_schemas:
+            raise ValueError(f"cannot list {schema_name}")
+        self.page_tokens.append(page_token)
+        if page_token:
+            self.page_fetched.set()
+        names = self.tables_by_schema[schema_name]
+        start = int(page_token or 0)
+        end = start + self.page_size
+        return {
+            "tables": [{"name": n} for n in names[start:end]],
+            "next_page_token": str(end) if end < len(names) else None,
+        }
+
+
 def test_list_catalogs_no_params(databricks_client_stub):
     """Test listing catalogs with no parameters."""
     # Set up stub data
@@ -220,3 +251,76 @@ def test_get_table_all_params(databricks_client_stub):
     assert len(databricks_client_stub.get_table_calls) == 1
     call_args = databricks_client_stub.get_table_calls[0]
     assert call_args == ("test_catalog.test_schema.test_table", True, True, True)
+
+
+def test_iter_tables_follows_next_page_token():
+    """Every page is read, not just the first."""
+    client = PagedTablesClient({"sales": [f"t{i}" for i in range(5)]})
+
+    names = [t["name"] for t in iter_tables(client, "main", "sales")]
+
+    assert names == ["t0", "t1", "t2", "t3", "t4"]
+    assert client.page_tokens == [None, "2", "4"]
+
+
+def test_iter_tables_prefetches_next_page_while_consuming():
+    """The next page loads while the caller is still on the current one."""
+    client = PagedTablesClient({"sales": ["a", "b", "c"]})
+    tables = iter_tables(client, "main", "sales")
+
+    assert next(tables)["name"] == "a"
+    assert client.page_fetched.wait(timeout=5)
+    assert [t["name"] for t in tables] == ["b", "c"]
+
+
+def test_iter_tables_stops_on_repeated_page_token():
+    """A server returning the same token twice does not loop forever."""
+
+    class RepeatingClient:
+        def list_tables(self, catalog_name, schema_name, page_token=None, **kwargs):
+            return {"tables": [{"name": "t"}], "next_page_token": "same"}
+
+    assert len(list(iter_tables(RepeatingClient(), "main", "sales"))) == 2
+
+
+def test_iter_tables_in_schemas_lists_schemas_concurrently():
+    """Schemas are listed at the same time and every table is yielded once."""
+    barrier = threading.Barrier(3, timeout=5)
+
+    class BarrierClient(PagedTablesClient):
+        def list_tables(self, catalog_name, schema_name, page_token=None, **kwargs):
+            if page_token is None:
+                barrier.wait()
+            return super().list_tables(catalog_name, schema_name, page_token)
+
+    client = BarrierClient({"a": ["a1", "a2", "a3"], "b": ["b1"], "c": []})
+
+    listed = sorted(
+        (schema, table["name"])
+        for _, schema, table in iter_tables_in_schemas(
+            client, [("main", "a"), ("main", "b"), ("main", "c")]
+        )
+    )
+
+    assert listed == [("a", "a1"), ("a", "a2"), ("a", "a3"), ("b", "b1")]
+
+
+def test_iter_tables_in_schemas_reports_failures():
+    """With on_error, a failing schema does not stop the others."""
+    client = PagedTablesClient({"a": ["a1"], "b": ["b1"]})
+    client.failing_schemas.add("b")
+    errors = []
+
+    listed = list(
+        iter_tables_in_schemas(
+            client,
+            [("main", "a"), ("main", "b")],
+            on_error=lambda c, s, e: errors.append(s),
+        )
+    )
+
+    assert [t["name"] for _, _, t in listed] == ["a1"]
+    assert errors == ["b"]
+
+    with pytest.raises(ValueError):
+        list(iter_tables_in_schemas(client, [("main", "a"), ("main", "b")]))
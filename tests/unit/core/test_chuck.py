@@ -5,7 +5,7 @@ import io
 from unittest.mock import patch, MagicMock
 
 
-@patch("chuck_data.__main__.ChuckTUI")
+@patch("chuck_data.ui.tui.ChuckTUI")
 @patch("chuck_data.__main__.setup_logging")
 def test_main_runs_tui(mock_setup_logging, mock_chuck_tui):
     """Test that the main function calls ChuckTUI.run()."""
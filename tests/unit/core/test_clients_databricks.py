@@ -65,7 +65,7 @@ def test_gcp_domain_detection_and_url_construction():
     assert gcp_client.workspace_url == "workspace"
 
 
-@patch("chuck_data.clients.databricks.requests.get")
+@patch("requests.Session.get")
 def test_get_success(mock_get, databricks_api_client):
     """Test successful GET request."""
     mock_response = MagicMock()
@@ -83,7 +83,7 @@ def test_get_success(mock_get, databricks_api_client):
     )
 
 
-@patch("chuck_data.clients.databricks.requests.get")
+@patch("requests.Session.get")
 def test_get_http_error(mock_get, databricks_api_client):
     """Test GET request with HTTP error."""
     mock_response = MagicMock()
@@ -100,7 +100,7 @@ def test_get_http_error(mock_get, databricks_api_client):
     assert "Not Found" in str(exc_info.value)
 
 
-@patch("chuck_data.clients.databricks.requests.get")
+@patch("requests.Session.get")
 def test_get_connection_error(mock_get, databricks_api_client):
     """Test GET request with connection error."""
     mock_get.side_effect = requests.exceptions.ConnectionError("Connection failed")
@@ -111,7 +111,7 @@ def test_get_connection_error(mock_get, databricks_api_client):
     assert "Connection error occurred" in str(exc_info.value)
 
 
-@patch("chuck_data.clients.databricks.requests.post")
+@patch("requests.Session.post")
 def test_post_success(mock_post, databricks_api_client):
     """Test successful POST request."""
     mock_response = MagicMock()
@@ -130,7 +130,7 @@ def test_post_success(mock_post, databricks_api_client):
     )
 
 
-@patch("chuck_data.clients.databricks.requests.post")
+@patch("requests.Session.post")
 def test_post_http_error(mock_post, databricks_api_client):
     """Test POST request with HTTP error."""
     mock_response = MagicMock()
@@ -147,7 +147,7 @@ def test_post_http_error(mock_post, databricks_api_client):
     assert "Bad Request" in str(exc_info.value)
 
 
-@patch("chuck_data.clients.databricks.requests.post")
+@patch("requests.Session.post")
 def test_post_connection_error(mock_post, databricks_api_client):
     """Test POST request with connection error."""
     mock_post.side_effect = requests.exceptions.ConnectionError("Connection failed")
@@ -63,7 +63,7 @@ def test_base_domain_map():
         assert client._get_base_domain() == domain
 
 
-@patch("requests.get")
+@patch("requests.Session.get")
 def test_azure_get_request_url(mock_get):
     """Test that Azure client constructs correct URLs for GET requests."""
     azure_client = DatabricksAPIClient(
@@ -240,7 +240,7 @@ def test_job_submission_without_instance_profile_arn(mock_post):
     # Base API request tests
 
 
-@patch("requests.get")
+@patch("requests.Session.get")
 def test_get_success(mock_get, client):
     """Test successful GET request."""
     mock_response = MagicMock()
@@ -258,7 +258,7 @@ def test_get_success(mock_get, client):
     )
 
 
-@patch("requests.get")
+@patch("requests.Session.get")
 def test_get_http_error(mock_get, client):
     """Test GET request with HTTP error."""
     mock_response = MagicMock()
@@ -275,7 +275,7 @@ def test_get_http_error(mock_get, client):
     assert "Not Found" in str(exc_info.value)
 
 
-@patch("requests.get")
+@patch("requests.Session.get")
 def test_get_connection_error(mock_get, client):
     """Test GET request with connection error."""
     mock_get.side_effect = requests.exceptions.ConnectionError("Connection failed")
@@ -286,7 +286,7 @@ def test_get_connection_error(mock_get, client):
     assert "Connection error occurred" in str(exc_info.value)
 
 
-@patch("requests.post")
+@patch("requests.Session.post")
 def test_post_success(mock_post, client):
     """Test successful POST request."""
     mock_response = MagicMock()
@@ -305,7 +305,7 @@ def test_post_success(mock_post, client):
     )
 
 
-@patch("requests.post")
+@patch("requests.Session.post")
 def test_post_http_error(mock_post, client):
     """Test POST request with HTTP error."""
     mock_response = MagicMock()
@@ -322,7 +322,7 @@ def test_post_http_error(mock_post, client):
     assert "Bad Request" in str(exc_info.value)
 
 
-@patch("requests.post")
+@patch("requests.Session.post")
 def test_post_connection_error(mock_post, client):
     """Test POST request with connection error."""
     mock_post.side_effect = requests.exceptions.ConnectionError("Connection failed")
@@ -392,7 +392,7 @@ def test_get_catalog(mock_get, client):
     # File system method tests
 
 
-@patch("requests.put")
+@patch("requests.Session.put")
 def test_upload_file_with_content(mock_put, client):
     """Test successful file upload with content."""
     mock_response = MagicMock()
@@ -415,7 +415,7 @@ def test_upload_file_with_content(mock_put, client):
 
 
 @patch("builtins.open", new_callable=mock_open, read_data=b"file content")
-@patch("requests.put")
+@patch("requests.Session.put")
 def test_upload_file_with_file_path(mock_put, mock_file, client):
     """Test successful file upload with file path."""
     mock_response = MagicMock()
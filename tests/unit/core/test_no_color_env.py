@@ -5,7 +5,7 @@ from unittest.mock import patch, MagicMock
 import chuck_data.__main__ as chuck
 
 
-@patch("chuck_data.__main__.ChuckTUI")
+@patch("chuck_data.ui.tui.ChuckTUI")
 @patch("chuck_data.__main__.setup_logging")
 def test_default_color_mode(mock_setup_logging, mock_chuck_tui):
     """Test that default mode passes no_color=False to ChuckTUI constructor."""
@@ -21,7 +21,7 @@ def test_default_color_mode(mock_setup_logging, mock_chuck_tui):
     mock_tui_instance.run.assert_called_once()
 
 
-@patch("chuck_data.__main__.ChuckTUI")
+@patch("chuck_data.ui.tui.ChuckTUI")
 @patch("chuck_data.__main__.setup_logging")
 def test_no_color_env_var_1(mock_setup_logging, mock_chuck_tui, monkeypatch):
     """Test that NO_COLOR=1 enables no-color mode."""
@@ -38,7 +38,7 @@ def test_no_color_env_var_1(mock_setup_logging, mock_chuck_tui, monkeypatch):
     mock_chuck_tui.assert_called_once_with(no_color=True)
 
 
-@patch("chuck_data.__main__.ChuckTUI")
+@patch("chuck_data.ui.tui.ChuckTUI")
 @patch("chuck_data.__main__.setup_logging")
 def test_no_color_env_var_true(mock_setup_logging, mock_chuck_tui, monkeypatch):
     """Test that NO_COLOR=true enables no-color mode."""
@@ -55,7 +55,7 @@ def test_no_color_env_var_true(mock_setup_logging, mock_chuck_tui, monkeypatch):
     mock_chuck_tui.assert_called_once_with(no_color=True)
 
 
-@patch("chuck_data.__main__.ChuckTUI")
+@patch("chuck_data.ui.tui.ChuckTUI")
 @patch("chuck_data.__main__.setup_logging")
 def test_no_color_flag(mock_setup_logging, mock_chuck_tui):
     """The --no-color flag forces no_color=True."""
@@ -0,0 +1,144 @@
+"""Tests for concurrent execution of side-effect-free agent tool calls."""
+
+import threading
+
+import pytest
+
+from chuck_data.agent.tool_executor import execute_tool_calls
+from chuck_data.command_registry import COMMAND_REGISTRY, CommandDefinition
+from chuck_data.commands.base import CommandResult
+from chuck_data.exceptions import PaginationCancelled
+
+
+class Recorder:
+    """Tracks how many handlers run at once and in what order they finish."""
+
+    def __init__(self, parties):
+        self.lock = threading.Lock()
+        self.in_flight = 0
+        self.peak_in_flight = 0
+        self.events = []
+        # Read-only handlers wait here until all of them have started
+        self.barrier = threading.Barrier(parties, timeout=5)
+
+    def read(self, client, name=None, tool_output_callback=None, **kwargs):
+        with self.lock:
+            self.in_flight += 1
+            self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+        try:
+            self.barrier.wait()
+        finally:
+            with self.lock:
+                self.in_flight -= 1
+                self.events.append(("read", name))
+        if tool_output_callback:
+            tool_output_callback("test_read", {"name": name})
+        return CommandResult(True, data={"name": name})
+
+    def write(self, client, name=None, **kwargs):
+        with self.lock:
+            self.events.append(("write", name))
+        return CommandResult(True, data={"written": name})
+
+
+@pytest.fixture
+def recorder():
+    return Recorder(parties=3)
+
+
+@pytest.fixture
+def registered_tools(recorder):
+    definitions = [
+        CommandDefinition(
+            name="test_read",
+            description="Read-only test tool",
+            handler=recorder.read,
+            parameters={"name": {"type": "string"}},
+            needs_api_client=False,
+            side_effect_free=True,
+        ),
+        CommandDefinition(
+            name="test_write",
+            description="Mutating test tool",
+            handler=recorder.write,
+            parameters={"name": {"type": "string"}},
+            needs_api_client=False,
+        ),
+    ]
+    for definition in definitions:
+        COMMAND_REGISTRY[definition.name] = definition
+    yield
+    for definition in definitions:
+        COMMAND_REGISTRY.pop(definition.name, None)
+
+
+def test_side_effect_free_calls_run_concurrently(recorder, registered_tools):
+    calls = [("test_read", {"name": n}) for n in ("a", "b", "c")]
+
+    results = execute_tool_calls(None, calls)
+
+    assert recorder.peak_in_flight == 3
+    assert results == [{"name": "a"}, {"name": "b"}, {"name": "c"}]
+
+
+def test_mutating_calls_are_barriers(registered_tools):
+    recorder = Recorder(parties=1)
+    COMMAND_REGISTRY["test_read"].handler = recorder.read
+    COMMAND_REGISTRY["test_write"].handler = recorder.write
+    calls = [
+        ("test_read", {"name": "a"}),
+        ("test_write", {"name": "w"}),
+        ("test_read", {"name": "b"}),
+    ]
+
+    results = execute_tool_calls(None, calls)
+
+    assert recorder.events == [("read", "a"), ("write", "w"), ("read", "b")]
+    assert results[1] == {"written": "w"}
+
+
+def test_buffered_output_is_replayed_in_call_order(recorder, registered_tools):
+    displayed = []
+    calls = [("test_read", {"name": n}) for n in ("a", "b", "c")]
+
+    execute_tool_calls(
+        None, calls, output_callback=lambda tool, data: displayed.append(data)
+    )
+
+    # Each call reports once from its handler and once from execute_tool
+    assert displayed == [{"name": n} for n in ("a", "a", "b", "b", "c", "c")]
+
+
+def test_pagination_cancel_during_replay_propagates(recorder, registered_tools):
+    def cancel(tool, data):
+        raise PaginationCancelled()
+
+    calls = [("test_read", {"name": n}) for n in ("a", "b", "c")]
+
+    with pytest.raises(PaginationCancelled):
+        execute_tool_calls(None, calls, output_callback=cancel)
+
+
+def test_a_failing_call_does_not_hide_other_results(registered_tools):
+    from unittest.mock import patch
+
+    from chuck_data.agent import tool_executor
+
+    real_execute_tool = tool_executor.execute_tool
+
+    def execute_tool(client, name, args, callback=None):
+        if args.get("name") == "boom":
+            raise RuntimeError("registry unavailable")
+        return real_execute_tool(client, name, args, callback)
+
+    calls = [
+        ("test_write", {"name": "w1"}),
+        ("test_write", {"name": "boom"}),
+        ("test_write", {"name": "w2"}),
+    ]
+    with patch.object(tool_executor, "execute_tool", side_effect=execute_tool):
+        results = execute_tool_calls(None, calls)
+
+    assert results[0] == {"written": "w1"}
+    assert "registry unavailable" in results[1]["error"]
+    assert results[2] == {"written": "w2"}
@@ -3,7 +3,7 @@ Tests for the profiler module.
 """
 
 import pytest
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 from chuck_data.profiler import (
     list_tables,
     query_llm,
@@ -19,7 +19,7 @@ def warehouse_id():
     return "warehouse-123"
 
 
-@patch("chuck_data.profiler.time.sleep")
+@patch("chuck_data.clients.statement_waiter.time.sleep")
 def test_list_tables(mock_sleep, databricks_client_stub, warehouse_id):
     """Test listing tables."""
     # Set up external API responses
@@ -59,7 +59,7 @@ def test_list_tables(mock_sleep, databricks_client_stub, warehouse_id):
     databricks_client_stub.get.assert_called_once()
 
 
-@patch("chuck_data.profiler.time.sleep")
+@patch("chuck_data.clients.statement_waiter.time.sleep")
 def test_list_tables_polling(mock_sleep, databricks_client_stub, warehouse_id):
     """Test polling behavior when listing tables."""
     # Set up external API responses
@@ -87,7 +87,7 @@ def test_list_tables_polling(mock_sleep, databricks_client_stub, warehouse_id):
     assert result[0]["table_name"] == "table1"
 
 
-@patch("chuck_data.profiler.time.sleep")
+@patch("chuck_data.clients.statement_waiter.time.sleep")
 def test_list_tables_failed_query(mock_sleep, databricks_client_stub, warehouse_id):
     """Test list tables with failed SQL query."""
     # Set up external API responses
@@ -101,6 +101,27 @@ def test_list_tables_failed_query(mock_sleep, databricks_client_stub, warehouse_
     assert result == []
 
 
+@patch("chuck_data.clients.statement_waiter.time.sleep")
+def test_list_tables_finished_on_submit(
+    mock_sleep, databricks_client_stub, warehouse_id
+):
+    """A statement that finished within the server-side wait is not polled."""
+    databricks_client_stub.post.return_value = {
+        "statement_id": "stmt-123",
+        "status": {"state": "SUCCEEDED"},
+        "result": {"data": [["table1", "catalog1", "schema1"]]},
+    }
+    databricks_client_stub.get = MagicMock()
+
+    result = list_tables(databricks_client_stub, warehouse_id)
+
+    databricks_client_stub.get.assert_not_called()
+    mock_sleep.assert_not_called()
+    assert result == [
+        {"table_name": "table1", "catalog_name": "catalog1", "schema_name": "schema1"}
+    ]
+
+
 def test_generate_manifest():
     """Test generating a manifest."""
     # Test data
@@ -123,7 +144,7 @@ def test_generate_manifest():
     assert "profiling_timestamp" in result
 
 
-@patch("chuck_data.profiler.time.sleep")
+@patch("chuck_data.clients.statement_waiter.time.sleep")
 @patch("chuck_data.profiler.base64.b64encode")
 def test_store_manifest(mock_b64encode, mock_sleep, databricks_client_stub):
     """Test storing a manifest."""
@@ -148,7 +169,7 @@ def test_store_manifest(mock_b64encode, mock_sleep, databricks_client_stub):
     assert databricks_client_stub.post.call_args[0][1]["path"] == manifest_path
 
 
-@patch("chuck_data.profiler.time.sleep")
+@patch("chuck_data.clients.statement_waiter.time.sleep")
 def test_profile_table_success(mock_sleep, databricks_client_stub, warehouse_id):
     """Test successfully profiling a table."""
     # Use real profiler logic with external API stubbing
@@ -0,0 +1,112 @@
+"""Import-time checks and benchmark for chuck startup."""
+
+import os
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).resolve().parents[3]
+
+# Provider SDKs only needed once a provider is actually used
+HEAVY_MODULES = ("boto3", "botocore.session", "openai", "snowflake.connector")
+
+# What runs before the first prompt: the TUI module and command metadata
+FIRST_PROMPT_SCRIPT = """
+import chuck_data.ui.tui
+from chuck_data.command_registry import get_user_commands
+get_user_commands()
+"""
+
+
+def _run_python(args, cwd, extra_env=None):
+    env = dict(os.environ, PYTHONPATH=str(PROJECT_ROOT))
+    env.update(extra_env or {})
+    return subprocess.run(
+        [sys.executable, *args],
+        cwd=cwd,
+        env=env,
+        capture_output=True,
+        text=True,
+        timeout=120,
+    )
+
+
+def _loaded_modules(script, cwd):
+    """Which heavy or startup-sensitive modules a script leaves imported."""
+    watched = HEAVY_MODULES + ("chuck_data.commands.scan_pii", "chuck_data.ui.tui")
+    probe = (
+        f"{script}\nimport sys\n"
+        f"print('loaded:' + ','.join(m for m in {watched!r} if m in sys.modules))"
+    )
+    result = _run_python(["-c", probe], cwd)
+    assert result.returncode == 0, result.stderr
+    # The script may print too (e.g. --version), so find the probe's own line
+    report = [line for line in result.stdout.splitlines() if line.startswith("loaded:")]
+    assert report, result.stdout
+    return [m for m in report[-1][len("loaded:") :].split(",") if m]
+
+
+def test_importing_chuck_data_registers_nothing(tmp_path):
+    assert _loaded_modules("import chuck_data", tmp_path) == []
+
+
+def test_version_flag_skips_tui_and_commands(tmp_path):
+    script = (
+        "from chuck_data.__main__ import main\n"
+        "try:\n    main(['--version'])\nexcept SystemExit:\n    pass"
+    )
+
+    assert _loaded_modules(script, tmp_path) == []
+
+
+def test_first_prompt_does_not_import_provider_sdks(tmp_path):
+    loaded = _loaded_modules(FIRST_PROMPT_SCRIPT, tmp_path)
+
+    assert "chuck_data.commands.scan_pii" in loaded
+    assert not set(loaded) & set(HEAVY_MODULES)
+
+
+def test_version_command_runs(tmp_path):
+    result = _run_python(["-m", "chuck_data", "--version"], tmp_path)
+
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.strip()
+
+
+def _import_times(args, cwd):
+    """Wall-clock seconds and the slowest top-level imports of a python run."""
+    started = time.perf_counter()
+    result = _run_python(["-X", "importtime", *args], cwd)
+    elapsed = time.perf_counter() - started
+    assert result.returncode == 0, result.stderr
+
+    # -X importtime lines: "import time: self [us] | cumulative | imported package"
+    top_level = []
+    for line in result.stderr.splitlines():
+        parts = line.split("|")
+        if line.startswith("import time:") and len(parts) == 3:
+            name = parts[2].rstrip()
+            if not name.startswith(" " * 2) and parts[1].strip().isdigit():
+                top_level.append((int(parts[1]) / 1e6, name.strip()))
+    return elapsed, sorted(top_level, reverse=True)[:5]
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize(
+    "label, args, budget",
+    [
+        ("chuck --version", ["-m", "chuck_data", "--version"], 3.0),
+        ("time to first prompt", ["-c", FIRST_PROMPT_SCRIPT], 6.0),
+    ],
+)
+def test_benchmark_startup_import_time(label, args, budget, tmp_path):
+    """Report startup time and the slowest imports (--run-benchmarks -s)."""
+    elapsed, slowest = _import_times(args, tmp_path)
+
+    print(f"\n{label}: {elapsed:.3f}s")
+    for seconds, module in slowest:
+        print(f"  {seconds:.3f}s  {module}")
+    assert elapsed < budget
@@ -46,7 +46,7 @@ def test_build_query_params_multiple_params():
     assert len(result.split("&")) == 3
 
 
-@patch("chuck_data.utils.time.sleep")  # Mock sleep to speed up test
+@patch("chuck_data.clients.statement_waiter.time.sleep")  # Mock sleep to speed up test
 def test_execute_sql_statement_success(mock_sleep):
     """Test successful SQL statement execution."""
     # Create mock client
@@ -70,7 +70,7 @@ def test_execute_sql_statement_success(mock_sleep):
     assert result == {"data": [["row1"], ["row2"]]}
 
 
-@patch("chuck_data.utils.time.sleep")  # Mock sleep to speed up test
+@patch("chuck_data.clients.statement_waiter.time.sleep")  # Mock sleep to speed up test
 def test_execute_sql_statement_with_catalog(mock_sleep):
     """Test SQL statement execution with catalog parameter."""
     # Create mock client
@@ -93,7 +93,7 @@ def test_execute_sql_statement_with_catalog(mock_sleep):
     assert post_args.get("catalog") == "test-catalog"
 
 
-@patch("chuck_data.utils.time.sleep")  # Mock sleep to speed up test
+@patch("chuck_data.clients.statement_waiter.time.sleep")  # Mock sleep to speed up test
 def test_execute_sql_statement_with_custom_timeout(mock_sleep):
     """Test SQL statement execution with custom timeout."""
     # Create mock client
@@ -120,7 +120,7 @@ def test_execute_sql_statement_with_custom_timeout(mock_sleep):
     assert post_args.get("wait_timeout") == custom_timeout
 
 
-@patch("chuck_data.utils.time.sleep")  # Mock sleep to speed up test
+@patch("chuck_data.clients.statement_waiter.time.sleep")  # Mock sleep to speed up test
 def test_execute_sql_statement_polling(mock_sleep):
     """Test SQL statement execution with polling."""
     # Create mock client
@@ -143,11 +143,27 @@ def test_execute_sql_statement_polling(mock_sleep):
     assert mock_client.get.call_count == 3
 
     # Verify sleep was called twice (once for each non-complete state)
-    mock_sleep.assert_called_with(1)
     assert mock_sleep.call_count == 2
 
 
-@patch("chuck_data.utils.time.sleep")  # Mock sleep to speed up test
+@patch("chuck_data.clients.statement_waiter.time.sleep")
+def test_execute_sql_statement_finished_on_submit(mock_sleep):
+    """A statement that finished within wait_timeout is not polled."""
+    mock_client = MagicMock()
+    mock_client.post.return_value = {
+        "statement_id": "123",
+        "status": {"state": "SUCCEEDED"},
+        "result": {"data": [["row1"]]},
+    }
+
+    result = execute_sql_statement(mock_client, "warehouse-123", "SELECT 1")
+
+    mock_client.get.assert_not_called()
+    mock_sleep.assert_not_called()
+    assert result == {"data": [["row1"]]}
+
+
+@patch("chuck_data.clients.statement_waiter.time.sleep")  # Mock sleep to speed up test
 def test_execute_sql_statement_failed(mock_sleep):
     """Test SQL statement execution that fails."""
     # Create mock client
@@ -167,7 +183,7 @@ def test_execute_sql_statement_failed(mock_sleep):
     assert "SQL statement failed: SQL syntax error" in str(excinfo.value)
 
 
-@patch("chuck_data.utils.time.sleep")  # Mock sleep to speed up test
+@patch("chuck_data.clients.statement_waiter.time.sleep")  # Mock sleep to speed up test
 def test_execute_sql_statement_error_without_message(mock_sleep):
     """Test SQL statement execution that fails without specific message."""
     # Create mock client
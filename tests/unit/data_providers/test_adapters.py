@@ -88,20 +88,16 @@ class TestDatabricksProviderAdapter:
             workspace_url="https://test.databricks.com", token="test-token"
         )
 
-        # Mock the client to return success for first, error for second
-        call_count = [0]
-
+        # Mock the client to fail any statement touching bad_column
         def mock_submit(sql_text, warehouse_id, wait_timeout):
-            call_count[0] += 1
-            if call_count[0] == 1:
-                return {"status": {"state": "SUCCEEDED"}}
-            else:
+            if "bad_column" in sql_text:
                 return {
                     "status": {
                         "state": "FAILED",
                         "error": {"message": "Column not found"},
                     }
                 }
+            return {"status": {"state": "SUCCEEDED"}}
 
         adapter.client.submit_sql_statement = Mock(side_effect=mock_submit)
 
@@ -125,6 +121,94 @@ class TestDatabricksProviderAdapter:
         assert len(result["errors"]) == 1
         assert result["errors"][0]["column"] == "bad_column"
 
+    def test_tag_columns_batches_each_table_into_one_statement(self):
+        """Columns of the same table are applied in a single scripting block."""
+        adapter = DatabricksProviderAdapter(
+            workspace_url="https://test.databricks.com", token="test-token"
+        )
+        adapter.client.submit_sql_statement = Mock(
+            return_value={"status": {"state": "SUCCEEDED"}}
+        )
+
+        tags = [
+            {"table": "users", "column": "email", "semantic_type": "pii/email"},
+            {"table": "users", "column": "phone", "semantic_type": "pii/phone"},
+            {"table": "orders", "column": "ship_to", "semantic_type": "address"},
+        ]
+
+        result = adapter.tag_columns(
+            tags, catalog="cat", schema="sch", warehouse_id="warehouse123"
+        )
+
+        assert result == {"success": True, "tags_applied": 3, "errors": []}
+        statements = sorted(
+            c.kwargs["sql_text"]
+            for c in adapter.client.submit_sql_statement.call_args_list
+        )
+        assert len(statements) == 2
+        assert statements[0].startswith("ALTER TABLE cat.sch.orders ")
+        assert statements[1].startswith("BEGIN")
+        assert statements[1].count("ALTER TABLE cat.sch.users ") == 2
+
+    def test_tag_columns_stops_batching_when_scripting_unsupported(self):
+        """A rejected block with no per-column failures disables batching."""
+        adapter = DatabricksProviderAdapter(
+            workspace_url="https://test.databricks.com", token="test-token"
+        )
+
+        def mock_submit(sql_text, warehouse_id, wait_timeout):
+            if sql_text.startswith("BEGIN"):
+                return {
+                    "status": {
+                        "state": "FAILED",
+                        "error": {"message": "PARSE_SYNTAX_ERROR"},
+                    }
+                }
+            return {"status": {"state": "SUCCEEDED"}}
+
+        adapter.client.submit_sql_statement = Mock(side_effect=mock_submit)
+
+        tags = [
+            {"table": "c.s.t1", "column": "a", "semantic_type": "pii/email"},
+            {"table": "c.s.t1", "column": "b", "semantic_type": "pii/phone"},
+        ]
+
+        result = adapter.tag_columns(tags, warehouse_id="warehouse123")
+        assert result["tags_applied"] == 2
+        assert adapter._sql_scripting_supported is False
+        assert adapter.client.submit_sql_statement.call_count == 3
+
+        adapter.client.submit_sql_statement.reset_mock()
+        adapter.tag_columns(tags, warehouse_id="warehouse123")
+        assert adapter.client.submit_sql_statement.call_count == 2
+
+    def test_tag_columns_reports_progress_per_table(self):
+        """progress_callback fires once per table with running totals."""
+        adapter = DatabricksProviderAdapter(
+            workspace_url="https://test.databricks.com", token="test-token"
+        )
+        adapter.client.submit_sql_statement = Mock(
+            return_value={"status": {"state": "SUCCEEDED"}}
+        )
+        progress = []
+
+        tags = [
+            {"table": "c.s.t1", "column": "a", "semantic_type": "pii/email"},
+            {"table": "c.s.t2", "column": "b", "semantic_type": "pii/phone"},
+            {"table": "c.s.t2", "column": "c", "semantic_type": "pii/phone"},
+        ]
+
+        adapter.tag_columns(
+            tags,
+            warehouse_id="warehouse123",
+            max_workers=2,
+            progress_callback=lambda *args: progress.append(args),
+        )
+
+        assert {(p[0], p[1]) for p in progress} == {("c.s.t1", 1), ("c.s.t2", 2)}
+        assert sorted(p[2] for p in progress) == [1, 2]
+        assert all(p[3] == 2 for p in progress)
+
 
 class TestRedshiftProviderAdapter:
     """Tests for RedshiftProviderAdapter implementation."""
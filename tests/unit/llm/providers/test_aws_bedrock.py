@@ -7,6 +7,7 @@ Following the testing guidelines:
 - Test behavioral outcomes, not implementation
 """
 
+import asyncio
 import json
 import pytest
 from unittest.mock import MagicMock, patch
@@ -86,6 +87,45 @@ class TestAWSBedrockProvider:
         assert response.usage.completion_tokens == 8
         assert response.usage.total_tokens == 18
 
+    @patch("chuck_data.llm.providers.aws_bedrock.boto3")
+    def test_async_conversation_without_tools(self, mock_boto3):
+        """achat() returns the same OpenAI-format response as chat()."""
+        mock_bedrock_runtime = MagicMock()
+        mock_boto3.client.return_value = mock_bedrock_runtime
+        mock_bedrock_runtime.converse.return_value = {
+            "output": {
+                "message": {
+                    "role": "assistant",
+                    "content": [{"text": "Hello from async."}],
+                }
+            },
+            "stopReason": "end_turn",
+            "usage": {"inputTokens": 10, "outputTokens": 4, "totalTokens": 14},
+        }
+
+        provider = AWSBedrockProvider()
+        messages = [{"role": "user", "content": "Hello"}]
+
+        response = asyncio.run(provider.achat(messages))
+
+        assert response.choices[0].message.content == "Hello from async."
+        assert response.usage.total_tokens == 14
+        call_kwargs = mock_bedrock_runtime.converse.call_args.kwargs
+        assert call_kwargs["modelId"] == provider.default_model
+        assert call_kwargs["messages"][0]["role"] == "user"
+
+    @patch("chuck_data.llm.providers.aws_bedrock.boto3")
+    def test_async_converse_error_propagates(self, mock_boto3):
+        """achat() raises Converse API errors."""
+        mock_bedrock_runtime = MagicMock()
+        mock_boto3.client.return_value = mock_bedrock_runtime
+        mock_bedrock_runtime.converse.side_effect = Exception("ThrottlingException")
+
+        provider = AWSBedrockProvider()
+
+        with pytest.raises(Exception, match="ThrottlingException"):
+            asyncio.run(provider.achat([{"role": "user", "content": "Hello"}]))
+
     @patch("chuck_data.llm.providers.aws_bedrock.boto3")
     def test_conversation_with_system_message(self, mock_boto3):
         """System messages are handled correctly."""
@@ -682,28 +722,93 @@ class TestAWSBedrockProvider:
         assert provider.default_model == clean_id
 
     @patch("chuck_data.llm.providers.aws_bedrock.boto3")
-    def test_streaming_not_yet_implemented(self, mock_boto3):
-        """Streaming parameter is acknowledged but falls back to non-streaming."""
+    def test_stream_chat_yields_text_deltas(self, mock_boto3):
+        """Text arrives as OpenAI content deltas ending with a finish reason."""
         mock_bedrock_runtime = MagicMock()
         mock_boto3.client.return_value = mock_bedrock_runtime
-
-        mock_bedrock_runtime.converse.return_value = {
-            "output": {
-                "message": {"role": "assistant", "content": [{"text": "Response"}]}
-            },
-            "stopReason": "end_turn",
-            "usage": {"inputTokens": 10, "outputTokens": 5, "totalTokens": 15},
+        mock_bedrock_runtime.converse_stream.return_value = {
+            "stream": [
+                {"messageStart": {"role": "assistant"}},
+                {
+                    "contentBlockDelta": {
+                        "contentBlockIndex": 0,
+                        "delta": {"text": "Hel"},
+                    }
+                },
+                {
+                    "contentBlockDelta": {
+                        "contentBlockIndex": 0,
+                        "delta": {"text": "lo"},
+                    }
+                },
+                {"contentBlockStop": {"contentBlockIndex": 0}},
+                {"messageStop": {"stopReason": "end_turn"}},
+                {
+                    "metadata": {
+                        "usage": {"inputTokens": 3, "outputTokens": 2, "totalTokens": 5}
+                    }
+                },
+            ]
         }
 
         provider = AWSBedrockProvider()
+        chunks = list(provider.stream_chat([{"role": "user", "content": "Hi"}]))
 
-        messages = [{"role": "user", "content": "Test"}]
+        texts = [c.choices[0].delta.content for c in chunks if c.choices]
+        assert texts[:2] == ["Hel", "lo"]
+        assert chunks[-2].choices[0].finish_reason == "stop"
+        assert chunks[-1].usage.total_tokens == 5
+
+    @patch("chuck_data.llm.providers.aws_bedrock.boto3")
+    def test_stream_chat_assembles_tool_call_arguments(self, mock_boto3):
+        """Tool input streamed in pieces is assembled into one tool call."""
+        mock_bedrock_runtime = MagicMock()
+        mock_boto3.client.return_value = mock_bedrock_runtime
+        mock_bedrock_runtime.converse_stream.return_value = {
+            "stream": [
+                {"messageStart": {"role": "assistant"}},
+                {
+                    "contentBlockDelta": {
+                        "contentBlockIndex": 0,
+                        "delta": {"text": "Checking"},
+                    }
+                },
+                {
+                    "contentBlockStart": {
+                        "contentBlockIndex": 1,
+                        "start": {
+                            "toolUse": {"toolUseId": "t1", "name": "list_tables"}
+                        },
+                    }
+                },
+                {
+                    "contentBlockDelta": {
+                        "contentBlockIndex": 1,
+                        "delta": {"toolUse": {"input": '{"schema'}},
+                    }
+                },
+                {
+                    "contentBlockDelta": {
+                        "contentBlockIndex": 1,
+                        "delta": {"toolUse": {"input": '_name": "sales"}'}},
+                    }
+                },
+                {"messageStop": {"stopReason": "tool_use"}},
+            ]
+        }
 
-        # Request streaming (not implemented yet, should fall back gracefully)
-        response = provider.chat(messages, stream=True)
+        provider = AWSBedrockProvider()
+        response = provider.chat([{"role": "user", "content": "Hi"}], stream=True)
 
-        # Should still work (non-streaming)
-        assert response.choices[0].message.content == "Response"
+        message = response.choices[0].message
+        assert message.content == "Checking"
+        assert response.choices[0].finish_reason == "tool_calls"
+        assert message.tool_calls[0].id == "t1"
+        assert message.tool_calls[0].function.name == "list_tables"
+        assert json.loads(message.tool_calls[0].function.arguments) == {
+            "schema_name": "sales"
+        }
+        mock_bedrock_runtime.converse.assert_not_called()
 
 
 class TestAWSBedrockMessageConversion:
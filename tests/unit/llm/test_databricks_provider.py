@@ -1,7 +1,9 @@
 """Tests for DatabricksProvider."""
 
+import asyncio
+
 import pytest
-from unittest.mock import patch, MagicMock
+from unittest.mock import AsyncMock, patch, MagicMock
 from chuck_data.llm.providers.databricks import DatabricksProvider
 
 
@@ -171,3 +173,86 @@ class TestDatabricksProviderListModels:
         provider = DatabricksProvider()
         with pytest.raises(ValueError, match="API error"):
             provider.list_models()
+
+
+class TestDatabricksProviderAchat:
+    """Test DatabricksProvider.achat() method."""
+
+    @patch("chuck_data.llm.providers.databricks.AsyncOpenAI")
+    def test_achat_uses_async_client(self, mock_async_openai):
+        """achat() awaits the AsyncOpenAI client against serving endpoints."""
+        mock_client = MagicMock()
+        mock_client.chat.completions.create = AsyncMock(return_value="response")
+        mock_async_openai.return_value = mock_client
+
+        provider = DatabricksProvider(
+            workspace_url="https://test.databricks.com",
+            token="test-token",
+            model="test-model",
+        )
+        messages = [{"role": "user", "content": "Hello"}]
+
+        assert asyncio.run(provider.achat(messages)) == "response"
+        mock_async_openai.assert_called_once_with(
+            api_key="test-token",
+            base_url="https://test.databricks.com/serving-endpoints",
+        )
+        mock_client.chat.completions.create.assert_awaited_once_with(
+            model="test-model", messages=messages
+        )
+
+    @patch("chuck_data.llm.providers.databricks.AsyncOpenAI")
+    def test_achat_reuses_client_within_event_loop(self, mock_async_openai):
+        """Concurrent achat() calls on one loop share a single client."""
+        mock_client = MagicMock()
+        mock_client.chat.completions.create = AsyncMock(return_value="response")
+        mock_async_openai.return_value = mock_client
+
+        provider = DatabricksProvider(
+            workspace_url="https://test.databricks.com",
+            token="test-token",
+            model="test-model",
+        )
+        messages = [{"role": "user", "content": "Hello"}]
+
+        async def run_many():
+            return await asyncio.gather(*(provider.achat(messages) for _ in range(5)))
+
+        asyncio.run(run_many())
+        assert mock_async_openai.call_count == 1
+        assert mock_client.chat.completions.create.await_count == 5
+
+        # A new event loop gets a new client
+        asyncio.run(provider.achat(messages))
+        assert mock_async_openai.call_count == 2
+
+    @patch("chuck_data.llm.providers.databricks.AsyncOpenAI")
+    def test_aclose_closes_the_loop_client(self, mock_async_openai):
+        """aclose() closes the client made for the running loop."""
+        mock_client = MagicMock()
+        mock_client.chat.completions.create = AsyncMock(return_value="response")
+        mock_client.close = AsyncMock()
+        mock_async_openai.return_value = mock_client
+
+        provider = DatabricksProvider(
+            workspace_url="https://test.databricks.com",
+            token="test-token",
+            model="test-model",
+        )
+
+        async def chat_and_close():
+            await provider.achat([{"role": "user", "content": "Hello"}])
+            await provider.aclose()
+
+        asyncio.run(chat_and_close())
+        mock_client.close.assert_awaited_once()
+        assert provider._async_client is None
+
+    @patch("chuck_data.llm.providers.databricks.get_active_model", return_value=None)
+    def test_achat_without_model_raises(self, _mock_active_model):
+        """achat() raises when no model is specified or configured."""
+        provider = DatabricksProvider(
+            workspace_url="https://test.databricks.com", token="test-token"
+        )
+        with pytest.raises(ValueError, match="No model specified"):
+            asyncio.run(provider.achat([{"role": "user", "content": "Hello"}]))
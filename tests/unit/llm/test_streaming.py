@@ -0,0 +1,182 @@
+"""Tests for streamed chat completions and their use in the agent loop."""
+
+import json
+from unittest.mock import MagicMock, patch
+
+from openai.types.chat import ChatCompletionChunk
+from openai.types.chat.chat_completion_chunk import (
+    Choice,
+    ChoiceDelta,
+    ChoiceDeltaToolCall,
+    ChoiceDeltaToolCallFunction,
+)
+
+from chuck_data.agent import AgentManager
+from chuck_data.llm.streaming import StreamAssembler
+
+
+def _chunk(delta, finish_reason=None):
+    return ChatCompletionChunk(
+        id="chunk-1",
+        model="test-model",
+        created=0,
+        object="chat.completion.chunk",
+        choices=[Choice(index=0, delta=delta, finish_reason=finish_reason)],
+    )
+
+
+def _text_chunks(*parts):
+    return [_chunk(ChoiceDelta(content=p)) for p in parts] + [
+        _chunk(ChoiceDelta(), finish_reason="stop")
+    ]
+
+
+def _tool_call_chunks(tool_id, name, *argument_parts):
+    chunks = [
+        _chunk(
+            ChoiceDelta(
+                tool_calls=[
+                    ChoiceDeltaToolCall(
+                        index=0,
+                        id=tool_id,
+                        type="function",
+                        function=ChoiceDeltaToolCallFunction(name=name, arguments=""),
+                    )
+                ]
+            )
+        )
+    ]
+    chunks += [
+        _chunk(
+            ChoiceDelta(
+                tool_calls=[
+                    ChoiceDeltaToolCall(
+                        index=0, function=ChoiceDeltaToolCallFunction(arguments=part)
+                    )
+                ]
+            )
+        )
+        for part in argument_parts
+    ]
+    return chunks + [_chunk(ChoiceDelta(), finish_reason="tool_calls")]
+
+
+class StreamingProvider:
+    """Provider fake that streams one scripted response per call."""
+
+    def __init__(self, responses):
+        self.responses = list(responses)
+        self.stream_calls = 0
+
+    def stream_chat(self, messages, model=None, tools=None, tool_choice="auto"):
+        self.stream_calls += 1
+        return iter(self.responses.pop(0))
+
+    def chat(self, *args, **kwargs):
+        raise AssertionError("chat() should not be used while streaming")
+
+
+def test_assembler_concatenates_text_and_forwards_deltas():
+    seen = []
+
+    response = StreamAssembler.collect(
+        _text_chunks("Hel", "lo", " there"), on_text=seen.append
+    )
+
+    assert seen == ["Hel", "lo", " there"]
+    assert response.choices[0].message.content == "Hello there"
+    assert response.choices[0].message.tool_calls is None
+    assert response.choices[0].finish_reason == "stop"
+
+
+def test_assembler_builds_tool_call_arguments_incrementally():
+    response = StreamAssembler.collect(
+        _tool_call_chunks("call-1", "list_tables", '{"schema', '_name": "sales"}')
+    )
+
+    tool_call = response.choices[0].message.tool_calls[0]
+    assert tool_call.id == "call-1"
+    assert tool_call.function.name == "list_tables"
+    assert json.loads(tool_call.function.arguments) == {"schema_name": "sales"}
+    assert response.choices[0].finish_reason == "tool_calls"
+
+
+def test_assembler_defaults_missing_tool_arguments_to_empty_object():
+    response = StreamAssembler.collect(_tool_call_chunks("call-1", "status"))
+
+    assert response.choices[0].message.tool_calls[0].function.arguments == "{}"
+
+
+def test_assembler_records_time_to_first_token():
+    assembler = StreamAssembler(started_at=0.0)
+    assert assembler.time_to_first_token is None
+
+    assembler.add(_chunk(ChoiceDelta(content="x")))
+
+    assert assembler.time_to_first_token > 0
+
+
+def test_agent_streams_text_and_runs_streamed_tool_calls():
+    provider = StreamingProvider(
+        [
+            _tool_call_chunks("call-1", "list_tables", '{"schema_name": "sales"}'),
+            _text_chunks("Found ", "3 tables."),
+        ]
+    )
+    deltas = []
+
+    with (
+        patch("chuck_data.agent.tool_executor.execute_tool") as mock_execute_tool,
+        patch("chuck_data.agent.manager.get_data_provider", return_value=None),
+    ):
+        mock_execute_tool.return_value = {"tables": []}
+        agent = AgentManager(
+            MagicMock(), llm_client=provider, stream_callback=deltas.append
+        )
+        agent.add_user_message("How many tables?")
+        response = agent.process_with_tools(tools=[])
+
+    assert response == "Found 3 tables."
+    assert provider.stream_calls == 2
+    # Each LLM response is terminated with None
+    assert deltas == [None, "Found ", "3 tables.", None]
+    mock_execute_tool.assert_called_once()
+    assert mock_execute_tool.call_args.args[2] == {"schema_name": "sales"}
+    assert agent.last_response_streamed is True
+    assert [t["streamed"] for t in agent.turn_timings] == [True, True]
+    assert all(t["time_to_first_token"] is not None for t in agent.turn_timings)
+
+
+def test_agent_without_stream_callback_uses_chat():
+    provider = MagicMock()
+    provider.chat.return_value.choices[0].message.tool_calls = None
+    provider.chat.return_value.choices[0].message.content = "Done"
+
+    with patch("chuck_data.agent.manager.get_data_provider", return_value=None):
+        agent = AgentManager(MagicMock(), llm_client=provider)
+        agent.add_user_message("Hi")
+        response = agent.process_with_tools(tools=[])
+
+    assert response == "Done"
+    provider.stream_chat.assert_not_called()
+    assert agent.last_response_streamed is False
+    assert agent.turn_timings[0]["streamed"] is False
+
+
+@patch("chuck_data.llm.providers.databricks.OpenAI")
+def test_databricks_chat_with_stream_returns_a_chat_completion(mock_openai):
+    from chuck_data.llm.providers.databricks import DatabricksProvider
+
+    mock_openai.return_value.chat.completions.create.return_value = iter(
+        _text_chunks("Hel", "lo")
+    )
+    provider = DatabricksProvider(
+        workspace_url="https://test.databricks.com", token="t", model="m"
+    )
+
+    response = provider.chat([{"role": "user", "content": "Hi"}], stream=True)
+
+    assert response.choices[0].message.content == "Hello"
+    assert response.choices[0].finish_reason == "stop"
+    create = mock_openai.return_value.chat.completions.create
+    assert create.call_args.kwargs["stream"] is True
@@ -1,8 +1,12 @@
 """Tests for job_cache module."""
 
+import json
 import os
 import tempfile
+from unittest.mock import patch
+
 from chuck_data.job_cache import (
+    MAX_CACHE_SIZE,
     JobCache,
 )
 
@@ -25,12 +29,12 @@ def test_job_cache_add_and_retrieve():
 
 
 def test_job_cache_maintains_last_5():
-    """Test that cache only keeps last 20 jobs."""
+    """Test that cache only keeps last max_size jobs."""
     with tempfile.NamedTemporaryFile(delete=False) as f:
         cache_file = f.name
 
     try:
-        cache = JobCache(cache_file)
+        cache = JobCache(cache_file, max_size=20)
 
         # Add 25 jobs
         for i in range(1, 26):
@@ -394,3 +398,64 @@ def test_get_last_job_id_without_timestamps_uses_cached_at():
     finally:
         if os.path.exists(temp_cache_file):
             os.remove(temp_cache_file)
+
+
+def test_job_cache_holds_more_than_20_jobs_by_default(tmp_path):
+    cache = JobCache(str(tmp_path / "jobs.json"))
+
+    for i in range(MAX_CACHE_SIZE + 5):
+        cache.add_job(f"chk-{i:04d}", f"run-{i:04d}")
+
+    assert MAX_CACHE_SIZE > 20
+    assert len(cache) == MAX_CACHE_SIZE
+    assert cache.find_run_id("chk-0004") is None
+    assert cache.find_job_id("run-0004") is None
+    assert cache.find_job_id("run-0005") == "chk-0005"
+
+
+def test_run_id_index_follows_updates(tmp_path):
+    cache = JobCache(str(tmp_path / "jobs.json"))
+    cache.add_job("chk-001", "run-001")
+
+    cache.add_job("chk-001", "run-002")
+
+    assert cache.find_job_id("run-001") is None
+    assert cache.find_job_id("run-002") == "chk-001"
+    assert cache.find_run_id("chk-001") == "run-002"
+    assert JobCache(cache.cache_file).find_job_id("run-002") == "chk-001"
+
+
+def test_batched_updates_write_the_file_once(tmp_path):
+    cache_file = tmp_path / "jobs.json"
+    cache = JobCache(str(cache_file))
+
+    with patch("chuck_data.job_cache.os.replace", wraps=os.replace) as replace:
+        with cache.batch_updates():
+            for i in range(50):
+                cache.add_job(f"chk-{i:03d}", job_data={"state": "running"})
+            # Nothing is written until the batch ends
+            assert not cache_file.exists()
+
+    replace.assert_called_once()
+    assert len(json.loads(cache_file.read_text())["jobs"]) == 50
+    assert list(tmp_path.iterdir()) == [cache_file]
+
+
+def test_concurrent_saves_leave_a_complete_file(tmp_path):
+    import threading
+
+    cache_file = tmp_path / "jobs.json"
+    cache = JobCache(str(cache_file))
+
+    def add_jobs(prefix):
+        for i in range(25):
+            cache.add_job(f"{prefix}-{i:02d}", job_data={"state": "running"})
+
+    threads = [threading.Thread(target=add_jobs, args=(p,)) for p in "abcd"]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(json.loads(cache_file.read_text())["jobs"]) == 100
+    assert list(tmp_path.iterdir()) == [cache_file]
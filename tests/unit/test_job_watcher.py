@@ -0,0 +1,315 @@
+"""Tests for the shared background job watcher."""
+
+import queue
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from chuck_data.clients.databricks import DatabricksAPIClient
+from chuck_data.commands.monitor_job import handle_command as monitor_job
+from chuck_data.job_watcher import (
+    KIND_AMPERITY,
+    KIND_DATABRICKS,
+    KIND_EMR,
+    MAX_POLL_INTERVAL,
+    PENDING_POLL_INTERVAL,
+    JobWatcher,
+    get_job_watcher,
+    reset_job_watcher,
+)
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+class FakeEMR:
+    """EMR client whose steps are read from a dict of step ID to state."""
+
+    def __init__(self, states, cluster_id="j-CLUSTER"):
+        self.states = states
+        self.cluster_id = cluster_id
+        self.batch_calls = []
+        self.single_calls = []
+
+    def get_steps_status(self, step_ids, cluster_id=None):
+        # One ListSteps call per 10 steps, as in EMRAPIClient
+        for start in range(0, len(step_ids), 10):
+            self.batch_calls.append(list(step_ids[start : start + 10]))
+        # Steps that dropped out of the listing are left for get_step_status
+        return {
+            step_id: {"status": self.states[step_id]}
+            for step_id in step_ids
+            if self.states.get(step_id, "HIDDEN") != "HIDDEN"
+        }
+
+    def get_step_status(self, step_id, cluster_id=None):
+        self.single_calls.append(step_id)
+        return {"status": "COMPLETED"}
+
+
+class FakeDatabricks:
+    def __init__(self, active, finished):
+        self.active = active
+        self.finished = finished
+        self.list_calls = 0
+        self.get_calls = []
+
+    def list_job_runs(self, active_only=False, page_token=None, **kwargs):
+        self.list_calls += 1
+        runs = [
+            {"run_id": int(run_id), "state": {"life_cycle_state": state}}
+            for run_id, state in self.active.items()
+        ]
+        return {"runs": runs, "has_more": False}
+
+    def get_job_run_status(self, run_id):
+        self.get_calls.append(run_id)
+        return {
+            "run_id": int(run_id),
+            "state": {
+                "life_cycle_state": "TERMINATED",
+                "result_state": self.finished[run_id],
+            },
+        }
+
+
+@pytest.fixture
+def clock():
+    return Clock()
+
+
+@pytest.fixture
+def watcher(clock):
+    return JobWatcher(clock=clock, background=False)
+
+
+def test_emr_steps_on_a_cluster_share_one_batched_call(watcher):
+    client = FakeEMR({"s-1": "RUNNING", "s-2": "PENDING", "s-3": "HIDDEN"})
+    for step_id in ("s-1", "s-2", "s-3"):
+        watcher.watch_emr_step(step_id, client)
+
+    events = watcher.poll_once()
+
+    assert client.batch_calls == [["s-1", "s-2", "s-3"]]
+    # Only the step missing from the listing is described individually
+    assert client.single_calls == ["s-3"]
+    assert {e.job_id: e.state for e in events} == {
+        "s-1": "RUNNING",
+        "s-2": "PENDING",
+        "s-3": "COMPLETED",
+    }
+    assert not watcher.is_watching((KIND_EMR, "s-3"))
+
+
+def test_databricks_runs_are_read_from_the_active_runs_list(watcher):
+    client = FakeDatabricks(active={"11": "RUNNING"}, finished={"12": "SUCCESS"})
+    watcher.watch_databricks_run(11, client)
+    watcher.watch_databricks_run(12, client)
+
+    events = {e.job_id: e for e in watcher.poll_once()}
+
+    assert client.list_calls == 1
+    assert client.get_calls == ["12"]
+    assert events["11"].state == "RUNNING" and not events["11"].terminal
+    assert events["12"].state == "SUCCESS" and events["12"].succeeded
+
+
+def test_only_changes_are_published(watcher, clock):
+    client = MagicMock()
+    client.get_job_status.return_value = {"state": ":running", "record-count": 5}
+    received = []
+    watcher.subscribe(received.append)
+    watcher.watch_amperity_job("job-1", "token", client=client, poll_interval=1)
+
+    watcher.poll_once()
+    clock.now += 60
+    watcher.poll_once()
+    client.get_job_status.return_value = {"state": ":running", "record-count": 9}
+    clock.now += 60
+    watcher.poll_once()
+
+    assert client.get_job_status.call_count == 3
+    assert [e.data["record-count"] for e in received] == [5, 9]
+    assert received[0].previous_state is None
+
+
+def test_poll_interval_follows_the_job_phase(watcher, clock):
+    client = MagicMock()
+    client.get_job_status.return_value = {"state": "pending"}
+    key = watcher.watch_amperity_job("job-1", "t", client=client, poll_interval=60)
+    job = watcher._jobs[key]
+
+    watcher.poll_once()
+    assert job.next_poll - clock.now == PENDING_POLL_INTERVAL
+
+    # Running and unchanged: back off, but never beyond the ceiling
+    client.get_job_status.return_value = {"state": "running"}
+    gaps = []
+    for _ in range(6):
+        clock.now = job.next_poll
+        watcher.poll_once()
+        gaps.append(job.next_poll - clock.now)
+    assert gaps[0] == 60
+    assert gaps == sorted(gaps)
+    assert gaps[-1] == MAX_POLL_INTERVAL
+
+    # Failed status calls back off exponentially from the base interval
+    client.get_job_status.side_effect = ConnectionError("down")
+    clock.now = job.next_poll
+    error_event = watcher.poll_once()[0]
+    assert isinstance(error_event.error, ConnectionError)
+    assert job.next_poll - clock.now == MAX_POLL_INTERVAL
+    assert job.errors == 1
+
+
+def test_jobs_are_dropped_when_their_watch_expires(watcher, clock):
+    client = MagicMock()
+    client.get_job_status.return_value = {"state": "running"}
+    key = watcher.watch_amperity_job("job-1", "t", client=client, timeout=100)
+
+    clock.now += 101
+    assert watcher.poll_once() == []
+    assert not watcher.is_watching(key)
+    client.get_job_status.assert_not_called()
+
+
+def test_key_subscribers_mark_events_as_awaited(watcher):
+    client = MagicMock()
+    client.get_job_status.return_value = {"state": "succeeded"}
+    everything, awaited = [], []
+    watcher.subscribe(everything.append)
+    watcher.subscribe(awaited.append, key=(KIND_AMPERITY, "job-1"))
+    watcher.watch_amperity_job("job-1", "t", client=client)
+    watcher.watch_amperity_job("job-2", "t", client=client)
+
+    watcher.poll_once()
+
+    assert [e.job_id for e in awaited] == ["job-1"]
+    assert {e.job_id: e.awaited for e in everything} == {"job-1": True, "job-2": False}
+
+
+def test_background_thread_publishes_without_being_driven():
+    watcher = JobWatcher()
+    client = MagicMock()
+    client.get_job_status.side_effect = [{"state": "running"}, {"state": "succeeded"}]
+    events = queue.Queue()
+    watcher.subscribe(events.put)
+    try:
+        watcher.watch_amperity_job("job-1", "t", client=client, poll_interval=0.01)
+        states = [events.get(timeout=5).state for _ in range(2)]
+    finally:
+        watcher.stop()
+
+    assert states == ["running", "succeeded"]
+    assert not watcher.get_watched_jobs()
+
+
+def test_monitor_job_in_background_returns_immediately():
+    reset_job_watcher()
+    with (
+        patch(
+            "chuck_data.commands.monitor_job.find_run_id_for_job", return_value="run-1"
+        ),
+        patch("chuck_data.config.get_amperity_token", return_value="token"),
+        patch("chuck_data.clients.amperity.AmperityAPIClient") as client_class,
+    ):
+        client_class.return_value.get_job_status.return_value = {"state": "running"}
+        result = monitor_job(job_id="job-1", background=True)
+        watching = get_job_watcher().is_watching((KIND_AMPERITY, "job-1"))
+    reset_job_watcher()
+
+    assert result.success and result.data["background"]
+    assert watching
+
+
+def test_monitor_job_watches_a_databricks_run_without_a_chuck_job():
+    reset_job_watcher()
+    client = MagicMock(spec=DatabricksAPIClient)
+    with patch(
+        "chuck_data.commands.monitor_job.find_job_id_for_run", return_value=None
+    ):
+        result = monitor_job(client, run_id="42", background=True)
+        watching = get_job_watcher().is_watching((KIND_DATABRICKS, "42"))
+    reset_job_watcher()
+
+    assert result.success and result.data["background"]
+    assert watching
+
+
+@pytest.mark.parametrize(
+    "result_state, succeeded", [("SUCCESS", True), ("FAILED", False)]
+)
+def test_monitor_job_reports_the_databricks_run_outcome(result_state, succeeded):
+    reset_job_watcher()
+    client = MagicMock(spec=DatabricksAPIClient)
+    client.list_job_runs.return_value = {"runs": [], "has_more": False}
+    client.get_job_run_status.return_value = {
+        "run_id": 42,
+        "state": {
+            "life_cycle_state": "TERMINATED",
+            "result_state": result_state,
+            "state_message": "Task failed",
+        },
+    }
+    try:
+        with patch(
+            "chuck_data.commands.monitor_job.find_job_id_for_run", return_value=None
+        ):
+            result = monitor_job(client, run_id="42", poll_interval=0.01, timeout=5)
+    finally:
+        reset_job_watcher()
+
+    assert result.success is succeeded
+    assert result.data["state"] == result_state
+    client.get_job_run_status.assert_called_with("42")
+    if not succeeded:
+        assert result.data["error"] == "Task failed"
+
+
+def test_emr_steps_are_batched_per_cluster(watcher):
+    """200 steps on 2 clusters take 20 ListSteps calls instead of 200."""
+    clusters = [FakeEMR({}, cluster_id=f"j-{c}") for c in range(2)]
+    for c, client in enumerate(clusters):
+        for n in range(100):
+            step_id = f"s-{c}-{n}"
+            client.states[step_id] = "RUNNING"
+            watcher.watch_emr_step(step_id, client)
+
+    events = watcher.poll_once()
+
+    calls = sum(len(c.batch_calls) + len(c.single_calls) for c in clusters)
+    assert len(events) == 200
+    assert calls == 20
+
+
+def test_status_without_a_state_is_terminal(watcher):
+    client = MagicMock()
+    client.get_job_status.return_value = {"state": None}
+    watcher.watch_amperity_job("job-1", "t", client=client)
+
+    (event,) = watcher.poll_once()
+
+    assert event.terminal and event.error is None
+    assert not watcher.is_watching((KIND_AMPERITY, "job-1"))
+
+
+def test_malformed_status_backs_off_without_dropping_other_jobs(watcher, clock):
+    client = MagicMock()
+    client.get_job_status.side_effect = lambda job_id, token: (
+        ["not", "a", "dict"] if job_id == "bad" else {"state": "running"}
+    )
+    watcher.watch_amperity_job("bad", "t", client=client, poll_interval=10)
+    watcher.watch_amperity_job("good", "t", client=client, poll_interval=10)
+
+    events = {e.job_id: e for e in watcher.poll_once()}
+
+    assert events["good"].state == "running"
+    assert events["bad"].error is not None
+    # Both jobs are scheduled into the future, so nothing is polled again at once
+    assert watcher.poll_once() == []
+    assert client.get_job_status.call_count == 2
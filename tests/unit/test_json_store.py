@@ -0,0 +1,54 @@
+"""Tests for json_store module."""
+
+import json
+import os
+
+from chuck_data import json_store
+
+
+def test_mapping_round_trips_through_disk(tmp_path):
+    """A saved mapping loads back under the same version and field."""
+    path = str(tmp_path / "sub" / "store.json")
+
+    assert json_store.save_mapping(path, 1, "entries", {"k": {"v": 1}}, "test store")
+    assert json_store.load_mapping(path, 1, "entries", "test store") == {"k": {"v": 1}}
+    assert os.listdir(tmp_path / "sub") == ["store.json"]
+
+
+def test_load_discards_missing_stale_and_corrupt_files(tmp_path):
+    """Missing files, other format versions and invalid JSON load as empty."""
+    path = tmp_path / "store.json"
+    assert json_store.load_mapping(str(path), 1, "entries", "test store") == {}
+
+    path.write_text(json.dumps({"version": 0, "entries": {"k": {}}}))
+    assert json_store.load_mapping(str(path), 1, "entries", "test store") == {}
+
+    path.write_text(json.dumps({"version": 1, "entries": ["k"]}))
+    assert json_store.load_mapping(str(path), 1, "entries", "test store") == {}
+
+    path.write_text("{not json")
+    assert json_store.load_mapping(str(path), 1, "entries", "test store") == {}
+
+
+def test_failed_save_leaves_no_temp_file(tmp_path):
+    """A mapping that cannot be serialized is reported and cleaned up."""
+    path = str(tmp_path / "store.json")
+
+    assert not json_store.save_mapping(path, 1, "entries", {"k": object()}, "store")
+    assert os.listdir(tmp_path) == []
+
+
+def test_lazy_instance_creates_once_until_reset():
+    """get() reuses the instance, peek() never creates one, reset() forgets it."""
+    created = []
+    lazy = json_store.LazyInstance(lambda: created.append(object()) or created[-1])
+
+    assert lazy.peek() is None
+    first = lazy.get()
+    assert lazy.get() is first
+    assert lazy.peek() is first
+
+    lazy.reset()
+    assert lazy.peek() is None
+    assert lazy.get() is not first
+    assert len(created) == 2
@@ -0,0 +1,143 @@
+"""Tests for the Unity Catalog metadata cache."""
+
+import copy
+from unittest.mock import patch
+
+import pytest
+
+from chuck_data.clients.databricks import DatabricksAPIClient
+from chuck_data.metadata_cache import MetadataCache, make_cache_key
+
+CATALOGS = {"catalogs": [{"name": "main"}]}
+TABLES = {"tables": [{"name": "customers"}]}
+
+
+@pytest.fixture
+def client():
+    return DatabricksAPIClient("test-workspace", "fake-token", metadata_cache=None)
+
+
+def test_repeated_listing_hits_the_cache(client):
+    with patch.object(client, "get", return_value=CATALOGS) as mock_get:
+        first = client.list_catalogs()
+        second = client.list_catalogs()
+
+    assert first == second == CATALOGS
+    mock_get.assert_called_once()
+    stats = client.metadata_cache.stats()
+    assert (stats["hits"], stats["misses"]) == (1, 1)
+    assert stats["by_resource"]["catalogs"] == {"hits": 1, "misses": 1}
+
+
+def test_cached_responses_are_copies(client):
+    # A fresh response, so clearing it cannot touch the TABLES constant
+    with patch.object(client, "get_with_params", return_value=copy.deepcopy(TABLES)):
+        client.list_tables("main", "sales")["tables"].clear()
+        assert client.list_tables("main", "sales") == TABLES
+
+
+def test_different_parameters_are_cached_separately(client):
+    with patch.object(client, "get_with_params", return_value=TABLES) as mock_get:
+        client.list_tables("main", "sales")
+        client.list_tables("main", "sales", omit_columns=True)
+        client.list_tables("main", "hr")
+
+    assert mock_get.call_count == 3
+
+
+def test_entries_expire_after_their_ttl(client):
+    client._metadata_cache = MetadataCache(ttls={"tables": 10})
+    with (
+        patch.object(client, "get_with_params", return_value=TABLES) as mock_get,
+        patch("chuck_data.metadata_cache.time.time", side_effect=[0, 5, 20, 20]),
+    ):
+        client.list_tables("main", "sales")  # stored at 0, expires at 10
+        client.list_tables("main", "sales")  # hit at 5
+        client.list_tables("main", "sales")  # expired at 20
+
+    assert mock_get.call_count == 2
+
+
+def test_create_volume_invalidates_volume_listing(client):
+    with (
+        patch.object(
+            client, "get_with_params", return_value={"volumes": []}
+        ) as mock_get,
+        patch.object(client, "post", return_value={"name": "chuck"}),
+    ):
+        client.list_volumes("main", "sales")
+        client.create_volume("main", "sales", "chuck")
+        client.list_volumes("main", "sales")
+
+    assert mock_get.call_count == 2
+
+
+def test_tagging_sql_invalidates_only_the_tagged_table(client):
+    with (
+        patch.object(client, "get", return_value={"name": "customers"}) as mock_get,
+        patch.object(client, "get_with_params", return_value=TABLES) as mock_list,
+        patch.object(client, "post", return_value={"statement_id": "s1"}),
+        patch.object(
+            client,
+            "wait_for_sql_statement",
+            return_value={"status": {"state": "SUCCEEDED"}},
+        ),
+    ):
+        client.get_table("main.sales.customers")
+        client.get_table("main.sales.orders")
+        client.list_tables("main", "hr")
+        client.submit_sql_statement(
+            "ALTER TABLE main.sales.customers ALTER COLUMN email "
+            "SET TAGS ('semantic' = 'email')",
+            warehouse_id="wh",
+        )
+        client.get_table("main.sales.customers")
+        client.get_table("main.sales.orders")
+        client.list_tables("main", "hr")
+
+    assert [c.args[0] for c in mock_get.call_args_list] == [
+        "/api/2.1/unity-catalog/tables/main.sales.customers",
+        "/api/2.1/unity-catalog/tables/main.sales.orders",
+        "/api/2.1/unity-catalog/tables/main.sales.customers",
+    ]
+    mock_list.assert_called_once()
+
+
+def test_select_statements_do_not_invalidate():
+    cache = MetadataCache()
+    cache.put(make_cache_key("w", "/tables"), "tables", TABLES, "main", "sales")
+
+    assert cache.invalidate_for_sql("SELECT * FROM main.sales.customers") == 0
+    assert cache.invalidate_for_sql("CREATE SCHEMA main.sales") == 1
+
+
+def test_unqualified_ddl_does_not_stop_later_invalidation():
+    cache = MetadataCache()
+    cache.put(make_cache_key("w", "/tables"), "tables", TABLES, "main", "sales")
+    cache.put(make_cache_key("w", "/schemas"), "schemas", [], "main")
+
+    dropped = cache.invalidate_for_sql("CREATE TABLE t (id INT); DROP SCHEMA main.hr")
+
+    assert dropped == 2
+    assert cache.get(make_cache_key("w", "/schemas"), "schemas") is None
+
+
+def test_persisted_cache_survives_restart(tmp_path):
+    cache_file = str(tmp_path / "cache.json")
+    cache = MetadataCache(cache_file=cache_file, persist=True)
+    cache.put("k", "catalogs", CATALOGS)
+    cache.save()
+
+    reloaded = MetadataCache(cache_file=cache_file, persist=True)
+    assert reloaded.get("k", "catalogs") == CATALOGS
+    assert len(MetadataCache(cache_file=cache_file)) == 0
+
+
+def test_cache_can_be_disabled():
+    client = DatabricksAPIClient("test-workspace", "fake-token", metadata_cache=False)
+    with patch.object(client, "get", return_value=CATALOGS) as mock_get:
+        client.list_catalogs()
+        client.list_catalogs()
+
+    assert client.metadata_cache is None
+    assert mock_get.call_count == 2
@@ -0,0 +1,140 @@
+"""Tests for pii_cache module."""
+
+from chuck_data.commands.pii_tools import _helper_scan_schema_for_pii_logic
+from chuck_data.pii_cache import PIIClassificationCache, make_cache_key
+
+COLUMNS = [{"name": "email", "type": "string"}, {"name": "id", "type": "bigint"}]
+TAGGED = [
+    {"name": "email", "type": "string", "semantic": "email"},
+    {"name": "id", "type": "bigint", "semantic": None},
+]
+
+
+def test_cache_key_changes_with_inputs():
+    """Any change to provider, table, columns, prompt or model changes the key."""
+    base = make_cache_key("databricks", "c.s.t", COLUMNS, "1", "model-a")
+
+    assert base == make_cache_key("databricks", "c.s.t", COLUMNS, "1", "model-a")
+    assert base != make_cache_key("redshift", "c.s.t", COLUMNS, "1", "model-a")
+    assert base != make_cache_key("databricks", "c.s.u", COLUMNS, "1", "model-a")
+    assert base != make_cache_key("databricks", "c.s.t", COLUMNS[::-1], "1", "model-a")
+    assert base != make_cache_key(
+        "databricks", "c.s.t", [{"name": "email", "type": "int"}], "1", "model-a"
+    )
+    assert base != make_cache_key("databricks", "c.s.t", COLUMNS, "2", "model-a")
+    assert base != make_cache_key("databricks", "c.s.t", COLUMNS, "1", "model-b")
+
+
+def test_cache_round_trips_through_disk(tmp_path):
+    """Saved entries are visible to a fresh cache instance."""
+    cache_file = str(tmp_path / "cache.json")
+    cache = PIIClassificationCache(cache_file)
+    cache.put("k1", "c.s.t", TAGGED)
+    cache.save()
+
+    reloaded = PIIClassificationCache(cache_file)
+    assert reloaded.get("k1") == TAGGED
+    assert reloaded.get("missing") is None
+
+
+def test_cache_evicts_least_recently_used_by_size(tmp_path):
+    """Entries beyond the size bound are evicted oldest-first."""
+    cache = PIIClassificationCache(str(tmp_path / "cache.json"), max_bytes=400)
+    cache.put("k1", "c.s.t1", TAGGED)
+    cache.put("k2", "c.s.t2", TAGGED)
+    cache.get("k1")  # k1 is now the most recently used
+    cache.put("k3", "c.s.t3", TAGGED)
+
+    assert cache.get("k2") is None
+    assert cache.get("k1") is not None
+    assert cache.get("k3") is not None
+
+
+def test_cache_ignores_corrupt_file(tmp_path):
+    """A corrupt cache file starts an empty cache instead of failing."""
+    cache_file = tmp_path / "cache.json"
+    cache_file.write_text("{not json")
+
+    assert len(PIIClassificationCache(str(cache_file))) == 0
+
+
+def _add_tables(databricks_client_stub):
+    databricks_client_stub.add_catalog("cat")
+    databricks_client_stub.add_schema("cat", "sch")
+    for name in ("a", "b"):
+        databricks_client_stub.add_table(
+            "cat", "sch", name, columns=[{"name": "email", "type_name": "string"}]
+        )
+
+
+def test_scan_reuses_cached_classifications(
+    databricks_client_stub, llm_client_stub, temp_config, tmp_path
+):
+    """A second scan of unchanged tables makes no LLM calls."""
+    _add_tables(databricks_client_stub)
+    llm_client_stub.set_response_content('[{"name":"email","semantic":"email"}]')
+    cache = PIIClassificationCache(str(tmp_path / "cache.json"))
+
+    first = _helper_scan_schema_for_pii_logic(
+        databricks_client_stub,
+        llm_client_stub,
+        "cat",
+        "sch",
+        show_progress=False,
+        pii_cache=cache,
+    )
+    calls_after_first = len(llm_client_stub.chat_calls)
+    second = _helper_scan_schema_for_pii_logic(
+        databricks_client_stub,
+        llm_client_stub,
+        "cat",
+        "sch",
+        show_progress=False,
+        pii_cache=cache,
+    )
+
+    assert (first["cache_hits"], first["cache_misses"]) == (0, 2)
+    assert (second["cache_hits"], second["cache_misses"]) == (2, 0)
+    assert len(llm_client_stub.chat_calls) == calls_after_first
+    assert second["total_pii_columns"] == first["total_pii_columns"] == 2
+
+
+def test_scan_reclassifies_changed_tables_and_on_refresh(
+    databricks_client_stub, llm_client_stub, temp_config, tmp_path
+):
+    """Changed columns miss the cache; refresh bypasses it entirely."""
+    _add_tables(databricks_client_stub)
+    llm_client_stub.set_response_content('[{"name":"email","semantic":"email"}]')
+    cache = PIIClassificationCache(str(tmp_path / "cache.json"))
+    _helper_scan_schema_for_pii_logic(
+        databricks_client_stub,
+        llm_client_stub,
+        "cat",
+        "sch",
+        show_progress=False,
+        pii_cache=cache,
+    )
+
+    databricks_client_stub.tables[("cat", "sch")][1]["columns"] = [
+        {"name": "email", "type_name": "int"}
+    ]
+    changed = _helper_scan_schema_for_pii_logic(
+        databricks_client_stub,
+        llm_client_stub,
+        "cat",
+        "sch",
+        show_progress=False,
+        pii_cache=cache,
+    )
+    refreshed = _helper_scan_schema_for_pii_logic(
+        databricks_client_stub,
+        llm_client_stub,
+        "cat",
+        "sch",
+        show_progress=False,
+        refresh=True,
+        pii_cache=cache,
+    )
+
+    assert (changed["cache_hits"], changed["cache_misses"]) == (1, 1)
+    assert (refreshed["cache_hits"], refreshed["cache_misses"]) == (0, 2)
@@ -0,0 +1,175 @@
+"""Tests for the windowed SQL result viewer."""
+
+import io
+import time
+
+import pytest
+from rich.console import Console
+
+from chuck_data.exceptions import PaginationCancelled
+from chuck_data.ui.result_viewer import (
+    ColumnarRowBuffer,
+    LocalRowSource,
+    ResultViewer,
+)
+
+
+class GeneratedRows:
+    """Row source computing rows on demand and counting reads."""
+
+    def __init__(self, total):
+        self.total = total
+        self.reads = []
+
+    def get_rows(self, start_row, num_rows):
+        self.reads.append(start_row)
+        end = min(start_row + num_rows, self.total)
+        return [[str(i), f"name_{i}", None] for i in range(start_row, end)]
+
+
+def _console():
+    return Console(file=io.StringIO(), width=120, height=30)
+
+
+def test_window_is_returned_column_by_column():
+    buffer = ColumnarRowBuffer(GeneratedRows(100), ["id", "name", "x"], 100, 10)
+
+    ids, names, empty = buffer.get_window(8, 4)
+
+    assert ids == ["8", "9", "10", "11"]
+    assert names == [f"name_{i}" for i in range(8, 12)]
+    assert empty == ["", "", "", ""]
+
+
+def test_window_stops_at_end_of_result():
+    buffer = ColumnarRowBuffer(GeneratedRows(25), ["id", "name", "x"], 25, 10)
+
+    ids, _, _ = buffer.get_window(20, 10)
+
+    assert ids == [str(i) for i in range(20, 25)]
+
+
+def test_column_widths_grow_as_blocks_load_and_are_capped():
+    rows = [["a", "short"]] * 10 + [["b", "x" * 100]] * 10
+    buffer = ColumnarRowBuffer(
+        LocalRowSource(rows), ["id", "value"], 20, block_size=10, max_column_width=30
+    )
+
+    buffer.get_window(0, 5)
+    assert buffer.widths == [2, 5]
+
+    buffer.get_window(10, 5)
+    buffer.get_window(0, 5)
+    assert buffer.widths == [2, 30]
+
+
+def test_blocks_are_evicted_and_reloaded_when_scrolling_back():
+    source = GeneratedRows(1000)
+    buffer = ColumnarRowBuffer(source, ["id", "name", "x"], 1000, 100, max_blocks=2)
+
+    for start in (0, 100, 200, 100, 0):
+        buffer.get_window(start, 10)
+
+    assert source.reads == [0, 100, 200, 0]
+    assert buffer.loads == 4
+
+
+def test_navigation_is_clamped_to_the_result():
+    viewer = ResultViewer(
+        _console(), ["id", "name", "x"], GeneratedRows(95), 95, window_size=10
+    )
+
+    viewer.page_up()
+    assert viewer.top == 0
+    viewer.goto(50)
+    assert viewer.top == 49
+    viewer.scroll(-3)
+    assert viewer.top == 46
+    viewer.end()
+    assert (viewer.top, viewer.at_end) == (85, True)
+    viewer.page_down()
+    assert viewer.top == 85
+    viewer.goto(1_000_000)
+    assert viewer.top == 85
+    viewer.home()
+    assert viewer.top == 0
+
+
+def test_keys_scroll_both_ways_and_q_cancels():
+    viewer = ResultViewer(
+        _console(), ["id", "name", "x"], GeneratedRows(100), 100, window_size=10
+    )
+
+    for key, top in ((" ", 10), ("n", 20), ("j", 21), ("k", 20), ("b", 10)):
+        viewer.handle_key(key)
+        assert viewer.top == top
+    viewer.handle_key("G")
+    assert viewer.top == 90
+    with pytest.raises(PaginationCancelled):
+        viewer.handle_key("q")
+
+
+def test_render_only_builds_visible_rows():
+    viewer = ResultViewer(
+        _console(), ["id", "name", "x"], GeneratedRows(1000), 1000, window_size=10
+    )
+    viewer.goto(501)
+
+    table = viewer.render()
+
+    assert table.row_count == 10
+    assert table.title == "SQL Query Results (Rows 501-510 of 1000)"
+    assert [c.plain for c in table.columns[0]._cells][0] == "500"
+
+
+def test_non_interactive_run_prints_each_row_once_and_cancels():
+    console = _console()
+    rows = [[str(i)] for i in range(120)]
+    viewer = ResultViewer(console, ["n"], LocalRowSource(rows), 120)
+
+    with pytest.raises(PaginationCancelled):
+        viewer.run(interactive=False)
+
+    # The title wraps to the width of the one narrow column
+    output = " ".join(console.file.getvalue().split())
+    assert "Rows 1-50 of 120" in output
+    assert "Rows 101-120 of 120" in output
+    assert "End of results (120 total rows)" in output
+
+
+def test_interactive_run_uses_the_alternate_screen():
+    from unittest.mock import patch
+
+    console = Console(file=io.StringIO(), width=120, height=30, force_terminal=True)
+    viewer = ResultViewer(
+        console, ["id", "name", "x"], GeneratedRows(100), 100, window_size=10
+    )
+
+    with (
+        patch.object(viewer, "_read_key", side_effect=[" ", "q"]),
+        patch.object(console, "clear") as clear,
+        patch.object(console, "set_alt_screen", wraps=console.set_alt_screen) as alt,
+        pytest.raises(PaginationCancelled),
+    ):
+        viewer.run(interactive=True)
+
+    clear.assert_not_called()
+    assert [c.args[0] for c in alt.call_args_list] == [True, False]
+    assert viewer.top == 10
+
+
+def test_jumping_through_a_million_rows_stays_responsive():
+    source = GeneratedRows(1_000_000)
+    viewer = ResultViewer(
+        _console(), ["id", "name", "x"], source, 1_000_000, window_size=20
+    )
+
+    started = time.perf_counter()
+    for row in (1, 500_001, 999_990, 250_000, 1):
+        viewer.goto(row)
+        viewer.render()
+    elapsed = time.perf_counter() - started
+
+    # Only the blocks under each window are read, never the whole result
+    assert len(source.reads) <= 6
+    assert elapsed < 1.0
@@ -0,0 +1,169 @@
+"""Tests and benchmark for table row rendering."""
+
+import inspect
+import io
+import time
+from unittest.mock import patch
+
+import pytest
+from rich.console import Console
+
+from chuck_data.ui.table_formatter import (
+    NONE_STYLE,
+    add_rows_from_data,
+    compile_style,
+    create_table,
+    display_table,
+    render_column_cells,
+)
+
+COLUMNS = ["name", "state", "size", "owner"]
+
+
+def _rows(count):
+    return [
+        {
+            "name": f"table_{i}",
+            "state": "ACTIVE" if i % 3 else "FAILED",
+            "size": i * 10,
+            "owner": None if i % 5 == 0 else "data-team",
+        }
+        for i in range(count)
+    ]
+
+
+def _style_map():
+    def state_style(state, row):
+        return "red" if state == "FAILED" else "green"
+
+    return {
+        "name": lambda name: "bold" if name.endswith("0") else None,
+        "state": state_style,
+        "size": "cyan",
+    }
+
+
+def test_cells_match_format_cell_semantics():
+    rows = [{"name": "a", "size": 3, "owner": None}]
+
+    name, size, owner = render_column_cells(
+        rows, ["name", "size", "owner"], {"name": "bold", "size": lambda v: "cyan"}
+    )
+
+    assert (name[0].plain, name[0].style) == ("a", "bold")
+    assert (size[0].plain, size[0].style) == ("3", "cyan")
+    assert (owner[0].plain, owner[0].style) == ("N/A", NONE_STYLE)
+
+
+def test_style_arity_is_resolved_once_per_column():
+    seen = []
+
+    def style_with_row(value, row):
+        seen.append(row["id"])
+        return "green"
+
+    with patch(
+        "chuck_data.ui.table_formatter.inspect.signature",
+        wraps=inspect.signature,
+    ) as signature:
+        (cells,) = render_column_cells(
+            [{"id": i, "v": i} for i in range(50)], ["v"], {"v": style_with_row}
+        )
+
+    assert signature.call_count == 1
+    assert seen == list(range(50))
+    assert all(c.style == "green" for c in cells)
+
+
+def test_failing_style_falls_back_to_value_then_unstyled():
+    def needs_row_but_fails(value, row):
+        raise KeyError("row")
+
+    assert compile_style(lambda value, row=None: 1 / 0)("x", {}) is None
+
+    resolve = compile_style(needs_row_but_fails)
+    assert resolve("x", {}) is None
+
+    resolve = compile_style(lambda value, *rest: "ok" if not rest else rest[0]["s"])
+    assert resolve("x", {}) == "ok"
+
+
+def test_plain_rendering_calls_no_style_functions():
+    def style(value):
+        raise AssertionError("style functions are not used in plain mode")
+
+    name, owner = render_column_cells(
+        [{"name": "a", "owner": None}], ["name", "owner"], {"name": style}, plain=True
+    )
+
+    assert (name[0].plain, name[0].style) == ("a", "")
+    assert (owner[0].plain, owner[0].style) == ("N/A", "")
+
+
+def test_add_rows_keeps_row_order():
+    table = create_table(headers=COLUMNS)
+
+    add_rows_from_data(table, _rows(7), COLUMNS, _style_map())
+
+    assert table.row_count == 7
+    assert [c.plain for c in table.columns[0]._cells] == [
+        f"table_{i}" for i in range(7)
+    ]
+    assert table.columns[1]._cells[0].style == "red"
+
+
+def test_display_table_uses_plain_path_for_no_color_console():
+    output = io.StringIO()
+    console = Console(file=output, no_color=True, width=120)
+
+    with patch(
+        "chuck_data.ui.table_formatter.add_rows_from_data",
+        wraps=add_rows_from_data,
+    ) as add_rows:
+        display_table(console, _rows(3), COLUMNS, style_map=_style_map())
+
+    assert add_rows.call_args.kwargs["plain"] is True
+    assert "table_2" in output.getvalue()
+
+
+def test_plain_and_styled_rows_have_the_same_text():
+    rows = _rows(50)
+    styled = create_table(headers=COLUMNS)
+    plain = create_table(headers=COLUMNS)
+
+    add_rows_from_data(styled, rows, COLUMNS, _style_map())
+    add_rows_from_data(plain, rows, COLUMNS, _style_map(), plain=True)
+
+    assert styled.row_count == plain.row_count == 50
+    for styled_column, plain_column in zip(styled.columns, plain.columns):
+        assert [c.plain for c in styled_column._cells] == [
+            c.plain for c in plain_column._cells
+        ]
+
+
+def _cell_text(table):
+    return [[c.plain for c in column._cells] for column in table.columns]
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("row_count, budget", [(10_000, 2.0), (100_000, 20.0)])
+def test_benchmark_add_rows(row_count, budget):
+    """Time styled and plain rendering of large tables (--run-benchmarks -s)."""
+    rows = _rows(row_count)
+    tables = {}
+    for plain in (False, True):
+        table = create_table(headers=COLUMNS)
+        started = time.perf_counter()
+        add_rows_from_data(table, rows, COLUMNS, _style_map(), plain=plain)
+        elapsed = time.perf_counter() - started
+
+        mode = "plain" if plain else "styled"
+        print(
+            f"{row_count:>7} rows {mode:>6}: {elapsed:.3f}s "
+            f"({row_count / elapsed:,.0f} rows/s)"
+        )
+        assert table.row_count == row_count
+        assert elapsed < budget
+        tables[mode] = table
+
+    assert _cell_text(tables["styled"]) == _cell_text(tables["plain"])
@@ -633,3 +633,52 @@ def test_prompt_styling_respects_no_color():
                 for msg in print_calls
             )
         )
+
+
+def test_agent_stream_renders_live_and_stops_at_end():
+    """Streamed agent text is rendered in one live panel until None arrives."""
+    tui_instance = ChuckTUI()
+    tui_instance.console = Console(file=MagicMock(), force_terminal=False)
+
+    with patch("chuck_data.ui.tui.Live") as mock_live_class:
+        live = mock_live_class.return_value
+        tui_instance.display_agent_stream("Hello")
+        tui_instance.display_agent_stream(" world")
+        tui_instance.display_agent_stream(None)
+
+    mock_live_class.assert_called_once()
+    live.start.assert_called_once()
+    assert live.update.call_count == 1
+    assert live.update.call_args.args[0].renderable == "Hello world"
+    live.stop.assert_called_once()
+    assert tui_instance._stream_live is None
+    assert tui_instance._stream_text == ""
+
+
+def test_streamed_agent_response_is_not_printed_again(tui):
+    """The final panel is skipped when the response was already streamed."""
+    result = MagicMock(success=True, message=None)
+    result.data = {"response": "Hello world", "streamed": True}
+
+    tui._process_command_result("/agent", result)
+
+    tui.console.print.assert_not_called()
+
+
+def test_background_job_completions_are_reported_once(tui):
+    from chuck_data.job_watcher import JobEvent, PHASE_RUNNING, PHASE_TERMINAL
+
+    finished = JobEvent("emr", "s-1", "COMPLETED", "RUNNING", PHASE_TERMINAL, {})
+    running = JobEvent("amperity", "job-2", "running", None, PHASE_RUNNING, {})
+    awaited = JobEvent(
+        "amperity", "job-3", "failed", "running", PHASE_TERMINAL, {}, awaited=True
+    )
+    for event in (finished, running, awaited):
+        tui._job_events.put(event)
+
+    tui._print_job_notifications()
+    tui._print_job_notifications()
+
+    printed = [call.args[0] for call in tui.console.print.call_args_list]
+    assert len(printed) == 1
+    assert "EMR step s-1 finished: COMPLETED" in printed[0]